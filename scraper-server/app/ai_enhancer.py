@@ -8,13 +8,17 @@ import logging
 import json
 import time
 import re
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Set, Tuple
 from datetime import datetime
 
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from openai import APIConnectionError, APIStatusError, OpenAI, RateLimitError
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.utils.retry_policy import RETRYABLE_STATUSES, RetryPolicy, RetryScheduler, error_retry_after
+from app.utils.text_compaction import compact_text, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,82 @@ FORMATTING RULES:
 
 CRITICAL: Focus on EXTRACTION over ENHANCEMENT. The goal is accurate data, not creative writing."""
 
+# Fields the model is asked to extract, with the hint shown for each in the prompt
+EXTRACTION_FIELDS = {
+    'company': '"Company name - EXTRACT from description if not provided"',
+    'company_website': '"URL if mentioned, otherwise null"',
+    'industry': '"Infer from company/role if clear"',
+    'job_level': '"entry|mid|senior|lead|director - based on title and requirements"',
+    'employment_type': '"full-time|part-time|contract|freelance|internship"',
+    'work_arrangement': '"remote|hybrid|onsite - based on location mentions"',
+    'country': '"Full country name extracted from location"',
+    'city': '"City name if mentioned"',
+    'specific_location': '"Full location string as mentioned"',
+    'salary_min': 'null or number if salary range mentioned',
+    'salary_max': 'null or number if salary range mentioned',
+    'currency': '"USD|EUR|GBP - based on location"',
+    'salary_type': '"annual|hourly if mentioned"',
+    'years_experience': '"0-1|1-3|3-5|5-7|7-10|10+ if mentioned"',
+    'education_level': '"bachelor|master|phd|none-required if mentioned"',
+    'required_skills': '["Array of skills MENTIONED in requirements"]',
+    'preferred_skills': '["Array of skills mentioned as preferred/nice-to-have"]',
+    'required_certifications': '["CPACC", "WAS", etc. if MENTIONED]',
+    'wcag_level': '"2.0|2.1|2.2|3.0 if mentioned"',
+    'accessibility_focus': '["web", "mobile", "document", etc. based on role"]',
+    'assistive_tech_experience': '["JAWS", "NVDA", "VoiceOver", etc. if mentioned]',
+    'description': '"Clean, well-formatted job overview - 2-3 paragraphs, NO markdown symbols"',
+    'key_responsibilities': '"Clean bullet points as readable text, NO markdown"',
+    'requirements': '"Clean requirements section, NO markdown"',
+    'nice_to_have': '"Optional qualifications if mentioned"',
+}
+
+# Weight of each field in a job's completeness score. Unweighted fields are
+# still requested when missing but never send a job to the LLM on their own.
+COMPLETENESS_WEIGHTS = {
+    'company': 3.0,
+    'description': 2.0,
+    'requirements': 2.0,
+    'required_skills': 2.0,
+    'key_responsibilities': 1.0,
+    'job_level': 1.0,
+    'employment_type': 1.0,
+    'work_arrangement': 1.0,
+    'country': 1.0,
+    'industry': 1.0,
+    'years_experience': 1.0,
+    'accessibility_focus': 0.5,
+    'required_certifications': 0.5,
+    'assistive_tech_experience': 0.5,
+    'wcag_level': 0.5,
+    'education_level': 0.5,
+    'city': 0.5,
+    'salary_min': 0.5,
+}
+
+# Requesting one of these also requests the rest of its group
+FIELD_COMPANIONS = {
+    'salary_min': ('salary_max', 'currency', 'salary_type'),
+    'salary_max': ('salary_min', 'currency', 'salary_type'),
+}
+
+
+# Free-text fields the model may rewrite; they dominate prompt and output size
+TEXT_FIELDS = ('description', 'key_responsibilities', 'requirements', 'nice_to_have')
+
+# Rough completion tokens needed per requested field
+OUTPUT_TOKENS_PER_TEXT_FIELD = 600
+OUTPUT_TOKENS_PER_FIELD = 40
+
+
+def render_schema(fields) -> str:
+    """Render the JSON field list shown to the model for ``fields``"""
+    lines = [f'  "{field}": {EXTRACTION_FIELDS[field]}' for field in EXTRACTION_FIELDS
+             if field in fields]
+    return "{\n" + ",\n".join(lines) + "\n}"
+
+
+EXTRACTION_SCHEMA = render_schema(EXTRACTION_FIELDS)
+
 # Optimized user prompt focused on extraction
 USER_PROMPT_TEMPLATE = """Extract and structure the following job posting. Focus on EXTRACTION of existing information.
 
@@ -52,40 +132,7 @@ RAW JOB DATA:
 
 Return a JSON object with these fields. ONLY include values you can EXTRACT from the content above:
 
-{{
-  "company": "Company name - EXTRACT from description if not provided",
-  "company_website": "URL if mentioned, otherwise null",
-  "industry": "Infer from company/role if clear",
-  
-  "job_level": "entry|mid|senior|lead|director - based on title and requirements",
-  "employment_type": "full-time|part-time|contract|freelance|internship",
-  "work_arrangement": "remote|hybrid|onsite - based on location mentions",
-  
-  "country": "Full country name extracted from location",
-  "city": "City name if mentioned",
-  "specific_location": "Full location string as mentioned",
-  
-  "salary_min": null or number if salary range mentioned,
-  "salary_max": null or number if salary range mentioned,
-  "currency": "USD|EUR|GBP - based on location",
-  "salary_type": "annual|hourly if mentioned",
-  
-  "years_experience": "0-1|1-3|3-5|5-7|7-10|10+ if mentioned",
-  "education_level": "bachelor|master|phd|none-required if mentioned",
-  
-  "required_skills": ["Array of skills MENTIONED in requirements"],
-  "preferred_skills": ["Array of skills mentioned as preferred/nice-to-have"],
-  "required_certifications": ["CPACC", "WAS", etc. if MENTIONED],
-  
-  "wcag_level": "2.0|2.1|2.2|3.0 if mentioned",
-  "accessibility_focus": ["web", "mobile", "document", etc. based on role"],
-  "assistive_tech_experience": ["JAWS", "NVDA", "VoiceOver", etc. if mentioned],
-  
-  "description": "Clean, well-formatted job overview - 2-3 paragraphs, NO markdown symbols",
-  "key_responsibilities": "Clean bullet points as readable text, NO markdown",
-  "requirements": "Clean requirements section, NO markdown",
-  "nice_to_have": "Optional qualifications if mentioned"
-}}
+{schema}
 
 IMPORTANT:
 - Return ONLY valid JSON
@@ -93,21 +140,139 @@ IMPORTANT:
 - For description fields, CLEAN the markdown but keep original content
 - Extract company name from description patterns like "at [Company]", "[Company] is seeking", etc."""
 
+# Batched prompt: several jobs per request, answered as an array keyed by job_id
+BATCH_USER_PROMPT_TEMPLATE = """Extract and structure each of the following {count} job postings independently. Focus on EXTRACTION of existing information.
+
+RAW JOBS (JSON array, every job has a "job_id"):
+```
+{jobs_data}
+```
+
+Return a JSON array with exactly one object per job. Every object MUST contain that job's "job_id" unchanged plus these fields. ONLY include values you can EXTRACT from that job's own content:
+
+{schema}
+
+IMPORTANT:
+- Return ONLY a valid JSON array
+- Never copy information from one job into another
+- Use null for fields you cannot extract
+- For description fields, CLEAN the markdown but keep original content
+- Extract company name from description patterns like "at [Company]", "[Company] is seeking", etc."""
+
+
+class AdaptiveRateController:
+    """
+    AIMD concurrency window for OpenRouter calls
+    
+    The window grows additively (about one slot per window of successful
+    calls) up to ``max_in_flight`` and is halved on a 429. After a 429 no new
+    call is dispatched until the provider's Retry-After, or ``cooldown_seconds``
+    when the header is absent, has elapsed.
+    """
+    
+    def __init__(self, max_in_flight: int, cooldown_seconds: float = 1.0,
+                 decrease_factor: float = 0.5):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.cooldown_seconds = max(0.0, cooldown_seconds)
+        self.decrease_factor = decrease_factor
+        self.limit = 1.0
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.successes = 0
+        self.rate_limited = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        """Block until a call may be dispatched under the current window"""
+        with self._cond:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    self._cond.wait(pause)
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._cond.wait()
+    
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+    
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight slot for the duration of a call"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+    
+    def record_success(self):
+        """Additive increase: +1/limit per success, i.e. ~+1 per full window"""
+        with self._cond:
+            self.successes += 1
+            self.limit = min(float(self.max_in_flight), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+    
+    def record_rate_limited(self, retry_after: Optional[float] = None):
+        """Multiplicative decrease, applied once per cool-down period"""
+        with self._cond:
+            self.rate_limited += 1
+            now = time.monotonic()
+            # Calls already in flight when the first 429 arrived report their
+            # own 429s; those describe the same overload and must not shrink
+            # the window again.
+            if now >= self.paused_until:
+                self.limit = max(1.0, self.limit * self.decrease_factor)
+            pause = retry_after if retry_after is not None else self.cooldown_seconds
+            self.paused_until = max(self.paused_until, now + pause)
+            self._cond.notify_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'max_in_flight': self.max_in_flight,
+                'current_limit': round(self.limit, 2),
+                'successes': self.successes,
+                'rate_limited': self.rate_limited,
+            }
+
+
+def is_retryable_ai_error(error: BaseException) -> bool:
+    """Rate limits, timeouts, dropped connections and 408/409/5xx answers"""
+    if isinstance(error, APIStatusError):
+        return error.status_code == 409 or error.status_code in RETRYABLE_STATUSES
+    # APITimeoutError is an APIConnectionError
+    return isinstance(error, APIConnectionError)
+
 
 class AIEnhancer:
     """Enhances job postings using OpenRouter AI - Optimized for extraction"""
     
-    def __init__(self):
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
         self.client = None
         self.enabled = bool(self.settings.openrouter_api_key)
+        self.rate_controller = AdaptiveRateController(
+            max_in_flight=self.settings.ai_max_concurrency,
+            cooldown_seconds=self.settings.ai_rate_limit_delay,
+        )
+        # Backoff between 2 and 10 seconds, as the tenacity decorator had
+        self.retry_policy = RetryPolicy(self.settings.retry_budget, base=2.0, max_delay=10.0)
+        self.run_stats = self._empty_run_stats()
+        self._stats_lock = threading.Lock()
         
         if self.enabled:
             self.client = OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=self.settings.openrouter_api_key
+                base_url=self.settings.openrouter_base_url,
+                api_key=self.settings.openrouter_api_key,
+                # Retries are ours (_call_openrouter); the client's own would
+                # absorb 429s before the rate controller saw them
+                max_retries=0
             )
-            logger.info("AI Enhancer initialized with OpenRouter")
+            logger.info(f"AI Enhancer initialized with OpenRouter at {self.settings.openrouter_base_url}")
         else:
             logger.warning("AI Enhancer disabled - OPENROUTER_API_KEY not set")
     
@@ -115,28 +280,136 @@ class AIEnhancer:
         """Check if AI enhancement is available"""
         return self.enabled and self.client is not None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True
-    )
-    def _call_openrouter(self, messages: List[Dict]) -> str:
-        """Call OpenRouter API with retry logic"""
-        response = self.client.chat.completions.create(
-            model=self.settings.openrouter_model,
-            messages=messages,
-            temperature=0.1,  # Lower temperature for more consistent extraction
-            max_tokens=3000   # More tokens for complete responses
+    def _request_completion(self, messages: List[Dict], max_tokens: int):
+        """One OpenRouter request, paced by the rate controller"""
+        with self.rate_controller.slot():
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.settings.openrouter_model,
+                    messages=messages,
+                    temperature=0.1,  # Lower temperature for more consistent extraction
+                    max_tokens=max_tokens  # More tokens for complete responses
+                )
+            except RateLimitError as e:
+                self.rate_controller.record_rate_limited(error_retry_after(e))
+                raise
+        self.rate_controller.record_success()
+        return response
+    
+    def _call_openrouter(self, messages: List[Dict], max_tokens: int = 3000,
+                         label: str = 'AI call', attempts: int = 3) -> str:
+        """
+        Call OpenRouter, retrying transient failures under the retry policy
+
+        Retries wait inline, on the calling thread, with the rate controller's
+        slot released. Pooled calls pass ``attempts=1`` and are retried on
+        ``_map_concurrently``'s delay queue instead, so a pool thread never
+        sleeps through a backoff.
+        """
+        if attempts == 1:
+            response = self._request_completion(messages, max_tokens)
+        else:
+            response = self.retry_policy.call(
+                self._request_completion, messages, max_tokens,
+                attempts=attempts, retryable=is_retryable_ai_error, site='openrouter'
+            )
+        content = response.choices[0].message.content
+        
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        if prompt_tokens is None:
+            prompt_tokens = sum(estimate_tokens(m['content']) for m in messages)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        if completion_tokens is None:
+            completion_tokens = estimate_tokens(content or '')
+        self._count('prompt_tokens', prompt_tokens)
+        self._count('completion_tokens', completion_tokens)
+        logger.info(f"{label}: {prompt_tokens} input tokens, "
+                    f"{completion_tokens} output tokens (max {max_tokens})")
+        return content
+    
+    @staticmethod
+    def _empty_run_stats() -> Dict[str, int]:
+        return {
+            'jobs': 0,
+            'skipped_complete': 0,
+            'reduced_prompts': 0,
+            'batched_requests': 0,
+            'batched_jobs': 0,
+            'fallback_jobs': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+        }
+    
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.run_stats[key] += amount
+    
+    def _field_is_filled(self, field: str, value: Any) -> bool:
+        """Whether a deterministic extractor already produced a usable value"""
+        if value is None:
+            return False
+        if field == 'company':
+            return self._is_valid_company(value)
+        if field in TEXT_FIELDS:
+            # Same bar _merge_job_data uses before letting the AI rewrite text
+            return len(value) >= 50 and not self._has_excessive_markdown(value)
+        if isinstance(value, str):
+            return value.strip().lower() not in ('', '[]', 'null', 'none', 'nan', 'unknown')
+        if isinstance(value, (list, dict)):
+            return bool(value)
+        return True
+    
+    def missing_fields(self, job_data: Dict[str, Any]) -> List[str]:
+        """Extraction fields the job still lacks, in prompt order"""
+        missing = {
+            field for field in EXTRACTION_FIELDS
+            if not self._field_is_filled(field, job_data.get(field))
+        }
+        for field in list(missing):
+            missing.update(FIELD_COMPANIONS.get(field, ()))
+        return [field for field in EXTRACTION_FIELDS if field in missing]
+    
+    def completeness_score(self, job_data: Dict[str, Any]) -> float:
+        """Weighted share (0-1) of COMPLETENESS_WEIGHTS fields already filled"""
+        total = sum(COMPLETENESS_WEIGHTS.values())
+        filled = sum(
+            weight for field, weight in COMPLETENESS_WEIGHTS.items()
+            if self._field_is_filled(field, job_data.get(field))
         )
-        return response.choices[0].message.content
+        return filled / total
+    
+    def _requested_fields(self, job_data: Dict[str, Any], truncated=()) -> List[str]:
+        """
+        Fields to ask the model for: the missing ones, or all if none are
+        
+        Text fields cut short by prompt compaction are never requested, since
+        the model would rewrite them from a partial copy.
+        """
+        fields = self.missing_fields(job_data) or list(EXTRACTION_FIELDS)
+        return [field for field in fields if field not in truncated]
+    
+    @staticmethod
+    def _output_token_budget(fields: List[str]) -> int:
+        """Completion cap sized to the requested fields, at most 3000 tokens"""
+        text_fields = sum(1 for field in fields if field in TEXT_FIELDS)
+        budget = (100 + text_fields * OUTPUT_TOKENS_PER_TEXT_FIELD
+                  + (len(fields) - text_fields) * OUTPUT_TOKENS_PER_FIELD)
+        return min(3000, budget)
     
-    def enhance_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    def enhance_job(self, job_data: Dict[str, Any], raise_errors: bool = False,
+                    attempts: int = 3) -> Dict[str, Any]:
         """
         Enhance a single job posting using AI
         
+        The prompt only asks for the fields the job is missing, so values the
+        scrapers already extracted are kept and the response stays short.
+        
         Args:
             job_data: Raw job data from scraper
+            raise_errors: Raise on call/parse failures instead of returning
+                the original data (used by the background queue to retry)
+            attempts: OpenRouter attempts made inline (see ``_call_openrouter``)
             
         Returns:
             Enhanced job data with filled/improved fields
@@ -147,20 +420,33 @@ class AIEnhancer:
         
         try:
             # Prepare the job data for the prompt
-            job_for_prompt = self._prepare_for_prompt(job_data)
+            job_for_prompt, truncated = self._prepare_for_prompt(job_data)
+            fields = self._requested_fields(job_data, truncated)
+            if not fields:
+                return job_data
+            if len(fields) < len(EXTRACTION_FIELDS):
+                self._count('reduced_prompts')
             
             # Call OpenRouter with retry
             messages = [
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": USER_PROMPT_TEMPLATE.format(
-                    job_data=json.dumps(job_for_prompt, indent=2)
+                    job_data=json.dumps(job_for_prompt, ensure_ascii=False),
+                    schema=render_schema(fields)
                 )}
             ]
             
-            content = self._call_openrouter(messages)
+            content = self._call_openrouter(
+                messages,
+                max_tokens=self._output_token_budget(fields),
+                label=f"AI job '{job_data.get('title', 'Unknown')}'",
+                attempts=attempts
+            )
             
             # Parse the response
             enhanced = self._parse_response(content)
+            if enhanced and len(fields) < len(EXTRACTION_FIELDS):
+                enhanced = {k: v for k, v in enhanced.items() if k in fields}
             
             if enhanced:
                 # Merge enhanced data with original, preserving required fields
@@ -168,43 +454,247 @@ class AIEnhancer:
                 logger.info(f"AI enhanced job: {result.get('title')} at {result.get('company')}")
                 return result
             else:
+                if raise_errors:
+                    raise ValueError("AI response could not be parsed")
                 logger.warning("AI response could not be parsed, using original data")
                 return job_data
                 
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"AI enhancement failed: {e}")
             return job_data
     
     def enhance_jobs_batch(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Enhance multiple jobs with rate limiting
+        Enhance multiple jobs concurrently under adaptive rate control
+        
+        Jobs whose completeness score reaches ``ai_completeness_threshold``
+        are returned untouched without an LLM call. Up to
+        ``ai_max_concurrency`` requests are in flight at once; the rate
+        controller narrows that window on 429s and widens it again while the
+        provider keeps accepting calls. With ``ai_batch_size`` > 1 several jobs
+        share one request (see ``_enhance_packed``).
         
         Args:
             jobs: List of raw job data
             
         Returns:
-            List of enhanced job data
+            List of enhanced job data, in the same order as ``jobs``
         """
-        if not self.is_enabled():
+        if not self.is_enabled() or not jobs:
             return jobs
         
-        enhanced_jobs = []
-        rate_limit_delay = self.settings.ai_rate_limit_delay
+        self.run_stats = self._empty_run_stats()
+        self.run_stats['jobs'] = len(jobs)
+        self.retry_policy.reset(self.settings.retry_budget)
+        threshold = self.settings.ai_completeness_threshold
+        pending = [i for i, job in enumerate(jobs) if self.completeness_score(job) < threshold]
+        self.run_stats['skipped_complete'] = len(jobs) - len(pending)
+        logger.info(f"{self.run_stats['skipped_complete']} of {len(jobs)} jobs already "
+                    f"complete (score >= {threshold}), skipping AI for them")
         
-        for i, job in enumerate(jobs):
-            logger.info(f"Enhancing job [{i+1}/{len(jobs)}]: {job.get('title', 'Unknown')}")
-            enhanced = self.enhance_job(job)
-            enhanced_jobs.append(enhanced)
+        to_enhance = [jobs[i] for i in pending]
+        if self.settings.ai_batch_size > 1:
+            enhanced = self._enhance_packed(to_enhance)
+        else:
+            total = len(to_enhance)
+            
+            def enhance_indexed(item):
+                i, job = item
+                logger.info(f"Enhancing job [{i+1}/{total}]: {job.get('title', 'Unknown')}")
+                return self.enhance_job(job, raise_errors=True, attempts=1)
             
-            # Rate limiting: delay between API calls
-            if i < len(jobs) - 1:
-                time.sleep(rate_limit_delay)
+            enhanced = self._map_concurrently(enhance_indexed, list(enumerate(to_enhance)),
+                                              lambda item: item[1])
         
+        enhanced_jobs = list(jobs)
+        for index, result in zip(pending, enhanced):
+            enhanced_jobs[index] = result
+        
+        logger.info(f"AI rate controller: {self.rate_controller.get_stats()}")
+        logger.info(f"AI retries: {self.retry_policy.summary()}")
         return enhanced_jobs
     
-    def _prepare_for_prompt(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare job data for prompt (serialize datetime, clean for AI)"""
+    def _map_concurrently(self, func, items: List[Any], fallback) -> List[Any]:
+        """
+        Apply ``func`` to ``items`` on up to ``ai_max_concurrency`` threads
+
+        ``func`` makes one OpenRouter attempt and raises when it fails. A
+        retryable failure waits on the retry scheduler's delay queue rather
+        than on a pool thread; an item that still fails gets
+        ``fallback(item)`` as its result. Results keep the order of ``items``.
+        """
+        if not items:
+            return []
+        max_workers = max(1, min(self.settings.ai_max_concurrency, len(items)))
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                RetryScheduler(executor, self.retry_policy) as retries:
+            futures = [retries.submit(func, item, attempts=3, retryable=is_retryable_ai_error,
+                                      site='openrouter')
+                       for item in items]
+            for item, future in zip(items, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"AI enhancement failed: {e}")
+                    results.append(fallback(item))
+        return results
+    
+    def _pack_batches(self, jobs: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Greedily pack job indexes into batches
+        
+        A batch closes when it holds ``ai_batch_size`` jobs or the next job
+        would push its estimated prompt tokens past ``ai_batch_token_budget``.
+        A job larger than the budget on its own gets a batch to itself.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, job in enumerate(jobs):
+            payload, _ = self._prepare_for_prompt(job)
+            tokens = estimate_tokens(json.dumps(payload, ensure_ascii=False, default=str))
+            if current and (len(current) >= self.settings.ai_batch_size
+                            or current_tokens + tokens > self.settings.ai_batch_token_budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _enhance_packed(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enhance jobs several per request
+        
+        Jobs missing from a batched answer, or answered with a malformed entry,
+        are retried with the single-job prompt so one bad entry never costs
+        the rest of the batch.
+        """
+        batches = self._pack_batches(jobs)
+        if not batches:
+            return []
+        logger.info(f"Enhancing {len(jobs)} jobs in {len(batches)} batched requests")
+        
+        def enhance_batch(indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+            if len(indexes) == 1:
+                return {indexes[0]: self.enhance_job(jobs[indexes[0]], raise_errors=True, attempts=1)}
+            return self._enhance_batch_request(jobs, indexes, attempts=1)
+        
+        def unanswered(indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+            # A failed batch leaves its jobs to the single-job fallback below
+            return {indexes[0]: jobs[indexes[0]]} if len(indexes) == 1 else {}
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        for answered in self._map_concurrently(enhance_batch, batches, unanswered):
+            for index, enhanced in answered.items():
+                results[index] = enhanced
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"{len(missing)} jobs missing from batched responses, "
+                           f"falling back to single-job calls")
+            self._count('fallback_jobs', len(missing))
+            retried = self._map_concurrently(
+                lambda job: self.enhance_job(job, raise_errors=True, attempts=1),
+                [jobs[i] for i in missing], lambda job: job
+            )
+            for index, enhanced in zip(missing, retried):
+                results[index] = enhanced
+        
+        return results
+    
+    def _enhance_batch_request(self, jobs: List[Dict[str, Any]], indexes: List[int],
+                               attempts: int = 3) -> Dict[int, Dict[str, Any]]:
+        """
+        Send one batched request; return the jobs it answered, by index
+
+        With ``attempts=1`` a retryable failure is raised for the caller's
+        delay queue to retry instead of being logged.
+        """
+        answered = {}
+        payload = []
+        job_ids = {}
+        requested = {}
+        for index in indexes:
+            job_for_prompt, truncated = self._prepare_for_prompt(jobs[index])
+            fields = self._requested_fields(jobs[index], truncated)
+            if not fields:
+                answered[index] = jobs[index]
+                continue
+            job_id = f"job-{len(payload) + 1}"
+            job_ids[job_id] = index
+            requested[index] = fields
+            payload.append({'job_id': job_id, **job_for_prompt})
+        if not payload:
+            return answered
+        
+        fields = set().union(*requested.values())
+        if len(fields) < len(EXTRACTION_FIELDS):
+            self._count('reduced_prompts')
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": BATCH_USER_PROMPT_TEMPLATE.format(
+                count=len(payload),
+                jobs_data=json.dumps(payload, ensure_ascii=False, default=str),
+                schema=render_schema(fields)
+            )}
+        ]
+        max_tokens = min(
+            self.settings.ai_batch_max_output_tokens,
+            sum(self._output_token_budget(f) for f in requested.values())
+        )
+        
+        try:
+            content = self._call_openrouter(
+                messages, max_tokens=max_tokens,
+                label=f"AI batch of {len(payload)} jobs", attempts=attempts
+            )
+        except Exception as e:
+            if attempts == 1 and is_retryable_ai_error(e):
+                raise
+            logger.error(f"Batched AI enhancement failed: {e}")
+            return answered
+        
+        for job_id, entry in self._parse_batch_response(content).items():
+            index = job_ids.get(job_id)
+            # An entry carrying nothing but its id is as good as missing
+            if index is None or len(entry) <= 1:
+                continue
+            enhanced = {k: v for k, v in entry.items() if k in requested[index]}
+            answered[index] = self._merge_job_data(jobs[index], enhanced)
+        
+        self._count('batched_requests')
+        self._count('batched_jobs', len(answered))
+        return answered
+    
+    def _prepare_for_prompt(self, job_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Prepare job data for prompt (serialize datetime, clean for AI)
+        
+        Text fields are compacted: legal/EEO boilerplate trimmed, paragraphs
+        repeated within or across fields dropped, and each field capped at
+        ``ai_prompt_field_token_cap`` tokens. The section fields are compacted
+        before the description, so a block they share stays in the section.
+        
+        Returns:
+            (prompt payload, names of text fields that had to be truncated)
+        """
         result = {}
+        compacted = {}
+        truncated = set()
+        seen_blocks: Set[str] = set()
+        for field in ('requirements', 'key_responsibilities', 'nice_to_have', 'description'):
+            value = job_data.get(field)
+            if isinstance(value, str) and value:
+                compacted[field], was_truncated = compact_text(
+                    value, self.settings.ai_prompt_field_token_cap, seen_blocks
+                )
+                if was_truncated:
+                    truncated.add(field)
         
         # Fields to include for AI
         include_fields = [
@@ -221,10 +711,12 @@ class AIEnhancer:
                 result[key] = value.isoformat()
             elif key in ['created_at', 'updated_at']:
                 continue  # Skip these for the AI
+            elif value is None or value == '':
+                continue  # Nothing to extract from, only costs tokens
             else:
-                result[key] = value
+                result[key] = compacted.get(key, value)
         
-        return result
+        return result, truncated
     
     def _parse_response(self, content: str) -> Optional[Dict[str, Any]]:
         """Parse JSON response from AI"""
@@ -250,6 +742,35 @@ class AIEnhancer:
             logger.debug(f"Response content: {content[:500]}...")
             return None
     
+    def _parse_batch_response(self, content: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a batched JSON array response into entries keyed by job_id
+        
+        Objects are decoded one at a time, so a response that was truncated
+        or garbled part-way still yields every entry before the damage.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        start = content.find('[')
+        if start < 0:
+            logger.error("Batched AI response contains no JSON array")
+            return entries
+        
+        decoder = json.JSONDecoder()
+        pos = start + 1
+        while True:
+            pos = content.find('{', pos)
+            if pos < 0:
+                break
+            try:
+                entry, pos = decoder.raw_decode(content, pos)
+            except json.JSONDecodeError:
+                logger.warning("Batched AI response is malformed past "
+                               f"{len(entries)} entries")
+                break
+            if isinstance(entry, dict) and isinstance(entry.get('job_id'), str):
+                entries[entry['job_id']] = entry
+        return entries
+    
     def _merge_job_data(self, original: Dict[str, Any], enhanced: Dict[str, Any]) -> Dict[str, Any]:
         """Merge enhanced data with original, preserving core fields"""
         result = original.copy()
@@ -277,7 +798,7 @@ class AIEnhancer:
                 value = enhanced[field]
                 
                 # For text fields, only replace if significantly improved
-                if field in ['description', 'key_responsibilities', 'requirements', 'nice_to_have']:
+                if field in TEXT_FIELDS:
                     current = original.get(field, '')
                     # Only replace if AI cleaned up markdown or original is poor
                     if value and (self._has_excessive_markdown(current) or len(current) < 50):
@@ -29,12 +29,29 @@ class Settings(BaseSettings):
     # Rate limiting
     request_delay_seconds: float = 2.0
     max_retries: int = 3
+    retry_budget: int = 200  # Retries allowed across a scrape or AI batch run
+    html_parser: str = "auto"  # "auto" uses lxml when installed, else "html.parser"
+    fetch_max_bytes: int = 2 * 1024 * 1024  # Response bodies are read up to this size
     
     # AI Enhancement (OpenRouter)
     openrouter_api_key: Optional[str] = None
     openrouter_model: str = "anthropic/claude-3-haiku"  # Fast & cheap
+    openrouter_base_url: str = "https://openrouter.ai/api/v1"  # Point at a local stand-in to benchmark
     enable_ai_enhancement: bool = True
-    ai_rate_limit_delay: float = 1.0  # Delay between AI calls
+    ai_rate_limit_delay: float = 1.0  # Cool-down after a 429 without Retry-After
+    ai_max_concurrency: int = 4  # Max in-flight AI calls (AIMD window ceiling)
+    ai_batch_size: int = 1  # Jobs packed into one AI request (1 = one call per job)
+    ai_batch_token_budget: int = 6000  # Estimated input tokens of job data per batched request
+    ai_batch_max_output_tokens: int = 4096  # Completion cap for a batched request
+    ai_prompt_field_token_cap: int = 1000  # Estimated tokens per text field sent to the AI
+    ai_completeness_threshold: float = 0.7  # Jobs this complete skip the AI (above 1 = never skip)
+    
+    # Background enhancement: insert jobs first, enhance them later from a queue
+    ai_background_enhancement: bool = False
+    enhancement_queue_path: str = "data/enhancement_queue.db"  # SQLite file, keep on a volume
+    enhancement_poll_seconds: float = 5.0  # Worker sleep when the queue is empty
+    enhancement_max_attempts: int = 5  # Attempts before a job is dead-lettered
+    enhancement_retry_base_seconds: float = 60.0  # Backoff base, doubled per attempt
     
     # Security
     admin_api_key: Optional[str] = None  # Required for trigger endpoints
@@ -12,6 +12,10 @@ from urllib.parse import urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
 
+from app.config import get_settings
+from app.utils.bounded_fetch import DEFAULT_MAX_BYTES, BoundedFetcher
+from app.utils.safe_extract import find_emails
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +24,7 @@ class ContactExtractor:
     
     # Common email patterns to look for
     EMAIL_PATTERNS = [
-        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+        re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
     ]
     
     # Priority keywords for career-related emails
@@ -61,11 +65,13 @@ class ContactExtractor:
         'Accept-Language': 'en-US,en;q=0.5',
     }
     
-    def __init__(self, timeout: int = 10, max_retries: int = 2):
+    def __init__(self, timeout: int = 10, max_retries: int = 2, max_bytes: int = DEFAULT_MAX_BYTES):
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
+        # Probed paths can serve PDFs or huge bundles; read pages only, capped
+        self.fetcher = BoundedFetcher(max_bytes)
     
     def extract_contact_info(self, company_url: Optional[str], company_name: str, 
                              description: str = '') -> Dict[str, Optional[str]]:
@@ -141,7 +147,7 @@ class ContactExtractor:
         if not text:
             return None
         
-        emails = re.findall(self.EMAIL_PATTERNS[0], text)
+        emails = find_emails(self.EMAIL_PATTERNS[0], text)
         
         # Prioritize career-related emails
         for email in emails:
@@ -189,7 +195,7 @@ class ContactExtractor:
         for path in self.CAREER_PATHS:
             careers_url = urljoin(base_url, path)
             try:
-                response = self.session.get(careers_url, timeout=self.timeout, allow_redirects=True)
+                response = self.fetcher.get(self.session, careers_url, timeout=self.timeout, allow_redirects=True)
                 if response.status_code == 200:
                     # Check if this looks like a careers page
                     text = response.text.lower()
@@ -214,7 +220,7 @@ class ContactExtractor:
         for path in self.CONTACT_PATHS:
             contact_url = urljoin(base_url, path)
             try:
-                response = self.session.get(contact_url, timeout=self.timeout, allow_redirects=True)
+                response = self.fetcher.get(self.session, contact_url, timeout=self.timeout, allow_redirects=True)
                 if response.status_code == 200:
                     email = self._extract_email_from_text(response.text)
                     if email:
@@ -291,4 +297,4 @@ class ContactExtractor:
 
 
 # Global instance
-contact_extractor = ContactExtractor()
+contact_extractor = ContactExtractor(max_bytes=get_settings().fetch_max_bytes)
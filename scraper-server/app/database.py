@@ -8,13 +8,25 @@ from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Columns background enhancement may write; anything else is never updated
+ENHANCEABLE_COLUMNS = frozenset({
+    'company', 'company_website', 'industry', 'job_level', 'employment_type',
+    'work_arrangement', 'country', 'city', 'specific_location',
+    'salary_min', 'salary_max', 'currency', 'salary_type',
+    'years_experience', 'education_level',
+    'required_certifications', 'preferred_certifications',
+    'required_skills', 'preferred_skills',
+    'wcag_level', 'accessibility_focus', 'assistive_tech_experience',
+    'description', 'key_responsibilities', 'requirements', 'nice_to_have',
+})
+
 
 class Database:
     """Database connection pool and job operations"""
@@ -180,6 +192,41 @@ class Database:
             logger.error(f"Error inserting job: {e}")
             return None
     
+    def update_job_fields(self, job_id: str, fields: Dict[str, Any],
+                          expected_updated_at: datetime) -> bool:
+        """
+        Update selected columns of a job, guarded by optimistic locking
+        
+        The row is only written if its ``updated_at`` still equals
+        ``expected_updated_at``, so edits made since the job was read (by an
+        admin, or a later scrape) are never overwritten.
+        
+        Returns:
+            True if the row was updated, False if it changed or no longer exists
+        """
+        columns = [column for column in fields if column in ENHANCEABLE_COLUMNS]
+        if not columns:
+            return True
+        
+        assignments = sql.SQL(', ').join(
+            sql.SQL('{} = {}').format(sql.Identifier(column), sql.Placeholder(column))
+            for column in columns
+        )
+        query = sql.SQL(
+            "UPDATE jobs SET {}, updated_at = %(new_updated_at)s "
+            "WHERE id = %(job_id)s AND updated_at = %(expected_updated_at)s"
+        ).format(assignments)
+        params = {column: fields[column] for column in columns}
+        params.update({
+            'job_id': job_id,
+            'expected_updated_at': expected_updated_at,
+            'new_updated_at': datetime.now(),
+        })
+        
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.rowcount == 1
+    
     def get_job_count(self) -> int:
         """Get total number of jobs in database"""
         try:
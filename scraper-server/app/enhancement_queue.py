@@ -0,0 +1,278 @@
+"""
+Durable background AI enhancement queue
+
+In background mode jobs are inserted as soon as they are scraped and queued
+here; a worker thread enhances them later and writes back only the fields
+the AI changed. An OpenRouter slowdown therefore delays enhancement, never
+new postings going live.
+
+The queue is a local SQLite file so pending work survives restarts.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.ai_enhancer import ai_enhancer
+from app.config import get_settings
+from app.database import ENHANCEABLE_COLUMNS, db
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+IN_PROGRESS = 'in_progress'
+DEAD = 'dead'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS enhancement_queue (
+    job_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expected_updated_at TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_enhancement_queue_due
+    ON enhancement_queue (status, next_attempt_at);
+"""
+
+
+def _json_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+class EnhancementQueue:
+    """SQLite-backed queue of inserted jobs awaiting AI enhancement"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.settings = get_settings()
+        self.path = path or self.settings.enhancement_queue_path
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection, creating the file and schema on first use"""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    conn = sqlite3.connect(self.path)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(SCHEMA)
+                    finally:
+                        conn.close()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def enqueue(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """Queue an inserted job; ``job_data['updated_at']`` is the lock version"""
+        now = time.time()
+        expected = job_data['updated_at']
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO enhancement_queue "
+                "(job_id, payload, expected_updated_at, status, attempts, "
+                " next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+                (str(job_id), json.dumps(job_data, default=_json_default),
+                 _json_default(expected), PENDING, now, now, now)
+            )
+
+    def claim(self, limit: int) -> List[Dict[str, Any]]:
+        """Mark up to ``limit`` due jobs in progress and return them"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT job_id, payload, expected_updated_at, attempts "
+                "FROM enhancement_queue WHERE status = ? AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (PENDING, now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE enhancement_queue SET status = ?, updated_at = ? WHERE job_id = ?",
+                [(IN_PROGRESS, now, row['job_id']) for row in rows]
+            )
+        return [
+            {
+                'job_id': row['job_id'],
+                'job': json.loads(row['payload']),
+                'expected_updated_at': datetime.fromisoformat(row['expected_updated_at']),
+                'attempts': row['attempts'],
+            }
+            for row in rows
+        ]
+
+    def complete(self, job_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM enhancement_queue WHERE job_id = ?", (job_id,))
+
+    def fail(self, job_id: str, error: str) -> bool:
+        """
+        Record a failed attempt, scheduling a retry with exponential backoff
+
+        Returns:
+            True if the job was dead-lettered (no attempts left)
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM enhancement_queue WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            attempts = row['attempts'] + 1
+            dead = attempts >= self.settings.enhancement_max_attempts
+            delay = self.settings.enhancement_retry_base_seconds * 2 ** (attempts - 1)
+            conn.execute(
+                "UPDATE enhancement_queue SET status = ?, attempts = ?, "
+                "next_attempt_at = ?, last_error = ?, updated_at = ? WHERE job_id = ?",
+                (DEAD if dead else PENDING, attempts, now + delay,
+                 error[:1000], now, job_id)
+            )
+        return dead
+
+    def recover_in_progress(self) -> int:
+        """Return jobs left in progress by a crashed or stopped worker to the queue"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE enhancement_queue SET status = ?, updated_at = ? WHERE status = ?",
+                (PENDING, time.time(), IN_PROGRESS)
+            )
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM enhancement_queue GROUP BY status"
+            ).fetchall())
+            oldest = conn.execute(
+                "SELECT MIN(created_at) FROM enhancement_queue WHERE status = ?", (PENDING,)
+            ).fetchone()[0]
+            dead_letters = [
+                dict(row) for row in conn.execute(
+                    "SELECT job_id, attempts, last_error FROM enhancement_queue "
+                    "WHERE status = ? ORDER BY updated_at DESC LIMIT 10", (DEAD,)
+                )
+            ]
+        return {
+            'pending': counts.get(PENDING, 0),
+            'in_progress': counts.get(IN_PROGRESS, 0),
+            'dead': counts.get(DEAD, 0),
+            'oldest_pending_seconds': round(time.time() - oldest, 1) if oldest else None,
+            'recent_dead_letters': dead_letters,
+        }
+
+
+class EnhancementWorker:
+    """Background thread draining the enhancement queue"""
+
+    def __init__(self, queue: EnhancementQueue):
+        self.settings = get_settings()
+        self.queue = queue
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {'enhanced': 0, 'unchanged': 0, 'conflicts': 0, 'retried': 0, 'dead_lettered': 0}
+
+    def start(self):
+        if self.is_running():
+            return
+        recovered = self.queue.recover_in_progress()
+        if recovered:
+            logger.info(f"Re-queued {recovered} jobs left in progress")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='enhancement-worker', daemon=True
+        )
+        self._thread.start()
+        logger.info("Enhancement worker started")
+
+    def stop(self, timeout: float = 30.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+            logger.info("Enhancement worker stopped")
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _run(self):
+        workers = max(1, self.settings.ai_max_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while not self._stop.is_set():
+                try:
+                    items = self.queue.claim(workers)
+                except Exception as e:
+                    logger.error(f"Enhancement queue claim failed: {e}")
+                    items = []
+                if not items:
+                    self._stop.wait(self.settings.enhancement_poll_seconds)
+                    continue
+                list(executor.map(self.process, items))
+
+    def process(self, item: Dict[str, Any]) -> None:
+        """Enhance one queued job and write back only the fields that changed"""
+        job_id = item['job_id']
+        original = item['job']
+        try:
+            enhanced = ai_enhancer.enhance_job(original, raise_errors=True)
+            changed = {
+                column: enhanced[column] for column in ENHANCEABLE_COLUMNS
+                if column in enhanced and enhanced[column] != original.get(column)
+            }
+            if not changed:
+                self._count('unchanged')
+            elif db.update_job_fields(job_id, changed, item['expected_updated_at']):
+                self._count('enhanced')
+            else:
+                # Edited or deleted since insert; the newer row wins
+                logger.info(f"Job {job_id} changed since insert, discarding AI update")
+                self._count('conflicts')
+            self.queue.complete(job_id)
+        except Exception as e:
+            if self.queue.fail(job_id, str(e)):
+                logger.error(f"Job {job_id} dead-lettered after repeated failures: {e}")
+                self._count('dead_lettered')
+            else:
+                logger.warning(f"Enhancement of job {job_id} failed, will retry: {e}")
+                self._count('retried')
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        return {'running': self.is_running(), **stats}
+
+
+# Global queue and worker instances
+enhancement_queue = EnhancementQueue()
+enhancement_worker = EnhancementWorker(enhancement_queue)
@@ -13,7 +13,9 @@ from fastapi.security import APIKeyHeader
 
 from app import __version__
 from app.config import get_settings
+from app.ai_enhancer import ai_enhancer
 from app.database import db
+from app.enhancement_queue import enhancement_queue, enhancement_worker
 from app.scheduler import job_scheduler
 from app.scrapers.manager import scraper_manager
 from app.models import HealthResponse, ScrapeStatus
@@ -60,11 +62,18 @@ async def lifespan(app: FastAPI):
     job_scheduler.start()
     logger.info("Scheduler started")
     
+    # Start background enhancement worker
+    settings = get_settings()
+    if (settings.ai_background_enhancement and settings.enable_ai_enhancement
+            and ai_enhancer.is_enabled()):
+        enhancement_worker.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down scraper server...")
     job_scheduler.stop()
+    enhancement_worker.stop()
     db.disconnect()
     logger.info("Shutdown complete")
 
@@ -164,6 +173,17 @@ async def get_scrape_status():
     }
 
 
+@app.get("/api/enhancement/status", tags=["Scraping"])
+async def get_enhancement_status():
+    """Get background AI enhancement queue and worker status"""
+    settings = get_settings()
+    return {
+        "enabled": settings.ai_background_enhancement,
+        "worker": enhancement_worker.get_status(),
+        "queue": await asyncio.to_thread(enhancement_queue.get_stats)
+    }
+
+
 # ============ Stats Endpoints ============
 
 @app.get("/api/stats", tags=["Stats"])
@@ -14,6 +14,9 @@ from bs4 import BeautifulSoup
 
 from app.scrapers.base import BaseScraper
 from app.config import get_settings
+from app.utils.bounded_fetch import BoundedFetcher
+from app.utils.html_parsing import HtmlParser
+from app.utils.retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -34,22 +37,24 @@ class A11yJobsScraper(BaseScraper):
         super().__init__("a11yjobs")
         self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
+        self.html = HtmlParser(self.settings.html_parser)
+        self.fetcher = BoundedFetcher(self.settings.fetch_max_bytes)
+        self.retry_policy = RetryPolicy(self.settings.retry_budget, base=self.delay)
+    
+    def _load_page(self, url: str) -> Optional[BeautifulSoup]:
+        response = self.fetcher.get(self.session, url, timeout=10)
+        response.raise_for_status()
+        if response.skipped:
+            return None
+        return self.html.parse(response.content)
     
     def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage with retries"""
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    logger.warning(f"[A11yJobs] Retry {attempt + 1}/{self.max_retries} for {url}")
-                    self.wait(multiplier=2 ** attempt)
-                else:
-                    logger.error(f"[A11yJobs] Failed to fetch {url}: {e}")
-                    return None
-        return None
+        """Fetch and parse a webpage, retrying transient failures"""
+        try:
+            return self.retry_policy.call(self._load_page, url, attempts=self.max_retries, site='page')
+        except Exception as e:
+            logger.error(f"[A11yJobs] Failed to fetch {url}: {e}")
+            return None
     
     def _extract_job_links(self, soup: BeautifulSoup) -> List[str]:
         """Extract job detail page URLs from listing page"""
@@ -141,6 +146,7 @@ class A11yJobsScraper(BaseScraper):
     def scrape(self) -> List[Dict[str, Any]]:
         """Scrape jobs from a11yjobs.com"""
         logger.info("[A11yJobs] Starting scrape")
+        self.retry_policy.reset(self.settings.retry_budget)
         
         # Fetch main listing page
         soup = self._fetch_page(self.BASE_URL)
@@ -182,6 +188,9 @@ class A11yJobsScraper(BaseScraper):
             self.wait()
         
         logger.info(f"[A11yJobs] Total jobs scraped: {len(mapped_jobs)}")
+        logger.info(f"[A11yJobs] {self.html.summary()}")
+        logger.info(f"[A11yJobs] {self.fetcher.summary()}")
+        logger.info(f"[A11yJobs] {self.retry_policy.summary()}")
         return mapped_jobs
     
     def map_to_schema(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
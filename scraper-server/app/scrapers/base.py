@@ -8,14 +8,28 @@ import re
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 from app.config import get_settings
 from app.models import ScrapeResult
 from app.contact_extractor import contact_extractor
+from app.utils.company_patterns import company_engine
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.safe_extract import ExtractionBudget, find_emails
 
 logger = logging.getLogger(__name__)
 
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Company mentions are looked for near the top of the description only
+COMPANY_SCAN_CHARS = 800
+
+
+@lru_cache(maxsize=None)
+def _keyword_matcher(terms: Tuple[str, ...], ignore_case: bool = True) -> KeywordMatcher:
+    """One compiled matcher per vocabulary, shared by every scraper instance"""
+    return KeywordMatcher(terms, ignore_case=ignore_case)
+
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers"""
@@ -54,41 +68,32 @@ class BaseScraper(ABC):
         time.sleep(self.delay * multiplier)
     
     def extract_skills(self, text: str) -> List[str]:
-        """Extract accessibility skills from text"""
+        """Extract accessibility skills from text, in order of first mention"""
         if not text:
             return []
         
-        text_lower = text.lower()
-        found = []
-        
-        for skill in self.ACCESSIBILITY_SKILLS:
-            if skill.lower() in text_lower:
-                found.append(skill)
-        
-        return list(set(found))[:10]  # Limit to 10
+        matcher = _keyword_matcher(tuple(self.ACCESSIBILITY_SKILLS))
+        return matcher.find(text)[:10]  # Limit to 10
     
     def extract_certifications(self, text: str) -> List[str]:
         """Extract certifications from text"""
         if not text:
             return []
         
-        text_lower = text.lower()
-        found = []
-        
-        for cert in self.ACCESSIBILITY_CERTS:
-            if cert.lower() in text_lower:
-                found.append(cert)
-        
-        return list(set(found))
+        # Acronyms match case-sensitively so the word "was" is not a WAS cert
+        acronyms = tuple(c for c in self.ACCESSIBILITY_CERTS if c.isupper())
+        names = tuple(c for c in self.ACCESSIBILITY_CERTS if not c.isupper())
+        found = _keyword_matcher(acronyms, ignore_case=False).find(text)
+        found += _keyword_matcher(names).find(text)
+        return found
     
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email from text"""
         if not text:
             return None
         
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(pattern, text)
-        return match.group(0) if match else None
+        emails = find_emails(EMAIL_RE, text)
+        return emails[0] if emails else None
     
     def determine_job_level(self, title: str, description: str = '') -> str:
         """Determine job level from title and description"""
@@ -196,53 +201,20 @@ class BaseScraper(ABC):
         if not description:
             return None
         
-        # Clean up the description first
-        clean_desc = description.replace('\\n', '\n').replace('\\-', '-')
-        
-        # Common patterns for company mentions - ordered by reliability
-        patterns = [
-            # "Company Name is seeking/looking/hiring..." - very reliable
-            r'^([A-Z][A-Za-z0-9\s&.,\'\-]+?)\s+is\s+(?:seeking|looking|hiring|searching|recruiting)',
-            # "At Company Name, we..."
-            r'^At\s+([A-Z][A-Za-z0-9\s&.,\'\-]+?),\s+(?:we|our)',
-            # "Join Company Name" or "Join the Company Name team"
-            r'^Join\s+(?:the\s+)?([A-Z][A-Za-z0-9\s&.,\'\-]+?)(?:\s+team)?\s+',
-            # "About Company Name:" at start
-            r'^About\s+([A-Z][A-Za-z0-9\s&.,\'\-]+?):',
-            # "Company Name - Job Title" at start
-            r'^\*?\*?([A-Z][A-Za-z0-9\s&.,\'\-]+?)\*?\*?\s*[\-–—]\s*',
-            # "Company Name is a..." or "Company Name is an..."
-            r'^([A-Z][A-Za-z0-9\s&.,\'\-]+?)\s+is\s+(?:a|an)\s+',
-            # "Work at Company Name" or "Working at Company Name"
-            r'^Work(?:ing)?\s+(?:at|for|with)\s+([A-Z][A-Za-z0-9\s&.,\'\-]+)',
-            # University/College patterns - very specific
-            r'((?:University|College|Institute)\s+(?:of\s+)?[A-Za-z\s]+?)(?:\s+is|\s+-|,)',
-            # "Company Name\n Location" pattern common in JobSpy
-            r'^\*?\*?([A-Z][A-Za-z0-9\s&.,\'\-]+?)\*?\*?\n[A-Z][a-z]+,\s*[A-Z]{2}',
-            # "Posted by Company Name"
-            r'Posted\s+by\s+([A-Z][A-Za-z0-9\s&.,\'\-]+)',
-            # "Company Name offers/provides..."
-            r'^([A-Z][A-Za-z0-9\s&.,\'\-]+?)\s+(?:offers|provides|has|needs)',
-            # Bold company name: "**Company Name**"
-            r'^\*\*([A-Z][A-Za-z0-9\s&.,\'\-]+?)\*\*',
-            # Company name followed by industries
-            r'^([A-Z][A-Za-z0-9\s&.,\'\-]+?),?\s+(?:a\s+)?(?:leading|global|innovative|premier)',
-            # "Welcome to Company Name"
-            r'Welcome\s+to\s+([A-Z][A-Za-z0-9\s&.,\'\-]+)',
-            # Email domain extraction: careers@companyname.com -> Company Name
-            r'(?:careers?|jobs?|hr|recruiting|employment)@([a-z0-9]+)\.(?:com|org|net|io)',
-        ]
+        # Clean up the description first. Unescaping at most halves the
+        # length, so twice the scan window is all that can reach it.
+        clean_desc = description[:2 * COMPANY_SCAN_CHARS].replace('\\n', '\n').replace('\\-', '-')
+        clean_desc = clean_desc[:COMPANY_SCAN_CHARS]
+        
+        def accept(captured: str) -> Optional[str]:
+            company = self._clean_company_name(captured.strip())
+            return company if self.is_valid_company_name(company) else None
         
-        for pattern in patterns:
-            match = re.search(pattern, clean_desc[:800], re.MULTILINE | re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                # Clean up the extracted name
-                company = self._clean_company_name(company)
-                # Validate it looks like a company name
-                if self.is_valid_company_name(company):
-                    logger.debug(f"Extracted company '{company}' using pattern")
-                    return company
+        found = company_engine.best(clean_desc, accept, ExtractionBudget())
+        if found:
+            rule, company = found
+            logger.debug(f"Extracted company '{company}' using rule '{rule}'")
+            return company
         
         return None
     
@@ -8,11 +8,13 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 from app.config import get_settings
+from app.contact_extractor import contact_extractor
 from app.database import db
 from app.models import ScrapeResult
 from app.scrapers.jobspy_scraper import JobSpyScraper
 from app.scrapers.a11yjobs_scraper import A11yJobsScraper
 from app.ai_enhancer import ai_enhancer
+from app.enhancement_queue import enhancement_queue
 
 logger = logging.getLogger(__name__)
 
@@ -108,12 +110,20 @@ class ScraperManager:
                         'error': str(e)
                     })
             
+            logger.info(f"[Contact probes] {contact_extractor.fetcher.summary()}")
+            
             # Deduplicate all jobs
             unique_jobs = self._deduplicate_jobs(all_jobs)
             
-            # AI Enhancement step (if enabled)
+            # AI Enhancement step (if enabled). In background mode jobs are
+            # inserted as scraped and queued for the enhancement worker.
             enhanced_jobs = unique_jobs
-            if self.settings.enable_ai_enhancement and ai_enhancer.is_enabled():
+            ai_available = self.settings.enable_ai_enhancement and ai_enhancer.is_enabled()
+            background = ai_available and self.settings.ai_background_enhancement
+            if background:
+                results['ai_enhancement'] = {'enabled': True, 'mode': 'background', 'jobs_queued': 0}
+                logger.info("AI enhancement deferred to the background queue")
+            elif ai_available:
                 logger.info("=== Running AI enhancement ===")
                 ai_start = time.time()
                 enhanced_jobs = ai_enhancer.enhance_jobs_batch(unique_jobs)
@@ -121,8 +131,13 @@ class ScraperManager:
                 logger.info(f"AI enhancement completed in {ai_duration:.2f}s")
                 results['ai_enhancement'] = {
                     'enabled': True,
-                    'jobs_enhanced': len(enhanced_jobs),
-                    'duration_seconds': round(ai_duration, 2)
+                    'mode': 'inline',
+                    'jobs_enhanced': len(enhanced_jobs) - ai_enhancer.run_stats['skipped_complete'],
+                    'jobs_skipped_complete': ai_enhancer.run_stats['skipped_complete'],
+                    'duration_seconds': round(ai_duration, 2),
+                    'rate_controller': ai_enhancer.rate_controller.get_stats(),
+                    'retries': ai_enhancer.retry_policy.stats(),
+                    'run_stats': dict(ai_enhancer.run_stats)
                 }
             else:
                 results['ai_enhancement'] = {'enabled': False}
@@ -135,9 +150,18 @@ class ScraperManager:
             
             for job in enhanced_jobs:
                 try:
+                    # insert_job fills column defaults into the job in place, so
+                    # score and snapshot it as scraped, before they look like data
+                    scraped = None
+                    if background and (ai_enhancer.completeness_score(job)
+                                       < self.settings.ai_completeness_threshold):
+                        scraped = dict(job)
                     job_id = db.insert_job(job)
                     if job_id:
                         inserted += 1
+                        if scraped is not None:
+                            enhancement_queue.enqueue(job_id, {**scraped, 'updated_at': job['updated_at']})
+                            results['ai_enhancement']['jobs_queued'] += 1
                     else:
                         skipped += 1  # Duplicate or insertion returned None
                 except Exception as e:
@@ -0,0 +1,96 @@
+"""
+Bounded HTTP reads for scrapers and contact probes
+
+``session.get`` reads the whole body before anything looks at it, so a
+careers link that turns out to be a PDF, an image or a multi-megabyte app
+bundle is downloaded in full. BoundedFetcher streams instead: bodies that
+are not HTML, JSON or text are dropped on their headers, a Content-Length
+over the cap is not read at all, and longer streams stop at the cap. Only
+the prefix that was read is decoded. The daily pipeline has the same helper
+(fetch_bounded in scripts/a11yjobs_http.py).
+"""
+
+from typing import Any, List, NamedTuple, Optional
+
+import requests
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+CHUNK_BYTES = 64 * 1024
+FETCHABLE_MEDIA_TYPES = frozenset({
+    'text/html', 'application/xhtml+xml', 'text/plain', 'application/json', 'application/ld+json',
+})
+
+
+class BoundedResponse(NamedTuple):
+    status_code: int
+    url: str
+    headers: Any
+    content: bytes
+    encoding: Optional[str]
+    skipped: Optional[str]  # 'content_type' or 'content_length' when the body was not read
+    truncated: bool
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class BoundedFetcher:
+    """
+    Streaming GETs capped at ``max_bytes``, with running totals
+
+    ``bytes_avoided`` counts the declared length of bodies that were skipped
+    or cut short; streams without a Content-Length only show as truncated.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.responses = 0
+        self.bytes_read = 0
+        self.bytes_avoided = 0
+        self.skipped = 0
+        self.truncated = 0
+
+    def get(self, session: requests.Session, url: str, **kwargs) -> BoundedResponse:
+        response = session.get(url, stream=True, **kwargs)
+        try:
+            headers = response.headers
+            media_type = str(headers.get('Content-Type') or '').split(';')[0].strip().lower()
+            length = str(headers.get('Content-Length') or '').strip()
+            declared = int(length) if length.isdigit() else None
+            skipped = None
+            if media_type and media_type not in FETCHABLE_MEDIA_TYPES:
+                skipped = 'content_type'
+            elif declared is not None and declared > self.max_bytes:
+                skipped = 'content_length'
+            chunks: List[bytes] = []
+            size = 0
+            truncated = False
+            if not skipped and response.status_code < 400:
+                for chunk in response.iter_content(CHUNK_BYTES):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        truncated = True
+                        break
+            content = b''.join(chunks)[:self.max_bytes]
+            result = BoundedResponse(
+                response.status_code, response.url, headers, content, response.encoding, skipped, truncated,
+            )
+        finally:
+            response.close()
+        self.responses += 1
+        self.bytes_read += len(content)
+        self.skipped += bool(skipped)
+        self.truncated += truncated
+        if declared is not None and declared > len(content) and (skipped or truncated):
+            self.bytes_avoided += declared - len(content)
+        return result
+
+    def summary(self) -> str:
+        return (f"{self.responses} responses, {self.bytes_read / 1024:.0f} KiB read, "
+                f"{self.bytes_avoided / 1024:.0f} KiB avoided ({self.skipped} skipped, {self.truncated} truncated)")
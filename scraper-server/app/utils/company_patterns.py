@@ -0,0 +1,131 @@
+"""
+Company-name extraction from the top of a job description
+
+The rules used to be 15 pattern strings handed to ``re.search`` in turn, so a
+description that matched none of them paid for 15 full scans, most of them
+lazy runs retried from every line start. Here each rule is compiled once and
+carries the keywords any match of it must contain. One pass folds the text
+(case and whitespace, the way ``re.IGNORECASE`` and ``\\s+`` see it), rules
+whose keywords are absent are skipped, and the rest are searched best rank
+first until the caller accepts a candidate.
+"""
+
+import re
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from app.utils.safe_extract import ExtractionBudget
+
+COMPANY_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE
+
+# Non-ASCII characters re.IGNORECASE matches to ASCII letters
+_IGNORECASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+_NAME = r'[A-Z][A-Za-z0-9\s&.,\'\-]'
+
+
+class CompanyRule(NamedTuple):
+    name: str
+    pattern: str
+    # Any match contains one of these, in folded text (empty: always searched)
+    keywords: Tuple[str, ...] = ()
+
+
+# Ordered by reliability; group 1 is the company name
+COMPANY_RULES: List[CompanyRule] = [
+    # "Company Name is seeking/looking/hiring..." - very reliable
+    CompanyRule('seeking', rf'^({_NAME}+?)\s+is\s+(?:seeking|looking|hiring|searching|recruiting)',
+                (' is seeking', ' is looking', ' is hiring', ' is searching', ' is recruiting')),
+    # "At Company Name, we..."
+    CompanyRule('at_company', rf'^At\s+({_NAME}+?),\s+(?:we|our)', (', we', ', our')),
+    # "Join Company Name" or "Join the Company Name team"
+    CompanyRule('join', rf'^Join\s+(?:the\s+)?({_NAME}+?)(?:\s+team)?\s+', ('join ',)),
+    # "About Company Name:" at start
+    CompanyRule('about', rf'^About\s+({_NAME}+?):', ('about ',)),
+    # "Company Name - Job Title" at start
+    CompanyRule('title_dash', rf'^\*?\*?({_NAME}+?)\*?\*?\s*[\-–—]\s*', ('-', '–', '—')),
+    # "Company Name is a..." or "Company Name is an..."
+    CompanyRule('is_a', rf'^({_NAME}+?)\s+is\s+(?:a|an)\s+', (' is a ', ' is an ')),
+    # "Work at Company Name" or "Working at Company Name"
+    CompanyRule('work_at', rf'^Work(?:ing)?\s+(?:at|for|with)\s+({_NAME}+)',
+                ('work at ', 'work for ', 'work with ', 'working at ', 'working for ', 'working with ')),
+    # University/College patterns - very specific
+    CompanyRule('institution', r'((?:University|College|Institute)\s+(?:of\s+)?[A-Za-z\s]+?)(?:\s+is|\s+-|,)',
+                ('university ', 'college ', 'institute ')),
+    # "Company Name\n Location" pattern common in JobSpy
+    CompanyRule('location_line', rf'^\*?\*?({_NAME}+?)\*?\*?\n[A-Z][a-z]+,\s*[A-Z]{{2}}', (',',)),
+    # "Posted by Company Name"
+    CompanyRule('posted_by', rf'Posted\s+by\s+({_NAME}+)', ('posted by ',)),
+    # "Company Name offers/provides..."
+    CompanyRule('offers', rf'^({_NAME}+?)\s+(?:offers|provides|has|needs)',
+                (' offers', ' provides', ' has', ' needs')),
+    # Bold company name: "**Company Name**"
+    CompanyRule('bold', rf'^\*\*({_NAME}+?)\*\*', ('**',)),
+    # Company name followed by industries
+    CompanyRule('industry', rf'^({_NAME}+?),?\s+(?:a\s+)?(?:leading|global|innovative|premier)',
+                (' leading', ' global', ' innovative', ' premier')),
+    # "Welcome to Company Name"
+    CompanyRule('welcome', rf'Welcome\s+to\s+({_NAME}+)', ('welcome to ',)),
+    # Email domain extraction: careers@companyname.com -> Company Name
+    CompanyRule('careers_email', r'(?:careers?|jobs?|hr|recruiting|employment)@([a-z0-9]+)\.(?:com|org|net|io)',
+                ('career@', 'careers@', 'job@', 'jobs@', 'hr@', 'recruiting@', 'employment@')),
+]
+
+
+def fold_for_keywords(text: str) -> str:
+    """
+    Lower-case ``text`` and collapse whitespace runs to one space, so a
+    keyword written with single spaces is present whenever an ignore-case
+    pattern spelling it with ``\\s+`` could match
+    """
+    return _WHITESPACE_RUN_RE.sub(' ', text.translate(_IGNORECASE_FOLDS).lower())
+
+
+class CompanyPatternEngine:
+    """
+    Ranked company-name candidates from one description
+
+    Rules are tried in rank order, as the sequential searches were, and a
+    rule's search is skipped when none of its keywords is in the folded
+    text. Skipping only ever drops rules that could not have matched, so the
+    first candidate the caller accepts is the one it always got.
+    """
+
+    def __init__(self, rules: List[CompanyRule], flags: int = COMPANY_PATTERN_FLAGS):
+        self.rules = list(rules)
+        self._compiled = []
+        for rule in self.rules:
+            compiled = re.compile(rule.pattern, flags)
+            if compiled.groups != 1:
+                raise ValueError(f"Company rule '{rule.name}' must have exactly one group")
+            self._compiled.append(compiled)
+
+    def candidates(self, text: str) -> Iterator[Tuple[str, str]]:
+        """``(rule name, raw capture)`` for every rule that matches, best rank first"""
+        if not text:
+            return
+        folded = fold_for_keywords(text)
+        for rule, compiled in zip(self.rules, self._compiled):
+            if rule.keywords and not any(keyword in folded for keyword in rule.keywords):
+                continue
+            match = compiled.search(text)
+            if match:
+                yield rule.name, match.group(1)
+
+    def best(self, text: str, accept: Callable[[str], Optional[str]],
+             budget: Optional[ExtractionBudget] = None) -> Optional[Tuple[str, str]]:
+        """
+        ``(rule name, name)`` for the best-ranked candidate ``accept`` turns
+        into a name; None if there is none or ``budget`` runs out first
+        """
+        for rule_name, captured in self.candidates(text):
+            if budget is not None and budget.exhausted(len(text)):
+                return None
+            company = accept(captured)
+            if company:
+                return rule_name, company
+        return None
+
+
+company_engine = CompanyPatternEngine(COMPANY_RULES)
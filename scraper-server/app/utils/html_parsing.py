@@ -0,0 +1,59 @@
+"""
+HTML parsing with the fastest installed BeautifulSoup tree builder
+
+Pages used to be parsed with the pure-Python 'html.parser'. HtmlParser takes
+lxml when it is installed (HTML_PARSER=auto, the default) and times every
+parse so scrape logs show what parsing cost. The daily pipeline makes the
+same choice (scripts/a11yjobs_http.py).
+"""
+
+import time
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+HTML_PARSER_BACKENDS = ('lxml', 'html.parser')
+
+
+def resolve_html_parser(requested: str = 'auto') -> str:
+    """Tree builder for ``requested``: 'auto', 'lxml' or 'html.parser'"""
+    requested = (requested or 'auto').strip().lower()
+    if requested != 'auto' and requested not in HTML_PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser {requested!r}; expected auto or one of {HTML_PARSER_BACKENDS}")
+    if requested == 'html.parser':
+        return requested
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        if requested == 'lxml':
+            raise
+        return 'html.parser'
+    return 'lxml'
+
+
+class HtmlParser:
+    """
+    BeautifulSoup parses on one resolved backend, with running totals
+
+    Pass response bytes straight in: BeautifulSoup sniffs the declared
+    encoding itself instead of requests guessing it over the whole body.
+    ``parse_only`` builds just the nodes a caller reads.
+    """
+
+    def __init__(self, requested: str = 'auto'):
+        self.backend = resolve_html_parser(requested)
+        self.documents = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def parse(self, markup: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        start = time.perf_counter()
+        soup = BeautifulSoup(markup, self.backend, parse_only=parse_only)
+        self.seconds += time.perf_counter() - start
+        self.documents += 1
+        self.bytes += len(markup)
+        return soup
+
+    def summary(self) -> str:
+        return (f"{self.documents} pages ({self.bytes / 1024:.0f} KiB) parsed in "
+                f"{self.seconds * 1000:.0f} ms with {self.backend}")
@@ -0,0 +1,240 @@
+"""
+One retry policy for scraper fetches and AI calls
+
+Each call site used to retry in its own way: fixed doubling sleeps, or
+tenacity retrying every exception including 4xx answers that will never
+succeed. RetryPolicy retries only transient failures, waits a capped
+exponential backoff with jitter (never less than the server's Retry-After),
+and stops once the run's retry budget is spent. Retries, give-ups and time
+waited are counted per call site. RetryScheduler runs calls on a thread
+pool and parks their retries on a delay queue instead of a pool thread.
+The daily pipeline has the same pair (scripts/a11yjobs_http.py).
+"""
+
+import heapq
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+BASE_SECONDS = 1.0
+MAX_DELAY_SECONDS = 30.0
+MAX_RETRY_AFTER_SECONDS = 120.0  # A longer Retry-After gives up instead of waiting
+DEFAULT_BUDGET = 200
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(headers: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """Retry-After as seconds from now; the header may be a number or an HTTP date"""
+    value = str((headers or {}).get('Retry-After') or '').strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def error_retry_after(error: BaseException) -> Optional[float]:
+    """Retry-After of the response an error carries (requests or httpx), if any"""
+    response = getattr(error, 'response', None)
+    return retry_after_seconds(getattr(response, 'headers', None)) if response is not None else None
+
+
+def is_transient_http_error(error: BaseException) -> bool:
+    """Timeouts, dropped connections and 408/425/429/5xx gateway statuses"""
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in RETRYABLE_STATUSES
+    if isinstance(error, requests.exceptions.SSLError):
+        return False
+    return isinstance(error, (
+        requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError,
+    ))
+
+
+class RetryPolicy:
+    """
+    Backoff, Retry-After and a retry budget shared by a run's call sites
+
+    ``reset`` starts a new run. ``delay`` decides whether failed attempt
+    ``attempt`` is retried and after how long; ``call`` retries inline and
+    RetryScheduler retries on a delay queue.
+    """
+
+    def __init__(self, budget: Optional[int] = DEFAULT_BUDGET, base: float = BASE_SECONDS,
+                 max_delay: float = MAX_DELAY_SECONDS,
+                 max_retry_after: float = MAX_RETRY_AFTER_SECONDS,
+                 rng: Callable[[], float] = random.random,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.base = base
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.rng = rng
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self.reset(budget)
+
+    def reset(self, budget: Optional[int] = DEFAULT_BUDGET) -> None:
+        with self._lock:
+            self.budget = budget
+            self._counts: Dict[str, int] = Counter()
+            self._sites: Dict[str, Dict[str, Any]] = {}
+            self._waited = 0.0
+
+    def _site(self, site: str) -> Dict[str, Any]:
+        return self._sites.setdefault(site, {'retries': 0, 'gave_up': 0, 'wait_seconds': 0.0})
+
+    def delay(self, attempt: int, attempts: int, retry_after: Optional[float] = None,
+              site: str = 'other') -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up"""
+        with self._lock:
+            stats = self._site(site)
+            if attempt >= attempts or (retry_after is not None and retry_after > self.max_retry_after):
+                stats['gave_up'] += 1
+                return None
+            if self.budget is not None and self._counts['retries'] >= self.budget:
+                stats['gave_up'] += 1
+                self._counts['budget_exhausted'] += 1
+                return None
+            stats['retries'] += 1
+            self._counts['retries'] += 1
+        # Half the capped backoff, plus up to the other half at random
+        backoff = min(self.max_delay, self.base * 2 ** (attempt - 1))
+        seconds = backoff / 2 + self.rng() * backoff / 2
+        return max(seconds, retry_after or 0.0)
+
+    def record_wait(self, seconds: float, site: str = 'other', deferred: bool = False) -> None:
+        with self._lock:
+            self._site(site)['wait_seconds'] += seconds
+            self._waited += seconds
+            if deferred:
+                self._counts['deferred'] += 1
+
+    def wait(self, seconds: float, site: str = 'other') -> None:
+        self.sleep(seconds)
+        self.record_wait(seconds, site)
+
+    def call(self, func: Callable[..., Any], *args: Any, attempts: int = 3,
+             retryable: Callable[[BaseException], bool] = is_transient_http_error,
+             site: str = 'other', **kwargs: Any) -> Any:
+        """``func(*args, **kwargs)``, retried inline; the last error propagates"""
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as error:
+                if not retryable(error):
+                    raise
+                seconds = self.delay(attempt, attempts, error_retry_after(error), site)
+                if seconds is None:
+                    raise
+                self.wait(seconds, site)
+                attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'budget': self.budget,
+                'retries': self._counts['retries'],
+                'deferred': self._counts['deferred'],
+                'budget_exhausted': self._counts['budget_exhausted'],
+                'wait_seconds': round(self._waited, 1),
+                'sites': {
+                    site: {**stats, 'wait_seconds': round(stats['wait_seconds'], 1)}
+                    for site, stats in sorted(self._sites.items())
+                },
+            }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (f"{stats['retries']} retries, {stats['wait_seconds']} s waiting"
+                f"{' (budget exhausted)' if stats['budget_exhausted'] else ''}")
+
+
+class RetryScheduler:
+    """
+    Runs calls on ``executor`` and parks their retries on a delay queue
+
+    A failed attempt does not sleep on its worker: it goes onto a heap keyed
+    by when it is due, and a timer thread resubmits it to the executor then,
+    so the worker takes other calls meanwhile. ``submit`` returns a Future
+    for the final outcome. Use as a context manager inside the executor's
+    and collect every future before leaving it.
+    """
+
+    def __init__(self, executor: Any, policy: RetryPolicy,
+                 clock: Callable[[], float] = time.monotonic):
+        self.executor = executor
+        self.policy = policy
+        self.clock = clock
+        self._queue: List[Tuple[float, int, Tuple[Any, ...]]] = []
+        self._sequence = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._timer = threading.Thread(target=self._run_timer, name='retry-scheduler', daemon=True)
+        self._timer.start()
+
+    def __enter__(self) -> 'RetryScheduler':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit(self, func: Callable[..., Any], *args: Any, attempts: int = 3,
+               retryable: Callable[[BaseException], bool] = is_transient_http_error,
+               site: str = 'other') -> Future:
+        future: Future = Future()
+        self.executor.submit(self._attempt, future, (func, args, attempts, retryable, site), 1)
+        return future
+
+    def _attempt(self, future: Future, call: Tuple[Any, ...], attempt: int) -> None:
+        func, args, attempts, retryable, site = call
+        try:
+            result = func(*args)
+        except Exception as error:
+            seconds = (self.policy.delay(attempt, attempts, error_retry_after(error), site)
+                       if retryable(error) else None)
+            if seconds is None:
+                future.set_exception(error)
+                return
+            self.policy.record_wait(seconds, site, deferred=True)
+            with self._cond:
+                self._sequence += 1
+                heapq.heappush(self._queue, (self.clock() + seconds, self._sequence,
+                                             (future, call, attempt + 1)))
+                self._cond.notify()
+            return
+        future.set_result(result)
+
+    def _run_timer(self) -> None:
+        with self._cond:
+            while not self._closed:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+                due = self._queue[0][0] - self.clock()
+                if due > 0:
+                    self._cond.wait(due)
+                    continue
+                _, _, retry = heapq.heappop(self._queue)
+                self.executor.submit(self._attempt, *retry)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._timer.join()
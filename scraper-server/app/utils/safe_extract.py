@@ -0,0 +1,65 @@
+"""
+Bounded regex extraction over untrusted scraped text
+
+``re`` cannot be interrupted mid-match, so worst-case latency is bounded by
+capping what each extractor reads and keeping its regexes linear in that
+input. ExtractionBudget adds a cooperative work budget for loops that run
+many patterns; it counts characters scanned rather than seconds, so load on
+the machine or the worker pool cannot change what is extracted. The daily
+pipeline applies the same guards (scripts/run_a11yjobs_daily.py).
+"""
+
+import re
+from typing import List
+
+EMAIL_LOCAL_PART_MAX = 64
+EMAIL_DOMAIN_MAX = 255
+EXTRACTION_STEP_BUDGET = 200_000  # Characters scanned per extraction call
+
+
+class ExtractionBudget:
+    """Work budget checked before each step of one extraction call"""
+
+    __slots__ = ('remaining', 'tripped')
+
+    def __init__(self, steps: int = EXTRACTION_STEP_BUDGET):
+        self.remaining = steps
+        self.tripped = False
+
+    def exhausted(self, cost: int = 1) -> bool:
+        """True once a step of ``cost`` would overrun the budget"""
+        if not self.tripped:
+            if cost > self.remaining:
+                self.tripped = True
+            else:
+                self.remaining -= cost
+        return self.tripped
+
+
+def find_emails(pattern: 're.Pattern[str]', text: str) -> List[str]:
+    """
+    ``pattern.findall(text)`` for an email pattern, in linear time
+
+    Searched plainly, a long run of local-part characters without an '@' is
+    retried from every position in the run. Here each '@' is matched only
+    within its own window: from the previous '@' and at most
+    EMAIL_LOCAL_PART_MAX characters back, up to the next '@' and at most
+    EMAIL_DOMAIN_MAX characters ahead. Only addresses beyond those RFC 5321
+    limits can differ from ``findall``.
+    """
+    found: List[str] = []
+    last_end = 0
+    previous_at = -1
+    at = text.find('@')
+    while at != -1:
+        next_at = text.find('@', at + 1)
+        window_end = at + 1 + EMAIL_DOMAIN_MAX
+        if next_at != -1:
+            window_end = min(window_end, next_at)
+        match = pattern.search(text, max(last_end, previous_at + 1, at - EMAIL_LOCAL_PART_MAX), window_end)
+        if match and match.start() <= at:
+            found.append(match.group(0))
+            last_end = match.end()
+        previous_at = at
+        at = next_at
+    return found
@@ -0,0 +1,85 @@
+"""
+Prompt compaction for scraped job text
+
+Scraped descriptions carry legal/EEO boilerplate, blocks repeated across the
+description/requirements split and markdown padding. None of it helps the
+model extract fields, and all of it is billed as input tokens.
+"""
+
+import re
+from typing import Optional, Set, Tuple
+
+# Same markers the daily pipeline trims on (scripts/run_a11yjobs_daily.py)
+LEGAL_BOILERPLATE_MARKERS = [
+    re.compile(r"\bEEO Statement\b", re.I),
+    re.compile(r"\bEqual Employment Opportunity Employer\b", re.I),
+    re.compile(r"\bis an [Ee]qual [Oo]pportunity [Ee]mployer\b"),
+    re.compile(r"\bADA Accommodations\b", re.I),
+    re.compile(r"\bSupplemental Contact Information\b", re.I),
+    re.compile(r"\bVeterans[’']? and National Guard Preference\b", re.I),
+    re.compile(r"\bApplication Process\b\s*\*\*", re.I),
+    re.compile(r"Only those lawfully authorized to work in the designated country\b", re.I),
+]
+
+BLOCK_SPLIT = re.compile(r'\n\s*\n')
+WHITESPACE = re.compile(r'\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting prompts (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+def trim_legal_boilerplate(text: str) -> str:
+    """Cut everything from the first legal/EEO marker, if real content precedes it"""
+    if not text:
+        return text
+    starts = [m.start() for m in (p.search(text) for p in LEGAL_BOILERPLATE_MARKERS) if m]
+    earliest = min(starts, default=-1)
+    if earliest > 300:
+        return text[:earliest].rstrip("* \n").strip()
+    return text
+
+
+def dedupe_blocks(text: str, seen: Optional[Set[str]] = None) -> str:
+    """
+    Drop paragraphs already seen, in this text or (via ``seen``) in earlier fields
+
+    Blocks are compared case- and whitespace-insensitively. Pass the same
+    ``seen`` set for every field of a job to drop cross-field repeats.
+    """
+    seen = set() if seen is None else seen
+    kept = []
+    for block in BLOCK_SPLIT.split(text):
+        block = '\n'.join(line.strip() for line in block.strip().splitlines())
+        key = WHITESPACE.sub(' ', block).lower()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        kept.append(block)
+    return '\n\n'.join(kept)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> Tuple[str, bool]:
+    """Cap text at roughly ``max_tokens``, cutting at a line or word boundary"""
+    limit = max_tokens * 4
+    if len(text) <= limit:
+        return text, False
+    cut = text[:limit]
+    boundary = max(cut.rfind('\n'), cut.rfind(' '))
+    if boundary > limit // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + ' …', True
+
+
+def compact_text(text: str, max_tokens: int, seen: Optional[Set[str]] = None) -> Tuple[str, bool]:
+    """
+    Boilerplate-trim, dedupe and token-cap one text field
+
+    Returns:
+        (compacted text, whether it had to be truncated)
+    """
+    if not text:
+        return text, False
+    text = dedupe_blocks(trim_legal_boilerplate(text), seen)
+    return truncate_to_tokens(text, max_tokens)
@@ -0,0 +1,51 @@
+"""
+Benchmark batched vs single-job AI enhancement against a local mock OpenRouter
+
+Usage (from scraper-server/):
+    python -m benchmarks.bench_batched_prompts --jobs 40 --batch-size 5
+"""
+
+import argparse
+import time
+
+from benchmarks.harness import make_enhancer
+from benchmarks.mock_openrouter import MockOpenRouter, synthetic_jobs
+
+
+def run_once(mock: MockOpenRouter, jobs, batch_size: int, concurrency: int) -> dict:
+    enhancer = make_enhancer(mock, ai_batch_size=batch_size, ai_max_concurrency=concurrency)
+
+    mock.reset()
+    start = time.perf_counter()
+    results = enhancer.enhance_jobs_batch(jobs)
+    elapsed = time.perf_counter() - start
+    return {
+        'batch_size': batch_size,
+        'seconds': round(elapsed, 2),
+        'jobs_per_second': round(len(jobs) / elapsed, 2),
+        'enhanced': sum(1 for r in results if r.get('industry')),
+        **mock.get_stats(),
+        'fallback_jobs': enhancer.run_stats['fallback_jobs'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=40)
+    parser.add_argument('--batch-size', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.3,
+                        help='Fixed per-request latency in seconds')
+    args = parser.parse_args(argv)
+
+    mock = MockOpenRouter(base_latency=args.latency).start()
+    jobs = synthetic_jobs(args.jobs)
+    try:
+        for batch_size in (1, args.batch_size):
+            print(run_once(mock, jobs, batch_size, args.concurrency))
+    finally:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
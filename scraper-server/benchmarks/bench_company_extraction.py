@@ -0,0 +1,115 @@
+"""
+Benchmark the keyword-gated company-name engine against sequential re.search calls
+
+The legacy path is the pre-engine loop: every rule string handed to
+``re.search`` in turn over the description's first 800 characters. Both
+paths run over the pinned fixture corpus (tests/fixtures) padded with
+synthetic JobSpy-style descriptions, and must pick the same names.
+
+Usage (from scraper-server/):
+    python -m benchmarks.bench_company_extraction --descriptions 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from pathlib import Path
+from typing import List, Optional
+
+os.environ.setdefault('DATABASE_URL', 'postgresql://benchmark@localhost/benchmark')
+
+from app.scrapers.base import BaseScraper, COMPANY_SCAN_CHARS  # noqa: E402
+from app.utils.company_patterns import COMPANY_PATTERN_FLAGS, COMPANY_RULES  # noqa: E402
+
+CORPUS = Path(__file__).resolve().parent.parent / 'tests' / 'fixtures' / 'company_descriptions.json'
+
+OPENINGS = [
+    '{company} is seeking a {role}.',
+    'At {company}, we build inclusive products.',
+    'About {company}:',
+    '**{company}**',
+    '{company} - {role}',
+    'Overview',
+    'Job Description',
+    'We are looking for a {role}.',
+]
+BODY = [
+    'You will audit web and native apps against WCAG 2.2 AA.',
+    'Experience with JAWS, NVDA and VoiceOver is required.',
+    'Partner with design systems to ship accessible components.',
+    'Remote within the US; occasional travel.',
+    'Apply by emailing careers@{domain}.com.',
+]
+COMPANIES = ['Deque Systems', 'Level Access', 'TPGi', 'Fable', 'Knowbility', 'Allyant']
+ROLES = ['Accessibility Engineer', 'Digital Accessibility Lead', 'A11y QA Analyst']
+
+
+class _Scraper(BaseScraper):
+    def scrape(self):
+        return []
+
+    def map_to_schema(self, raw_job):
+        return {}
+
+
+def synthetic_descriptions(count: int, seed: int = 17) -> List[str]:
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        company = rng.choice(COMPANIES)
+        lines = [rng.choice(OPENINGS).format(company=company, role=rng.choice(ROLES))]
+        for _ in range(rng.randint(3, 12)):
+            lines.append(rng.choice(BODY).format(domain=company.split()[0].lower()))
+        descriptions.append('\n'.join(lines))
+    return descriptions
+
+
+def legacy_extract(scraper: BaseScraper, description: str) -> Optional[str]:
+    if not description:
+        return None
+    clean_desc = description.replace('\\n', '\n').replace('\\-', '-')[:COMPANY_SCAN_CHARS]
+    for rule in COMPANY_RULES:
+        match = re.search(rule.pattern, clean_desc, COMPANY_PATTERN_FLAGS)
+        if match:
+            company = scraper._clean_company_name(match.group(1).strip())
+            if scraper.is_valid_company_name(company):
+                return company
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--descriptions', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    scraper = _Scraper('benchmark')
+    pinned = [case['description'] for case in json.loads(CORPUS.read_text(encoding='utf-8'))]
+    descriptions = pinned + synthetic_descriptions(args.descriptions)
+
+    results = {}
+    for label, extract in (
+        ('legacy', lambda text: legacy_extract(scraper, text)),
+        ('engine', scraper.extract_company_from_description),
+    ):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            names = [extract(text) for text in descriptions]
+            best = min(best, time.perf_counter() - start)
+        results[label] = names
+        print({
+            'patterns': label,
+            'descriptions': len(descriptions),
+            'us_per_description': round(best / len(descriptions) * 1e6, 1),
+        })
+
+    mismatches = sum(a != b for a, b in zip(results['legacy'], results['engine']))
+    print({'mismatches': mismatches})
+
+
+if __name__ == '__main__':
+    main()
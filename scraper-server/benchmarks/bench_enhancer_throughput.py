@@ -0,0 +1,77 @@
+"""
+Throughput benchmark for AIEnhancer.enhance_jobs_batch against a local mock OpenRouter
+
+Reports jobs/sec, p50/p95 latency of each logical AI call from submit to
+final result (retries and their delay-queue waits included) and the retry
+count from the enhancer's retry policy.
+
+Usage (from scraper-server/):
+    python -m benchmarks.bench_enhancer_throughput --jobs 100 --rate-limit-rate 0.05
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.harness import CallTimer, make_enhancer
+from benchmarks.mock_openrouter import MockOpenRouter, latency_sampler, synthetic_jobs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=100)
+    parser.add_argument('--batch-size', type=int, default=1)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency-dist', choices=('fixed', 'uniform', 'lognormal'),
+                        default='lognormal')
+    parser.add_argument('--latency', type=float, default=0.3, help='Median overhead (s)')
+    parser.add_argument('--spread', type=float, default=0.5)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=1.0)
+    parser.add_argument('--malformed-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    mock = MockOpenRouter(
+        latency=latency_sampler(args.latency_dist, args.latency, args.spread,
+                                random.Random(args.seed)),
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    ).start()
+    try:
+        enhancer = make_enhancer(
+            mock,
+            ai_batch_size=args.batch_size,
+            ai_max_concurrency=args.concurrency,
+            ai_completeness_threshold=1.1,  # send every job
+        )
+        jobs = synthetic_jobs(args.jobs)
+
+        with CallTimer() as timer:
+            start = time.perf_counter()
+            results = enhancer.enhance_jobs_batch(jobs)
+            elapsed = time.perf_counter() - start
+
+        calls = timer.summary()
+        server = mock.get_stats()
+        print({
+            'jobs': len(jobs),
+            'seconds': round(elapsed, 2),
+            'jobs_per_second': round(len(jobs) / elapsed, 2),
+            'enhanced': sum(1 for r in results if r.get('industry')),
+            **calls,
+            'http_requests': server['requests'],
+            'retries': enhancer.retry_policy.stats()['retries'],
+            'rate_limited': server['rate_limited'],
+            'malformed': server['malformed'],
+            'fallback_jobs': enhancer.run_stats['fallback_jobs'],
+            'rate_controller': enhancer.rate_controller.get_stats(),
+        })
+    finally:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
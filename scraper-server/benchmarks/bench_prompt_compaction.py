@@ -0,0 +1,86 @@
+"""
+Benchmark compacted vs legacy AI prompts against a local mock OpenRouter
+
+The legacy prompt is the pre-compaction shape: raw text fields, indented
+JSON, the full schema and a fixed 3000-token completion cap.
+
+Usage (from scraper-server/):
+    python -m benchmarks.bench_prompt_compaction --jobs 20
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.harness import make_enhancer  # sets up the env before app imports
+from app.ai_enhancer import (
+    AIEnhancer, EXTRACTION_SCHEMA, SYSTEM_PROMPT, USER_PROMPT_TEMPLATE,
+)
+from benchmarks.mock_openrouter import MockOpenRouter, synthetic_jobs
+
+# anthropic/claude-3-haiku list prices, USD per million tokens
+INPUT_PRICE = 0.25
+OUTPUT_PRICE = 1.25
+
+LEGACY_FIELDS = (
+    'title', 'company', 'description', 'key_responsibilities', 'requirements',
+    'nice_to_have', 'location', 'type', 'work_arrangement', 'employment_type',
+    'salary_min', 'salary_max', 'country', 'city', 'specific_location',
+)
+
+
+def run_legacy(enhancer: AIEnhancer, jobs) -> None:
+    def call(job):
+        raw = {k: v for k, v in job.items() if k in LEGACY_FIELDS}
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(
+                job_data=json.dumps(raw, indent=2), schema=EXTRACTION_SCHEMA
+            )},
+        ]
+        enhancer._call_openrouter(messages, max_tokens=3000, attempts=1)
+
+    enhancer._map_concurrently(call, jobs, lambda job: None)
+
+
+def report(label: str, mock: MockOpenRouter, jobs, elapsed: float) -> dict:
+    stats = mock.get_stats()
+    cost = (stats['prompt_tokens'] * INPUT_PRICE
+            + stats['completion_tokens'] * OUTPUT_PRICE) / 1_000_000
+    return {
+        'prompts': label,
+        'seconds': round(elapsed, 2),
+        'input_tokens_per_job': stats['prompt_tokens'] // len(jobs),
+        'output_tokens_per_job': stats['completion_tokens'] // len(jobs),
+        'usd_per_1k_jobs': round(cost / len(jobs) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.3,
+                        help='Fixed per-request latency in seconds')
+    args = parser.parse_args(argv)
+
+    mock = MockOpenRouter(base_latency=args.latency).start()
+    jobs = synthetic_jobs(args.jobs)
+    try:
+        enhancer = make_enhancer(mock, ai_batch_size=1, ai_max_concurrency=args.concurrency)
+        start = time.perf_counter()
+        run_legacy(enhancer, jobs)
+        print(report('legacy', mock, jobs, time.perf_counter() - start))
+
+        mock.reset()
+        enhancer = make_enhancer(mock, ai_batch_size=1, ai_max_concurrency=args.concurrency,
+                                 ai_completeness_threshold=1.1)
+        start = time.perf_counter()
+        enhancer.enhance_jobs_batch(jobs)
+        print(report('compacted', mock, jobs, time.perf_counter() - start))
+    finally:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Shared helpers for the AI enhancer benchmarks
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List
+
+os.environ.setdefault('DATABASE_URL', 'postgresql://benchmark@localhost/benchmark')
+
+from app import ai_enhancer  # noqa: E402
+from app.ai_enhancer import AIEnhancer  # noqa: E402
+from app.config import get_settings  # noqa: E402
+from benchmarks.mock_openrouter import MockOpenRouter  # noqa: E402
+
+
+def make_enhancer(mock: MockOpenRouter, **overrides) -> AIEnhancer:
+    """Enhancer configured, via OPENROUTER_BASE_URL's setting, to call ``mock``"""
+    settings = get_settings().model_copy(update={
+        'openrouter_base_url': mock.base_url,
+        'openrouter_api_key': 'mock-key',
+        **overrides,
+    })
+    return AIEnhancer(settings)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+class CallTimer:
+    """
+    Times every logical OpenRouter call an enhancer schedules, retries included
+
+    While active, each call the enhancer hands its RetryScheduler (one per
+    job, or per packed batch) is timed from ``submit`` until its future
+    settles, so time spent parked on the delay queue counts. Use as a
+    context manager around the run.
+    """
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self._lock = threading.Lock()
+        self._original = ai_enhancer.RetryScheduler
+
+    def __enter__(self) -> 'CallTimer':
+        timer = self
+
+        class TimedRetryScheduler(self._original):
+            def submit(self, *args, **kwargs):
+                start = time.perf_counter()
+                future = super().submit(*args, **kwargs)
+                future.add_done_callback(lambda _: timer._record(time.perf_counter() - start))
+                return future
+
+        ai_enhancer.RetryScheduler = TimedRetryScheduler
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        ai_enhancer.RetryScheduler = self._original
+
+    def _record(self, seconds: float) -> None:
+        with self._lock:
+            self.durations.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            durations = list(self.durations)
+        return {
+            'calls': len(durations),
+            'p50_seconds': round(percentile(durations, 50), 3),
+            'p95_seconds': round(percentile(durations, 95), 3),
+        }
@@ -0,0 +1,268 @@
+"""
+Local stand-in for the OpenRouter chat completions endpoint
+
+Answers the single-job and batched extraction prompts with canned
+extractions after a simulated latency: a per-request overhead drawn from a
+configurable distribution plus a per-token cost, so request counts and
+prompt sizes show up in wall time. A share of requests can be answered with
+429s (with Retry-After) or truncated, malformed JSON.
+
+Run standalone and point the server at it with OPENROUTER_BASE_URL:
+    python -m benchmarks.mock_openrouter --port 8089 --rate-limit-rate 0.05
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+RAW_DATA_PATTERN = re.compile(r'```\n(.*?)\n```', re.DOTALL)
+SCHEMA_FIELD_PATTERN = re.compile(r'^  "(\w+)":', re.MULTILINE)
+TEXT_FIELDS = ('description', 'key_responsibilities', 'requirements', 'nice_to_have')
+
+
+def canned_extraction(job: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Deterministic extraction for one job from the prompt
+
+    Only ``fields`` (the schema the prompt asked for) are answered. Requested
+    text fields echo the job's own text, as a real model's cleaned rewrite
+    would, so completion size follows what the prompt asks for.
+    """
+    answer = {
+        'company': job.get('company') or 'Acme Accessibility',
+        'industry': 'Technology',
+        'job_level': 'senior' if 'senior' in str(job.get('title', '')).lower() else 'mid',
+        'employment_type': 'full-time',
+        'work_arrangement': 'remote',
+        'required_skills': ['WCAG', 'ARIA'],
+        'assistive_tech_experience': ['JAWS', 'NVDA'],
+        'wcag_level': '2.1',
+    }
+    for field in TEXT_FIELDS:
+        if job.get(field):
+            answer[field] = job[field]
+    if fields is not None:
+        answer = {k: v for k, v in answer.items() if k in fields}
+    return answer
+
+
+def latency_sampler(kind: str = 'fixed', median: float = 0.3, spread: float = 0.5,
+                    rng: Optional[random.Random] = None) -> Callable[[], float]:
+    """
+    Per-request overhead in seconds
+
+    ``fixed`` always returns ``median``; ``uniform`` draws from
+    median * (1 ± spread); ``lognormal`` has the given median and sigma
+    ``spread``, giving the long tail real providers show.
+    """
+    rng = rng or random.Random()
+    if kind == 'fixed':
+        return lambda: median
+    if kind == 'uniform':
+        return lambda: rng.uniform(median * (1 - spread), median * (1 + spread))
+    if kind == 'lognormal':
+        return lambda: median * rng.lognormvariate(0, spread)
+    raise ValueError(f"Unknown latency distribution: {kind}")
+
+
+class MockOpenRouter:
+    """Threaded HTTP server speaking enough of the chat completions API"""
+
+    def __init__(self, base_latency: float = 0.3, input_token_cost: float = 0.00002,
+                 output_token_cost: float = 0.0005, port: int = 0,
+                 latency: Optional[Callable[[], float]] = None,
+                 rate_limit_rate: float = 0.0, retry_after: float = 1.0,
+                 malformed_rate: float = 0.0, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.latency = latency or latency_sampler('fixed', base_latency)
+        self.input_token_cost = input_token_cost
+        self.output_token_cost = output_token_cost
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.malformed_rate = malformed_rate
+        self.requests = 0
+        self.rate_limited = 0
+        self.malformed = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def start(self) -> 'MockOpenRouter':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.requests = self.rate_limited = self.malformed = 0
+            self.prompt_tokens = self.completion_tokens = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'rate_limited': self.rate_limited,
+                'malformed': self.malformed,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+            }
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self.rng.random() < rate
+
+    def should_rate_limit(self) -> bool:
+        """Decide whether to answer this request with a 429"""
+        if not self._roll(self.rate_limit_rate):
+            return False
+        with self._lock:
+            self.requests += 1
+            self.rate_limited += 1
+        return True
+
+    def complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the completion for one request body, sleeping for its latency"""
+        prompt = body['messages'][-1]['content']
+        match = RAW_DATA_PATTERN.search(prompt)
+        jobs = json.loads(match.group(1)) if match else {}
+        fields = SCHEMA_FIELD_PATTERN.findall(prompt[match.end():] if match else prompt)
+
+        if isinstance(jobs, list):
+            answer: Any = [{'job_id': job.get('job_id'), **canned_extraction(job, fields)}
+                           for job in jobs]
+        else:
+            answer = canned_extraction(jobs, fields)
+        content = json.dumps(answer)
+        if self._roll(self.malformed_rate):
+            # Cut mid-object, like a response that hit max_tokens
+            content = content[:max(1, len(content) // 2)]
+            with self._lock:
+                self.malformed += 1
+
+        prompt_tokens = sum(len(m['content']) for m in body['messages']) // 4
+        completion_tokens = len(content) // 4
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+        time.sleep(self.latency()
+                   + prompt_tokens * self.input_token_cost
+                   + completion_tokens * self.output_token_cost)
+        return {
+            'id': 'mock-completion',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'mock'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length))
+                if mock.should_rate_limit():
+                    self._send(429, {'error': {'message': 'Rate limit exceeded', 'code': 429}},
+                               {'Retry-After': str(mock.retry_after)})
+                    return
+                self._send(200, mock.complete(body))
+
+            def _send(self, status: int, body: Dict[str, Any],
+                      headers: Optional[Dict[str, str]] = None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def synthetic_jobs(count: int) -> List[Dict[str, Any]]:
+    """Scraped-looking jobs with realistic description lengths"""
+    paragraph = ("We are seeking an accessibility specialist to audit web and mobile "
+                 "products against WCAG 2.1 AA, pair with engineers on ARIA patterns "
+                 "and test with JAWS, NVDA and VoiceOver. ")
+    requirements = '**Requirements**\n- 3+ years WCAG auditing\n- Screen reader fluency'
+    boilerplate = ("Acme is an Equal Opportunity Employer. All qualified applicants will "
+                   "receive consideration without regard to protected status. ") * 8
+    return [
+        {
+            'title': f"{'Senior ' if i % 3 == 0 else ''}Accessibility Engineer {i}",
+            'company': 'Unknown',
+            'location': 'Remote, USA',
+            # Scraped descriptions repeat the requirements section and end in EEO text
+            'description': '\n\n'.join([paragraph * 3, requirements, paragraph * 3, boilerplate]),
+            'requirements': requirements,
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local OpenRouter stand-in')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-dist', choices=('fixed', 'uniform', 'lognormal'),
+                        default='lognormal')
+    parser.add_argument('--latency', type=float, default=0.3, help='Median overhead (s)')
+    parser.add_argument('--spread', type=float, default=0.5)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=1.0)
+    parser.add_argument('--malformed-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    mock = MockOpenRouter(
+        port=args.port,
+        latency=latency_sampler(args.latency_dist, args.latency, args.spread,
+                                random.Random(args.seed)),
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    ).start()
+    print(f"Mock OpenRouter listening on {mock.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,342 @@
+"""
+Tests for AI enhancement
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.ai_enhancer import AIEnhancer, AdaptiveRateController
+
+
+@pytest.fixture
+def enhancer():
+    """Create an enabled enhancer whose OpenRouter call is stubbed per test"""
+    instance = AIEnhancer()
+    instance.enabled = True
+    instance.client = object()
+    return instance
+
+
+class TestAdaptiveRateController:
+    """Tests for the AIMD rate controller"""
+
+    def test_window_grows_on_success_up_to_ceiling(self):
+        controller = AdaptiveRateController(max_in_flight=3)
+        for _ in range(20):
+            controller.record_success()
+        assert controller.get_stats()['current_limit'] == 3
+
+    def test_rate_limit_halves_window_once_per_cooldown(self):
+        controller = AdaptiveRateController(max_in_flight=8, cooldown_seconds=0.05)
+        controller.limit = 8.0
+        controller.record_rate_limited()
+        controller.record_rate_limited()  # same overload, still cooling down
+        assert controller.limit == 4.0
+
+        time.sleep(0.06)
+        controller.record_rate_limited(retry_after=0)
+        assert controller.limit == 2.0
+        assert controller.get_stats()['rate_limited'] == 3
+
+    def test_dispatch_waits_for_retry_after(self):
+        controller = AdaptiveRateController(max_in_flight=2)
+        controller.record_rate_limited(retry_after=0.1)
+        start = time.monotonic()
+        with controller.slot():
+            pass
+        assert time.monotonic() - start >= 0.09
+
+
+class TestOpenRouterRetries:
+    """Tests for retrying OpenRouter calls under the shared retry policy"""
+
+    @staticmethod
+    def api_error(error_class, status: int, headers=None):
+        import httpx
+        request = httpx.Request('POST', 'https://openrouter.ai/api/v1/chat/completions')
+        response = httpx.Response(status, headers=headers or {}, request=request)
+        return error_class(f'{status}', response=response, body=None)
+
+    def test_rate_limit_waits_for_retry_after_and_client_errors_fail_fast(self, enhancer):
+        from openai import BadRequestError, RateLimitError
+        from app.utils.retry_policy import RetryPolicy
+
+        sleeps = []
+        enhancer.retry_policy = RetryPolicy(budget=5, base=2.0, max_delay=10.0,
+                                            rng=lambda: 0.0, sleep=sleeps.append)
+        enhancer.rate_controller = AdaptiveRateController(max_in_flight=2, cooldown_seconds=0)
+        message = SimpleNamespace(content='{"industry": "Software"}')
+        outcomes = [self.api_error(RateLimitError, 429, {'retry-after': '0'}),
+                    SimpleNamespace(choices=[SimpleNamespace(message=message)]),
+                    self.api_error(BadRequestError, 400)]
+
+        def fake_create(**kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        enhancer.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+        )
+
+        assert enhancer._call_openrouter([{'role': 'user', 'content': 'x'}]) == '{"industry": "Software"}'
+        assert sleeps == [1.0]
+        with pytest.raises(BadRequestError):
+            enhancer._call_openrouter([{'role': 'user', 'content': 'x'}])
+        assert sleeps == [1.0]
+        assert enhancer.retry_policy.stats()['sites']['openrouter']['retries'] == 1
+        assert enhancer.rate_controller.get_stats()['rate_limited'] == 1
+
+
+class TestEnhanceJobsBatch:
+    """Tests for concurrent batch enhancement"""
+
+    def test_preserves_order_and_runs_concurrently(self, enhancer):
+        enhancer.rate_controller = AdaptiveRateController(max_in_flight=4)
+        enhancer.rate_controller.limit = 4.0
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_create(**kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            # Later jobs finish first so completion order differs from input order
+            title = kwargs['messages'][1]['content'].split('"title": "')[1].split('"')[0]
+            time.sleep(0.05 / int(title.split()[-1]))
+            with lock:
+                active.pop()
+            message = SimpleNamespace(content='{"industry": "%s"}' % title)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        enhancer.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+        )
+
+        jobs = [{'title': f'Job {i}', 'company': 'Acme'} for i in range(1, 9)]
+        results = enhancer.enhance_jobs_batch(jobs)
+
+        assert [r['industry'] for r in results] == [f'Job {i}' for i in range(1, 9)]
+        assert max(peak) > 1
+
+    def test_retries_wait_on_the_delay_queue_not_a_pool_thread(self, enhancer):
+        import httpx
+        from openai import APIConnectionError
+        from app.utils.retry_policy import RetryPolicy
+
+        sleeps = []
+        enhancer.settings = enhancer.settings.model_copy(update={'ai_max_concurrency': 1,
+                                                                 'retry_budget': 5})
+        enhancer.rate_controller = AdaptiveRateController(max_in_flight=1, cooldown_seconds=0)
+        enhancer.retry_policy = RetryPolicy(budget=5, base=0.1, rng=lambda: 0.0, sleep=sleeps.append)
+        answered = []
+        failures = {'Job 1': 1}
+
+        def fake_create(**kwargs):
+            title = kwargs['messages'][1]['content'].split('"title": "')[1].split('"')[0]
+            if failures.get(title):
+                failures[title] -= 1
+                raise APIConnectionError(request=httpx.Request('POST', 'https://openrouter.ai'))
+            answered.append(title)
+            message = SimpleNamespace(content='{"industry": "%s"}' % title)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        enhancer.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))
+        )
+
+        jobs = [{'title': f'Job {i}', 'company': 'Acme'} for i in range(1, 4)]
+        results = enhancer.enhance_jobs_batch(jobs)
+
+        assert [r['industry'] for r in results] == ['Job 1', 'Job 2', 'Job 3']
+        assert answered == ['Job 2', 'Job 3', 'Job 1']
+        assert sleeps == []
+        stats = enhancer.retry_policy.stats()
+        assert (stats['retries'], stats['deferred']) == (1, 1)
+        assert stats['sites']['openrouter']['gave_up'] == 0
+
+    def test_failed_job_falls_back_to_original(self, enhancer, monkeypatch):
+        def fake_call(messages, **kwargs):
+            if 'Broken' in messages[1]['content']:
+                raise RuntimeError("provider error")
+            return '{"industry": "Software"}'
+
+        monkeypatch.setattr(enhancer, '_call_openrouter', fake_call)
+        jobs = [
+            {'title': 'Good Job', 'company': 'Acme'},
+            {'title': 'Broken Job', 'company': 'Acme'},
+        ]
+        results = enhancer.enhance_jobs_batch(jobs)
+
+        assert results[0]['industry'] == 'Software'
+        assert results[1] is jobs[1]
+
+
+class TestBatchedPrompts:
+    """Tests for multi-job batched prompts"""
+
+    @pytest.fixture
+    def batching(self, enhancer):
+        enhancer.settings = enhancer.settings.model_copy(update={
+            'ai_batch_size': 3,
+            'ai_batch_token_budget': 500,
+        })
+        return enhancer
+
+    def test_packs_by_size_and_token_budget(self, batching):
+        jobs = [{'title': f'Job {i}', 'description': 'x' * 100} for i in range(7)]
+        assert batching._pack_batches(jobs) == [[0, 1, 2], [3, 4, 5], [6]]
+
+        jobs[1]['description'] = 'x ' * 1500  # over budget on its own
+        assert batching._pack_batches(jobs)[:3] == [[0], [1], [2, 3, 4]]
+
+    def test_maps_answers_by_id_and_falls_back_for_bad_entries(self, batching, monkeypatch):
+        single_calls = []
+
+        def fake_call(messages, **kwargs):
+            prompt = messages[1]['content']
+            if 'job_id' not in prompt:
+                single_calls.append(prompt)
+                return '{"industry": "Single"}'
+            # Answers out of order, drops job-2 and sends an empty job-3
+            return ('[{"job_id": "job-3"}, '
+                    '{"job_id": "job-1", "industry": "Batched"}]')
+
+        monkeypatch.setattr(batching, '_call_openrouter', fake_call)
+        jobs = [{'title': f'Job {i}', 'company': 'Acme'} for i in range(3)]
+        results = batching.enhance_jobs_batch(jobs)
+
+        assert [r['industry'] for r in results] == ['Batched', 'Single', 'Single']
+        assert len(single_calls) == 2
+
+    def test_parses_entries_before_truncation(self, batching):
+        content = ('```json\n[{"job_id": "job-1", "industry": "A"}, '
+                   '{"job_id": "job-2", "industry": "B", "description": "cut of')
+        entries = batching._parse_batch_response(content)
+        assert list(entries) == ['job-1']
+
+
+class TestCompletenessGate:
+    """Tests for skipping or narrowing AI calls on already-extracted jobs"""
+
+    @staticmethod
+    def extracted_job(**overrides):
+        text = 'Audit web products against WCAG 2.1 AA and pair with engineers on fixes.'
+        job = {
+            'title': 'Accessibility Engineer',
+            'company': 'Acme',
+            'description': text,
+            'key_responsibilities': text,
+            'requirements': text,
+            'required_skills': '["WCAG", "ARIA"]',
+            'required_certifications': '[]',
+            'job_level': 'mid',
+            'employment_type': 'full-time',
+            'work_arrangement': 'remote',
+            'country': 'United States',
+        }
+        job.update(overrides)
+        return job
+
+    def test_scores_extracted_fields(self, enhancer):
+        assert enhancer.completeness_score(self.extracted_job()) >= 0.7
+        sparse = self.extracted_job(company='Unknown', required_skills='[]', requirements='')
+        assert enhancer.completeness_score(sparse) < 0.7
+
+    def test_complete_jobs_skip_the_llm(self, enhancer, monkeypatch):
+        prompts = []
+
+        def fake_call(messages, **kwargs):
+            prompts.append(messages[1]['content'])
+            return '{"industry": "Software"}'
+
+        monkeypatch.setattr(enhancer, '_call_openrouter', fake_call)
+        complete = self.extracted_job()
+        sparse = self.extracted_job(company='Unknown', required_skills='[]', requirements='')
+        results = enhancer.enhance_jobs_batch([complete, sparse])
+
+        assert results[0] is complete
+        assert results[1]['industry'] == 'Software'
+        assert len(prompts) == 1
+        assert enhancer.run_stats['skipped_complete'] == 1
+
+    def test_reduced_prompt_asks_only_for_missing_fields(self, enhancer, monkeypatch):
+        prompts = []
+
+        def fake_call(messages, **kwargs):
+            prompts.append(messages[1]['content'])
+            return '{"industry": "Software", "job_level": "director"}'
+
+        monkeypatch.setattr(enhancer, '_call_openrouter', fake_call)
+        result = enhancer.enhance_job(self.extracted_job())
+
+        assert '"industry"' in prompts[0]
+        assert '"job_level"' not in prompts[0]
+        assert '"salary_max"' in prompts[0]  # requested with salary_min
+        assert result['industry'] == 'Software'
+        assert result['job_level'] == 'mid'
+
+
+class TestPromptCompaction:
+    """Tests for boilerplate trimming, dedupe and token caps on prompt text"""
+
+    def test_trims_boilerplate_and_cross_field_repeats(self, enhancer):
+        intro = 'Join our team auditing products for WCAG conformance. ' * 8
+        requirements = '- 3+ years auditing\n- Screen reader fluency'
+        job = {
+            'title': 'Accessibility Engineer',
+            'description': f"{intro}\n\n{requirements}\n\n"
+                           "EEO Statement: Acme values every applicant.",
+            'requirements': requirements,
+            'city': None,
+        }
+        payload, truncated = enhancer._prepare_for_prompt(job)
+
+        assert payload['description'] == intro.strip()
+        assert payload['requirements'] == requirements
+        assert 'city' not in payload
+        assert truncated == set()
+
+    def test_truncated_fields_are_not_requested(self, enhancer, monkeypatch):
+        prompts = []
+
+        def fake_call(messages, **kwargs):
+            prompts.append(messages[1]['content'])
+            return '{"description": "partial rewrite", "industry": "Software"}'
+
+        monkeypatch.setattr(enhancer, '_call_openrouter', fake_call)
+        job = {'title': 'Accessibility Engineer', 'description': '**Audit** ' * 2000}
+        result = enhancer.enhance_job(job)
+
+        assert len(prompts[0]) < 8000
+        assert '"description": "Clean' not in prompts[0]
+        assert result['description'] == job['description']
+        assert result['industry'] == 'Software'
+
+
+class TestMockOpenRouter:
+    """Tests driving the enhancer against the local OpenRouter stand-in"""
+
+    def test_base_url_setting_points_client_at_stand_in(self):
+        from app.config import get_settings
+        from benchmarks.mock_openrouter import MockOpenRouter
+
+        mock = MockOpenRouter(base_latency=0).start()
+        try:
+            settings = get_settings().model_copy(update={
+                'openrouter_base_url': mock.base_url,
+                'openrouter_api_key': 'mock-key',
+            })
+            enhancer = AIEnhancer(settings)
+            result = enhancer.enhance_job({'title': 'Senior Accessibility Engineer', 'company': 'Acme'})
+        finally:
+            mock.stop()
+
+        assert result['job_level'] == 'senior'
+        assert mock.get_stats()['requests'] == 1
+        assert enhancer.run_stats['prompt_tokens'] > 0
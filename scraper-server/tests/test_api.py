@@ -49,3 +49,16 @@ def test_scrape_status_endpoint(client):
     data = response.json()
     assert "scraper" in data
     assert "scheduler" in data
+
+
+def test_enhancement_status_endpoint(client, tmp_path, monkeypatch):
+    """Test background enhancement status endpoint"""
+    from app.enhancement_queue import enhancement_queue
+    monkeypatch.setattr(enhancement_queue, 'path', str(tmp_path / 'queue.db'))
+    monkeypatch.setattr(enhancement_queue, '_initialized', False)
+
+    response = client.get("/api/enhancement/status")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["queue"]["pending"] == 0
+    assert "running" in data["worker"]
@@ -0,0 +1,44 @@
+"""
+Smoke tests: every benchmark's main runs end to end on a handful of jobs
+"""
+
+import ast
+
+import pytest
+
+from benchmarks import (
+    bench_batched_prompts,
+    bench_company_extraction,
+    bench_enhancer_throughput,
+    bench_prompt_compaction,
+)
+
+
+def printed(capsys):
+    """Each dict a benchmark printed, in order"""
+    return [ast.literal_eval(line) for line in capsys.readouterr().out.splitlines()]
+
+
+class TestBenchmarkMains:
+    """Each benchmark runs against the mock OpenRouter with tiny inputs"""
+
+    @pytest.mark.parametrize('module, argv', [
+        (bench_batched_prompts, ['--jobs', '4', '--batch-size', '2', '--latency', '0']),
+        (bench_prompt_compaction, ['--jobs', '3', '--latency', '0']),
+        (bench_enhancer_throughput, ['--jobs', '4', '--latency', '0', '--spread', '0',
+                                     '--latency-dist', 'fixed']),
+        (bench_company_extraction, ['--descriptions', '5', '--repeat', '1']),
+    ])
+    def test_main_runs(self, module, argv, capsys):
+        module.main(argv)
+        assert printed(capsys)
+
+    def test_throughput_counts_retries_from_the_policy(self, capsys):
+        bench_enhancer_throughput.main(['--jobs', '6', '--latency', '0', '--latency-dist', 'fixed',
+                                        '--rate-limit-rate', '0.5', '--retry-after', '0',
+                                        '--seed', '3'])
+        [report] = printed(capsys)
+        assert report['calls'] == 6
+        assert report['retries'] > 0
+        assert report['http_requests'] == report['calls'] + report['retries']
+        assert report['p95_seconds'] >= report['p50_seconds']
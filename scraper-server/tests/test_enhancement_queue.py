@@ -0,0 +1,152 @@
+"""
+Tests for the background enhancement queue
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app import enhancement_queue as queue_module
+from app.enhancement_queue import EnhancementQueue, EnhancementWorker
+from app.scrapers import manager as manager_module
+from app.scrapers.manager import ScraperManager
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Queue backed by a throwaway SQLite file"""
+    instance = EnhancementQueue(path=str(tmp_path / 'queue' / 'enhancement.db'))
+    instance.settings = instance.settings.model_copy(update={
+        'enhancement_max_attempts': 2,
+        'enhancement_retry_base_seconds': 0,
+    })
+    return instance
+
+
+def make_job(title='Accessibility Engineer'):
+    return {'title': title, 'company': 'Acme', 'updated_at': datetime(2024, 5, 1, 12, 30, 15, 123456)}
+
+
+class TestEnhancementQueue:
+    """Tests for durable queue operations"""
+
+    def test_claim_round_trips_job_and_lock_version(self, queue):
+        queue.enqueue('42', make_job())
+        items = queue.claim(10)
+
+        assert [item['job_id'] for item in items] == ['42']
+        assert items[0]['expected_updated_at'] == datetime(2024, 5, 1, 12, 30, 15, 123456)
+        assert items[0]['job']['title'] == 'Accessibility Engineer'
+        assert queue.claim(10) == []  # already in progress
+        assert queue.get_stats()['in_progress'] == 1
+
+        queue.complete('42')
+        assert queue.get_stats()['in_progress'] == 0
+
+    def test_failures_retry_then_dead_letter(self, queue):
+        queue.enqueue('7', make_job())
+        queue.claim(1)
+        assert queue.fail('7', 'timeout') is False
+        assert queue.get_stats()['pending'] == 1
+
+        queue.claim(1)
+        assert queue.fail('7', 'timeout again') is True
+        stats = queue.get_stats()
+        assert stats['dead'] == 1
+        assert stats['recent_dead_letters'][0]['last_error'] == 'timeout again'
+        assert queue.claim(1) == []
+
+    def test_in_progress_jobs_survive_restart(self, queue):
+        queue.enqueue('1', make_job())
+        queue.claim(1)
+
+        restarted = EnhancementQueue(path=queue.path)
+        assert restarted.recover_in_progress() == 1
+        assert [item['job_id'] for item in restarted.claim(1)] == ['1']
+
+
+class TestEnhancementWorker:
+    """Tests for applying queued enhancements"""
+
+    @pytest.fixture
+    def worker(self, queue):
+        return EnhancementWorker(queue)
+
+    def test_writes_only_changed_fields_with_lock(self, worker, queue, monkeypatch):
+        updates = []
+        monkeypatch.setattr(
+            queue_module.ai_enhancer, 'enhance_job',
+            lambda job, raise_errors=False: {**job, 'industry': 'Software', 'title': 'Changed'}
+        )
+        monkeypatch.setattr(
+            queue_module.db, 'update_job_fields',
+            lambda job_id, fields, expected: updates.append((job_id, fields, expected)) or True
+        )
+        queue.enqueue('5', make_job())
+        worker.process(queue.claim(1)[0])
+
+        assert updates == [('5', {'industry': 'Software'}, make_job()['updated_at'])]
+        assert worker.get_status()['enhanced'] == 1
+        assert queue.get_stats()['pending'] == 0
+
+    def test_lock_conflict_discards_update(self, worker, queue, monkeypatch):
+        monkeypatch.setattr(
+            queue_module.ai_enhancer, 'enhance_job',
+            lambda job, raise_errors=False: {**job, 'industry': 'Software'}
+        )
+        monkeypatch.setattr(queue_module.db, 'update_job_fields', lambda *args: False)
+        queue.enqueue('5', make_job())
+        worker.process(queue.claim(1)[0])
+
+        assert worker.get_status()['conflicts'] == 1
+        assert queue.get_stats()['pending'] == 0
+
+    def test_enhancement_failure_is_retried(self, worker, queue, monkeypatch):
+        def fail(job, raise_errors=False):
+            raise RuntimeError("provider error")
+
+        monkeypatch.setattr(queue_module.ai_enhancer, 'enhance_job', fail)
+        queue.enqueue('5', make_job())
+        worker.process(queue.claim(1)[0])
+
+        assert worker.get_status()['retried'] == 1
+        assert queue.get_stats()['pending'] == 1
+
+
+class TestBackgroundEnqueue:
+    """Tests for queueing scraped jobs after insertion"""
+
+    def test_queues_the_job_as_scraped_not_with_column_defaults(self, queue, monkeypatch):
+        inserted_at = datetime(2024, 5, 2, 9, 0)
+
+        class FakeDb:
+            def is_connected(self):
+                return True
+
+            def insert_job(self, job):
+                # Like Database.insert_job, fill column defaults in place
+                job.update({'job_level': 'mid', 'country': 'United States',
+                            'currency': 'USD', 'required_skills': '[]',
+                            'updated_at': inserted_at})
+                return '9'
+
+        scraper = type('Scraper', (), {'name': 'fake', 'scrape': lambda self: [
+            {'title': 'Accessibility Engineer', 'company': 'Acme', 'description': 'Audit apps.'}
+        ]})()
+        monkeypatch.setattr(manager_module, 'db', FakeDb())
+        monkeypatch.setattr(manager_module, 'enhancement_queue', queue)
+        monkeypatch.setattr(manager_module.ai_enhancer, 'is_enabled', lambda: True)
+        manager = ScraperManager()
+        manager.settings = manager.settings.model_copy(update={
+            'ai_background_enhancement': True, 'ai_completeness_threshold': 0.7,
+        })
+        manager.scrapers = [scraper]
+
+        results = manager.run_all_scrapers()
+
+        assert results['ai_enhancement']['jobs_queued'] == 1
+        [item] = queue.claim(1)
+        assert item['job']['updated_at'] == inserted_at.isoformat()
+        for field in ('job_level', 'country', 'currency', 'required_skills'):
+            assert field not in item['job']
+        assert 'job_level' in manager_module.ai_enhancer.missing_fields(item['job'])
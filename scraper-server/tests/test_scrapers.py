@@ -2,10 +2,19 @@
 Tests for scraper modules
 """
 
+import json
+from pathlib import Path
+
 import pytest
 from app.scrapers.base import BaseScraper
 from app.scrapers.jobspy_scraper import JobSpyScraper
 from app.scrapers.a11yjobs_scraper import A11yJobsScraper
+from app.utils.company_patterns import company_engine, fold_for_keywords
+from app.utils.safe_extract import ExtractionBudget
+
+COMPANY_CORPUS = json.loads(
+    (Path(__file__).parent / 'fixtures' / 'company_descriptions.json').read_text(encoding='utf-8')
+)
 
 
 class TestBaseScraper:
@@ -47,6 +56,20 @@ class TestBaseScraper:
         assert "WAS" in certs
         assert "IAAP" in certs
     
+    def test_keyword_extraction_is_word_bounded(self):
+        """Terms inside other words are not skills or certifications"""
+        class TestScraper(BaseScraper):
+            def scrape(self):
+                return []
+            def map_to_schema(self, raw_job):
+                return {}
+        
+        scraper = TestScraper("test")
+        
+        text = "Based in Canada, this role was opened for an axe-core expert."
+        assert scraper.extract_skills(text) == ["Axe"]
+        assert scraper.extract_certifications(text) == []
+    
     def test_extract_email(self):
         """Test email extraction"""
         class TestScraper(BaseScraper):
@@ -65,6 +88,50 @@ class TestBaseScraper:
         text2 = "No email here"
         assert scraper.extract_email(text2) is None
     
+    def test_email_scan_matches_findall_and_stays_linear(self):
+        """Windowed email scan agrees with findall and survives '@'-less runs"""
+        import re
+        import time
+        from app.utils.safe_extract import find_emails
+
+        pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        samples = [
+            "Contact careers@example.com or jobs@acme.co.uk, not a@b@c.org",
+            "..john@x.com;mary.o-neil+hr@sub.example.io and trailing@",
+            "no address here",
+        ]
+        for text in samples:
+            assert find_emails(pattern, text) == pattern.findall(text)
+
+        start = time.perf_counter()
+        assert find_emails(pattern, "a." * 100000 + "@") == []
+        assert time.perf_counter() - start < 1.0
+
+    def test_company_extraction_matches_pinned_corpus(self):
+        """Company engine reproduces the pinned per-pattern outputs"""
+        class TestScraper(BaseScraper):
+            def scrape(self):
+                return []
+            def map_to_schema(self, raw_job):
+                return {}
+        
+        scraper = TestScraper("test")
+        
+        for case in COMPANY_CORPUS:
+            assert scraper.extract_company_from_description(case['description']) == case['company'], case
+    
+    def test_company_candidates_follow_rule_rank(self):
+        """Candidates come out best rule first, whatever their position"""
+        text = "Posted by Vispero\nAbout TPGi:\nDeque Systems is seeking an engineer"
+        rules = [rule for rule, _ in company_engine.candidates(text)]
+        assert rules[:3] == ['seeking', 'about', 'posted_by']
+        assert company_engine.best(text, lambda name: None) is None
+        # The budget counts characters scanned, so the cut-off is the same on any machine
+        assert company_engine.best(text, lambda name: name, ExtractionBudget(len(text)))[0] == 'seeking'
+        assert company_engine.best(text, lambda name: name, ExtractionBudget(len(text) - 1)) is None
+        # Keyword gates see text the way re.IGNORECASE and \\s+ do
+        assert fold_for_keywords("Acme\u00a0\u0130S\tſeeking\n") == "acme is seeking "
+    
     def test_determine_job_level(self):
         """Test job level determination"""
         class TestScraper(BaseScraper):
@@ -114,3 +181,63 @@ class TestA11yJobsScraper:
         scraper = A11yJobsScraper()
         assert scraper.name == "a11yjobs"
         assert scraper.BASE_URL == "https://www.a11yjobs.com"
+    
+    def test_html_parser_resolves_backend_and_times_parses(self):
+        """Pinned builders are honoured, unknown ones rejected, parses counted"""
+        from bs4 import SoupStrainer
+        from app.utils.html_parsing import HtmlParser, resolve_html_parser
+        
+        assert resolve_html_parser('html.parser') == 'html.parser'
+        assert resolve_html_parser('auto') in ('lxml', 'html.parser')
+        with pytest.raises(ValueError):
+            resolve_html_parser('html5lib')
+        
+        parser = HtmlParser('html.parser')
+        soup = parser.parse(b'<p>Intro</p><a href="/jobs/1">Job</a>', parse_only=SoupStrainer('a'))
+        assert [a['href'] for a in soup.find_all('a')] == ['/jobs/1']
+        assert soup.find('p') is None
+        assert parser.documents == 1 and parser.bytes == 37
+        assert 'html.parser' in parser.summary()
+    
+    def test_bounded_fetcher_skips_non_pages_and_caps_streams(self):
+        """PDFs and oversized bodies are never read; undeclared streams stop at the cap"""
+        import io
+        import requests
+        from unittest.mock import Mock
+        from app.utils.bounded_fetch import BoundedFetcher
+        
+        def response(body: bytes, content_type: str, length: str = '') -> requests.Response:
+            resp = requests.Response()
+            resp.status_code = 200
+            resp.url = 'https://example.com/careers'
+            resp.headers['Content-Type'] = content_type
+            if length:
+                resp.headers['Content-Length'] = length
+            resp.raw = io.BytesIO(body)
+            return resp
+        
+        fetcher = BoundedFetcher(max_bytes=1000)
+        session = Mock()
+        session.get.side_effect = [
+            response(b'%PDF' * 500, 'application/pdf', '2000'),
+            response(b'<p>careers</p>' * 200, 'text/html', '2800'),
+            response(b'<p>careers@example.org</p>' * 100, 'text/html; charset=utf-8'),
+            response(b'<p>Join us</p>', 'text/html'),
+        ]
+        
+        pdf, oversized, streamed, page = [fetcher.get(session, 'https://example.com/careers') for _ in range(4)]
+        
+        assert (pdf.skipped, pdf.content) == ('content_type', b'')
+        assert oversized.skipped == 'content_length'
+        assert streamed.truncated and len(streamed.content) == 1000
+        assert streamed.text.startswith('<p>careers@example.org</p>')
+        assert page.text == '<p>Join us</p>' and not page.truncated
+        assert fetcher.bytes_avoided == 4800
+        assert session.get.call_args.kwargs['stream'] is True
+    
+    def test_contact_probes_use_the_configured_byte_cap(self):
+        """Careers and contact probes read no more than fetch_max_bytes"""
+        from app.config import get_settings
+        from app.contact_extractor import contact_extractor
+        
+        assert contact_extractor.fetcher.max_bytes == get_settings().fetch_max_bytes
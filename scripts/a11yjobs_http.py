@@ -0,0 +1,571 @@
+"""HTTP fetching, HTML parsing and retries shared by the a11yjobs scripts.
+
+``run_a11yjobs_daily`` and ``scrape_a11yjobs`` both import from here, so a
+script that only needs to load a page does not pull in the daily pipeline.
+"""
+
+import heapq
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# HTML backends. Trees are BeautifulSoup trees built by HTML_PARSER: "auto"
+# takes lxml, a C parser, when it is installed and "html.parser" otherwise;
+# A11YJOBS_HTML_PARSER pins either ("html.parser" reproduces earlier trees
+# exactly; lxml recovers differently from some malformed markup). Lookups
+# that only need strings out of a page (JSON-LD, a meta tag, link targets)
+# skip the Python tree and use selectolax's lexbor parser when that is
+# installed and no parser is pinned.
+HTML_PARSER_BACKENDS = ("lxml", "html.parser")
+
+
+def resolve_html_parser(requested: str = "auto") -> str:
+    """Return the tree builder for ``requested``: "auto", "lxml" or "html.parser"."""
+    requested = (requested or "auto").strip().lower()
+    if requested != "auto" and requested not in HTML_PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser {requested!r}; expected auto or one of {HTML_PARSER_BACKENDS}")
+    if requested == "html.parser":
+        return requested
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        if requested == "lxml":
+            raise
+        return "html.parser"
+    return "lxml"
+
+
+def _load_lexbor_parser(requested: str) -> Optional[Callable[[str], Any]]:
+    if (requested or "auto").strip().lower() != "auto":
+        return None
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+    return LexborHTMLParser
+
+
+HTML_PARSER = resolve_html_parser(os.getenv("A11YJOBS_HTML_PARSER", "auto"))
+_LEXBOR_PARSER = _load_lexbor_parser(os.getenv("A11YJOBS_HTML_PARSER", "auto"))
+
+_HTML_PARSE_STATS: Dict[str, Dict[str, float]] = {}
+_HTML_PARSE_LOCK = threading.Lock()
+
+
+def _record_html_parse(purpose: str, markup: Union[str, bytes], started: float) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _HTML_PARSE_LOCK:
+        stats = _HTML_PARSE_STATS.setdefault(purpose, {"documents": 0, "bytes": 0, "ms": 0.0})
+        stats["documents"] += 1
+        stats["bytes"] += len(markup)
+        stats["ms"] += elapsed_ms
+
+
+def parse_html(
+    markup: Union[str, bytes],
+    purpose: str,
+    parse_only: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    """Parse ``markup`` with HTML_PARSER, timing it under ``purpose``.
+
+    Response bytes should be passed as they are: BeautifulSoup sniffs the
+    declared encoding itself, which skips requests' whole-body charset
+    detection behind ``response.text``.
+    """
+    started = time.perf_counter()
+    soup = BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+    _record_html_parse(purpose, markup, started)
+    return soup
+
+
+def select_html(
+    markup: Union[str, bytes],
+    purpose: str,
+    selector: str,
+    parse_only: SoupStrainer,
+    attribute: Optional[str] = None,
+) -> List[Optional[str]]:
+    """Return ``attribute`` (or the raw text) of every node matching ``selector``.
+
+    ``parse_only`` must keep every node the selector can match; it limits the
+    BeautifulSoup parse when lexbor is unavailable, or when bytes are not
+    UTF-8 and need BeautifulSoup's encoding detection.
+    """
+    if _LEXBOR_PARSER is not None:
+        text: Optional[str] = markup if isinstance(markup, str) else None
+        if text is None:
+            try:
+                text = markup.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        if text is not None:
+            started = time.perf_counter()
+            nodes = _LEXBOR_PARSER(text).css(selector)
+            values = [node.attributes.get(attribute) if attribute else node.text(deep=True) for node in nodes]
+            _record_html_parse(purpose, markup, started)
+            return values
+    nodes = parse_html(markup, purpose, parse_only).select(selector)
+    return [node.get(attribute) if attribute else node.get_text("") for node in nodes]
+
+
+def html_parse_stats() -> Dict[str, Any]:
+    """Backends in use plus documents, input size and parse time per purpose."""
+    with _HTML_PARSE_LOCK:
+        purposes = {
+            purpose: {**stats, "ms": round(stats["ms"], 1)}
+            for purpose, stats in sorted(_HTML_PARSE_STATS.items())
+        }
+    return {
+        "parser": HTML_PARSER,
+        "lookups": "selectolax" if _LEXBOR_PARSER is not None else HTML_PARSER,
+        "purposes": purposes,
+    }
+
+
+# Deadlines. A Deadline caps a unit of work and every network timeout under
+# it is clipped to the time left.
+class DeadlineExceeded(Exception):
+    """A Deadline, or one of its parents, ran out before the work finished."""
+
+
+class Deadline:
+    """A time by which work must finish, never later than its ``parent``'s.
+
+    ``seconds=None`` sets no limit of its own. ``timeout(cap)`` is the
+    timeout for the next network call: ``cap`` clipped to the time left,
+    raising DeadlineExceeded once nothing is left.
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float],
+        parent: Optional["Deadline"] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.clock = parent.clock if parent is not None else clock
+        self.parent = parent
+        self.expires_at = None if seconds is None else self.clock() + seconds
+
+    def cancel(self) -> None:
+        """Expire now; work under this deadline (and its children) stops at its next check."""
+        self.expires_at = self.clock()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None when neither this deadline nor a parent has a limit."""
+        own = None if self.expires_at is None else self.expires_at - self.clock()
+        inherited = self.parent.remaining() if self.parent is not None else None
+        if own is None or inherited is None:
+            return inherited if own is None else own
+        return min(own, inherited)
+
+    def expired(self) -> bool:
+        left = self.remaining()
+        return left is not None and left <= 0
+
+    def timeout(self, cap: float) -> float:
+        left = self.remaining()
+        if left is None:
+            return cap
+        if left <= 0:
+            raise DeadlineExceeded("enrichment budget exhausted")
+        return min(cap, left)
+
+
+def deadline_timeout(deadline: Optional[Deadline], cap: float) -> float:
+    return cap if deadline is None else deadline.timeout(cap)
+
+
+# Bounded reads. Apply links can lead to PDFs, images or multi-megabyte
+# app bundles; responses are streamed, anything that is not a page or JSON
+# is dropped on its headers and bodies stop at FETCH_MAX_BYTES.
+FETCH_MAX_BYTES = 2 * 1024 * 1024
+FETCH_CHUNK_BYTES = 64 * 1024
+FETCHABLE_MEDIA_TYPES = frozenset({
+    "text/html", "application/xhtml+xml", "text/plain", "application/json", "application/ld+json",
+})
+
+_FETCH_STATS: Dict[str, int] = Counter()
+_FETCH_STATS_LOCK = threading.Lock()
+
+
+class BoundedResponse(NamedTuple):
+    status_code: int
+    url: str
+    headers: Any
+    content: bytes
+    encoding: Optional[str]
+    # "content_type" or "content_length" when the body was not read at all
+    skipped: Optional[str]
+    truncated: bool
+
+    @property
+    def text(self) -> str:
+        """The body read so far, decoded like ``requests`` (UTF-8 when no charset is known)."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+def _declared_length(headers: Any) -> Optional[int]:
+    value = str(headers.get("Content-Length") or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def fetch_bounded(
+    session: requests.Session,
+    url: str,
+    timeout: float,
+    max_bytes: int = FETCH_MAX_BYTES,
+    deadline: Optional[Deadline] = None,
+    **kwargs: Any,
+) -> BoundedResponse:
+    """GET ``url`` reading at most ``max_bytes`` of an HTML, JSON or text body.
+
+    The body is left unread when the status is an error, the content type
+    is something else, or Content-Length already exceeds the cap; a longer
+    stream is cut at the cap. Network errors propagate as from
+    ``session.get``. With ``deadline`` the timeout is clipped to the time
+    left and DeadlineExceeded is raised once it runs out, mid-body included.
+    """
+    timeout = deadline_timeout(deadline, timeout)
+    response = session.get(url, timeout=timeout, stream=True, **kwargs)
+    try:
+        headers = response.headers
+        media_type = str(headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        declared = _declared_length(headers)
+        skipped = None
+        if media_type and media_type not in FETCHABLE_MEDIA_TYPES:
+            skipped = "content_type"
+        elif declared is not None and declared > max_bytes:
+            skipped = "content_length"
+        chunks: List[bytes] = []
+        size = 0
+        truncated = False
+        if not skipped and response.status_code < 400:
+            for chunk in response.iter_content(FETCH_CHUNK_BYTES):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > max_bytes:
+                    truncated = True
+                    break
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded(f"enrichment budget exhausted reading {url}")
+        content = b"".join(chunks)[:max_bytes]
+        result = BoundedResponse(
+            response.status_code, response.url, headers, content, response.encoding, skipped, truncated,
+        )
+    finally:
+        response.close()
+    with _FETCH_STATS_LOCK:
+        _FETCH_STATS["responses"] += 1
+        _FETCH_STATS["bytes_read"] += len(content)
+        if skipped:
+            _FETCH_STATS[f"skipped_{skipped}"] += 1
+        if truncated:
+            _FETCH_STATS["truncated"] += 1
+        if declared is not None and declared > len(content) and (skipped or truncated):
+            _FETCH_STATS["bytes_avoided"] += declared - len(content)
+    return result
+
+
+def fetch_stats() -> Dict[str, int]:
+    """Responses read, bytes read and bytes left unread (when a length was declared)."""
+    with _FETCH_STATS_LOCK:
+        return {
+            key: _FETCH_STATS[key]
+            for key in (
+                "responses", "bytes_read", "bytes_avoided",
+                "skipped_content_type", "skipped_content_length", "truncated",
+            )
+        }
+
+
+# Retries. Every retrying HTTP call site shares one policy: capped exponential
+# backoff with jitter, the server's Retry-After honoured, only transient
+# failures retried, and a per-run budget so a struggling upstream cannot
+# multiply the number of requests a run makes.
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 30.0
+# A Retry-After longer than this gives up instead of parking the call.
+RETRY_AFTER_MAX_SECONDS = 120.0
+RETRY_BUDGET = 200
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def retry_after_seconds(headers: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """Retry-After as seconds from now; the header may be a number or an HTTP date."""
+    value = str((headers or {}).get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def is_transient_http_error(error: BaseException) -> bool:
+    """Timeouts, dropped connections and 408/425/429/5xx gateway statuses."""
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in RETRYABLE_STATUSES
+    if isinstance(error, requests.exceptions.SSLError):
+        return False
+    return isinstance(error, (
+        requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError,
+    ))
+
+
+def _error_retry_after(error: BaseException) -> Optional[float]:
+    response = getattr(error, "response", None)
+    return retry_after_seconds(getattr(response, "headers", None)) if response is not None else None
+
+
+class RetryPolicy:
+    """Backoff, Retry-After and the per-run retry budget for every call site.
+
+    ``delay`` decides whether a failed attempt is retried and how long to
+    wait first; ``call`` retries inline for sequential callers, and
+    ``RetryScheduler`` parks pooled retries on a delay queue instead of a
+    worker thread. Retries, give-ups and seconds waited are counted per
+    ``site``.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = RETRY_BUDGET,
+        base: float = RETRY_BASE_SECONDS,
+        max_delay: float = RETRY_MAX_DELAY_SECONDS,
+        max_retry_after: float = RETRY_AFTER_MAX_SECONDS,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.base = base
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.rng = rng
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self.reset(budget)
+
+    def reset(self, budget: Optional[int] = RETRY_BUDGET) -> None:
+        """Start a new run: restore the budget (None for unlimited) and clear the counts."""
+        with self._lock:
+            self.budget = budget
+            self._counts: Dict[str, int] = Counter()
+            self._sites: Dict[str, Dict[str, Any]] = {}
+            self._waited = 0.0
+
+    def _site(self, site: str) -> Dict[str, Any]:
+        return self._sites.setdefault(site, {"retries": 0, "gave_up": 0, "wait_seconds": 0.0})
+
+    def delay(
+        self,
+        attempt: int,
+        attempts: int,
+        retry_after: Optional[float] = None,
+        site: str = "other",
+    ) -> Optional[float]:
+        """Seconds to wait before retrying failed attempt ``attempt`` (1-based), or None to give up.
+
+        The wait is half the capped exponential backoff plus up to the other
+        half at random, and never less than ``retry_after``. Each retry spends
+        one unit of the run's budget.
+        """
+        with self._lock:
+            stats = self._site(site)
+            if attempt >= attempts or (retry_after is not None and retry_after > self.max_retry_after):
+                stats["gave_up"] += 1
+                return None
+            if self.budget is not None and self._counts["retries"] >= self.budget:
+                stats["gave_up"] += 1
+                self._counts["budget_exhausted"] += 1
+                return None
+            stats["retries"] += 1
+            self._counts["retries"] += 1
+        backoff = min(self.max_delay, self.base * 2 ** (attempt - 1))
+        seconds = backoff / 2 + self.rng() * backoff / 2
+        return max(seconds, retry_after or 0.0)
+
+    def record_wait(self, seconds: float, site: str = "other", deferred: bool = False) -> None:
+        with self._lock:
+            self._site(site)["wait_seconds"] += seconds
+            self._waited += seconds
+            if deferred:
+                self._counts["deferred"] += 1
+
+    def wait(self, seconds: float, site: str = "other") -> None:
+        self.sleep(seconds)
+        self.record_wait(seconds, site)
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        attempts: int = 3,
+        retryable: Callable[[BaseException], bool] = is_transient_http_error,
+        site: str = "other",
+        **kwargs: Any,
+    ) -> Any:
+        """``func(*args, **kwargs)``, retried inline; the last error propagates."""
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as error:
+                if not retryable(error):
+                    raise
+                seconds = self.delay(attempt, attempts, _error_retry_after(error), site)
+                if seconds is None:
+                    raise
+                self.wait(seconds, site)
+                attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "budget": self.budget,
+                "retries": self._counts["retries"],
+                "deferred": self._counts["deferred"],
+                "budget_exhausted": self._counts["budget_exhausted"],
+                "wait_seconds": round(self._waited, 1),
+                "sites": {
+                    site: {**stats, "wait_seconds": round(stats["wait_seconds"], 1)}
+                    for site, stats in sorted(self._sites.items())
+                },
+            }
+
+
+RETRY_POLICY = RetryPolicy()
+
+
+def retry_stats() -> Dict[str, Any]:
+    """Retries per call site, retries left waiting on the delay queue and seconds waited."""
+    return RETRY_POLICY.stats()
+
+
+class RetryScheduler:
+    """Runs calls on ``executor`` and parks their retries on a delay queue.
+
+    A failed attempt does not sleep on its worker: it is pushed onto a heap
+    keyed by when it is due, and a timer thread resubmits it to the executor
+    then, so the worker picks up other calls in the meantime. ``submit``
+    returns a Future for the final outcome. Use as a context manager inside
+    the executor's, and collect every future before leaving it.
+    """
+
+    def __init__(
+        self,
+        executor: Any,
+        policy: Optional[RetryPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.executor = executor
+        self.policy = policy or RETRY_POLICY
+        self.clock = clock
+        self._queue: List[Tuple[float, int, Tuple[Any, ...]]] = []
+        self._sequence = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._timer = threading.Thread(target=self._run_timer, name="retry-scheduler", daemon=True)
+        self._timer.start()
+
+    def __enter__(self) -> "RetryScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        attempts: int = 3,
+        retryable: Callable[[BaseException], bool] = is_transient_http_error,
+        site: str = "other",
+    ) -> Future:
+        future: Future = Future()
+        self.executor.submit(self._attempt, future, (func, args, attempts, retryable, site), 1)
+        return future
+
+    def _attempt(self, future: Future, call: Tuple[Any, ...], attempt: int) -> None:
+        func, args, attempts, retryable, site = call
+        try:
+            result = func(*args)
+        except Exception as error:
+            seconds = (
+                self.policy.delay(attempt, attempts, _error_retry_after(error), site)
+                if retryable(error) else None
+            )
+            if seconds is None:
+                future.set_exception(error)
+                return
+            self.policy.record_wait(seconds, site, deferred=True)
+            with self._cond:
+                self._sequence += 1
+                heapq.heappush(self._queue, (self.clock() + seconds, self._sequence, (future, call, attempt + 1)))
+                self._cond.notify()
+            return
+        future.set_result(result)
+
+    def _run_timer(self) -> None:
+        with self._cond:
+            while not self._closed:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+                due = self._queue[0][0] - self.clock()
+                if due > 0:
+                    self._cond.wait(due)
+                    continue
+                _, _, retry = heapq.heappop(self._queue)
+                self.executor.submit(self._attempt, *retry)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._timer.join()
+
+
+def load_page(
+    session: requests.Session,
+    url: str,
+    parse_only: Optional[SoupStrainer] = None,
+) -> Optional[BeautifulSoup]:
+    """One attempt at ``url``: the parsed page, None for non-page content, or the error."""
+    response = fetch_bounded(session, url, timeout=10)
+    response.raise_for_status()
+    if response.skipped:
+        return None
+    return parse_html(response.content, "page", parse_only)
+
+
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    retries: int = 3,
+    parse_only: Optional[SoupStrainer] = None,
+) -> Optional[BeautifulSoup]:
+    try:
+        return RETRY_POLICY.call(load_page, session, url, parse_only, attempts=retries, site="page")
+    except Exception:
+        return None
@@ -0,0 +1,954 @@
+#!/usr/bin/env python3
+"""Offline micro-benchmarks for the daily pipeline's hot text paths.
+
+Each case times the current implementation in ``run_a11yjobs_daily`` against
+the per-term approach it replaced, over a synthetic corpus of description-
+sized documents. Nothing touches the network or the database.
+
+Usage (from scripts/):
+    python benchmark_a11yjobs_pipeline.py --docs 500
+    python benchmark_a11yjobs_pipeline.py --case keywords --size 16000
+    python benchmark_a11yjobs_pipeline.py --case consolidation --candidates 10000 100000
+    python benchmark_a11yjobs_pipeline.py --case descriptions --baseline-rev 8212e3c
+    python benchmark_a11yjobs_pipeline.py --case structured_fields --baseline-rev 731ae64
+    python benchmark_a11yjobs_pipeline.py --case adversarial --adversarial-sizes 20000 2000000
+    A11YJOBS_HTML_PARSER=lxml python benchmark_a11yjobs_pipeline.py --case html_parsing --docs 50
+    python benchmark_a11yjobs_pipeline.py --case fetched_document --baseline-rev e2f5ee1 --docs 50
+    python benchmark_a11yjobs_pipeline.py --case search_cache --days 30 --new-per-day 40
+    python benchmark_a11yjobs_pipeline.py --case frontier --days 30 --new-per-day 40
+    python benchmark_a11yjobs_pipeline.py --case host_breaker --jobs 400 --hosts 30
+    python benchmark_a11yjobs_pipeline.py --case bounded_fetch --responses 100
+    python benchmark_a11yjobs_pipeline.py --case retry_scheduler --fetches 60
+    python benchmark_a11yjobs_pipeline.py --case alternate_links --link-jobs 40
+    python benchmark_a11yjobs_pipeline.py --case deadlines --jobs 200 --hosts 30 --job-budget 10
+
+The ``analysis_cache`` case compares against a zero-size cache, i.e. every
+view recomputed at every call site. The ``descriptions``,
+``structured_fields``, ``html_parsing`` and ``fetched_document`` cases import the pipeline as it was at
+``--baseline-rev`` (via ``git show``) and also check that both revisions
+produce identical output.
+"""
+
+import argparse
+import html
+import io
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import requests
+
+import a11yjobs_http
+import run_a11yjobs_daily as daily
+
+
+SAMPLE_PARAGRAPHS = [
+    "We are seeking an accessibility specialist to audit web and mobile products "
+    "against WCAG 2.1 AA, pair with engineers on ARIA patterns and test with JAWS, "
+    "NVDA and VoiceOver on iOS and Android.",
+    "Responsibilities include manual testing and automated testing with axe-core, "
+    "Playwright and Lighthouse, remediating accessible documents and PDFs, and "
+    "writing VPAT / ACR reports for Section 508 procurement.",
+    "Preferred qualifications: CPACC or WAS certification preferred, Trusted Tester "
+    "Certification, experience with React, TypeScript, Figma and inclusive design.",
+    "You will log document accessibility defects, coach designers on UX and UI "
+    "patterns, and support screen reader users across our website and apps.",
+    "Our company is headquartered in Canada with offices in Bulgaria. Benefits "
+    "include health insurance, 401(k) matching and paid time off.",
+]
+
+
+def synthetic_documents(count: int, size: int, seed: int = 7) -> List[str]:
+    """Markdown-ish job descriptions of roughly ``size`` characters"""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        parts: List[str] = []
+        while sum(len(part) for part in parts) < size:
+            parts.append(("- " if rng.random() < 0.3 else "") + rng.choice(SAMPLE_PARAGRAPHS))
+        documents.append("\n\n".join(parts))
+    return documents
+
+
+# Per-term reference implementations, as the pipeline ran before the
+# single-pass KeywordMatcher.
+_LEGACY_SKILL_PATTERNS = [
+    (skill, re.compile(r"\b" + re.escape(skill) + r"\b", re.I))
+    for skill in daily._SKILL_KEYWORDS
+]
+
+
+def legacy_extract_skills(text: str) -> List[str]:
+    analysis_text = daily._plain_markdown(text)
+    found = []
+    for skill, pattern in _LEGACY_SKILL_PATTERNS:
+        if pattern.search(analysis_text) and skill not in found:
+            found.append(skill)
+    return found
+
+
+def legacy_relevance_score(title: str, description: str) -> int:
+    title_lower = title.lower()
+    description_lower = description.lower()
+    title_hits = sum(1 for marker in daily._RELEVANCE_TITLE_MARKERS if marker in title_lower)
+    description_hits = sum(1 for marker in daily._RELEVANCE_DESCRIPTION_MARKERS if marker in description_lower)
+    return title_hits * 5 + min(description_hits, 8)
+
+
+@contextmanager
+def analysis_cache(maxsize: int, module: types.ModuleType = daily) -> Iterator["daily.TextAnalysisCache"]:
+    """Run with a fresh text analysis cache; size 0 recomputes every view"""
+    original = module._TEXT_ANALYSIS_CACHE
+    module._TEXT_ANALYSIS_CACHE = module.TextAnalysisCache(maxsize=maxsize)
+    try:
+        yield module._TEXT_ANALYSIS_CACHE
+    finally:
+        module._TEXT_ANALYSIS_CACHE = original
+
+
+@contextmanager
+def shared_link_sessions() -> Iterator[None]:
+    """Let alternate links fetch on the stand-in session instead of forking a real one"""
+    original = daily.fork_session
+    daily.fork_session = lambda session: session
+    try:
+        yield
+    finally:
+        daily.fork_session = original
+
+
+def time_per_doc(func: Callable[[str], object], documents: List[str], repeat: int) -> float:
+    """Best-of-``repeat`` milliseconds per document"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            func(document)
+        best = min(best, time.perf_counter() - start)
+    return best / len(documents) * 1000
+
+
+def case_keywords(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    repeat = args.repeat
+    rows = []
+    pairs = [
+        ("extract_skills", legacy_extract_skills, daily.extract_skills),
+        ("relevance_score",
+         lambda text: legacy_relevance_score("Accessibility Engineer", text),
+         lambda text: daily.accessibility_relevance_score("Accessibility Engineer", text)),
+    ]
+    for name, legacy, current in pairs:
+        legacy_ms = time_per_doc(legacy, documents, repeat)
+        with analysis_cache(0):
+            current_ms = time_per_doc(current, documents, repeat)
+        rows.append({
+            "case": name,
+            "legacy_ms_per_doc": round(legacy_ms, 3),
+            "current_ms_per_doc": round(current_ms, 3),
+            "speedup": round(legacy_ms / current_ms, 1),
+        })
+    return rows
+
+
+def _candidate_pass(documents: List[str]) -> None:
+    """The per-candidate text work of one run: extract, rank twice, verify."""
+    jobs = []
+    for index, document in enumerate(documents):
+        sections = daily.analyze_text(document).sections
+        daily.extract_structured_fields(document, sections)
+        jobs.append({"title": f"Accessibility Engineer {index}", "company": "Acme",
+                     "description": document, "job_source": "linkedin"})
+    sorted(jobs, key=daily.candidate_quality_score)
+    sorted(jobs, key=daily.candidate_quality_score)
+    for job in jobs:
+        daily.external_content_matches_job(job["description"], job)
+
+
+def case_analysis_cache(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    repeat = args.repeat
+    timings = {}
+    for label, maxsize in (("uncached", 0), ("cached", len(documents))):
+        best = float("inf")
+        for _ in range(repeat):
+            with analysis_cache(maxsize) as cache:
+                start = time.perf_counter()
+                _candidate_pass(documents)
+                best = min(best, time.perf_counter() - start)
+                stats = cache.stats()
+        timings[label] = best / len(documents) * 1000
+    return [{
+        "case": "candidate_pass",
+        "legacy_ms_per_doc": round(timings["uncached"], 3),
+        "current_ms_per_doc": round(timings["cached"], 3),
+        "speedup": round(timings["uncached"] / timings["cached"], 1),
+        "hit_rate": stats["hit_rate"],
+    }]
+
+
+SOURCE_MIX = ["a11yjobs", "indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
+
+
+VOCABULARY = sorted(set(re.findall(r"[a-z]+", " ".join(SAMPLE_PARAGRAPHS).lower())))
+
+
+def synthetic_candidates(count: int, seed: int = 11) -> List[Dict[str, object]]:
+    """Normalized candidates, about three sources per distinct posting.
+
+    Every posting has its own description. Some sources spell the title or
+    employer differently ("Sr." / "Senior", "Acme 7, Inc." / "ACME 7"), which
+    only near-duplicate detection can fold together.
+    """
+    rng = random.Random(seed)
+    candidates = []
+    descriptions: Dict[int, str] = {}
+    for index in range(count):
+        posting = index // 3
+        if posting not in descriptions:
+            descriptions[posting] = " ".join(rng.choice(VOCABULARY) for _ in range(120))
+        source = rng.choice(SOURCE_MIX)
+        direct = rng.random() < 0.2
+        variant = rng.random() < 0.3
+        candidates.append({
+            "title": f"{'Sr.' if variant else 'Senior'} Accessibility Engineer {posting}",
+            "company": f"ACME {posting % 997}" if variant else f"Acme {posting % 997}, Inc.",
+            "job_source": source,
+            "source_url": (f"https://careers.acme{posting}.example/jobs/{posting}" if direct
+                           else f"https://www.{source}.com/jobs/view/{index}"),
+            "description": descriptions[posting],
+            "salary_min": 90000 if rng.random() < 0.5 else None,
+            "salary_max": 120000,
+            "relevance_score": rng.randint(0, 13),
+        })
+    return candidates
+
+
+def case_consolidation(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    rows = []
+    for count in args.candidates:
+        candidates = synthetic_candidates(count)
+        with analysis_cache(2048):
+            start = time.perf_counter()
+            consolidated, duplicates = daily.consolidate_source_candidates(candidates)
+            elapsed = time.perf_counter() - start
+        rows.append({
+            "case": "consolidate_source_candidates",
+            "candidates": count,
+            "consolidated": len(consolidated),
+            "duplicates": len(duplicates),
+            "near_duplicates": sum(1 for row in duplicates if row["reason"] == "cross_source_near_duplicate"),
+            "seconds": round(elapsed, 2),
+            "us_per_candidate": round(elapsed / count * 1e6, 1),
+        })
+    return rows
+
+
+GENERIC_PARAGRAPH = (
+    "Join our operations team to manage vendor relationships, schedule facilities work, "
+    "track budgets and coordinate office moves across three regional sites. "
+)
+
+
+def synthetic_jobspy_frame(rows: int, seed: int = 5):
+    """A concatenated JobSpy result: repeats across searches, off-topic hits"""
+    import pandas as pd
+
+    rng = random.Random(seed)
+    records = []
+    for index in range(rows):
+        # Overlapping search terms and markets return the same posting again
+        posting = rng.randrange(max(1, int(rows * 0.7)))
+        relevant = posting % 5 < 2
+        records.append({
+            "site": rng.choice(["indeed", "linkedin", "glassdoor"]),
+            "title": f"Accessibility Engineer {posting}" if relevant else f"Operations Coordinator {posting}",
+            "company": f"Acme {posting % 211}",
+            "job_url": f"https://www.indeed.com/viewjob?jk={posting}",
+            "job_url_direct": None,
+            "date_posted": "2026-07-15",
+            "location": "Remote, US",
+            "description": " ".join(rng.choice(SAMPLE_PARAGRAPHS) for _ in range(16))
+            if relevant else GENERIC_PARAGRAPH * 20,
+        })
+    return pd.DataFrame(records)
+
+
+def legacy_map_jobspy_rows(frame) -> int:
+    seen_urls = set()
+    mapped = 0
+    for row in frame.to_dict("records"):
+        row_url = daily.clean_optional_text(row.get("job_url_direct")) or daily.clean_optional_text(row.get("job_url"))
+        if row_url and row_url in seen_urls:
+            continue
+        if row_url:
+            seen_urls.add(row_url)
+        mapped += daily.jobspy_record_to_job(row) is not None
+    return mapped
+
+
+def current_map_jobspy_rows(frame) -> int:
+    rows, _ = daily.preprocess_jobspy_frame(frame)
+    return sum(daily.jobspy_record_to_job(row) is not None for row in rows)
+
+
+def case_jobspy_prefilter(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    frame = synthetic_jobspy_frame(args.jobspy_rows)
+    timings = {}
+    mapped = {}
+    for label, func in (("legacy", legacy_map_jobspy_rows), ("current", current_map_jobspy_rows)):
+        with analysis_cache(2048):
+            start = time.perf_counter()
+            mapped[label] = func(frame)
+            timings[label] = time.perf_counter() - start
+    _, prefilter = daily.preprocess_jobspy_frame(frame)
+    return [{
+        "case": "jobspy_rows",
+        "rows": len(frame),
+        "rows_to_map": prefilter["rows_to_map"],
+        "mapped": mapped["current"],
+        "mapped_legacy": mapped["legacy"],
+        "legacy_seconds": round(timings["legacy"], 2),
+        "current_seconds": round(timings["current"], 2),
+        "speedup": round(timings["legacy"] / timings["current"], 1),
+    }]
+
+
+ATS_HEADINGS = [
+    "About the Role", "Responsibilities", "What You'll Do", "Qualifications",
+    "Preferred Qualifications", "Nice to have", "Required Skills", "Benefits",
+]
+
+
+def synthetic_ats_documents(count: int, size: int, seed: int = 13) -> List[str]:
+    """Raw ATS page text: bold headings, glyph bullets, wrapped and indented lines"""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        parts: List[str] = []
+        while sum(len(part) for part in parts) < size:
+            roll = rng.random()
+            if roll < 0.1:
+                parts.append(f"**{rng.choice(ATS_HEADINGS)}**")
+            elif roll < 0.5:
+                parts.append("\n".join("• " + rng.choice(SAMPLE_PARAGRAPHS)[:90] for _ in range(4)))
+            elif roll < 0.6:
+                parts.append("  " + rng.choice(SAMPLE_PARAGRAPHS))
+            else:
+                parts.append(rng.choice(SAMPLE_PARAGRAPHS) + " " + rng.choice(SAMPLE_PARAGRAPHS))
+        documents.append("\n\n".join(parts))
+    return documents
+
+
+@lru_cache(maxsize=None)
+def load_baseline_module(revision: str) -> types.ModuleType:
+    """Import ``run_a11yjobs_daily`` as committed at ``revision``"""
+    source = subprocess.run(
+        ["git", "show", f"{revision}:./run_a11yjobs_daily.py"],
+        cwd=Path(__file__).resolve().parent, check=True, capture_output=True, text=True,
+    ).stdout
+    module = types.ModuleType("run_a11yjobs_daily_baseline")
+    sys.modules[module.__name__] = module
+    exec(compile(source, f"{revision}:run_a11yjobs_daily.py", "exec"), module.__dict__)
+    return module
+
+
+def case_descriptions(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    baseline = load_baseline_module(args.baseline_rev)
+    pages = synthetic_ats_documents(len(documents), args.size)
+    rows = []
+    for name in ("normalize_description_text", "parse_description_sections"):
+        legacy, current = getattr(baseline, name), getattr(daily, name)
+        legacy_ms = time_per_doc(legacy, pages, args.repeat)
+        current_ms = time_per_doc(current, pages, args.repeat)
+        rows.append({
+            "case": name,
+            "legacy_ms_per_doc": round(legacy_ms, 3),
+            "current_ms_per_doc": round(current_ms, 3),
+            "speedup": round(legacy_ms / current_ms, 1),
+            "identical": all(legacy(page) == current(page) for page in pages),
+        })
+    return rows
+
+
+def case_structured_fields(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Field extraction from a cold analysis cache, sections already parsed"""
+    baseline = load_baseline_module(args.baseline_rev)
+    pages = synthetic_ats_documents(len(documents), args.size)
+    sections = [daily.parse_description_sections(page) for page in pages]
+    timings = {}
+    outputs = {}
+    for label, module in (("legacy", baseline), ("current", daily)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            with analysis_cache(len(pages), module):
+                start = time.perf_counter()
+                outputs[label] = [
+                    module.extract_structured_fields(page, page_sections)
+                    for page, page_sections in zip(pages, sections)
+                ]
+                best = min(best, time.perf_counter() - start)
+        timings[label] = best / len(pages) * 1000
+    return [{
+        "case": "extract_structured_fields",
+        "legacy_ms_per_doc": round(timings["legacy"], 3),
+        "current_ms_per_doc": round(timings["current"], 3),
+        "speedup": round(timings["legacy"] / timings["current"], 1),
+        "identical": outputs["legacy"] == outputs["current"],
+    }]
+
+
+def adversarial_inputs(size: int) -> Dict[str, str]:
+    """Pathological scraped text, each about ``size`` characters.
+
+    Every entry once drove a regex in the pipeline into quadratic (or
+    worse) backtracking, or is the shape that would: long runs that almost
+    match and never close.
+    """
+    return {
+        "blank_lines": "\n" * size,
+        "unclosed_brackets": "](" + "[" * size,
+        "unclosed_links": "[x](" * (size // 4),
+        "email_local_run": "a." * (size // 2),
+        "email_at_run": "a@" * (size // 2),
+        "hyphenated_run": "Acme-" * (size // 5),
+        "salary_markers": "salary $ " * (size // 9),
+        "salary_digits": "salary $" + "1 " * (size // 2),
+        "html_tags": "<b>" * (size // 3),
+        "indented_connectors": "\n".join("   of x" for _ in range(size // 8)),
+        "dangling_bullets": "\n".join("- x with" for _ in range(size // 9)),
+        "repeated_markers": "5 years WCAG 2.1 " * (size // 17),
+        "one_long_line": "x" * size,
+        "stars": "*" * size,
+    }
+
+
+ADVERSARIAL_ENTRY_POINTS: Dict[str, Callable[[str], object]] = {
+    "normalize_description_text": daily.normalize_description_text,
+    "parse_description_sections": daily.parse_description_sections,
+    "extract_structured_fields": lambda text: daily.extract_structured_fields(text, {}),
+    "parse_salary": daily.parse_salary,
+    "extract_contact_email": daily.extract_contact_email,
+}
+
+
+def case_adversarial(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Worst input per entry point; latency must stay flat past the caps"""
+    rows = []
+    for size in args.adversarial_sizes:
+        inputs = adversarial_inputs(size)
+        for name, func in ADVERSARIAL_ENTRY_POINTS.items():
+            worst, worst_input = 0.0, ""
+            for label, text in inputs.items():
+                with analysis_cache(0):
+                    start = time.perf_counter()
+                    func(text)
+                    elapsed = time.perf_counter() - start
+                if elapsed > worst:
+                    worst, worst_input = elapsed, label
+            rows.append({
+                "case": name,
+                "chars": size,
+                "worst_ms": round(worst * 1000, 1),
+                "worst_input": worst_input,
+            })
+    rows.append({"case": "extraction_guards", **daily.extraction_guard_stats()})
+    return rows
+
+
+def synthetic_ats_pages(count: int, size: int, seed: int = 19) -> List[str]:
+    """Direct-ATS HTML: site chrome, JSON-LD, og:site_name and a marked job body"""
+    rng = random.Random(seed)
+    pages = []
+    for text in synthetic_ats_documents(count, size, seed):
+        body = []
+        for block in text.split("\n\n"):
+            if block.startswith("**"):
+                body.append(f"<h2>{html.escape(block.strip('*'))}</h2>")
+            elif block.startswith("• "):
+                items = "".join(f"<li>{html.escape(line[2:])}</li>" for line in block.splitlines())
+                body.append(f"<ul>{items}</ul>")
+            else:
+                body.append(f"<p>{html.escape(block)}</p>")
+        nav = "".join(f'<li><a href="/careers/{n}">Team {n}</a></li>' for n in range(rng.randint(20, 60)))
+        jsonld = json.dumps({"@type": "JobPosting", "title": "Accessibility Engineer", "description": text[:2000]})
+        pages.append(
+            "<!doctype html><html><head><title>Accessibility Engineer</title>"
+            '<meta property="og:site_name" content="Example Co">'
+            f'<script type="application/ld+json">{jsonld}</script>'
+            "<style>body { font-family: sans-serif; }</style></head><body>"
+            f"<header><nav><ul>{nav}</ul></nav></header>"
+            f'<main><div itemprop="description">{"".join(body)}</div>'
+            '<a href="https://jobs.lever.co/example/123/apply">Apply</a></main>'
+            "<footer><script>window.analytics = {};</script></footer></body></html>"
+        )
+    return pages
+
+
+def case_html_parsing(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """External-page consumers on html.parser trees vs the current backends"""
+    baseline = load_baseline_module(args.baseline_rev)
+    pages = synthetic_ats_pages(len(documents), args.size)
+    rows = []
+    for name in (
+        "extract_external_jobposting",
+        "extract_external_company_name",
+        "extract_embedded_direct_job_urls",
+        "normalize_external_content",
+    ):
+        legacy, current = getattr(baseline, name), getattr(daily, name)
+        legacy_ms = time_per_doc(legacy, pages, args.repeat)
+        current_ms = time_per_doc(current, pages, args.repeat)
+        rows.append({
+            "case": name,
+            "legacy_ms_per_doc": round(legacy_ms, 3),
+            "current_ms_per_doc": round(current_ms, 3),
+            "speedup": round(legacy_ms / current_ms, 1),
+            "identical": all(legacy(page) == current(page) for page in pages),
+        })
+    stats = a11yjobs_http.html_parse_stats()
+    rows.append({"case": "backends", "parser": stats["parser"], "lookups": stats["lookups"]})
+    return rows
+
+
+def enrichment_checks(module: types.ModuleType, content: object) -> tuple:
+    """The page checks ``enrich_job`` runs on matched evidence, in its order"""
+    job = {"title": "Accessibility Engineer", "company": "Example Co", "country": "US"}
+    jsonld = module.extract_external_jobposting(content)
+    facts = module.reconcile_explicit_external_facts(job, content)
+    return (
+        module.external_content_matches_job(content, job),
+        jsonld,
+        facts,
+        module.external_content_has_job_detail(content, jsonld),
+        module.external_content_is_closed(content),
+        module.extract_external_company_name(content),
+        module.normalize_external_content(content),
+        job,
+    )
+
+
+def case_fetched_document(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Enrichment checks re-deriving views from page text vs one FetchedDocument"""
+    baseline = load_baseline_module(args.baseline_rev)
+    pages = synthetic_ats_pages(len(documents), args.size)
+    legacy_ms = time_per_doc(lambda page: enrichment_checks(baseline, page), pages, args.repeat)
+    current_ms = time_per_doc(
+        lambda page: enrichment_checks(daily, daily.FetchedDocument(page)), pages, args.repeat
+    )
+    return [{
+        "case": "enrichment_checks",
+        "legacy_ms_per_doc": round(legacy_ms, 3),
+        "current_ms_per_doc": round(current_ms, 3),
+        "speedup": round(legacy_ms / current_ms, 1),
+        "identical": all(
+            enrichment_checks(baseline, page) == enrichment_checks(daily, daily.FetchedDocument(page))
+            for page in pages
+        ),
+    }]
+
+
+def daily_search_demand(days: int, new_per_day: int, seed: int = 23) -> List[List[tuple]]:
+    """(title, company) pairs needing a search on each day; postings stay listed 1-30 days"""
+    rng = random.Random(seed)
+    roles = ["Accessibility Engineer", "Digital Accessibility Specialist", "A11y QA Analyst", "Accessibility Lead"]
+    listed: List[tuple] = []
+    demand = []
+    for day in range(days):
+        listed = [(pair, last_day) for pair, last_day in listed if last_day >= day]
+        for n in range(new_per_day):
+            pair = (rng.choice(roles), f"Employer {day}-{n}")
+            listed.append((pair, day + rng.randint(0, 29)))
+        demand.append([pair for pair, _ in listed])
+    return demand
+
+
+def case_search_cache(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Daily runs against a stand-in search backend, with and without the persistent cache"""
+    demand = daily_search_demand(args.days, args.new_per_day)
+    results = {
+        f"{title} {company} job posting": [f"https://jobs.lever.co/{company.replace(' ', '-').lower()}/1"]
+        for day in demand for title, company in day if int(company.rsplit("-", 1)[1]) % 3
+    }
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "search_cache.json")
+        for label, use_cache in (("uncached", False), ("cached", True)):
+            backend = daily.StaticSearchBackend(results)
+            lookups, elapsed = 0, 0.0
+            for day, pairs in enumerate(demand):
+                cache = daily.SearchResultCache(path, clock=lambda: day * 86400.0) if use_cache else None
+                start = time.perf_counter()
+                for title, company in pairs:
+                    daily.search_alternate_urls(None, title, company, cache, backend)
+                elapsed += time.perf_counter() - start
+                lookups += len(pairs)
+                if cache is not None:
+                    cache.save()
+            rows.append({
+                "case": label,
+                "days": args.days,
+                "lookups": lookups,
+                "searches": len(backend.queries),
+                "us_per_lookup": round(elapsed / lookups * 1e6, 1),
+            })
+    return rows
+
+
+def frontier_outcome(company: str, day: int) -> str:
+    """Stand-in pipeline outcome for a posting on a given day"""
+    n = int(company.rsplit("-", 1)[1])
+    if n % 10 < 5:
+        return "inserted"
+    if n % 10 < 7:
+        return "unverified"
+    if n % 10 == 7:
+        return "invalid"
+    if n % 10 == 8:
+        return "closed"
+    return "transient" if day % 3 else "inserted"
+
+
+def case_frontier(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Postings fetched, DB-checked and enriched per daily run, with and without the crawl frontier"""
+    demand = daily_search_demand(args.days, args.new_per_day)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "crawl_frontier.json")
+        for label, use_frontier in (("no_frontier", False), ("frontier", True)):
+            inserted: set = set()
+            listed, processed, elapsed = 0, 0, 0.0
+            outcomes: Counter = Counter()
+            for day, pairs in enumerate(demand):
+                frontier = daily.CrawlFrontier(path if use_frontier else None, clock=lambda: day * 86400.0)
+                start = time.perf_counter()
+                for title, company in pairs:
+                    url = f"https://www.a11yjobs.com/jobs/{company.replace(' ', '-').lower()}/?utm_source=listing"
+                    listed += 1
+                    if frontier.skip(url):
+                        continue
+                    processed += 1
+                    outcome = "duplicate" if url in inserted else frontier_outcome(company, day)
+                    if outcome == "inserted":
+                        inserted.add(url)
+                    outcomes[outcome] += 1
+                    frontier.record(url, outcome)
+                frontier.save()
+                elapsed += time.perf_counter() - start
+            rows.append({
+                "case": label,
+                "days": args.days,
+                "listed": listed,
+                "processed": processed,
+                "duplicates_rechecked": outcomes["duplicate"],
+                "ms_per_day": round(elapsed / args.days * 1e3, 2),
+            })
+    return rows
+
+
+def streamed_response(
+    body: bytes, content_type: str, declare_length: bool, url: str = "https://careers.example.com/apply",
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers["Content-Type"] = content_type
+    if declare_length:
+        response.headers["Content-Length"] = str(len(body))
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class VirtualClock:
+    """Seconds of simulated network time, advanced by ``StandInSession``"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StandInSession:
+    """Offline ``requests.Session`` stand-in: blocking hosts serve a captcha page
+
+    With a ``clock``, each request advances it by the host's ``latency``
+    (0.5 s by default), or by the timeout when the host is slower, in which
+    case the request times out.
+    """
+
+    BLOCKED = "<html><body><h1>Access denied</h1><p>" + "Complete the captcha to continue. " * 10 + "</p></body></html>"
+
+    def __init__(
+        self,
+        blocking_hosts: set,
+        posting: str,
+        pages: Optional[Dict[str, str]] = None,
+        latency: Optional[Dict[str, float]] = None,
+        clock: Optional[VirtualClock] = None,
+    ):
+        self.blocking_hosts = blocking_hosts
+        self.posting = posting
+        self.pages = pages or {}
+        self.latency = latency or {}
+        self.clock = clock
+        self.requests = 0
+
+    def get(self, url: str, timeout: float = 0, **kwargs: object) -> requests.Response:
+        self.requests += 1
+        host = url.split("/")[2]
+        if self.clock is not None:
+            delay = self.latency.get(host, 0.5)
+            self.clock.now += min(delay, timeout)
+            if delay > timeout:
+                raise requests.Timeout(f"{host} timed out")
+        page = self.pages.get(host) or (self.BLOCKED if host in self.blocking_hosts else self.posting)
+        return streamed_response(page.encode(), "text/html", True, url)
+
+    def close(self) -> None:
+        pass
+
+
+def case_host_breaker(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Fetches issued for jobs spread over hosts, a third of which block direct fetches"""
+    rng = random.Random(29)
+    hosts = [f"careers{n}.example.com" for n in range(args.hosts)]
+    blocking = set(hosts[::3])
+    urls = [f"https://{rng.choice(hosts)}/jobs/{n}" for n in range(args.jobs)]
+    posting = "<html><body><p>" + html.escape(documents[0]) + "</p></body></html>"
+    rows = []
+    for label, breaker in (("no_breaker", None), ("breaker", daily.HostCircuitBreaker())):
+        session = StandInSession(blocking, posting)
+        sources = Counter(daily.fetch_external_text(session, url, breaker)[1] for url in urls)
+        rows.append({
+            "case": label,
+            "jobs": len(urls),
+            "requests": session.requests,
+            "sources": dict(sorted(sources.items())),
+        })
+    return rows
+
+
+def case_bounded_fetch(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Bytes pulled from apply-link responses: whole-body reads vs bounded streaming"""
+    rng = random.Random(31)
+    page = ("<html><body>" + documents[0] + "</body></html>").encode()
+    kinds = [
+        (page, "text/html; charset=utf-8", True),
+        (page, "text/html", False),
+        (b"%PDF-1.7" + b"\0" * 3_000_000, "application/pdf", True),
+        (b"<img>" * 800_000, "image/png", False),
+        (b"window.__APP__=" + b"x" * 6_000_000, "text/html", False),
+    ]
+    mix = [rng.choice(kinds) for _ in range(args.responses)]
+    rows = []
+    for label in ("whole_body", "bounded"):
+        read, start = 0, time.perf_counter()
+        for body, content_type, declared in mix:
+            response = streamed_response(body, content_type, declared)
+            session = types.SimpleNamespace(get=lambda url, **kwargs: response)
+            if label == "whole_body":
+                read += len(response.content)
+            else:
+                read += len(a11yjobs_http.fetch_bounded(session, response.url, timeout=5).content)
+        rows.append({
+            "case": label,
+            "responses": len(mix),
+            "mb_read": round(read / 1e6, 1),
+            "ms_per_response": round((time.perf_counter() - start) / len(mix) * 1000, 2),
+        })
+    rows.append({"case": "fetch_stats", **a11yjobs_http.fetch_stats()})
+    return rows
+
+
+def case_retry_scheduler(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Wall time of pooled fetches when a quarter time out once: sleeping workers vs the delay queue"""
+    latency, workers = 0.02, 4
+    rows = []
+    for label in ("sleep_in_worker", "delay_queue"):
+        policy = a11yjobs_http.RetryPolicy(budget=None, base=0.4, rng=lambda: 0.0)
+        failed = set()
+        lock = threading.Lock()
+
+        def fetch(n: int) -> int:
+            time.sleep(latency)
+            with lock:
+                first_try = n % 4 == 0 and n not in failed
+                failed.add(n)
+            if first_try:
+                raise requests.Timeout("timed out")
+            return n
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if label == "sleep_in_worker":
+                results = list(executor.map(lambda n: policy.call(fetch, n), range(args.fetches)))
+            else:
+                with a11yjobs_http.RetryScheduler(executor, policy) as retries:
+                    results = [future.result() for future in [retries.submit(fetch, n) for n in range(args.fetches)]]
+        assert results == list(range(args.fetches))
+        rows.append({
+            "case": label,
+            "fetches": args.fetches,
+            "workers": workers,
+            "seconds": round(time.perf_counter() - start, 2),
+            **{key: policy.stats()[key] for key in ("retries", "deferred", "wait_seconds")},
+        })
+    return rows
+
+
+def case_deadlines(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Simulated enrichment seconds per job when a fifth of hosts time out, without and with a job budget"""
+    rng = random.Random(37)
+    hosts = [f"careers{n}.example.com" for n in range(args.hosts)]
+    slow = hosts[::5]
+    posting = "<html><body><p>" + html.escape(documents[0]) + "</p></body></html>"
+    # Two of the five search results sit on slow hosts
+    search_page = "".join(
+        f'<a class="result__a" href="https://{host}/jobs/{n}">Result</a>'
+        for n, host in enumerate([hosts[1], slow[1], hosts[2], slow[2], hosts[3]])
+    )
+    jobs = [
+        {"title": "Accessibility Engineer", "company": f"Employer {n}", "apply_url": f"https://{rng.choice(hosts)}/apply/{n}"}
+        for n in range(args.jobs)
+    ]
+    rows = []
+    for label, budget in (("no_deadline", None), ("job_budget", args.job_budget)):
+        clock = VirtualClock()
+        session = StandInSession(
+            set(), posting, pages={"duckduckgo.com": search_page},
+            latency={host: 30.0 for host in slow}, clock=clock,
+        )
+        spent = []
+        exhausted = 0
+        for job in jobs:
+            start = clock.now
+            with shared_link_sessions():
+                enriched = daily.enrich_job(session, dict(job), deadline=a11yjobs_http.Deadline(budget, clock=clock))
+            spent.append(clock.now - start)
+            exhausted += bool(enriched.get("enrichment_budget_exhausted"))
+        spent.sort()
+        rows.append({
+            "case": label,
+            "jobs": len(jobs),
+            "requests": session.requests,
+            "total_seconds": round(sum(spent)),
+            "p95_job_seconds": round(spent[int(len(spent) * 0.95) - 1], 1),
+            "max_job_seconds": round(spent[-1], 1),
+            "budget_exhausted": exhausted,
+        })
+    return rows
+
+
+def case_alternate_links(documents: List[str], args: argparse.Namespace) -> List[Dict[str, object]]:
+    """Wall time to settle five ranked alternate links per job: one at a time vs fanned out"""
+    rng = random.Random(41)
+    job = {"title": "Accessibility Engineer", "company": "Example Company"}
+    posting = (
+        "<html><body><h1>Accessibility Engineer</h1><p>Example Company is hiring an Accessibility Engineer "
+        "to audit products against WCAG 2.2, test with assistive technology and coach product teams.</p></body></html>"
+    )
+    other = "<html><body><h1>Office Manager</h1><p>" + "Run the front desk and order supplies. " * 10 + "</p></body></html>"
+    # Per job: five links with 20-200 ms latency, matching from a random rank (or none).
+    jobs = []
+    for n in range(args.link_jobs):
+        match_from = rng.choice([1, 2, 3, 4, 5, 5])
+        jobs.append([
+            (f"https://careers{n}-{rank}.example.com/jobs/1", rng.uniform(0.02, 0.2), posting if rank >= match_from else other)
+            for rank in range(5)
+        ])
+
+    def session_for(links: List[tuple]) -> types.SimpleNamespace:
+        pages = {url: (delay, page) for url, delay, page in links}
+
+        def get(url: str, timeout: float = 0, **kwargs: object) -> requests.Response:
+            delay, page = pages.get(url, (0.0, ""))
+            time.sleep(delay)
+            return streamed_response(page.encode(), "text/html", True, url)
+
+        return types.SimpleNamespace(get=get, close=lambda: None)
+
+    rows, winners = [], {}
+    for label, fan_out in (("sequential", 1), ("fan_out", daily.ALTERNATE_LINK_FAN_OUT)):
+        start = time.perf_counter()
+        winners[label] = []
+        for links in jobs:
+            with shared_link_sessions():
+                winner, source, _ = daily.evaluate_alternate_links(
+                    session_for(links), [url for url, _, _ in links], job, fan_out=fan_out
+                )
+            winners[label].append((winner.rank if winner else None, source))
+        elapsed = time.perf_counter() - start
+        rows.append({
+            "case": label,
+            "jobs": len(jobs),
+            "fan_out": fan_out,
+            "ms_per_job": round(elapsed / len(jobs) * 1000, 1),
+        })
+    rows.append({"case": "same_winners", "identical": winners["sequential"] == winners["fan_out"]})
+    return rows
+
+
+CASES: Dict[str, Callable[[List[str], argparse.Namespace], List[Dict[str, object]]]] = {
+    "adversarial": case_adversarial,
+    "alternate_links": case_alternate_links,
+    "analysis_cache": case_analysis_cache,
+    "bounded_fetch": case_bounded_fetch,
+    "consolidation": case_consolidation,
+    "deadlines": case_deadlines,
+    "descriptions": case_descriptions,
+    "fetched_document": case_fetched_document,
+    "frontier": case_frontier,
+    "host_breaker": case_host_breaker,
+    "html_parsing": case_html_parsing,
+    "jobspy_prefilter": case_jobspy_prefilter,
+    "keywords": case_keywords,
+    "retry_scheduler": case_retry_scheduler,
+    "search_cache": case_search_cache,
+    "structured_fields": case_structured_fields,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--case", choices=sorted(CASES), action="append",
+                        help="Case to run (repeatable; default: all)")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--size", type=int, default=8000, help="Characters per document")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[10000, 25000, 50000, 100000],
+                        help="Candidate counts for the consolidation scaling case")
+    parser.add_argument("--adversarial-sizes", type=int, nargs="+", default=[20000, 200000, 2000000],
+                        help="Input sizes for the adversarial case")
+    parser.add_argument("--baseline-rev", default="8212e3c",
+                        help="Git revision the descriptions case compares against")
+    parser.add_argument("--jobspy-rows", type=int, default=3000,
+                        help="Rows in the synthetic JobSpy frame (needs pandas)")
+    parser.add_argument("--jobs", type=int, default=400, help="Fetches in the host_breaker case, jobs in deadlines")
+    parser.add_argument("--hosts", type=int, default=30, help="Distinct hosts in the host_breaker and deadlines cases")
+    parser.add_argument("--link-jobs", type=int, default=40, help="Jobs in the alternate_links case")
+    parser.add_argument("--job-budget", type=float, default=10.0, help="Per-job seconds in the deadlines case")
+    parser.add_argument("--responses", type=int, default=100, help="Responses in the bounded_fetch case")
+    parser.add_argument("--fetches", type=int, default=60, help="Pooled fetches in the retry_scheduler case")
+    parser.add_argument("--days", type=int, default=30, help="Daily runs in the search_cache and frontier cases")
+    parser.add_argument("--new-per-day", type=int, default=40, help="New postings per day in the search_cache and frontier cases")
+    args = parser.parse_args()
+
+    documents = synthetic_documents(args.docs, args.size)
+    for name in args.case or sorted(CASES):
+        for row in CASES[name](documents, args):
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,9 @@ employer or ATS pages are preferred when available, while aggregator-only
 records require corroboration from another source before insertion.
 """
 
+import copy
 import csv
+import hashlib
 import html
 import json
 import os
@@ -15,16 +17,36 @@ import re
 import sys
 import time
 import subprocess
-from collections import Counter
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urljoin, urlparse
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qs, parse_qsl, urlencode, urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
 
+from a11yjobs_http import (
+    RETRY_BUDGET,
+    RETRY_POLICY,
+    BoundedResponse,
+    Deadline,
+    DeadlineExceeded,
+    RetryPolicy,
+    RetryScheduler,
+    deadline_timeout,
+    fetch_bounded,
+    fetch_page,
+    fetch_stats,
+    html_parse_stats,
+    parse_html,
+    retry_stats,
+    select_html,
+)
+
 BASE_URL = "https://www.a11yjobs.com"
 LIST_URL = f"{BASE_URL}/"
 
@@ -32,6 +54,8 @@ OUTPUT_DIR = "/Users/khushwantparihar/AccessibiityJobs/scripts/output"
 CANDIDATES_JSON = os.path.join(OUTPUT_DIR, "multisource_jobs_candidates_final_with_nan.json")
 CANDIDATES_CSV = os.path.join(OUTPUT_DIR, "multisource_jobs_candidates_final_table.csv")
 INSERT_READY_JSON = os.path.join(OUTPUT_DIR, "multisource_jobs_insert_ready_final.json")
+SEARCH_CACHE_JSON = os.path.join(OUTPUT_DIR, "alternate_url_search_cache.json")
+FRONTIER_JSON = os.path.join(OUTPUT_DIR, "crawl_frontier.json")
 
 JOBSPY_SOURCES = ["indeed", "linkedin"]
 SUPPORTED_JOBSPY_SOURCES = ["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
@@ -212,6 +236,13 @@ def mask_db_url(db_url: str) -> str:
     return parsed._replace(netloc=netloc).geturl()
 
 
+# Database retries keep their own policy, outside the run's RETRY_BUDGET:
+# flaky job hosts spending that budget must not stop the run from reading
+# its cutoff or inserting what it found. Each query makes four attempts
+# at most, so the policy needs no budget of its own.
+PSQL_RETRY_POLICY = RetryPolicy(budget=None)
+
+
 def psql_query(db_url: str, sql: str) -> Tuple[int, str, str]:
     transient_markers = [
         "operation timed out",
@@ -221,7 +252,8 @@ def psql_query(db_url: str, sql: str) -> Tuple[int, str, str]:
         "terminating connection due to administrator command",
     ]
 
-    for attempt in range(4):
+    attempts = 4
+    for attempt in range(1, attempts + 1):
         result = subprocess.run(
             ["psql", "-d", db_url, "-At", "-v", "ON_ERROR_STOP=1", "-c", sql],
             capture_output=True,
@@ -237,9 +269,11 @@ def psql_query(db_url: str, sql: str) -> Tuple[int, str, str]:
 
         err_lower = err.lower()
         is_transient = any(marker in err_lower for marker in transient_markers)
-        if is_transient and attempt < 3:
-            time.sleep(2 ** attempt)
-            continue
+        if is_transient:
+            delay = PSQL_RETRY_POLICY.delay(attempt, attempts, site="psql")
+            if delay is not None:
+                PSQL_RETRY_POLICY.wait(delay, site="psql")
+                continue
         return code, out, err
 
     return 1, "", "psql retry exhaustion"
@@ -264,18 +298,34 @@ def fetch_total_count(db_url: str) -> int:
     return int(out) if out else 0
 
 
-def fetch_page(session: requests.Session, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-    for attempt in range(retries):
-        try:
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, "html.parser")
-        except Exception:
-            if attempt < retries - 1:
-                time.sleep(2 ** attempt)
-            else:
-                return None
-    return None
+# Partial parses: consumers that read one kind of node build only those
+# nodes (and their contents) instead of the whole page tree.
+_JSONLD_TYPE_RE = re.compile(r"ld\+json", re.I)
+JSONLD_ONLY = SoupStrainer("script", type=_JSONLD_TYPE_RE)
+META_ONLY = SoupStrainer("meta")
+LINKS_ONLY = SoupStrainer("a", href=True)
+SEARCH_RESULTS_ONLY = SoupStrainer("a", class_=re.compile(r"(?:^|\s)result__a(?:\s|$)"))
+LINKEDIN_DETAILS_ONLY = SoupStrainer(
+    class_=re.compile(r"show-more-less-html__markup|description__text|description__job-criteria-list")
+)
+LINKEDIN_APPLY_URL_ONLY = SoupStrainer("code", id="applyUrl")
+
+
+# Enrichment deadlines. A job's fetches and searches share one budget, and
+# every job also stops at the run's deadline, so a few slow hosts cannot set
+# the length of the run. Each network timeout is clipped to the time left.
+ENRICHMENT_JOB_BUDGET_SECONDS = 45.0
+ENRICHMENT_RUN_BUDGET_SECONDS = 40 * 60.0
+
+
+def env_seconds(name: str, default: Optional[float]) -> Optional[float]:
+    """A duration from the environment; unset or unreadable gives ``default``, 0 no limit."""
+    value = os.getenv(name, "").strip()
+    try:
+        seconds = float(value) if value else default
+    except ValueError:
+        return default
+    return seconds if seconds and seconds > 0 else None
 
 
 def normalize_text(value: str) -> str:
@@ -671,17 +721,118 @@ def extract_label_value(soup: BeautifulSoup, label_regex: str) -> Optional[str]:
     return text if text else None
 
 
+# Scraped pages are untrusted input, and one malformed multi-megabyte ATS
+# payload used to pin a worker in a quadratic regex. Each guarded extractor
+# reads at most its cap of characters, and the loops that run many regexes
+# count their work between steps (``re`` itself cannot be interrupted),
+# falling back to a degraded but valid result once the step budget is spent.
+# The regexes inside those loops are linear in their input, so cap plus
+# budget bounds the worst case. Budgets count lines, pay windows and
+# characters scanned rather than seconds, so a loaded machine or a busy
+# thread pool cannot change a run's output.
+EXTRACTION_INPUT_CAPS = {
+    "description": 200_000,
+    "salary": 50_000,
+    "contact_email": 200_000,
+}
+EXTRACTION_STEP_BUDGETS = {
+    "description": 10_000,  # lines
+    "sections": 10_000,  # lines
+    "salary": 200,  # pay windows
+    "structured_fields": 2_000_000,  # characters scanned, summed over extractors
+}
+EMAIL_LOCAL_PART_MAX = 64
+EMAIL_DOMAIN_MAX = 255
+
+_EXTRACTION_GUARD_COUNTS: Dict[str, Dict[str, int]] = {}
+_EXTRACTION_GUARD_LOCK = threading.Lock()
+
+
+def _count_extraction_guard(field: str, event: str) -> None:
+    with _EXTRACTION_GUARD_LOCK:
+        counts = _EXTRACTION_GUARD_COUNTS.setdefault(field, {"truncated": 0, "budget_exhausted": 0})
+        counts[event] += 1
+
+
+def cap_extraction_input(field: str, text: str) -> str:
+    cap = EXTRACTION_INPUT_CAPS[field]
+    if len(text) <= cap:
+        return text
+    _count_extraction_guard(field, "truncated")
+    return text[:cap]
+
+
+class ExtractionBudget:
+    """Cooperative work budget for one extraction call.
+
+    Loops over lines, pay windows or field extractors call ``exhausted(cost)``
+    before each step and switch to their fallback once it returns True, i.e.
+    once the step would overrun the field's ``EXTRACTION_STEP_BUDGETS`` entry.
+    """
+
+    __slots__ = ("field", "remaining", "tripped")
+
+    def __init__(self, field: str):
+        self.field = field
+        self.remaining = EXTRACTION_STEP_BUDGETS[field]
+        self.tripped = False
+
+    def exhausted(self, cost: int = 1) -> bool:
+        if not self.tripped:
+            if cost > self.remaining:
+                self.tripped = True
+                _count_extraction_guard(self.field, "budget_exhausted")
+            else:
+                self.remaining -= cost
+        return self.tripped
+
+
+def extraction_guard_stats() -> Dict[str, Dict[str, int]]:
+    with _EXTRACTION_GUARD_LOCK:
+        return {field: dict(counts) for field, counts in sorted(_EXTRACTION_GUARD_COUNTS.items())}
+
+
+def find_emails(pattern: "re.Pattern[str]", text: str) -> List[str]:
+    """``pattern.findall(text)`` for an email pattern, in linear time.
+
+    Searched plainly, a long run of local-part characters without an "@"
+    is retried from every position in the run. Here each "@" is matched
+    only within its own window: from the previous "@" (a local part cannot
+    contain one) and at most ``EMAIL_LOCAL_PART_MAX`` characters back, up
+    to the next "@" and at most ``EMAIL_DOMAIN_MAX`` characters ahead. Only
+    addresses beyond those RFC 5321 limits can differ from ``findall``.
+    """
+    found: List[str] = []
+    last_end = 0
+    previous_at = -1
+    at = text.find("@")
+    while at != -1:
+        next_at = text.find("@", at + 1)
+        window_end = at + 1 + EMAIL_DOMAIN_MAX
+        if next_at != -1:
+            window_end = min(window_end, next_at)
+        match = pattern.search(text, max(last_end, previous_at + 1, at - EMAIL_LOCAL_PART_MAX), window_end)
+        if match and match.start() <= at:
+            found.append(match.group(0))
+            last_end = match.end()
+        previous_at = at
+        at = next_at
+    return found
+
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return " ".join(text.split())
 
 
 def strip_html(text: str) -> str:
     if not text:
         return ""
-    soup = BeautifulSoup(text, "html.parser")
+    if "<" not in text and "&" not in text and text.strip():
+        # Nothing to parse: without tags or entities the text comes back as is
+        return text
+    soup = parse_html(text, "strip_html")
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
     return soup.get_text("\n")
@@ -691,34 +842,34 @@ RESPONSIBILITIES_FALLBACK = "See the full role overview above for day-to-day res
 REQUIREMENTS_FALLBACK = "See the full role overview above for required qualifications."
 
 
-_SECTION_PATTERNS = [
+# Line-level section headings, in precedence order. They are matched as one
+# alternation of named groups, so classifying a line is a single fullmatch.
+_SECTION_HEADINGS = [
     (
         "overview",
-        re.compile(
-            r"^(?:about (?:the )?(?:role|opportunity)|job description|job summary|position summary|role summary|overview|"
+        (
+            r"(?:about (?:the )?(?:role|opportunity)|job description|job summary|position summary|role summary|overview|"
             r"position summary statement|company description|your opportunity|your role|the role|job overview|"
-            r"about this team and role|we are looking for)$",
-            re.I,
+            r"about this team and role|we are looking for)"
         ),
     ),
     (
         "responsibilities",
-        re.compile(
-            r"^(?:(?:key job|key|core|primary|role) responsibilities|responsibilities|duties|"
+        (
+            r"(?:(?:key job|key|core|primary|role) responsibilities|responsibilities|duties|"
             r"job duties|duties and responsibilities|essential functions|job role and responsibilit(?:y|ies)|"
             r"essential duties(?: and responsibilities)?|job responsibilities|project coordination|your responsibilities|"
             r"roles?\s*(?:&|and)\s*responsibilities|your impact\s*[-–—]\s*responsibilities|"
             r"website accessibility compliance|content refinement and optimization|website redesign support|"
             r"accessibility training and guidance|governance and review processes|"
             r"user experience \(ux\) enhancement|graphic design support|"
-            r"what you['’]?ll (?:do|be doing)|what you will (?:do|be doing)|what you['’]?ll own|your impact)$",
-            re.I,
+            r"what you['’]?ll (?:do|be doing)|what you will (?:do|be doing)|what you['’]?ll own|your impact)"
         ),
     ),
     (
         "requirements",
-        re.compile(
-            r"^(?:requirements?|additional requirements?|qualifications?|basic qualifications?|"
+        (
+            r"(?:requirements?|additional requirements?|qualifications?|basic qualifications?|"
             r"required qualifications?(?:,?\s*capabilities?,?\s*(?:and|&)\s*skills?)?|"
             r"must[- ]have (?:qualifications?|skills?)|essential(?: qualifications?)?|"
             r"minimum qualifications?|required experience(?:\s*/\s*clearance)?|experience required|"
@@ -731,23 +882,21 @@ _SECTION_PATTERNS = [
             r"minimum education\s*(?:&|and)\s*experience|"
             r"tools?\s*&\s*technologies|your education|what you['’]?ll need|what you will need|"
             r"what you['’]?ll bring|what you will bring|what you bring|"
-            r"who you are|about you|what we['’]?re looking for|what we are looking for|required)$",
-            re.I,
+            r"who you are|about you|what we['’]?re looking for|what we are looking for|required)"
         ),
     ),
     (
         "preferred",
-        re.compile(
-            r"^(?:preferred qualifications?|preferred experience|preferred skills?|desired(?: experience)?|"
+        (
+            r"(?:preferred qualifications?|preferred experience|preferred skills?|desired(?: experience)?|"
             r"desirable(?: skills?)?|advantageous|preferred certification|"
-            r"nice[- ]to[- ]have qualifications?|nice to have|good[- ]to[- ]have skills?|bonus points?|a plus)$",
-            re.I,
+            r"nice[- ]to[- ]have qualifications?|nice to have|good[- ]to[- ]have skills?|bonus points?|a plus)"
         ),
     ),
     (
         "ignore",
-        re.compile(
-            r"^(?:benefits?|why join (?:us|our team)|what we offer|what you['’]?ll get|compensation|salary|pay range|location|keywords|"
+        (
+            r"(?:benefits?|why join (?:us|our team)|what we offer|what you['’]?ll get|compensation|salary|pay range|location|keywords|"
             r"physical demands?|application requirements?|position type\s*(?:&|and)\s*work location|"
             r"what['’]?s in it for you\??|impact you['’]?ll make|how to apply|accessibility and inclusion|"
             r"be more|"
@@ -756,12 +905,16 @@ _SECTION_PATTERNS = [
             r"company snapshot|our core principles|use of ai in hiring|seniority level|employment type|why [A-Za-z0-9&.' -]{2,80}\??|"
             r"job function|industries|we value equal opportunity|applicants with disabilities|"
             r"about us|about the team|about royal london|inclusion,? diversity and belonging|"
-            r"drug and alcohol policy|equal opportunity employer|eeo statement)$",
-            re.I,
+            r"drug and alcohol policy|equal opportunity employer|eeo statement)"
         ),
     ),
 ]
 
+_SECTION_HEADING_RE = re.compile(
+    "|".join(f"(?P<{category}>{pattern})" for category, pattern in _SECTION_HEADINGS),
+    re.I,
+)
+
 _IGNORE_PROSE_START = re.compile(
     r"^(?:the )?(?:salary|compensation|base pay|pay) (?:range|band|provided)|"
     r"^actual compensation\b|^in addition to base salary\b|"
@@ -770,23 +923,163 @@ _IGNORE_PROSE_START = re.compile(
 )
 
 
+# Link text may not contain brackets and a URL may hold one level of
+# balanced parentheses. Each attempt then stops at the next bracket or
+# parenthesis, which keeps unclosed "[" / "](" runs linear.
+_MARKDOWN_IMAGE_RE = re.compile(r"!\[[^\[\]]*\]\((?:[^()]|\([^()]*\))*\)")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\[\]]+)\]\((?:[^()]|\([^()]*\))*\)")
+_MARKDOWN_LINE_PREFIX_RE = re.compile(r"^[#>]+\s*")
+_MARKDOWN_EMPHASIS_RE = re.compile(r"[*_`]+")
+
+
 def _plain_markdown(value: str) -> str:
     value = html.unescape(value or "")
-    value = re.sub(r"!\[[^\]]*\]\([^)]*\)", " ", value)
-    value = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", value)
-    value = re.sub(r"^[#>]+\s*", "", value.strip())
-    value = re.sub(r"[*_`]+", "", value)
+    if "](" in value:
+        value = _MARKDOWN_IMAGE_RE.sub(" ", value)
+        value = _MARKDOWN_LINK_RE.sub(r"\1", value)
+    value = _MARKDOWN_LINE_PREFIX_RE.sub("", value.strip())
+    value = _MARKDOWN_EMPHASIS_RE.sub("", value)
     return clean_text(value).strip(" :.;-–—")
 
 
-def _section_category(value: str) -> Optional[str]:
-    label = _plain_markdown(value)
+class AnalyzedText:
+    """Derived views of one text, each computed on first use.
+
+    Descriptions are re-read by ranking, validation and several extractors;
+    sharing one instance per text (see ``analyze_text``) means markdown
+    stripping, section parsing and term scanning run once. Treat the views
+    as read-only; ``sections`` hands out a copy because callers fill it in.
+    """
+
+    __slots__ = (
+        "raw", "_plain", "_lower", "_folded", "_words", "_tokens", "_sections", "_terms", "_certifications",
+    )
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._plain: Optional[str] = None
+        self._lower: Optional[str] = None
+        self._words: Optional[Tuple[str, ...]] = None
+        self._tokens: Optional[frozenset] = None
+        self._sections: Optional[Dict[str, Optional[str]]] = None
+        self._terms: Optional["KeywordSpans"] = None
+        self._certifications: Optional["KeywordSpans"] = None
+        self._folded: Optional[str] = None
+
+    @property
+    def plain(self) -> str:
+        if self._plain is None:
+            self._plain = _plain_markdown(self.raw)
+        return self._plain
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.plain.lower()
+        return self._lower
+
+    @property
+    def folded(self) -> str:
+        # casefold, unlike lower, maps every character re.I treats as equal
+        # ("ſ" and "s"), so literal prefilters of re.I patterns stay exact.
+        if self._folded is None:
+            self._folded = self.plain.casefold()
+        return self._folded
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        if self._words is None:
+            self._words = tuple(re.findall(r"[a-z0-9]+", self.lower))
+        return self._words
+
+    @property
+    def tokens(self) -> frozenset:
+        if self._tokens is None:
+            self._tokens = frozenset(self.words)
+        return self._tokens
+
+    @property
+    def sections(self) -> Dict[str, Optional[str]]:
+        if self._sections is None:
+            self._sections = parse_description_sections(self.raw)
+        return dict(self._sections)
+
+    @property
+    def terms(self) -> "KeywordSpans":
+        if self._terms is None:
+            self._terms = _term_spans(self.plain)
+        return self._terms
+
+    @property
+    def certifications(self) -> "KeywordSpans":
+        if self._certifications is None:
+            self._certifications = _CERTIFICATION_MATCHER.scan(self.raw)
+        return self._certifications
+
+
+class TextAnalysisCache:
+    """Bounded LRU of ``AnalyzedText`` keyed by the text itself.
+
+    A str key is its own content hash (computed once and memoised by
+    Python), so equal descriptions from different sources share an entry.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, AnalyzedText]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> AnalyzedText:
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is not None:
+                self._entries.move_to_end(text)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            entry = AnalyzedText(text)
+            self._entries[text] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return entry
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+_TEXT_ANALYSIS_CACHE = TextAnalysisCache()
+
+
+def analyze_text(text: Optional[str]) -> AnalyzedText:
+    return _TEXT_ANALYSIS_CACHE.get(text or "")
+
+
+def text_analysis_stats() -> Dict[str, Any]:
+    return _TEXT_ANALYSIS_CACHE.stats()
+
+
+def _heading_category(label: str) -> Optional[str]:
+    """Section category of an already plain line, or None for content."""
     if not label or len(label) > 100:
         return None
-    for category, pattern in _SECTION_PATTERNS:
-        if pattern.fullmatch(label):
-            return category
-    return None
+    match = _SECTION_HEADING_RE.fullmatch(label)
+    return match.lastgroup if match else None
+
+
+def _section_category(value: str) -> Optional[str]:
+    return _heading_category(_plain_markdown(value))
+
+
+_GLUED_HEADING_RE = re.compile(r"^(\s*(?:#{1,6}\s*)?\*{2,}(.{2,100}?)\*{2,})(\s*\S.*)$")
 
 
 def _split_glued_heading(value: str) -> List[str]:
@@ -795,7 +1088,7 @@ def _split_glued_heading(value: str) -> List[str]:
     This repairs a common LinkedIn-derived artifact without guessing that
     every bold phrase is a section boundary.
     """
-    match = re.match(r"^(\s*(?:#{1,6}\s*)?\*{2,}(.{2,100}?)\*{2,})(\s*\S.*)$", value)
+    match = _GLUED_HEADING_RE.match(value) if "**" in value else None
     if not match or not _section_category(match.group(2)):
         return [value]
     remainder = match.group(3).strip()
@@ -804,145 +1097,168 @@ def _split_glued_heading(value: str) -> List[str]:
     return [match.group(1), remainder]
 
 
+# Windows-1252 decodings of UTF-8 punctuation observed in ATS responses.
+_MOJIBAKE_REPAIRS = {
+    "â¢": "•",
+    "â": "’",
+    "â": "–",
+    "â": "—",
+    "Â ": " ",
+}
+_GLUED_SENTENCE_RE = re.compile(r"(?<=[a-z])\.(?=[A-Z])")
+_GLUED_LIST_HEADING_RE = re.compile(
+    r"(?<=[a-z)])(?P<heading>Content Refinement and Optimization|Website Redesign Support|"
+    r"Accessibility Training and Guidance|Governance and Review Processes|"
+    r"User Experience \(UX\) Enhancement|Graphic Design Support)(?=\n\s*[-*•])"
+)
+_COLON_HEADING_RE = re.compile(
+    r"(?m)^[^\S\n]*(?P<heading>Job Overview|Job Responsibilities|Required Education|"
+    r"Preferred Certification|Required Skills|Preferred Skills)\s*:\s*"
+)
+# Some Workday JobPosting payloads flatten otherwise meaningful headings into
+# one long line. These restore only explicit, known heading phrases and only
+# for flat payloads; prose containing words such as "requirements" remains
+# untouched.
+_FLAT_HEADING_RE = re.compile(
+    r"(?P<heading>"
+    r"Your Opportunity|Project Coordination|How do we define success for your role\?|"
+    r"What You(?:'|’|â)ll Be Doing|Your Responsibilities|What You(?:'|’|â)ll Bring|"
+    r"Job Description|About the role|Desirable(?: skills?)?|Advantageous|Person Specification|"
+    r"Required Education|Preferred Certification|Required Skills|Preferred Skills|"
+    r"Job Overview|Job Responsibilities|Essential Duties(?: and Responsibilities)?|"
+    r"Website Accessibility Compliance|Content Refinement and Optimization|"
+    r"Website Redesign Support|Accessibility Training and Guidance|"
+    r"Governance and Review Processes|User Experience \(UX\) Enhancement|Graphic Design Support|"
+    r"Why [A-Za-z0-9&.' -]{2,80}\??|"
+    r"Qualifications"
+    r")(?:\s*:\s*|[ \t]+)(?=\S)"
+)
+_FLAT_INLINE_HEADING_RE = re.compile(
+    r"(?<=[.!?])\s+(?P<heading>what you['’]?ll do|essential skills? required|desirable skills?)\s*:\s+(?=\S)",
+    re.I,
+)
+_FLAT_BE_MORE_RE = re.compile(r"(?<=[.!?])\s+(?P<heading>be more)\s+(?=at the\b)", re.I)
+_BULLET_GLYPH_RE = re.compile(r"\s*•\s*")
+_EM_DASH_RE = re.compile(r"\s*—\s*")
+_ZERO_WIDTH_RE = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+_LIST_ITEM_RE = re.compile(r"\s*(?:\*{2,}[•-]\s*(?P<bold>.+?)\*{2,}\s*|(?:[-*•]|\d+[.)])\s+(?P<item>.+))$")
+_SENTENCE_END_RE = re.compile(r"[.!?;:]\s*$")
+_DANGLING_CONNECTOR_RE = re.compile(
+    r"(?:\bat least|\bof|\bwith|\bin|\bincluding|\bsuch as|\band|\bor|\bthe|\ba|\ban|\bto|\bfor)\s*$"
+)
+_LEADING_CONNECTOR_RE = re.compile(r"^(?:of|with|in|including|and|or|to|for)\b", re.I)
+_EXCESS_BREAKS_RE = re.compile(r"\n{3,}")
+_SPLIT_BULLET_RUN_RE = re.compile(r"(?m)(^-\s+[^\n]+)\n\n(?=-\s+)")
+_GLUED_BOLD_RE = re.compile(r"(?<=[A-Za-z0-9):])\*\*(?=[A-Za-z0-9])")
+_LIST_SECTIONS = frozenset({"responsibilities", "requirements", "preferred"})
+
+
+def _heading_break(match: "re.Match[str]") -> str:
+    return f"\n\n{match.group('heading')}\n\n"
+
+
 def normalize_description_text(text: str) -> str:
     """Normalize source text while preserving paragraphs, headings and lists.
 
     ``clean_text`` is intentionally unsuitable here because collapsing every
     newline destroys the only reliable section and bullet evidence supplied by
     A11yJobs JSON-LD.
+
+    A few document-level repairs run first because they create line breaks.
+    Everything else is one pass over the lines: each line is reduced to plain
+    text once, classified as heading, list item, continuation or prose, and
+    emitted.
     """
     if not text:
         return ""
 
-    text = html.unescape(text).replace("\r\n", "\n").replace("\r", "\n")
-    # Some ATS responses are UTF-8 bytes decoded as Windows-1252. Repair only
-    # the observed sequences so legitimate source punctuation is untouched.
-    for broken, repaired in {
-        "â¢": "•",
-        "â": "’",
-        "â": "–",
-        "â": "—",
-        "Â ": " ",
-    }.items():
+    budget = ExtractionBudget("description")
+    text = html.unescape(cap_extraction_input("description", text)).replace("\r\n", "\n").replace("\r", "\n")
+    # Repair only the observed mojibake sequences so legitimate source
+    # punctuation is untouched.
+    for broken, repaired in _MOJIBAKE_REPAIRS.items():
         text = text.replace(broken, repaired)
-    text = re.sub(r"(?<=[a-z])\.(?=[A-Z])", ". ", text)
-    text = re.sub(
-        r"(?<=[a-z)])(?P<heading>Content Refinement and Optimization|Website Redesign Support|"
-        r"Accessibility Training and Guidance|Governance and Review Processes|"
-        r"User Experience \(UX\) Enhancement|Graphic Design Support)(?=\n\s*[-*•])",
-        lambda match: f"\n\n{match.group('heading')}\n",
-        text,
-    )
+    text = _GLUED_SENTENCE_RE.sub(". ", text)
+    text = _GLUED_LIST_HEADING_RE.sub(lambda match: f"\n\n{match.group('heading')}\n", text)
     if text.count("\n") > 2:
-        text = re.sub(
-            r"(?m)^\s*(?P<heading>Job Overview|Job Responsibilities|Required Education|"
-            r"Preferred Certification|Required Skills|Preferred Skills)\s*:\s*",
-            lambda match: f"\n\n{match.group('heading')}\n\n",
-            text,
-        )
-    # Some Workday JobPosting payloads flatten otherwise meaningful headings
-    # into one long line. Restore only explicit, known heading phrases and only
-    # for flat payloads; prose containing words such as "requirements" remains
-    # untouched.
+        text = _COLON_HEADING_RE.sub(_heading_break, text)
     if text.count("\n") <= 2:
-        flat_heading = re.compile(
-            r"(?P<heading>"
-            r"Your Opportunity|Project Coordination|How do we define success for your role\?|"
-            r"What You(?:'|’|â)ll Be Doing|Your Responsibilities|What You(?:'|’|â)ll Bring|"
-            r"Job Description|About the role|Desirable(?: skills?)?|Advantageous|Person Specification|"
-            r"Required Education|Preferred Certification|Required Skills|Preferred Skills|"
-            r"Job Overview|Job Responsibilities|Essential Duties(?: and Responsibilities)?|"
-            r"Website Accessibility Compliance|Content Refinement and Optimization|"
-            r"Website Redesign Support|Accessibility Training and Guidance|"
-            r"Governance and Review Processes|User Experience \(UX\) Enhancement|Graphic Design Support|"
-            r"Why [A-Za-z0-9&.' -]{2,80}\??|"
-            r"Qualifications"
-            r")(?:\s*:\s*|[ \t]+)(?=\S)"
-        )
-        text = flat_heading.sub(
-            lambda match: f"\n\n{match.group('heading')}\n\n",
-            text,
-        )
-        inline_heading = re.compile(
-            r"(?<=[.!?])\s+(?P<heading>what you['’]?ll do|essential skills? required|desirable skills?)\s*:\s+(?=\S)",
-            re.I,
-        )
-        text = inline_heading.sub(
-            lambda match: f"\n\n{match.group('heading')}\n\n",
-            text,
-        )
-        text = re.sub(
-            r"(?<=[.!?])\s+(?P<heading>be more)\s+(?=at the\b)",
-            lambda match: f"\n\n{match.group('heading')}\n\n",
-            text,
-            flags=re.I,
-        )
-    text = re.sub(r"\s*•\s*", "\n- ", text)
-    text = re.sub(r"\s*—\s*", " - ", text)
-    text = re.sub(r"[\u200b\u200c\u200d\ufeff]", "", text)
+        text = _FLAT_HEADING_RE.sub(_heading_break, text)
+        text = _FLAT_INLINE_HEADING_RE.sub(_heading_break, text)
+        text = _FLAT_BE_MORE_RE.sub(_heading_break, text)
+    if "•" in text:
+        text = _BULLET_GLYPH_RE.sub("\n- ", text)
+    if "—" in text:
+        text = _EM_DASH_RE.sub(" - ", text)
+    text = _ZERO_WIDTH_RE.sub("", text)
+
     output: List[str] = []
     prose_buffer: List[str] = []
     pending_bullet_index: Optional[int] = None
     active_section_category: Optional[str] = None
 
-    def flush_prose() -> None:
-        if prose_buffer:
-            output.append(clean_text(" ".join(prose_buffer)))
-            prose_buffer.clear()
-
-    def add_break() -> None:
-        nonlocal pending_bullet_index
-        if output and output[-1] != "":
-            output.append("")
-        pending_bullet_index = None
-
-    for raw_line in text.split("\n"):
+    lines = text.split("\n")
+    for index, raw_line in enumerate(lines):
+        if budget.exhausted():
+            # Keep the unread tail as one plain paragraph.
+            if prose_buffer:
+                output.append(clean_text(" ".join(prose_buffer)))
+                prose_buffer.clear()
+            if output and output[-1] != "":
+                output.append("")
+            output.append(clean_text(" ".join(lines[index:])))
+            break
         if not raw_line.strip():
-            flush_prose()
-            add_break()
+            if prose_buffer:
+                output.append(clean_text(" ".join(prose_buffer)))
+                prose_buffer.clear()
+            if output and output[-1] != "":
+                output.append("")
+            pending_bullet_index = None
             continue
 
         for split_line in _split_glued_heading(raw_line):
-            stripped = re.sub(r"\s+", " ", split_line.strip())
-            category = _section_category(stripped)
+            stripped = " ".join(split_line.split())
+            plain = _plain_markdown(stripped)
+            category = _heading_category(plain)
             if category:
                 active_section_category = category
-                flush_prose()
-                add_break()
-                output.append(f"**{_plain_markdown(stripped)}**")
-                add_break()
+                if prose_buffer:
+                    output.append(clean_text(" ".join(prose_buffer)))
+                    prose_buffer.clear()
+                if output and output[-1] != "":
+                    output.append("")
+                output.extend((f"**{plain}**", ""))
+                pending_bullet_index = None
                 continue
 
-            bold_bullet_match = re.match(r"^\s*\*{2,}[•-]\s*(.+?)\*{2,}\s*$", split_line)
-            bullet_match = re.match(r"^\s*(?:[-*•]|\d+[.)])\s+(.+)$", split_line)
-            was_indented = bool(re.match(r"^\s{2,}\S", split_line)) or bool(
-                re.match(r"^\s\S", split_line)
-                and active_section_category in {"responsibilities", "requirements", "preferred"}
-            )
-            if bold_bullet_match or bullet_match or was_indented:
-                flush_prose()
-                content = (
-                    bold_bullet_match.group(1)
-                    if bold_bullet_match
-                    else bullet_match.group(1)
-                    if bullet_match
-                    else split_line.strip()
-                )
-                content = re.sub(r"\s+", " ", content).strip()
-                pending_text = output[pending_bullet_index] if pending_bullet_index is not None else ""
-                pending_plain = _plain_markdown(pending_text).lower()
-                if (
-                    was_indented
-                    and pending_bullet_index is not None
-                    and len(_plain_markdown(pending_text)) < 80
-                    and not re.search(r"[.!?;:]\s*$", pending_text.strip())
-                    and (
-                        re.search(r"(?:\bat least|\bof|\bwith|\bin|\bincluding|\bsuch as|\band|\bor|\bthe|\ba|\ban|\bto|\bfor)\s*$", pending_plain)
-                        or re.match(r"^(?:of|with|in|including|and|or|to|for)\b", _plain_markdown(content), re.I)
-                    )
-                ):
-                    output[pending_bullet_index] = f"{pending_text} {content}"
-                    continue
+            item_match = _LIST_ITEM_RE.match(split_line)
+            indent = len(split_line) - len(split_line.lstrip())
+            was_indented = indent >= 2 or (indent == 1 and active_section_category in _LIST_SECTIONS)
+            if item_match or was_indented:
+                if prose_buffer:
+                    output.append(clean_text(" ".join(prose_buffer)))
+                    prose_buffer.clear()
+                if item_match:
+                    content = item_match.group("bold") or item_match.group("item")
+                else:
+                    content = split_line
+                content = " ".join(content.split())
+                if was_indented and pending_bullet_index is not None:
+                    # Re-join a list item that the source wrapped onto an
+                    # indented line mid-phrase.
+                    pending_text = output[pending_bullet_index]
+                    pending_plain = _plain_markdown(pending_text)
+                    if (
+                        len(pending_plain) < 80
+                        and not _SENTENCE_END_RE.search(pending_text.strip())
+                        and (
+                            _DANGLING_CONNECTOR_RE.search(pending_plain.lower())
+                            or _LEADING_CONNECTOR_RE.match(_plain_markdown(content))
+                        )
+                    ):
+                        output[pending_bullet_index] = f"{pending_text} {content}"
+                        continue
                 if content:
                     output.append(f"- {content}")
                     pending_bullet_index = len(output) - 1
@@ -953,12 +1269,11 @@ def normalize_description_text(text: str) -> str:
             else:
                 prose_buffer.append(stripped)
 
-    flush_prose()
-    normalized = "\n".join(output)
-    normalized = re.sub(r"\n{3,}", "\n\n", normalized).strip()
-    normalized = re.sub(r"(?m)(^-\s+[^\n]+)\n\n(?=-\s+)", r"\1\n", normalized)
-    normalized = re.sub(r"(?<=[A-Za-z0-9):])\*\*(?=[A-Za-z0-9])", "** ", normalized)
-    return normalized
+    if prose_buffer:
+        output.append(clean_text(" ".join(prose_buffer)))
+    normalized = _EXCESS_BREAKS_RE.sub("\n\n", "\n".join(output)).strip()
+    normalized = _SPLIT_BULLET_RUN_RE.sub(r"\1\n", normalized)
+    return _GLUED_BOLD_RE.sub("** ", normalized)
 
 
 def is_placeholder_section(value: Optional[str]) -> bool:
@@ -995,19 +1310,27 @@ def parse_description_sections(description: str) -> Dict[str, Optional[str]]:
         "preferred": [],
     }
     active = "overview"
-
-    for line in normalized.splitlines():
-        if _IGNORE_PROSE_START.match(_plain_markdown(line)):
+    budget = ExtractionBudget("sections")
+
+    lines = normalized.splitlines()
+    for index, line in enumerate(lines):
+        if budget.exhausted():
+            # Unclassified, but still shown in the section it started in.
+            if active != "ignore":
+                buckets[active].extend(lines[index:])
+            break
+        plain = _plain_markdown(line)
+        if _IGNORE_PROSE_START.match(plain):
             active = "ignore"
             continue
-        category = _section_category(line)
+        category = _heading_category(plain)
         if category:
             if category == "ignore":
                 active = "ignore"
                 continue
             if category == "overview":
                 if (
-                    _plain_markdown(line).lower() == "about the role"
+                    plain.lower() == "about the role"
                     and len(_plain_markdown("\n".join(buckets["overview"]))) >= 100
                 ):
                     active = "responsibilities"
@@ -1022,7 +1345,7 @@ def parse_description_sections(description: str) -> Dict[str, Optional[str]]:
             # "Tools & Technologies" make a long requirements section easier
             # to scan. The first outer heading is already represented by UI.
             if active == category and buckets[category]:
-                buckets[category].extend(["", f"**{_plain_markdown(line)}**", ""])
+                buckets[category].extend(["", f"**{plain}**", ""])
             active = category
             continue
         if active != "ignore":
@@ -1139,7 +1462,7 @@ def parse_salary(text: Optional[str]) -> Tuple[Optional[int], Optional[int], Opt
     if not text:
         return None, None, None, None
 
-    text = html.unescape(strip_html(text)).strip()
+    text = html.unescape(strip_html(cap_extraction_input("salary", text))).strip()
     lower = text.lower()
     context_matches = list(re.finditer(r"\b(?:base salary|salary|compensation|pay range|base pay)\b", lower))
     has_pay_unit = bool(re.search(r"(?:/|per\s+)(?:hour|hr|day|month|year|yr)\b|\bhourly\b|\bannual(?:ly)?\b", lower))
@@ -1159,7 +1482,11 @@ def parse_salary(text: Optional[str]) -> Tuple[Optional[int], Optional[int], Opt
 
     chosen_window = ""
     chosen_numbers: List[int] = []
+    budget = ExtractionBudget("salary")
     for window in windows:
+        if budget.exhausted():
+            # No salary is better than one read from a partial scan.
+            return None, None, None, None
         if not currency_pattern.search(window):
             continue
         numbers: List[int] = []
@@ -1428,6 +1755,12 @@ def check_duplicate_db(db_url: str, source_url: str, title: str, company: str) -
 
 
 def extract_jsonld_jobposting(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    scripts = soup.find_all("script", type=_JSONLD_TYPE_RE)
+    return jobposting_from_jsonld(script.string or script.get_text("", strip=True) for script in scripts)
+
+
+def jobposting_from_jsonld(payloads: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """Return the first JobPosting found in the JSON-LD script bodies ``payloads``."""
     def unwrap_candidates(value: Any) -> List[Dict[str, Any]]:
         items: List[Dict[str, Any]] = []
         if isinstance(value, dict):
@@ -1442,18 +1775,14 @@ def extract_jsonld_jobposting(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
                 items.extend(unwrap_candidates(entry))
         return items
 
-    scripts = soup.find_all("script", type=re.compile("ld\+json", re.I))
-    for script in scripts:
+    for payload in payloads:
         try:
             # Some ATS pages publish otherwise valid JobPosting JSON-LD with
             # literal line breaks inside the description string.  Python's
             # strict decoder rejects those control characters and would make
             # us silently miss authoritative employment, salary, and posting
             # date facts from the direct source.
-            data = json.loads(
-                script.string or script.get_text("", strip=True),
-                strict=False,
-            )
+            data = json.loads(payload, strict=False)
         except Exception:
             continue
         for item in unwrap_candidates(data):
@@ -1461,11 +1790,14 @@ def extract_jsonld_jobposting(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
     return None
 
 
+_CONTACT_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+
+
 def extract_contact_email(text: str) -> Optional[str]:
     if not text:
         return None
-    matches = re.findall(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", text)
-    for email in matches:
+    text = cap_extraction_input("contact_email", text)
+    for email in find_emails(_CONTACT_EMAIL_RE, text):
         local_part = email.split("@", 1)[0].lower()
         if any(marker in local_part for marker in (
             "accommodation", "no-reply", "noreply", "info", "hello",
@@ -1485,6 +1817,92 @@ def extract_contact_email(text: str) -> Optional[str]:
     return None
 
 
+KeywordSpans = Dict[str, List[Tuple[int, int]]]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Find every term of a vocabulary against one shared copy of the text.
+
+    The text is case-folded once and each distinct term is located with
+    ``str.find`` plus word-boundary checks, so "ADA" never fires inside
+    "Canada" and overlapping terms ("web accessibility" / "accessibility
+    testing") are all reported. For vocabularies of this size that beats a
+    combined regex alternation, which pays interpreter overhead at every
+    character. ``scan`` returns every span keyed by label so several
+    extractors can read one result; ``labels`` stops at each term's first hit.
+
+    Terms are plain strings or ``(label, surface)`` pairs when several
+    spellings should report under one label.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[Union[str, Tuple[str, str]]],
+        ignore_case: bool = True,
+        right_bounded: bool = True,
+    ):
+        self.ignore_case = ignore_case
+        self.right_bounded = right_bounded
+        self._labels: Dict[str, List[str]] = {}
+        for term in terms:
+            label, surface = term if isinstance(term, tuple) else (term, term)
+            labels = self._labels.setdefault(self._fold(surface), [])
+            if label not in labels:
+                labels.append(label)
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        folded = text.lower()
+        if len(folded) != len(text):
+            # A few characters lower-case to two ("İ"); keep offsets aligned.
+            folded = "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+        return folded
+
+    def _starts(self, folded: str, surface: str, first_only: bool = False) -> List[int]:
+        starts = []
+        size = len(surface)
+        start = folded.find(surface)
+        while start != -1:
+            end = start + size
+            if (start == 0 or not _is_word_char(folded[start - 1])) and (
+                not self.right_bounded or end == len(folded) or not _is_word_char(folded[end])
+            ):
+                starts.append(start)
+                if first_only:
+                    break
+            start = folded.find(surface, start + 1)
+        return starts
+
+    def scan(self, text: str) -> KeywordSpans:
+        found: KeywordSpans = {}
+        if not text:
+            return found
+        folded = self._fold(text)
+        for surface, labels in self._labels.items():
+            spans = [(start, start + len(surface)) for start in self._starts(folded, surface)]
+            if spans:
+                for label in labels:
+                    found.setdefault(label, []).extend(spans)
+        for spans in found.values():
+            spans.sort()
+        return found
+
+    def labels(self, text: str) -> set:
+        if not text:
+            return set()
+        folded = self._fold(text)
+        found = set()
+        for surface, labels in self._labels.items():
+            if not found.issuperset(labels) and self._starts(folded, surface, first_only=True):
+                found.update(labels)
+        return found
+
+
 # Word-bounded, not a bare substring check: "ADA" as a plain substring
 # matches inside "readability", "ADA" as lowercase would also match nothing
 # meaningful, but short acronyms need boundaries to avoid exactly this kind
@@ -1501,28 +1919,63 @@ _SKILL_KEYWORDS = [
     "Node.js", "PostgreSQL", "JIRA", "Drupal", "keyboard accessibility",
     "PDF accessibility", "document accessibility", "AODA",
 ]
-_SKILL_PATTERNS = [
-    (skill, re.compile(r"\b" + re.escape(skill) + r"\b", re.I))
-    for skill in _SKILL_KEYWORDS
-]
+_ASSISTIVE_TECH_NAMES = ["JAWS", "NVDA", "VoiceOver", "TalkBack", "ZoomText", "Dragon"]
+_ACCESSIBILITY_FOCUS_TERMS = {
+    "web": ["web", "website"],
+    "mobile": ["mobile", "iOS", "Android"],
+    "documents": [
+        "document accessibility", "accessible document", "accessible documents",
+        "documents", "PDF", "PDFs", "Word", "PowerPoint",
+    ],
+    "design": ["inclusive design", "accessible design", "UX", "UI"],
+    "testing": ["accessibility testing", "manual testing", "automated testing"],
+}
+_FINDING_NOUN_RE = re.compile(r"\s+(?:defects?|issues?|findings?|results?)\b", re.I)
+
+# One scan of the plain description text serves skills, assistive technology
+# and accessibility focus; see _term_spans().
+_TERM_MATCHER = KeywordMatcher(
+    _SKILL_KEYWORDS
+    + _ASSISTIVE_TECH_NAMES
+    + [term for terms in _ACCESSIBILITY_FOCUS_TERMS.values() for term in terms]
+)
+
+
+def _term_spans(plain: str) -> KeywordSpans:
+    """Spans of every skill/assistive-tech/focus term in plain text.
+
+    Read through ``analyze_text(text).terms``. A term followed by a finding
+    noun ("document accessibility issues") describes defects, not a skill or
+    focus area, and is dropped here once for every consumer.
+    """
+    if not plain:
+        return {}
+    hits = _TERM_MATCHER.scan(plain)
+    doc_spans = [
+        span for span in hits.get("document accessibility", [])
+        if not _FINDING_NOUN_RE.match(plain, span[1])
+    ]
+    if doc_spans:
+        hits["document accessibility"] = doc_spans
+    else:
+        hits.pop("document accessibility", None)
+    documents = [span for span in hits.get("documents", []) if plain[max(0, span[0] - 7):span[0]].lower() != "design "]
+    if documents:
+        hits["documents"] = documents
+    else:
+        hits.pop("documents", None)
+    return hits
+
+
+def _skills_in(analysis: AnalyzedText) -> List[str]:
+    terms = analysis.terms
+    return [skill for skill in _SKILL_KEYWORDS if skill in terms]
 
 
 def extract_skills(text: str) -> List[str]:
     if not text:
         return []
-    analysis_text = _plain_markdown(text)
-    found: List[str] = []
-    for skill, pattern in _SKILL_PATTERNS:
-        match = pattern.search(analysis_text)
-        if (
-            skill == "document accessibility"
-            and match
-            and re.match(r"\s+(?:defects?|issues?|findings?|results?)\b", analysis_text[match.end():], re.I)
-        ):
-            continue
-        if match and skill not in found:
-            found.append(skill)
-    return found
+    return _skills_in(analyze_text(text))
 
 
 # Case-sensitive and word-bounded on purpose: "WAS" and "ADS" are real
@@ -1531,65 +1984,78 @@ def extract_skills(text: str) -> List[str]:
 # and "ads" (inside "leads", "downloads", etc.), silently tagging unrelated
 # jobs as requiring a WAS certification. Certifications are always written
 # in caps in real postings, so exact-case, word-bounded matching is safe.
-_CERTIFICATION_PATTERNS = [
-    (cert, re.compile(r"\b" + re.escape(cert) + r"\b"))
-    for cert in ["CPACC", "WAS", "CPWA", "DHS Trusted Tester", "Section 508 Trusted Tester", "ADS", "CPABE"]
-]
-_CERTIFICATION_PATTERNS.append(
-    ("DHS Trusted Tester", re.compile(r"\bTrusted Tester(?: Certification)?\b"))
+_CERTIFICATION_MATCHER = KeywordMatcher(
+    ["CPACC", "WAS", "CPWA", "DHS Trusted Tester", "Section 508 Trusted Tester", "ADS", "CPABE",
+     ("DHS Trusted Tester", "Trusted Tester"),
+     ("DHS Trusted Tester", "Trusted Tester Certification")],
+    ignore_case=False,
 )
+_PREFERRED_QUALIFIER_RE = re.compile(r"(?:\s+certification)?\s+(?:is\s+)?preferred\b", re.I)
+
+
+def _qualified_preferred_certifications(analysis: AnalyzedText) -> List[str]:
+    text = analysis.raw
+    found = [
+        cert
+        for cert, spans in analysis.certifications.items()
+        if any(_PREFERRED_QUALIFIER_RE.match(text[end:end + 80]) for _, end in spans)
+    ]
+    return sorted(found)
 
 
 def extract_certifications(text: str) -> List[str]:
     if not text:
         return []
-    found = [cert for cert, pattern in _CERTIFICATION_PATTERNS if pattern.search(text)]
-    return list(sorted(set(found)))
+    return sorted(analyze_text(text).certifications)
 
 
 def extract_preferred_certifications(text: str) -> List[str]:
     """Find certification mentions explicitly qualified as preferred nearby."""
     if not text:
         return []
-    found: List[str] = []
-    for cert, pattern in _CERTIFICATION_PATTERNS:
-        for match in pattern.finditer(text):
-            qualifier = text[match.end():match.end() + 80]
-            if re.match(r"(?:\s+certification)?\s+(?:is\s+)?preferred\b", qualifier, re.I):
-                found.append(cert)
-                break
-    return list(sorted(set(found)))
+    return _qualified_preferred_certifications(analyze_text(text))
 
 
+# (label, pattern, flag, triggers). A pattern only runs when one of its
+# case-folded trigger literals occurs in the text; most postings mention a
+# handful of benefits, so the rest cost a substring check instead of a
+# case-insensitive regex scan.
 _BENEFIT_KEYWORDS = [
-    ("Health coverage", re.compile(r"health (?:insurance|coverage|benefits)|medical(?: (?:insurance|coverage)|(?=.{0,30}\bcoverage\b))|HMO coverage", re.I), "health_insurance"),
-    ("Dental insurance", re.compile(r"dental(?: (?:insurance|coverage|benefits)|(?=.{0,20}\bcoverage\b))", re.I), None),
-    ("Vision insurance", re.compile(r"vision (?:insurance|coverage|benefits)", re.I), None),
-    ("Retirement plan", re.compile(r"401\(?k\)?|retirement (?:plan|contributions?)|pension scheme", re.I), "retirement"),
-    ("Paid time off", re.compile(r"paid time off|\bPTO\b|paid vacation|\b\d+ days annual leave\b", re.I), None),
-    ("Parental leave", re.compile(r"parental leave|family leave", re.I), None),
-    ("Professional development", re.compile(r"professional development (?:budget|allowance|fund)", re.I), "professional_development"),
-    ("Stock/equity", re.compile(r"stock (grant|purchase|option)|equity compensation", re.I), None),
-    ("Tuition assistance", re.compile(r"tuition (assistance|reimbursement)|college coaching", re.I), "professional_development"),
-    ("Wellness programs", re.compile(r"wellness program|mental health support", re.I), None),
-    ("Disability insurance", re.compile(r"disability insurance", re.I), None),
-    ("Life insurance", re.compile(r"life insurance", re.I), None),
+    ("Health coverage", re.compile(r"health (?:insurance|coverage|benefits)|medical(?: (?:insurance|coverage)|(?=.{0,30}\bcoverage\b))|HMO coverage", re.I), "health_insurance", ("health", "medical", "hmo")),
+    ("Dental insurance", re.compile(r"dental(?: (?:insurance|coverage|benefits)|(?=.{0,20}\bcoverage\b))", re.I), None, ("dental",)),
+    ("Vision insurance", re.compile(r"vision (?:insurance|coverage|benefits)", re.I), None, ("vision",)),
+    ("Retirement plan", re.compile(r"401\(?k\)?|retirement (?:plan|contributions?)|pension scheme", re.I), "retirement", ("401", "retirement", "pension")),
+    ("Paid time off", re.compile(r"paid time off|\bPTO\b|paid vacation|\b\d+ days annual leave\b", re.I), None, ("paid", "pto", "annual leave")),
+    ("Parental leave", re.compile(r"parental leave|family leave", re.I), None, ("parental", "family")),
+    ("Professional development", re.compile(r"professional development (?:budget|allowance|fund)", re.I), "professional_development", ("professional development",)),
+    ("Stock/equity", re.compile(r"stock (grant|purchase|option)|equity compensation", re.I), None, ("stock", "equity")),
+    ("Tuition assistance", re.compile(r"tuition (assistance|reimbursement)|college coaching", re.I), "professional_development", ("tuition", "college")),
+    ("Wellness programs", re.compile(r"wellness program|mental health support", re.I), None, ("wellness", "mental health")),
+    ("Disability insurance", re.compile(r"disability insurance", re.I), None, ("disability insurance",)),
+    ("Life insurance", re.compile(r"life insurance", re.I), None, ("life insurance",)),
 ]
 
 
+def _benefits_in(analysis: AnalyzedText) -> List[str]:
+    plain = analysis.plain
+    folded = analysis.folded
+    return [
+        label
+        for label, pattern, _, triggers in _BENEFIT_KEYWORDS
+        if any(trigger in folded for trigger in triggers) and pattern.search(plain)
+    ]
+
+
+def _benefit_flags(benefits: List[str]) -> Dict[str, bool]:
+    return {flag: True for label, _, flag, _ in _BENEFIT_KEYWORDS if flag and label in benefits}
+
+
 def extract_benefits(text: str) -> Tuple[List[str], Dict[str, bool]]:
     """Returns (benefit list, boolean flags) and mirrors the JS repair library."""
     if not text:
         return [], {}
-    found: List[str] = []
-    flags: Dict[str, bool] = {}
-    analysis_text = _plain_markdown(text)
-    for label, pattern, flag in _BENEFIT_KEYWORDS:
-        if pattern.search(analysis_text):
-            found.append(label)
-            if flag:
-                flags[flag] = True
-    return found, flags
+    found = _benefits_in(analyze_text(text))
+    return found, _benefit_flags(found)
 
 
 _WORD_NUMBERS = {
@@ -1604,13 +2070,11 @@ _EXPERIENCE_RE = re.compile(
 )
 
 
-def extract_experience(text: str) -> Optional[str]:
-    if not text:
-        return None
+def _experience_in(analysis: AnalyzedText) -> Optional[str]:
     # Require "experience" to follow within a few words. A bare "N years"
     # matches unrelated things like "six years of creditable service" for
     # veteran status, which has nothing to do with the job's experience bar.
-    match = _EXPERIENCE_RE.search(_plain_markdown(text))
+    match = _EXPERIENCE_RE.search(analysis.plain)
     if not match:
         return None
     raw = match.group(1).lower()
@@ -1630,10 +2094,14 @@ def extract_experience(text: str) -> Optional[str]:
     return "10+"
 
 
-def extract_education(text: str) -> Optional[str]:
+def extract_experience(text: str) -> Optional[str]:
     if not text:
         return None
-    lower = _plain_markdown(text).lower()
+    return _experience_in(analyze_text(text))
+
+
+def _education_in(analysis: AnalyzedText) -> Optional[str]:
+    lower = analysis.lower
     if "phd" in lower or "doctorate" in lower:
         return "phd"
     if re.search(r"(?:master'?s?\s+degree|master\s+of\s+)", lower):
@@ -1647,78 +2115,181 @@ def extract_education(text: str) -> Optional[str]:
     return None
 
 
-_ASSISTIVE_TECH_NAMES = ["JAWS", "NVDA", "VoiceOver", "TalkBack", "ZoomText", "Dragon"]
-_ACCESSIBILITY_FOCUS_PATTERNS = [
-    ("web", re.compile(r"\bweb(?:site| application| content| accessibility)?\b", re.I)),
-    ("mobile", re.compile(r"\bmobile\b|\biOS\b|\bAndroid\b", re.I)),
-    ("documents", re.compile(r"\bdocument accessibility\b(?!\s+(?:defects?|issues?|findings?|results?))|\baccessible documents?\b|(?<!design )\bdocuments\b|\bPDFs?\b|\bWord\b|\bPowerPoint\b", re.I)),
-    ("design", re.compile(r"inclusive design|accessible design|\bUX\b|\bUI\b", re.I)),
-    ("testing", re.compile(r"accessibility testing|manual testing|automated testing", re.I)),
+def extract_education(text: str) -> Optional[str]:
+    if not text:
+        return None
+    return _education_in(analyze_text(text))
+
+
+_WCAG_COMBINED_RE = re.compile(r"\bWCAG\s*(2\.[012])\s*(?:/|or)\s*(2\.[012])\b", re.I)
+_WCAG_VERSION_RES = [
+    (version, re.compile(rf"\bWCAG\s*{re.escape(version)}\b", re.I))
+    for version in ["3.0", "2.2", "2.1", "2.0"]
 ]
 
 
-def extract_wcag_level(text: str) -> Optional[str]:
-    analysis_text = _plain_markdown(text)
-    combined = re.search(
-        r"\bWCAG\s*(2\.[012])\s*(?:/|or)\s*(2\.[012])\b",
-        analysis_text,
-        re.I,
-    )
+def _wcag_level_in(analysis: AnalyzedText) -> Optional[str]:
+    analysis_text = analysis.plain
+    combined = _WCAG_COMBINED_RE.search(analysis_text)
     if combined:
         return f"wcag-{max(combined.group(1), combined.group(2))}"
-    for version in ["3.0", "2.2", "2.1", "2.0"]:
-        if re.search(rf"\bWCAG\s*{re.escape(version)}\b", analysis_text, re.I):
+    for version, pattern in _WCAG_VERSION_RES:
+        if pattern.search(analysis_text):
             return f"wcag-{version}"
     return None
 
 
+def extract_wcag_level(text: str) -> Optional[str]:
+    return _wcag_level_in(analyze_text(text))
+
+
+def _assistive_tech_in(analysis: AnalyzedText) -> List[str]:
+    terms = analysis.terms
+    return [name for name in _ASSISTIVE_TECH_NAMES if name in terms]
+
+
 def extract_assistive_tech(text: str) -> List[str]:
-    analysis_text = _plain_markdown(text)
-    return [name for name in _ASSISTIVE_TECH_NAMES if re.search(r"\b" + re.escape(name) + r"\b", analysis_text, re.I)]
+    return _assistive_tech_in(analyze_text(text))
+
+
+def _accessibility_focus_in(analysis: AnalyzedText) -> List[str]:
+    terms = analysis.terms
+    return [
+        label
+        for label, focus_terms in _ACCESSIBILITY_FOCUS_TERMS.items()
+        if any(term in terms for term in focus_terms)
+    ]
 
 
 def extract_accessibility_focus(text: str) -> List[str]:
-    analysis_text = _plain_markdown(text)
-    return [label for label, pattern in _ACCESSIBILITY_FOCUS_PATTERNS if pattern.search(analysis_text)]
+    return _accessibility_focus_in(analyze_text(text))
+
+
+class FieldExtractor(NamedTuple):
+    """One structured field, read from one section scope of a posting.
+
+    ``scope`` is "full", "required" or "preferred" (see
+    ``extract_structured_fields``). ``extract`` gets the shared
+    ``AnalyzedText`` of that scope, whose term and certification scans run
+    once per text whatever number of extractors read them, plus the fields
+    produced so far. Any regex an extractor needs beyond those is its own
+    pass over the scope text. When ``triggers`` is set and none of those
+    case-folded literals occurs in the scope text, or the extraction budget
+    has run out, the extractor is skipped and a copy of ``default`` used.
+    Fields named with a leading underscore are intermediate and not returned.
+    """
+
+    field: str
+    scope: str
+    extract: Callable[[AnalyzedText, Dict[str, Any]], Any]
+    triggers: Tuple[str, ...] = ()
+    default: Any = None
+
+
+FIELD_EXTRACTORS: List[FieldExtractor] = [
+    FieldExtractor("required_skills", "required", lambda text, fields: _skills_in(text), default=[]),
+    FieldExtractor(
+        "preferred_skills", "preferred",
+        lambda text, fields: [skill for skill in _skills_in(text) if skill not in fields["required_skills"]],
+        default=[],
+    ),
+    FieldExtractor(
+        "_preferred_section_certifications", "preferred",
+        lambda text, fields: sorted(text.certifications),
+        default=[],
+    ),
+    FieldExtractor(
+        "preferred_certifications", "required",
+        lambda text, fields: sorted(set(
+            fields["_preferred_section_certifications"] + _qualified_preferred_certifications(text)
+        )),
+        default=[],
+    ),
+    FieldExtractor(
+        "required_certifications", "required",
+        lambda text, fields: [
+            cert for cert in sorted(text.certifications) if cert not in fields["preferred_certifications"]
+        ],
+        default=[],
+    ),
+    FieldExtractor("years_experience", "full", lambda text, fields: _experience_in(text), triggers=("year",)),
+    FieldExtractor("education_level", "full", lambda text, fields: _education_in(text)),
+    FieldExtractor("benefits", "full", lambda text, fields: _benefits_in(text), default=[]),
+    FieldExtractor("benefit_flags", "full", lambda text, fields: _benefit_flags(fields["benefits"]), default={}),
+    FieldExtractor("wcag_level", "full", lambda text, fields: _wcag_level_in(text), triggers=("wcag",)),
+    FieldExtractor("accessibility_focus", "full", lambda text, fields: _accessibility_focus_in(text), default=[]),
+    FieldExtractor("assistive_tech_experience", "full", lambda text, fields: _assistive_tech_in(text), default=[]),
+]
+
+_FIELD_EXTRACTION_TIMINGS: Dict[str, List[float]] = {}
+_FIELD_EXTRACTION_LOCK = threading.Lock()
+
+
+def field_extraction_stats() -> Dict[str, Dict[str, Any]]:
+    """Calls, trigger skips and cumulative milliseconds per extracted field.
+
+    A shared scan (terms, certifications) is charged to the first extractor
+    that reads it for a given text.
+    """
+    with _FIELD_EXTRACTION_LOCK:
+        return {
+            field: {"calls": int(calls), "skipped": int(skipped), "ms": round(seconds * 1000, 1)}
+            for field, (calls, skipped, seconds) in sorted(_FIELD_EXTRACTION_TIMINGS.items())
+        }
 
 
 def extract_structured_fields(full_text: str, sections: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Run every registered ``FIELD_EXTRACTORS`` entry over its scope.
+
+    "full" is the whole posting, "preferred" the nice-to-have section and
+    "required" the requirements plus responsibilities (or the whole posting
+    when the requirements section is only a placeholder). This is not one
+    combined scan: each scope is analyzed once and shares its term and
+    certification scans, but the regex extractors (experience, education,
+    benefits, WCAG level) still make a pass each, skipped when their trigger
+    literals are absent. Merging their patterns into one alternation would
+    trade the per-pattern first-match results for leftmost non-overlapping
+    ones and change the output.
+    """
     responsibilities = sections.get("key_responsibilities") or ""
     requirements = sections.get("requirements") or ""
-    preferred_text = sections.get("nice_to_have") or ""
 
     if is_placeholder_section(requirements):
         required_context = full_text
     else:
         required_context = f"{requirements}\n{responsibilities}"
+    scopes = {
+        "full": cap_extraction_input("description", full_text),
+        "required": cap_extraction_input("description", required_context),
+        "preferred": cap_extraction_input("description", sections.get("nice_to_have") or ""),
+    }
 
-    required_skills = extract_skills(required_context)
-    preferred_skills = [skill for skill in extract_skills(preferred_text) if skill not in required_skills]
-    benefits, benefit_flags = extract_benefits(full_text)
-
-    preferred_certifications = list(sorted(set(
-        extract_certifications(preferred_text)
-        + extract_preferred_certifications(required_context)
-    )))
-    required_certifications = [
-        cert
-        for cert in extract_certifications(required_context)
-        if cert not in preferred_certifications
-    ]
+    analyses: Dict[str, AnalyzedText] = {}
+    fields: Dict[str, Any] = {}
+    timings: List[Tuple[str, bool, float]] = []
+    budget = ExtractionBudget("structured_fields")
+    for extractor in FIELD_EXTRACTORS:
+        if budget.exhausted(len(scopes[extractor.scope]) + 1):
+            fields[extractor.field] = copy.copy(extractor.default)
+            continue
+        analysis = analyses.get(extractor.scope)
+        if analysis is None:
+            analysis = analyses[extractor.scope] = analyze_text(scopes[extractor.scope])
+        start = time.perf_counter()
+        if extractor.triggers and not any(trigger in analysis.folded for trigger in extractor.triggers):
+            fields[extractor.field] = copy.copy(extractor.default)
+            timings.append((extractor.field, True, time.perf_counter() - start))
+            continue
+        fields[extractor.field] = extractor.extract(analysis, fields)
+        timings.append((extractor.field, False, time.perf_counter() - start))
 
-    return {
-        "required_skills": required_skills,
-        "preferred_skills": preferred_skills,
-        "required_certifications": required_certifications,
-        "preferred_certifications": preferred_certifications,
-        "years_experience": extract_experience(full_text),
-        "education_level": extract_education(full_text),
-        "benefits": benefits,
-        "benefit_flags": benefit_flags,
-        "wcag_level": extract_wcag_level(full_text),
-        "accessibility_focus": extract_accessibility_focus(full_text),
-        "assistive_tech_experience": extract_assistive_tech(full_text),
-    }
+    with _FIELD_EXTRACTION_LOCK:
+        for field, skipped, seconds in timings:
+            totals = _FIELD_EXTRACTION_TIMINGS.setdefault(field, [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += skipped
+            totals[2] += seconds
+    return {field: value for field, value in fields.items() if not field.startswith("_")}
 
 
 # --- Tagged (Required)/(Preferred) items in a corporate JD template -------
@@ -1813,79 +2384,350 @@ def trim_legal_boilerplate(text: str) -> str:
     return text
 
 
-def normalize_external_content(text: str) -> str:
+EXTERNAL_HTML_RE = re.compile(r"<html|<body|<div|<main|<section|<!doctype", re.I)
+
+
+def normalize_external_content(text: Union[str, "FetchedDocument"]) -> str:
+    if isinstance(text, FetchedDocument):
+        return text.visible
     if not text:
         return ""
 
-    if re.search(r"<html|<body|<div|<main|<section|<!doctype", text[:2000], re.I):
-        soup = BeautifulSoup(text, "html.parser")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-        # SuccessFactors and similar ATS pages mark the authoritative role body
-        # even when they omit JobPosting JSON-LD. Preserve its headings and
-        # list items instead of flattening them into surrounding page chrome.
-        job_body = soup.find(attrs={"itemprop": "description"})
-        if job_body:
-            fragment = BeautifulSoup(str(job_body), "html.parser")
-            for heading in fragment.find_all(re.compile(r"^h[1-6]$")):
-                label = clean_text(heading.get_text(" ", strip=True))
-                heading.replace_with(f"\n**{label}**\n" if label else "\n")
-            for item in fragment.find_all("li"):
-                label = clean_text(item.get_text(" ", strip=True))
-                item.replace_with(f"\n- {label}\n" if label else "\n")
-            for br in fragment.find_all("br"):
-                br.replace_with("\n")
-            visible_text = normalize_description_text(fragment.get_text("\n", strip=True))
-        else:
-            visible_text = normalize_description_text(soup.get_text("\n", strip=True))
-        if len(visible_text) >= 200:
-            text = visible_text
-        else:
-            meta_parts: List[str] = []
-            title_tag = soup.find("title")
-            if title_tag:
-                meta_parts.append(clean_text(title_tag.get_text(" ", strip=True)))
-            for attrs in [
-                {"name": "description"},
-                {"property": "og:description"},
-                {"name": "twitter:description"},
-                {"property": "twitter:description"},
-            ]:
-                meta_tag = soup.find("meta", attrs=attrs)
-                if meta_tag and meta_tag.get("content"):
-                    meta_parts.append(clean_text(meta_tag["content"]))
-            text = normalize_description_text("\n\n".join(part for part in meta_parts if part))
+    if EXTERNAL_HTML_RE.search(text[:2000]):
+        text = visible_page_text(parse_html(text, "external_content"))
 
     return normalize_description_text(strip_html(text))
 
 
-def fetch_external_text(session: requests.Session, url: str) -> Tuple[Optional[str], str, Optional[str]]:
+def visible_page_text(soup: BeautifulSoup) -> str:
+    """The role body, or else the page's text, of a parsed page; ``soup`` is consumed."""
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    # SuccessFactors and similar ATS pages mark the authoritative role body
+    # even when they omit JobPosting JSON-LD. Preserve its headings and
+    # list items instead of flattening them into surrounding page chrome.
+    job_body = soup.find(attrs={"itemprop": "description"})
+    if job_body:
+        # Rewrite the marked body detached from the page rather than
+        # serializing and parsing it a second time. The bare wrapper lets
+        # the body tag itself be rewritten, and smooth() rejoins the text
+        # the decomposed tags split, as a fresh parse would.
+        fragment = soup.new_tag("div")
+        fragment.append(job_body.extract())
+        fragment.smooth()
+        for heading in fragment.find_all(re.compile(r"^h[1-6]$")):
+            label = clean_text(heading.get_text(" ", strip=True))
+            heading.replace_with(f"\n**{label}**\n" if label else "\n")
+        for item in fragment.find_all("li"):
+            label = clean_text(item.get_text(" ", strip=True))
+            item.replace_with(f"\n- {label}\n" if label else "\n")
+        for br in fragment.find_all("br"):
+            br.replace_with("\n")
+        visible_text = normalize_description_text(fragment.get_text("\n", strip=True))
+    else:
+        visible_text = normalize_description_text(soup.get_text("\n", strip=True))
+    if len(visible_text) >= 200:
+        return visible_text
+    meta_parts: List[str] = []
+    title_tag = soup.find("title")
+    if title_tag:
+        meta_parts.append(clean_text(title_tag.get_text(" ", strip=True)))
+    for attrs in [
+        {"name": "description"},
+        {"property": "og:description"},
+        {"name": "twitter:description"},
+        {"property": "twitter:description"},
+    ]:
+        meta_tag = soup.find("meta", attrs=attrs)
+        if meta_tag and meta_tag.get("content"):
+            meta_parts.append(clean_text(meta_tag["content"]))
+    return normalize_description_text("\n\n".join(part for part in meta_parts if part))
+
+
+def copy_tree(soup: BeautifulSoup) -> BeautifulSoup:
+    """A detached copy of ``soup``, built node by node rather than re-parsed."""
+    clone = BeautifulSoup("", "html.parser")
+    for child in soup.contents:
+        clone.append(copy.copy(child))
+    return clone
+
+
+_UNSET: Any = object()
+
+
+class FetchedDocument:
+    """One fetched external page and its derived views, each computed on first use.
+
+    Enrichment asks the same page whether it is a block page, whether it
+    matches the job, what its JSON-LD and labelled facts say and whether it
+    is closed. The checks behind those questions all accept a document as
+    well as page text; handing them one document means each view is derived
+    once per page instead of once per check. Treat the views as read-only:
+    ``soup`` is shared between consumers.
+    """
+
+    __slots__ = (
+        "text", "url", "_raw", "_analysis", "_visible", "_visible_lower", "_visible_plain",
+        "_jsonld", "_site_name", "_soup",
+    )
+
+    def __init__(self, text: str, url: Optional[str] = None, raw: Optional[bytes] = None):
+        self.text = text
+        self.url = url
+        self._raw = raw
+        self._analysis: Optional[AnalyzedText] = None
+        self._visible: Optional[str] = None
+        self._visible_lower: Optional[str] = None
+        self._visible_plain: Optional[str] = None
+        self._jsonld: Any = _UNSET
+        self._site_name: Any = _UNSET
+        self._soup: Optional[BeautifulSoup] = None
+
+    @classmethod
+    def from_response(cls, response: BoundedResponse) -> "FetchedDocument":
+        return cls(response.text, response.url, response.content)
+
+    @property
+    def raw(self) -> bytes:
+        """The body as read (the UTF-8 encoded text when built from text)."""
+        return self._raw if self._raw is not None else self.text.encode("utf-8")
+
+    @property
+    def analysis(self) -> AnalyzedText:
+        if self._analysis is None:
+            self._analysis = analyze_text(self.text)
+        return self._analysis
+
+    @property
+    def lower(self) -> str:
+        """Lower-cased page text with markup characters stripped, tags included."""
+        return self.analysis.lower
+
+    @property
+    def tokens(self) -> frozenset:
+        return self.analysis.tokens
+
+    @property
+    def visible(self) -> str:
+        """What a reader sees: ``normalize_external_content`` of the page."""
+        if self._visible is None:
+            if self.text and EXTERNAL_HTML_RE.search(self.text[:2000]):
+                # Strip tags from a copy: ``soup`` is shared with other readers.
+                text = visible_page_text(copy_tree(self.soup))
+                self._visible = normalize_description_text(strip_html(text))
+            else:
+                self._visible = normalize_external_content(self.text)
+        return self._visible
+
+    @property
+    def visible_lower(self) -> str:
+        if self._visible_lower is None:
+            self._visible_lower = self.visible.lower()
+        return self._visible_lower
+
+    @property
+    def visible_plain(self) -> str:
+        if self._visible_plain is None:
+            self._visible_plain = _plain_markdown(self.visible)
+        return self._visible_plain
+
+    @property
+    def jsonld(self) -> Optional[Dict[str, Any]]:
+        if self._jsonld is _UNSET:
+            self._jsonld = extract_external_jobposting(self.text)
+        return self._jsonld
+
+    @property
+    def site_name(self) -> Optional[str]:
+        if self._site_name is _UNSET:
+            self._site_name = extract_external_company_name(self.text)
+        return self._site_name
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = parse_html(self.text, "external_document")
+        return self._soup
+
+
+def as_fetched_document(content: Union[str, FetchedDocument, None]) -> FetchedDocument:
+    return content if isinstance(content, FetchedDocument) else FetchedDocument(content or "")
+
+
+HOST_FAILURE_THRESHOLD = 2
+HOST_COOLDOWN_SECONDS = 600.0
+# Statuses that mean the host refused us rather than that the page is gone.
+HOST_REFUSAL_STATUSES = frozenset({401, 403, 407, 429, 503})
+
+
+class HostCircuitBreaker:
+    """Per-host health of each fetch strategy, shared by all enrichment workers.
+
+    A strategy ("direct" or "jina") that a host blocks, refuses or times out
+    on ``failure_threshold`` times in a row is opened for that host: callers
+    skip it and go to the next strategy without paying for the attempt.
+    After ``cooldown`` seconds one caller is let through as a probe; its
+    success closes the circuit again and its failure re-opens it. A probe
+    that ends without an answer (its deadline ran out or it was cancelled)
+    is ``release``d, leaving the next caller to probe instead.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = HOST_FAILURE_THRESHOLD,
+        cooldown: float = HOST_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self._circuits: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, host: str, strategy: str) -> Dict[str, Any]:
+        return self._circuits.setdefault((host, strategy), {
+            "state": "closed", "consecutive_failures": 0, "opened_at": 0.0,
+            "successes": 0, "failures": 0, "skipped": 0,
+        })
+
+    def allow(self, host: str, strategy: str) -> bool:
+        """Whether to attempt ``strategy`` on ``host``; an allowed call must be ``record``ed or ``release``d."""
+        with self._lock:
+            circuit = self._circuit(host, strategy)
+            if circuit["state"] == "open" and self.clock() - circuit["opened_at"] >= self.cooldown:
+                circuit["state"] = "half_open"
+                return True
+            if circuit["state"] == "closed":
+                return True
+            circuit["skipped"] += 1
+            return False
+
+    def record(self, host: str, strategy: str, ok: bool) -> None:
+        with self._lock:
+            circuit = self._circuit(host, strategy)
+            if ok:
+                circuit["successes"] += 1
+                circuit["consecutive_failures"] = 0
+                circuit["state"] = "closed"
+                return
+            circuit["failures"] += 1
+            circuit["consecutive_failures"] += 1
+            if circuit["state"] == "half_open" or circuit["consecutive_failures"] >= self.failure_threshold:
+                circuit["state"] = "open"
+                circuit["opened_at"] = self.clock()
+
+    def release(self, host: str, strategy: str) -> None:
+        """Give back an allowed call that ended without an answer, counting nothing.
+
+        A half-open probe returns the circuit to open with its original
+        ``opened_at``, so its cooldown has already passed for the next caller.
+        """
+        with self._lock:
+            circuit = self._circuit(host, strategy)
+            if circuit["state"] == "half_open":
+                circuit["state"] = "open"
+
+    def report(self) -> Dict[str, Any]:
+        """Totals, plus per-host state for every host a strategy failed on."""
+        with self._lock:
+            hosts: Dict[str, Dict[str, Any]] = {}
+            for (host, strategy), circuit in sorted(self._circuits.items()):
+                if circuit["failures"] or circuit["skipped"]:
+                    hosts.setdefault(host, {})[strategy] = {
+                        key: circuit[key] for key in ("state", "successes", "failures", "skipped")
+                    }
+            return {
+                "hosts_seen": len({host for host, _ in self._circuits}),
+                "open": sorted(
+                    f"{host}:{strategy}" for (host, strategy), circuit in self._circuits.items()
+                    if circuit["state"] != "closed"
+                ),
+                "skipped_attempts": sum(circuit["skipped"] for circuit in self._circuits.values()),
+                "hosts": hosts,
+            }
+
+
+def fetch_external_text(
+    session: requests.Session,
+    url: str,
+    host_health: Optional[HostCircuitBreaker] = None,
+    deadline: Optional[Deadline] = None,
+) -> Tuple[Optional[str], str, Optional[str]]:
+    document, source, resolved_url = fetch_external_document(session, url, host_health, deadline)
+    return (document.text if document else None), source, resolved_url
+
+
+def fetch_external_document(
+    session: requests.Session,
+    url: str,
+    host_health: Optional[HostCircuitBreaker] = None,
+    deadline: Optional[Deadline] = None,
+) -> Tuple[Optional[FetchedDocument], str, Optional[str]]:
+    """Fetch ``url`` (following A11yJobs apply redirects) as a ``FetchedDocument``.
+
+    Returns the document, the source kind ("direct", "jina", "invalid",
+    "unreachable" when every strategy was refused, timed out, hit a server
+    error or was skipped by ``host_health``, else "failed") and the URL the
+    evidence should be credited to. With
+    ``host_health``, strategies the host keeps blocking are skipped and
+    every attempt on the host is recorded. Every request shares
+    ``deadline``; DeadlineExceeded propagates once it runs out.
+    """
     if not url or not url_is_valid(url):
         return None, "invalid", None
 
-    def try_fetch(fetch_url: str) -> Tuple[Optional[str], Optional[str]]:
+    def try_fetch(fetch_url: str) -> Tuple[Optional[FetchedDocument], Optional[str]]:
+        """The usable document, or None and why: "refused" (no answer or a
+        refusal status), "error" (another 5xx) or "unusable"."""
         try:
-            response = session.get(fetch_url, timeout=5)
+            response = fetch_bounded(session, fetch_url, timeout=5, deadline=deadline)
             if response.status_code >= 400:
-                return None, None
-            text = response.text
-            if not text or len(text) < 200:
-                return None, None
-            return text, response.url
-        except Exception:
-            return None, None
+                if response.status_code in HOST_REFUSAL_STATUSES:
+                    return None, "refused"
+                return None, "error" if response.status_code >= 500 else "unusable"
+            if response.skipped:
+                return None, "unusable"
+            document = FetchedDocument.from_response(response)
+            if not document.text or len(document.text) < 200:
+                return None, "unusable"
+            return document, None
+        except DeadlineExceeded:
+            raise
+        except Exception as exc:
+            # A timeout cut short by our own deadline says nothing about the host.
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded(f"enrichment budget exhausted fetching {fetch_url}") from exc
+            return None, "refused"
+
+    host = hostname_without_www(url)
+
+    def settle(strategy: str, ok: bool) -> None:
+        # An answer that arrives after the deadline ran out, or after the
+        # link was cancelled, no longer counts for or against the host.
+        if deadline is not None and deadline.expired():
+            host_health.release(host, strategy)
+        else:
+            host_health.record(host, strategy, ok)
 
-    text, resolved_url = try_fetch(url)
-    if text:
-        javascript_redirect = re.search(
-            r"navigateTo\([^,]+,[^,]+,\s*[\"'](https?://[^\"']+)",
-            html.unescape(text),
-            re.I,
-        )
-        if javascript_redirect:
-            redirected_text, redirected_url = try_fetch(javascript_redirect.group(1))
-            if redirected_text:
-                text, resolved_url = redirected_text, redirected_url
+    direct_allowed = host_health is None or host_health.allow(host, "direct")
+    try:
+        document, failure = try_fetch(url) if direct_allowed else (None, "refused")
+        if document:
+            javascript_redirect = re.search(
+                r"navigateTo\([^,]+,[^,]+,\s*[\"'](https?://[^\"']+)",
+                html.unescape(document.text),
+                re.I,
+            )
+            if javascript_redirect:
+                redirected, _ = try_fetch(javascript_redirect.group(1))
+                if redirected:
+                    document = redirected
+    except BaseException:
+        # Out of time before the host answered: say nothing about the host.
+        if direct_allowed and host_health is not None:
+            host_health.release(host, "direct")
+        raise
+    resolved_url = document.url if document else None
     blocked_markers = [
         "enable javascript",
         "access denied",
@@ -1896,20 +2738,26 @@ def fetch_external_text(session: requests.Session, url: str) -> Tuple[Optional[s
         "service interruption",
         "check back later",
     ]
-    visible_text = normalize_external_content(text) if text else ""
-    is_blocked = any(marker in visible_text.lower() for marker in blocked_markers)
+
+    def is_blocked_page(candidate: FetchedDocument) -> bool:
+        return any(marker in candidate.visible_lower for marker in blocked_markers)
+
+    is_blocked = bool(document) and is_blocked_page(document)
+    if direct_allowed and host_health is not None:
+        settle("direct", not (failure == "refused" or is_blocked))
+    # Nothing usable came back because the host, not the page, failed.
+    direct_unreachable = is_blocked or failure in {"refused", "error"}
 
     # A11yJobs renders an intermediate confirmation page at /apply and exposes
     # the employer or ATS redirect at /apply/go. Follow that source-backed link
     # so evidence classification uses the final destination rather than the
     # aggregator confirmation page.
-    if text and not is_blocked and hostname_without_www(resolved_url or url) == "a11yjobs.com":
-        soup = BeautifulSoup(text, "html.parser")
+    if document and not is_blocked and hostname_without_www(resolved_url or url) == "a11yjobs.com":
         go_link = next(
             (
-                urljoin(resolved_url or url, anchor.get("href", ""))
-                for anchor in soup.find_all("a", href=True)
-                if re.search(r"/apply/go(?:[/?#]|$)", anchor.get("href", ""))
+                urljoin(resolved_url or url, href)
+                for href in select_html(document.text, "apply_links", "a[href]", LINKS_ONLY, "href")
+                if href and re.search(r"/apply/go(?:[/?#]|$)", href)
             ),
             None,
         )
@@ -1919,61 +2767,273 @@ def fetch_external_text(session: requests.Session, url: str) -> Tuple[Optional[s
         if not go_link and urlparse(resolved_url or url).path.rstrip("/").endswith("/apply"):
             go_link = (resolved_url or url).rstrip("/") + "/go"
         if go_link:
-            external_text, external_url = try_fetch(go_link)
-            external_visible = normalize_external_content(external_text) if external_text else ""
-            external_blocked = any(marker in external_visible.lower() for marker in blocked_markers)
-            if external_text and not external_blocked:
-                return external_text, "direct", external_url
+            external, _ = try_fetch(go_link)
+            if external and not is_blocked_page(external):
+                return external, "direct", external.url
 
-    if text and not is_blocked:
-        return text, "direct", resolved_url
+    if document and not is_blocked:
+        return document, "direct", resolved_url
 
+    if host_health is not None and not host_health.allow(host, "jina"):
+        return None, "unreachable" if direct_unreachable else "failed", None
     jina_url = f"https://r.jina.ai/http://{url.replace('https://', '').replace('http://', '')}"
-    text, _ = try_fetch(jina_url)
-    jina_visible = normalize_external_content(text) if text else ""
-    if text and not any(marker in jina_visible.lower() for marker in blocked_markers):
-        return text, "jina", url
+    try:
+        jina, failure = try_fetch(jina_url)
+    except BaseException:
+        if host_health is not None:
+            host_health.release(host, "jina")
+        raise
+    jina_blocked = bool(jina) and is_blocked_page(jina)
+    if host_health is not None:
+        settle("jina", not (failure == "refused" or jina_blocked))
+    if jina and not jina_blocked:
+        return jina, "jina", url
 
-    return None, "failed", None
+    jina_unreachable = jina_blocked or failure in {"refused", "error"}
+    return None, "unreachable" if direct_unreachable and jina_unreachable else "failed", None
 
 
-def search_alternate_urls(session: requests.Session, title: str, company: str) -> List[str]:
-    query = f"{title} {company} job posting"
-    search_url = "https://duckduckgo.com/html/"
-    try:
-        response = session.get(search_url, params={"q": query}, timeout=5)
+SEARCH_TIMEOUT_SECONDS = 5.0
+
+
+class SearchUnavailable(Exception):
+    """The engine answered without a results list, e.g. with a captcha page."""
+
+
+class SearchBackend(ABC):
+    """Source of result links for a job search query, in the engine's order.
+
+    ``search_alternate_urls`` filters, ranks and caches what a backend
+    returns; a backend only runs the query. Raising marks the search as
+    failed, which is never cached.
+    """
+
+    name = "search"
+
+    @abstractmethod
+    def search(self, session: requests.Session, query: str, timeout: float = SEARCH_TIMEOUT_SECONDS) -> List[str]:
+        ...
+
+
+class DuckDuckGoHtmlSearch(SearchBackend):
+    """DuckDuckGo's HTML endpoint, with its redirect links unwrapped.
+
+    When it suspects a bot, the endpoint answers 200 with an "anomaly"
+    challenge instead of results. A page without result links is therefore
+    a failed search rather than an empty one, so it is not cached.
+    """
+
+    name = "duckduckgo"
+    URL = "https://duckduckgo.com/html/"
+
+    def search(self, session: requests.Session, query: str, timeout: float = SEARCH_TIMEOUT_SECONDS) -> List[str]:
+        response = session.get(self.URL, params={"q": query}, timeout=timeout)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        hrefs = select_html(response.content, "search_results", "a.result__a", SEARCH_RESULTS_ONLY, "href")
+        if not hrefs:
+            raise SearchUnavailable(f"{self.name} returned no result links")
         links = []
-        for a in soup.select("a.result__a"):
-            href = a.get("href")
+        for href in hrefs:
             if not href:
                 continue
             parsed = urlparse(urljoin("https://duckduckgo.com", href))
             if parsed.hostname and parsed.hostname.endswith("duckduckgo.com"):
                 redirect_target = parse_qs(parsed.query).get("uddg", [None])[0]
                 href = redirect_target or ""
-            if url_is_valid(href) and href not in links:
-                links.append(href)
-        # Prefer employer/ATS pages while retaining independent boards as
-        # corroborating fallbacks. More than the first result is necessary
-        # because search engines commonly rank an aggregator above the ATS.
-        ranked_links = sorted(
-            enumerate(links),
-            key=lambda item: (not is_direct_job_url(item[1]), item[0]),
-        )
-        return [link for _, link in ranked_links[:5]]
-    except Exception:
+            links.append(href)
+        return links
+
+
+class StaticSearchBackend(SearchBackend):
+    """Offline stand-in returning canned links per query, for tests and benchmarks."""
+
+    name = "static"
+
+    def __init__(self, results: Optional[Dict[str, List[str]]] = None):
+        self.results = results or {}
+        self.queries: List[str] = []
+
+    def search(self, session: requests.Session, query: str, timeout: float = SEARCH_TIMEOUT_SECONDS) -> List[str]:
+        self.queries.append(query)
+        return list(self.results.get(query, []))
+
+
+DEFAULT_SEARCH_BACKEND = DuckDuckGoHtmlSearch()
+
+SEARCH_CACHE_TTL_SECONDS = 7 * 24 * 3600
+SEARCH_CACHE_NEGATIVE_TTL_SECONDS = 24 * 3600
+
+
+class SearchResultCache:
+    """Ranked alternate URLs per normalized (title, company), kept across runs.
+
+    Long-lived postings come back every day with the same title and company,
+    so an entry answers them without a search until ``ttl`` passes. Searches
+    that found nothing are remembered for the shorter ``negative_ttl``, so a
+    posting that later gains an employer page is searched again soon. With
+    ``path`` the entries are read at start and written back by ``save``;
+    without it the cache only lives for the run.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = SEARCH_CACHE_TTL_SECONDS,
+        negative_ttl: float = SEARCH_CACHE_NEGATIVE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.loaded = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stored = 0
+        if path:
+            self._load(path)
+
+    @staticmethod
+    def key(title: str, company: str) -> str:
+        return f"{normalize_text(title or '')}|{normalize_company_for_dedupe(company or '')}"
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != self.VERSION:
+            return
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return
+        now = self.clock()
+        for key, entry in entries.items():
+            if (
+                isinstance(entry, dict)
+                and isinstance(entry.get("links"), list)
+                and isinstance(entry.get("stored_at"), (int, float))
+                and not self._is_expired(entry, now)
+            ):
+                self._entries[key] = {"links": [str(link) for link in entry["links"]], "stored_at": entry["stored_at"]}
+        self.loaded = len(self._entries)
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        ttl = self.ttl if entry["links"] else self.negative_ttl
+        return now - entry["stored_at"] >= ttl
+
+    def get(self, title: str, company: str) -> Optional[List[str]]:
+        """Cached ranked links (possibly empty), or None when a search is needed."""
+        key = self.key(title, company)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry, self.clock()):
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry["links"]:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+            return list(entry["links"])
+
+    def put(self, title: str, company: str, links: List[str]) -> None:
+        with self._lock:
+            self._entries[self.key(title, company)] = {"links": list(links), "stored_at": self.clock()}
+            self.stored += 1
+
+    def save(self) -> None:
+        """Write unexpired entries to ``path``, replacing the file atomically."""
+        if not self.path:
+            return
+        now = self.clock()
+        with self._lock:
+            entries = {
+                key: entry for key, entry in sorted(self._entries.items())
+                if not self._is_expired(entry, now)
+            }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": entries}, f, ensure_ascii=True)
+        os.replace(temporary_path, self.path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "loaded": self.loaded,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "stored": self.stored,
+                "hit_rate": round((self.hits + self.negative_hits) / lookups, 3) if lookups else None,
+            }
+
+
+def search_alternate_urls(
+    session: requests.Session,
+    title: str,
+    company: str,
+    cache: Optional[SearchResultCache] = None,
+    backend: Optional[SearchBackend] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[str]:
+    if cache is not None:
+        cached = cache.get(title, company)
+        if cached is not None:
+            return cached
+    query = f"{title} {company} job posting"
+    timeout = deadline_timeout(deadline, SEARCH_TIMEOUT_SECONDS)
+    try:
+        results = (backend or DEFAULT_SEARCH_BACKEND).search(session, query, timeout=timeout)
+    except Exception as exc:
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceeded("enrichment budget exhausted searching") from exc
         return []
+    links: List[str] = []
+    for href in results:
+        if url_is_valid(href) and href not in links:
+            links.append(href)
+    # Prefer employer/ATS pages while retaining independent boards as
+    # corroborating fallbacks. More than the first result is necessary
+    # because search engines commonly rank an aggregator above the ATS.
+    ranked_links = sorted(
+        enumerate(links),
+        key=lambda item: (not is_direct_job_url(item[1]), item[0]),
+    )
+    ranked = [link for _, link in ranked_links[:5]]
+    if cache is not None:
+        cache.put(title, company, ranked)
+    return ranked
 
 
-def extract_embedded_direct_job_urls(content: str) -> List[str]:
+def extract_embedded_direct_job_urls(content: Union[str, FetchedDocument, None]) -> List[str]:
     """Return employer/ATS links explicitly printed in a board description."""
-    decoded = html.unescape(content or "").replace("\\/", "/")
-    soup = BeautifulSoup(decoded, "html.parser")
-    visible = soup.get_text(" ", strip=True)
+    document = as_fetched_document(content)
+    if not document.text:
+        return []
+    # Read the page's shared tree; escaped markup and JSON-escaped slashes
+    # are decoded in the strings it yields rather than before the parse.
+    soup = document.soup
+    visible = html.unescape(soup.get_text(" ", strip=True)).replace("\\/", "/")
     anchor_urls = " ".join(
-        str(anchor.get("href") or "") for anchor in soup.find_all("a", href=True)
+        html.unescape(str(anchor.get("href") or "")).replace("\\/", "/")
+        for anchor in soup.find_all("a", href=True)
     )
     links: List[str] = []
     for source_text in (visible, anchor_urls):
@@ -2264,7 +3324,7 @@ def parse_job_detail(session: requests.Session, url: str, listing_hint_date: Opt
     # value for someone browsing the board.
     display_description = trim_legal_boilerplate(description)
 
-    sections = parse_description_sections(display_description)
+    sections = analyze_text(display_description).sections
     job_description = sections["description"]
     key_responsibilities = sections["key_responsibilities"]
     requirements = sections["requirements"]
@@ -2436,20 +3496,28 @@ def is_direct_job_url(url: Optional[str]) -> bool:
     return True
 
 
+_RELEVANCE_TITLE_MARKERS = [
+    "accessibility", "a11y", "wcag", "section 508", "inclusive design",
+    "assistive technology", "digital inclusion",
+]
+_RELEVANCE_DESCRIPTION_MARKERS = [
+    "accessibility", "a11y", "wcag", "aria", "section 508",
+    "screen reader", "assistive technology", "inclusive design",
+    "accessibility testing", "accessibility audit", "accessibility remediation",
+]
+# Markers only need to start a word, so "WCAG2.1" and "screen readers" still
+# count while "aria" no longer fires inside "Bulgaria". Title and description
+# markers overlap, so one matcher serves both lists.
+_RELEVANCE_MATCHER = KeywordMatcher(
+    _RELEVANCE_TITLE_MARKERS + _RELEVANCE_DESCRIPTION_MARKERS, right_bounded=False
+)
+
+
 def accessibility_relevance_score(title: str, description: str) -> int:
-    title_lower = title.lower()
-    description_lower = description.lower()
-    title_markers = [
-        "accessibility", "a11y", "wcag", "section 508", "inclusive design",
-        "assistive technology", "digital inclusion",
-    ]
-    description_markers = [
-        "accessibility", "a11y", "wcag", "aria", "section 508",
-        "screen reader", "assistive technology", "inclusive design",
-        "accessibility testing", "accessibility audit", "accessibility remediation",
-    ]
-    title_hits = sum(1 for marker in title_markers if marker in title_lower)
-    description_hits = sum(1 for marker in description_markers if marker in description_lower)
+    title_terms = _RELEVANCE_MATCHER.labels(title)
+    description_terms = _RELEVANCE_MATCHER.labels(description)
+    title_hits = sum(1 for marker in _RELEVANCE_TITLE_MARKERS if marker in title_terms)
+    description_hits = sum(1 for marker in _RELEVANCE_DESCRIPTION_MARKERS if marker in description_terms)
     return title_hits * 5 + min(description_hits, 8)
 
 
@@ -2467,7 +3535,7 @@ def jobspy_record_to_job(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     company = clean_optional_text(raw.get("company")) or ""
     description = normalize_description_text(clean_optional_text(raw.get("description")) or "")
     description = trim_legal_boilerplate(description)
-    if not title or not company or len(_plain_markdown(description)) < 100:
+    if not title or not company or len(analyze_text(description).plain) < 100:
         return None
     if not is_accessibility_focused_job(title, description):
         return None
@@ -2527,7 +3595,7 @@ def jobspy_record_to_job(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             salary_min, salary_max = parsed_min, parsed_max
             currency, salary_type = parsed_currency, parsed_type
 
-    sections = parse_description_sections(description)
+    sections = analyze_text(description).sections
     if not sections.get("description"):
         return None
     structured = extract_structured_fields(description, sections)
@@ -2615,8 +3683,234 @@ def jobspy_record_to_job(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     }
 
 
-def scrape_jobspy_jobs(cutoff_date: date) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+_MISSING_TEXT_TOKENS = ["", "nan", "none", "null", "nat"]
+# Substring (not word-bounded) forms of the relevance markers, so the frame
+# prefilter is looser than is_accessibility_focused_job and never drops a
+# row that mapping would keep.
+_PREFILTER_TITLE_MARKERS = (
+    r"accessibility|a11y|wcag|section\s*508|inclusive\s+design|assistive\s+technology|digital\s+inclusion"
+)
+_PREFILTER_DESCRIPTION_MARKERS = [
+    re.sub(r"\\ ", r"\\s+", re.escape(marker)) for marker in _RELEVANCE_DESCRIPTION_MARKERS
+]
+
+
+def _frame_text_column(frame: Any, column: str) -> Any:
+    """``clean_optional_text`` for a whole column: NaN/"nan"/blank become <NA>."""
+    values = frame[column].astype("string").map(html.unescape, na_action="ignore").astype("string").str.strip()
+    return values.mask(values.str.lower().isin(_MISSING_TEXT_TOKENS))
+
+
+def preprocess_jobspy_frame(frame: Any) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Column-wise cleanup of concatenated JobSpy results before row mapping.
+
+    Coalesces and de-duplicates URLs, nulls out NaN cells and drops rows that
+    ``jobspy_record_to_job`` is certain to reject: missing title, company or
+    description, or no relevance marker in the title and fewer than four in
+    the description. Everything else still goes through the row mapper, which
+    stays the authority on relevance.
+    """
+    raw_rows = len(frame)
+    frame = frame.astype(object).where(frame.notna(), None)
+    for column in ("title", "company", "description", "job_url", "job_url_direct"):
+        if column not in frame:
+            frame[column] = None
+    urls = _frame_text_column(frame, "job_url_direct").fillna(_frame_text_column(frame, "job_url"))
+    duplicate = urls.notna() & urls.duplicated()
+
+    title = _frame_text_column(frame, "title")
+    description = _frame_text_column(frame, "description")
+    missing = title.isna() | _frame_text_column(frame, "company").isna() | description.isna()
+
+    description_lower = description.str.lower()
+    description_hits = sum(
+        description_lower.str.contains(marker, regex=True, na=False).astype(int)
+        for marker in _PREFILTER_DESCRIPTION_MARKERS
+    )
+    relevant = title.str.lower().str.contains(_PREFILTER_TITLE_MARKERS, regex=True, na=False) | (
+        description_hits >= 4
+    )
+
+    keep = ~duplicate & ~missing & relevant
+    return frame[keep].to_dict("records"), {
+        "raw_rows": raw_rows,
+        "duplicate_urls": int(duplicate.sum()),
+        "missing_required_fields": int((~duplicate & missing).sum()),
+        "irrelevant": int((~duplicate & ~missing & ~relevant).sum()),
+        "rows_to_map": int(keep.sum()),
+    }
+
+
+def fetch_existing_job_keys(db_url: str) -> Tuple[set, set]:
+    """All stored source URLs and normalized title::company keys, in one query."""
+    code, out, err = psql_query(
+        db_url,
+        "SELECT regexp_replace(lower(coalesce(title, '')), '[^a-z0-9]+', '', 'g') || '::' || "
+        "regexp_replace(lower(coalesce(company, '')), '[^a-z0-9]+', '', 'g'), "
+        "coalesce(source_url, '') FROM jobs;",
+    )
+    if code != 0:
+        raise RuntimeError(err or "psql error")
+    source_urls = set()
+    title_company_keys = set()
+    for line in out.splitlines():
+        key, _, source_url = line.partition("|")
+        title_company_keys.add(key)
+        if source_url:
+            source_urls.add(source_url)
+    return source_urls, title_company_keys
+
+
+def prefilter_linkedin_listings(
+    rows: List[Dict[str, Any]],
+    known_urls: set,
+    known_keys: set,
+    frontier: Optional["CrawlFrontier"] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Phase one of LinkedIn scraping: keep listings worth a description fetch.
+
+    Without a description only the title can show relevance, so this is the
+    one place a description-only accessibility match is given up; that is the
+    price of not fetching a page per off-topic result. Listings ``frontier``
+    remembers with a FRONTIER_PREFETCH_OUTCOMES outcome are dropped too.
+    """
+    stats = {
+        "listings": len(rows),
+        "duplicate_urls": 0,
+        "irrelevant_titles": 0,
+        "already_stored": 0,
+        "frontier_skipped": 0,
+    }
+    seen_urls = set()
+    survivors: List[Dict[str, Any]] = []
+    for row in rows:
+        url = clean_optional_text(row.get("job_url"))
+        if url and url in seen_urls:
+            stats["duplicate_urls"] += 1
+            continue
+        if url:
+            seen_urls.add(url)
+        title = clean_optional_text(row.get("title")) or ""
+        if not is_accessibility_focused_job(title, ""):
+            stats["irrelevant_titles"] += 1
+            continue
+        key = f"{normalize_text(title)}::{normalize_text(clean_optional_text(row.get('company')) or '')}"
+        if (url and url in known_urls) or key in known_keys:
+            stats["already_stored"] += 1
+            continue
+        if frontier is not None and frontier.skip(url, outcomes=FRONTIER_PREFETCH_OUTCOMES):
+            stats["frontier_skipped"] += 1
+            continue
+        survivors.append(row)
+    return survivors, stats
+
+
+LINKEDIN_APPLY_URL_RE = re.compile(r'https?://[^"\s]+')
+
+
+def load_linkedin_job_page(session: requests.Session, url: str) -> Optional[bytes]:
+    """One attempt at a public LinkedIn job page; None for non-page content or the signup wall."""
+    response = fetch_bounded(session, url, timeout=10)
+    response.raise_for_status()
+    if response.skipped or "linkedin.com/signup" in (response.url or ""):
+        return None
+    return response.content
+
+
+def fetch_linkedin_job_details(
+    session: requests.Session, url: str, raise_errors: bool = False
+) -> Optional[Dict[str, Any]]:
+    """The fields JobSpy's own LinkedIn detail fetch fills, read the way it reads them.
+
+    The description goes through JobSpy's markdown converter, and the direct
+    apply URL, employment type, seniority and industry come from the same
+    page nodes and JobSpy parsers. Returns None when the page has no
+    description. With ``raise_errors`` a single attempt is made and its
+    failure propagates, for callers that schedule their own retries.
+    """
+    from jobspy.linkedin.util import parse_company_industry, parse_job_level, parse_job_type
+    from jobspy.util import markdown_converter, remove_attributes
+
+    if raise_errors:
+        content = load_linkedin_job_page(session, url)
+    else:
+        try:
+            content = RETRY_POLICY.call(load_linkedin_job_page, session, url, attempts=2, site="page")
+        except Exception:
+            return None
+    if not content:
+        return None
+    soup = parse_html(content, "page", LINKEDIN_DETAILS_ONLY)
+    markup = soup.find("div", class_="show-more-less-html__markup") or soup.find("div", class_="description__text")
+    if markup is None:
+        return None
+    description = normalize_description_text(
+        markdown_converter(remove_attributes(markup).prettify(formatter="html")) or ""
+    )
+    if not description:
+        return None
+
+    job_url_direct = None
+    apply_url = parse_html(content, "page", LINKEDIN_APPLY_URL_ONLY).find("code", id="applyUrl")
+    if apply_url is not None:
+        # The element holds LinkedIn's externalApply redirect; the employer URL
+        # is its url= parameter (JobSpy's lookbehind also keeps &urlHash=...).
+        match = LINKEDIN_APPLY_URL_RE.search(html.unescape(apply_url.decode_contents()))
+        if match:
+            job_url_direct = (parse_qs(urlparse(match.group()).query).get("url") or [None])[0]
+    job_types = [job_type for job_type in parse_job_type(soup) or [] if job_type is not None]
+    return {
+        "description": description,
+        "job_url_direct": job_url_direct,
+        "job_type": ", ".join(job_type.value[0] for job_type in job_types) or None,
+        "job_level": (parse_job_level(soup) or "").lower() or None,
+        "company_industry": parse_company_industry(soup),
+    }
+
+
+def fetch_linkedin_descriptions(rows: List[Dict[str, Any]], workers: int) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Phase two: fetch job pages for prefiltered listings, ``workers`` at a time.
+
+    Each row gains the description and the other detail fields JobSpy would
+    have filled; listing values are kept where the page has none. A failed
+    page is retried from the delay queue, so its backoff does not hold one
+    of the ``workers`` threads.
+    """
+    def fetch(url: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not url:
+            return None
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        return fetch_linkedin_job_details(session, url, True)
+
+    fetched: List[Dict[str, Any]] = []
+    failures = 0
+    if rows:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(rows)))) as executor, \
+                RetryScheduler(executor) as retries:
+            futures = [
+                retries.submit(fetch, clean_optional_text(row.get("job_url")), attempts=2, site="linkedin")
+                for row in rows
+            ]
+            for row, future in zip(rows, futures):
+                try:
+                    details = future.result()
+                except Exception:
+                    details = None
+                if details:
+                    fetched.append({**row, **{key: value for key, value in details.items() if value}})
+                else:
+                    failures += 1
+    return fetched, {"descriptions_fetched": len(fetched), "description_failures": failures}
+
+
+def scrape_jobspy_jobs(
+    cutoff_date: date,
+    db_url: Optional[str] = None,
+    frontier: Optional["CrawlFrontier"] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     try:
+        import pandas as pd
         from jobspy import scrape_jobs
     except ImportError as exc:
         return [], {"status": "unavailable", "error": f"python-jobspy is not installed: {exc}"}
@@ -2643,46 +3937,77 @@ def scrape_jobspy_jobs(cutoff_date: date) -> Tuple[List[Dict[str, Any]], Dict[st
         return [], {"status": "failed", "error": "Multi-source configuration selected no sources, terms, or markets"}
     today_utc = datetime.now(timezone.utc).date()
     hours_old = min(720, max(48, ((today_utc - cutoff_date).days + 2) * 24))
-    raw_rows: List[Dict[str, Any]] = []
+    frames: List[Any] = []
     errors: List[str] = []
 
+    # Two-phase LinkedIn: JobSpy otherwise fetches a description page for
+    # every LinkedIn result, including off-topic titles and postings already
+    # stored, which is what gets the scraper slowed down and blocked.
+    two_phase_linkedin = (
+        "linkedin" in requested_sources
+        and os.getenv("MULTISOURCE_LINKEDIN_TWO_PHASE", "1").strip().lower() not in {"0", "false", "no"}
+    )
+    site_groups: List[Tuple[List[str], bool]] = [(requested_sources, True)]
+    if two_phase_linkedin:
+        other_sources = [source for source in requested_sources if source != "linkedin"]
+        site_groups = ([(other_sources, True)] if other_sources else []) + [(["linkedin"], False)]
+    linkedin_listings: List[Dict[str, Any]] = []
+
     for location, indeed_country in requested_markets:
         for search_term in requested_terms:
+            for site_names, fetch_descriptions in site_groups:
+                try:
+                    frame = scrape_jobs(
+                        site_name=site_names,
+                        search_term=search_term,
+                        google_search_term=f"{search_term} jobs in {location} since {cutoff_date.isoformat()}",
+                        location=location,
+                        results_wanted=results_per_source,
+                        hours_old=hours_old,
+                        country_indeed=indeed_country,
+                        description_format="markdown",
+                        linkedin_fetch_description=fetch_descriptions,
+                        verbose=0,
+                    )
+                except Exception as exc:
+                    errors.append(f"{location} | {search_term} | {type(exc).__name__}: {exc}")
+                    continue
+                if frame is None or frame.empty:
+                    continue
+                frame = frame.assign(_market=location)
+                if fetch_descriptions:
+                    frames.append(frame)
+                else:
+                    linkedin_listings.extend(frame.astype(object).where(frame.notna(), None).to_dict("records"))
+
+    raw_sites = [site for frame in frames for site in frame.get("site", [])]
+    raw_sites.extend(row.get("site") for row in linkedin_listings)
+    raw_source_counts = dict(sorted(Counter(
+        (clean_optional_text(site) or "unknown").lower().replace("ziprecruiter", "zip_recruiter")
+        for site in raw_sites
+    ).items()))
+
+    linkedin_report: Optional[Dict[str, Any]] = None
+    if two_phase_linkedin:
+        known_urls: set = set()
+        known_keys: set = set()
+        if db_url:
             try:
-                frame = scrape_jobs(
-                    site_name=requested_sources,
-                    search_term=search_term,
-                    google_search_term=f"{search_term} jobs in {location} since {cutoff_date.isoformat()}",
-                    location=location,
-                    results_wanted=results_per_source,
-                    hours_old=hours_old,
-                    country_indeed=indeed_country,
-                    description_format="markdown",
-                    linkedin_fetch_description=True,
-                    verbose=0,
-                )
+                known_urls, known_keys = fetch_existing_job_keys(db_url)
             except Exception as exc:
-                errors.append(f"{location} | {search_term} | {type(exc).__name__}: {exc}")
-                continue
-            if frame is None or frame.empty:
-                continue
-            for row in frame.to_dict("records"):
-                row["_market"] = location
-                raw_rows.append(row)
-
-    seen_urls = set()
+                errors.append(f"linkedin | existing job lookup | {type(exc).__name__}: {exc}")
+        survivors, linkedin_report = prefilter_linkedin_listings(linkedin_listings, known_urls, known_keys, frontier)
+        workers = max(1, int(os.getenv("MULTISOURCE_LINKEDIN_DESCRIPTION_WORKERS", "3")))
+        described, fetch_stats = fetch_linkedin_descriptions(survivors, workers)
+        linkedin_report.update(fetch_stats)
+        if described:
+            frames.append(pd.DataFrame(described))
+
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    rows_to_map, prefilter = preprocess_jobspy_frame(combined)
     mapped_jobs: List[Dict[str, Any]] = []
-    rejected_irrelevant = 0
-    raw_source_counts = dict(sorted(Counter(
-        (clean_optional_text(row.get("site")) or "unknown").lower().replace("ziprecruiter", "zip_recruiter")
-        for row in raw_rows
-    ).items()))
-    for row in raw_rows:
-        row_url = clean_optional_text(row.get("job_url_direct")) or clean_optional_text(row.get("job_url"))
-        if row_url and row_url in seen_urls:
-            continue
-        if row_url:
-            seen_urls.add(row_url)
+    rejected_irrelevant = prefilter["missing_required_fields"] + prefilter["irrelevant"]
+    for row in rows_to_map:
         mapped = jobspy_record_to_job(row)
         if mapped:
             mapped_jobs.append(mapped)
@@ -2696,7 +4021,9 @@ def scrape_jobspy_jobs(cutoff_date: date) -> Tuple[List[Dict[str, Any]], Dict[st
     }
     return mapped_jobs, {
         "status": "completed" if mapped_jobs or not errors else "failed",
-        "raw_rows": len(raw_rows),
+        "raw_rows": prefilter["raw_rows"],
+        "prefilter": prefilter,
+        "linkedin_two_phase": linkedin_report,
         "mapped_accessibility_jobs": len(mapped_jobs),
         "rejected_or_invalid": rejected_irrelevant,
         "raw_source_counts": raw_source_counts,
@@ -2709,9 +4036,11 @@ def scrape_jobspy_jobs(cutoff_date: date) -> Tuple[List[Dict[str, Any]], Dict[st
     }
 
 
-def candidate_quality_score(job: Dict[str, Any]) -> int:
+def candidate_quality_score(job: Dict[str, Any], direct: Optional[bool] = None) -> int:
+    if direct is None:
+        direct = is_direct_job_url(job.get("source_url"))
     score = 100 - SOURCE_PRIORITY.get(str(job.get("job_source") or ""), 20)
-    if is_direct_job_url(job.get("source_url")):
+    if direct:
         score += 100
     if job.get("company_website"):
         score += 15
@@ -2719,33 +4048,192 @@ def candidate_quality_score(job: Dict[str, Any]) -> int:
         score += 10
     if job.get("specific_location") and job.get("country"):
         score += 10
-    score += min(30, len(_plain_markdown(job.get("description") or "")) // 250)
+    score += min(30, len(analyze_text(job.get("description")).plain) // 250)
     score += int(job.get("relevance_score") or 0)
     return score
 
 
-def consolidate_source_candidates(jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-    for job in jobs:
-        key = f"{normalize_text(job.get('title') or '')}::{normalize_company_for_dedupe(job.get('company') or '')}"
-        groups.setdefault(key, []).append(job)
+def candidate_ranking_key(job: Dict[str, Any]) -> Tuple[bool, int, int]:
+    """Evidence class first, then source priority, then completeness."""
+    direct = is_direct_job_url(job.get("source_url"))
+    return (
+        direct,
+        -SOURCE_PRIORITY.get(str(job.get("job_source") or ""), 20),
+        candidate_quality_score(job, direct),
+    )
+
+
+_TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "mgr": "manager",
+    "eng": "engineer", "engr": "engineer", "dev": "developer", "a11y": "accessibility",
+}
+_COMPANY_SUFFIXES = {
+    "the", "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "plc",
+    "corp", "corporation", "co", "company", "gmbh",
+}
+MINHASH_BINS = 32
+LSH_BANDS = 8
+LSH_MAX_BUCKET = 50
+NEAR_DUPLICATE_TITLE_SIMILARITY = 0.75
+NEAR_DUPLICATE_DESCRIPTION_SIMILARITY = 0.6
+_SHINGLE_WORDS = 3
+_SHINGLE_WORD_LIMIT = 400
+
+
+class DedupeFingerprint(NamedTuple):
+    title_tokens: frozenset
+    company_core: str
+    company_tokens: frozenset
+    shingles: frozenset
+    signature: Tuple[int, ...]
 
-    consolidated: List[Dict[str, Any]] = []
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def minhash_signature(features: Iterable[str], bins: int = MINHASH_BINS) -> Tuple[int, ...]:
+    """One-permutation MinHash: every feature is hashed once into one of ``bins``.
+
+    Empty bins borrow the next filled bin's minimum (rotation densification),
+    offset by the distance so borrowed values only collide with the same
+    borrowing. Matching positions estimate Jaccard similarity like classic
+    k-permutation MinHash, at the cost of one hash per feature.
+    """
+    slots: List[Optional[int]] = [None] * bins
+    for feature in features:
+        value = _feature_hash(feature)
+        index, rank = value % bins, value // bins
+        if slots[index] is None or rank < slots[index]:
+            slots[index] = rank
+    if all(slot is None for slot in slots):
+        return ()
+    signature = []
+    for index in range(bins):
+        distance = 0
+        while slots[(index + distance) % bins] is None:
+            distance += 1
+        signature.append(slots[(index + distance) % bins] + distance * (1 << 58))
+    return tuple(signature)
+
+
+def dedupe_fingerprint(job: Dict[str, Any]) -> DedupeFingerprint:
+    title_words = re.findall(r"[a-z0-9]+", (job.get("title") or "").lower())
+    title_tokens = frozenset(_TITLE_ABBREVIATIONS.get(word, word) for word in title_words)
+    company_words = re.findall(r"[a-z0-9]+", clean_text(job.get("company") or "").lower())
+    company_tokens = frozenset(word for word in company_words if word not in _COMPANY_SUFFIXES)
+    company_core = "".join(word for word in company_words if word not in _COMPANY_SUFFIXES)
+    words = analyze_text(job.get("description")).words[:_SHINGLE_WORD_LIMIT]
+    shingles = frozenset(
+        " ".join(words[index:index + _SHINGLE_WORDS])
+        for index in range(max(0, len(words) - _SHINGLE_WORDS + 1))
+    )
+    features = [f"t:{token}" for token in title_tokens] + [f"d:{shingle}" for shingle in shingles]
+    return DedupeFingerprint(
+        title_tokens=title_tokens,
+        company_core=company_core or normalize_company_for_dedupe(job.get("company") or ""),
+        company_tokens=company_tokens,
+        shingles=shingles,
+        signature=minhash_signature(features),
+    )
+
+
+def _jaccard(left: frozenset, right: frozenset) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def is_near_duplicate(left: DedupeFingerprint, right: DedupeFingerprint) -> bool:
+    """Same posting under board-specific spelling of title or employer.
+
+    Equal normalized titles at the same employer match outright, as exact
+    title/company grouping already does. Anything looser, such as extra
+    title words or "Deque" vs "Deque Systems", must also share most of
+    its description.
+    """
+    if _jaccard(left.title_tokens, right.title_tokens) < NEAR_DUPLICATE_TITLE_SIMILARITY:
+        return False
+    same_company = bool(left.company_core) and left.company_core == right.company_core
+    if same_company and left.title_tokens == right.title_tokens:
+        return True
+    related_company = same_company or bool(
+        left.company_tokens and right.company_tokens
+        and (left.company_tokens <= right.company_tokens or right.company_tokens <= left.company_tokens)
+    )
+    return related_company and _jaccard(left.shingles, right.shingles) >= NEAR_DUPLICATE_DESCRIPTION_SIMILARITY
+
+
+def near_duplicate_pairs(fingerprints: List[DedupeFingerprint]) -> List[Tuple[int, int]]:
+    """Index pairs of near-duplicate candidates, via LSH instead of all pairs.
+
+    Signatures are split into ``LSH_BANDS`` bands; candidates sharing any band
+    (or the same employer and normalized title) are verified with
+    ``is_near_duplicate``. Buckets larger than ``LSH_MAX_BUCKET`` hold generic
+    boilerplate rather than one posting and are skipped, keeping the work
+    roughly linear in the number of candidates.
+    """
+    buckets: Dict[Tuple[Any, ...], List[int]] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        buckets.setdefault(("title", fingerprint.company_core, fingerprint.title_tokens), []).append(index)
+        signature = fingerprint.signature
+        if not signature:
+            continue
+        rows = len(signature) // LSH_BANDS
+        for band in range(LSH_BANDS):
+            buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), []).append(index)
+
+    checked = set()
+    pairs: List[Tuple[int, int]] = []
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > LSH_MAX_BUCKET:
+            continue
+        for position, left in enumerate(members):
+            for right in members[position + 1:]:
+                if (left, right) in checked:
+                    continue
+                checked.add((left, right))
+                if is_near_duplicate(fingerprints[left], fingerprints[right]):
+                    pairs.append((left, right))
+    return pairs
+
+
+def consolidate_source_candidates(jobs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    # One ranking key per candidate, reused for group ranking and the final
+    # order: each key parses the URL and reads the description once.
+    exact_keys = [
+        f"{normalize_text(job.get('title') or '')}::{normalize_company_for_dedupe(job.get('company') or '')}"
+        for job in jobs
+    ]
+    # Exact title/company matches always group; near-duplicates found by
+    # LSH join their groups through a small union-find over exact keys.
+    parents = {key: key for key in exact_keys}
+
+    def find(key: str) -> str:
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    fingerprints = [dedupe_fingerprint(job) for job in jobs]
+    for left, right in near_duplicate_pairs(fingerprints):
+        left_root, right_root = find(exact_keys[left]), find(exact_keys[right])
+        if left_root != right_root:
+            parents[right_root] = left_root
+
+    groups: Dict[str, List[Tuple[Tuple[bool, int, int], Dict[str, Any], str]]] = {}
+    for job, key in zip(jobs, exact_keys):
+        groups.setdefault(find(key), []).append((candidate_ranking_key(job), job, key))
+
+    ranked_winners: List[Tuple[int, Dict[str, Any]]] = []
     duplicates: List[Dict[str, Any]] = []
     for group in groups.values():
         # Evidence class must win before incidental completeness. A longer
         # LinkedIn description must not displace a direct employer/ATS row or
         # the curated A11yJobs copy, because those sources are the better base
         # for authoritative dates, work arrangement, and application routes.
-        ranked = sorted(
-            group,
-            key=lambda job: (
-                is_direct_job_url(job.get("source_url")),
-                -SOURCE_PRIORITY.get(str(job.get("job_source") or ""), 20),
-                candidate_quality_score(job),
-            ),
-            reverse=True,
-        )
+        group.sort(key=lambda entry: entry[0], reverse=True)
+        ranked = [job for _, job, _ in group]
         winner = dict(ranked[0])
         evidence: List[Dict[str, str]] = []
         seen_evidence = set()
@@ -2764,59 +4252,66 @@ def consolidate_source_candidates(jobs: List[Dict[str, Any]]) -> Tuple[List[Dict
         winner["additional_notes"] = f"{existing_note}; {evidence_note}" if existing_note else evidence_note
         winner.pop("_market", None)
         winner.pop("_discovery_url", None)
-        consolidated.append(winner)
+        # Consolidation only adds evidence fields, so the winner keeps its score.
+        ranked_winners.append((group[0][0][2], winner))
 
-        for duplicate in ranked[1:]:
+        winner_key = group[0][2]
+        for _, duplicate, duplicate_key in group[1:]:
             duplicates.append({
                 "source_url": duplicate.get("source_url") or "",
                 "title": duplicate.get("title") or "",
                 "company": duplicate.get("company") or "",
-                "reason": "cross_source_title_company",
+                "reason": "cross_source_title_company" if duplicate_key == winner_key else "cross_source_near_duplicate",
                 "kept_source": winner.get("job_source") or "",
                 "duplicate_source": duplicate.get("job_source") or "",
             })
 
-    consolidated.sort(key=candidate_quality_score, reverse=True)
-    return consolidated, duplicates
+    ranked_winners.sort(key=lambda entry: entry[0], reverse=True)
+    return [winner for _, winner in ranked_winners], duplicates
 
 
-def external_content_matches_job(content: str, job: Dict[str, Any]) -> bool:
-    plain = _plain_markdown(content).lower()
+def external_content_matches_job(content: Union[str, FetchedDocument], job: Dict[str, Any]) -> bool:
+    document = as_fetched_document(content)
+    plain, tokens = document.lower, document.tokens
     title_tokens = [
         token for token in re.findall(r"[a-z0-9]+", (job.get("title") or "").lower())
         if len(token) >= 4 and token not in {"with", "from", "that", "this", "senior", "junior"}
     ]
-    title_matches = sum(1 for token in set(title_tokens) if token in plain)
+    # A whole-word hit in the token set settles membership without scanning
+    # the page; substring hits ("engineer" in "engineering") still count.
+    title_matches = sum(1 for token in set(title_tokens) if token in tokens or token in plain)
     required_title_matches = 1 if len(set(title_tokens)) <= 2 else 2
     company_tokens = [
         token for token in re.findall(r"[a-z0-9]+", (job.get("company") or "").lower())
         if len(token) >= 3 and token not in {"the", "and", "inc", "llc", "ltd"}
     ]
-    company_matches = not company_tokens or any(token in plain for token in set(company_tokens))
+    company_matches = not company_tokens or any(
+        token in tokens or token in plain for token in set(company_tokens)
+    )
     return title_matches >= required_title_matches and company_matches
 
 
-def extract_external_jobposting(content: str) -> Optional[Dict[str, Any]]:
+def extract_external_jobposting(content: Union[str, FetchedDocument]) -> Optional[Dict[str, Any]]:
     """Return direct-page JobPosting data without trusting visible page chrome."""
+    if isinstance(content, FetchedDocument):
+        return content.jsonld
     if not content or not re.search(r"<script|@type", content, re.I):
         return None
-    return extract_jsonld_jobposting(BeautifulSoup(content, "html.parser"))
+    return jobposting_from_jsonld(select_html(content, "jsonld", 'script[type*="ld+json" i]', JSONLD_ONLY))
 
 
-def extract_external_company_name(content: str) -> Optional[str]:
+def extract_external_company_name(content: Union[str, FetchedDocument]) -> Optional[str]:
     """Return a direct page's branded employer name when explicitly present."""
-    soup = BeautifulSoup(content, "html.parser")
-    site_name = soup.find(
-        "meta",
-        attrs={"property": re.compile(r"^og:site_name$", re.I)},
-    )
-    if site_name and site_name.get("content"):
-        return clean_text(html.unescape(str(site_name["content"])))
+    if isinstance(content, FetchedDocument):
+        return content.site_name
+    site_names = select_html(content, "site_name", 'meta[property="og:site_name" i]', META_ONLY, "content")
+    if site_names and site_names[0]:
+        return clean_text(html.unescape(str(site_names[0])))
     return None
 
 
 def external_content_has_job_detail(
-    content: str,
+    content: Union[str, FetchedDocument],
     jsonld: Optional[Dict[str, Any]] = None,
 ) -> bool:
     """Distinguish a job description from a login/application form shell."""
@@ -2828,8 +4323,8 @@ def external_content_has_job_detail(
     if len(_plain_markdown(structured_description)) >= 100:
         return True
 
-    visible = normalize_external_content(content)
-    lowered = visible.lower()
+    document = as_fetched_document(content)
+    lowered = document.visible_lower
     shell_markers = (
         "begin application",
         "new applicants:",
@@ -2855,17 +4350,20 @@ def external_content_has_job_detail(
     detail_count = sum(1 for marker in detail_markers if marker in lowered)
     if any(marker in lowered for marker in shell_markers) and detail_count < 2:
         return False
-    return len(_plain_markdown(visible)) >= 300 and detail_count >= 2
+    return len(document.visible_plain) >= 300 and detail_count >= 2
 
 
-def external_content_is_closed(content: str) -> bool:
+def external_content_is_closed(content: Union[str, FetchedDocument]) -> bool:
     """Detect explicit employer/ATS closure notices ahead of stale JobPosting data."""
-    if not content:
+    document = as_fetched_document(content)
+    if not document.text:
         return False
-    soup = BeautifulSoup(content, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    visible = clean_text(soup.get_text(" ", strip=True)).lower()
+    # Read the shared tree without decomposing anything: get_text already
+    # skips script and style bodies, so only <noscript> text is left out here.
+    visible = clean_text(" ".join(
+        string.strip() for string in document.soup.strings
+        if string.strip() and string.find_parent("noscript") is None
+    )).lower()
     return bool(re.search(
         r"\bjob you are trying to apply for has been filled\b|"
         r"\b(?:job|position|opening) (?:has been|is) (?:filled|closed)\b|"
@@ -2874,11 +4372,11 @@ def external_content_is_closed(content: str) -> bool:
     ))
 
 
-def reconcile_explicit_external_facts(job: Dict[str, Any], content: str) -> List[str]:
+def reconcile_explicit_external_facts(job: Dict[str, Any], content: Union[str, FetchedDocument]) -> List[str]:
     """Apply labeled facts from direct pages that omit JobPosting JSON-LD."""
     conflicts: List[str] = []
-    soup = BeautifulSoup(content, "html.parser")
-    greenhouse_location = soup.select_one(".job__location")
+    document = as_fetched_document(content)
+    greenhouse_location = document.soup.select_one(".job__location")
     if greenhouse_location:
         direct_location = clean_text(greenhouse_location.get_text(" ", strip=True))
         if direct_location:
@@ -2908,7 +4406,7 @@ def reconcile_explicit_external_facts(job: Dict[str, Any], content: str) -> List
                     "",
                 )
 
-    visible = _plain_markdown(normalize_external_content(content))
+    visible = document.visible_plain
     if not visible:
         return conflicts
 
@@ -3089,66 +4587,187 @@ def reconcile_external_jobposting(job: Dict[str, Any], jsonld: Dict[str, Any]) -
     return conflicts
 
 
-def enrich_job(session: requests.Session, job: Dict[str, Any]) -> Dict[str, Any]:
+# Alternate evidence links fetched at once per job. Enrichment already runs
+# eight jobs in parallel, so this multiplies the requests in flight.
+ALTERNATE_LINK_FAN_OUT = 3
+
+
+def fork_session(session: requests.Session) -> requests.Session:
+    """A new Session carrying ``session``'s headers and cookies, but not its connections."""
+    forked = requests.Session()
+    forked.headers.update(session.headers)
+    forked.cookies.update(session.cookies)
+    return forked
+
+
+class LinkEvaluation(NamedTuple):
+    rank: int
+    url: str
+    document: Optional[FetchedDocument]
+    source: str
+    resolved_url: Optional[str]
+    matched: bool
+
+
+def evaluate_alternate_links(
+    session: requests.Session,
+    links: List[str],
+    job: Dict[str, Any],
+    host_health: Optional[HostCircuitBreaker] = None,
+    deadline: Optional[Deadline] = None,
+    fan_out: int = ALTERNATE_LINK_FAN_OUT,
+) -> Tuple[Optional[LinkEvaluation], Optional[str], bool]:
+    """Fetch and match ``links`` up to ``fan_out`` at a time; the best-ranked match wins.
+
+    Once a link matches, lower-ranked links are cancelled, including fetches
+    already in flight, and the result is returned as soon as every
+    higher-ranked link has failed to match. A cancelled fetch can still be
+    waiting on its host after that, so each link fetches on a Session of its
+    own rather than the job's, and its answer is not recorded in
+    ``host_health``. Returns the winner (None when
+    nothing matched), the source a one-by-one walk would have ended on, and
+    whether ``deadline`` ran out first.
+    """
+    if not links:
+        return None, None, False
+    # A child deadline per link: cancelling one stops that fetch alone.
+    link_deadlines = [Deadline(None, deadline) for _ in links]
+
+    def evaluate(rank: int) -> Optional[LinkEvaluation]:
+        link_session = fork_session(session)
+        try:
+            fetched, source, resolved_url = fetch_external_document(
+                link_session, links[rank], host_health, link_deadlines[rank]
+            )
+        except DeadlineExceeded:
+            return None
+        finally:
+            link_session.close()
+        matched = bool(fetched) and external_content_matches_job(fetched, job)
+        if matched:
+            # Cancel from the worker itself, before it can pick up a lower rank.
+            for lower in range(rank + 1, len(links)):
+                link_deadlines[lower].cancel()
+        return LinkEvaluation(rank, links[rank], fetched, source, resolved_url, matched)
+
+    outcomes: Dict[int, Optional[LinkEvaluation]] = {}
+    best = len(links)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(fan_out, len(links))))
+    try:
+        futures = [executor.submit(evaluate, rank) for rank in range(len(links))]
+        ranks = {future: rank for rank, future in enumerate(futures)}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            rank = ranks[future]
+            outcome = future.result()
+            outcomes[rank] = outcome
+            if outcome is not None and outcome.matched and rank < best:
+                best = rank
+                for lower in range(rank + 1, len(links)):
+                    futures[lower].cancel()
+            if best < len(links) and all(higher in outcomes for higher in range(best)):
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    exhausted = any(outcomes.get(rank, True) is None for rank in range(best))
+    if best < len(links):
+        return outcomes[best], outcomes[best].source, exhausted
+    finished = [outcome for _, outcome in sorted(outcomes.items()) if outcome is not None]
+    if not finished:
+        return None, None, exhausted
+    last = finished[-1]
+    return None, "mismatch" if last.document else last.source, exhausted
+
+
+def enrich_job(
+    session: requests.Session,
+    job: Dict[str, Any],
+    search_cache: Optional[SearchResultCache] = None,
+    host_health: Optional[HostCircuitBreaker] = None,
+    deadline: Optional[Deadline] = None,
+    link_fan_out: int = ALTERNATE_LINK_FAN_OUT,
+) -> Dict[str, Any]:
+    """Verify ``job`` against its apply page or a searched employer page.
+
+    Every fetch and search shares ``deadline``. When it runs out the job
+    keeps the evidence gathered so far and is marked
+    ``enrichment_budget_exhausted``. A job left without evidence because its
+    pages were unreachable is marked ``enrichment_fetch_failed``. Alternate
+    links are fetched ``link_fan_out`` at a time (see
+    ``evaluate_alternate_links``).
+    """
     apply_url = job.get("apply_url")
-    content = ""
-    aggregator_content = ""
+    # One FetchedDocument per page: every check below reuses its views.
+    document: Optional[FetchedDocument] = None
+    aggregator_document: Optional[FetchedDocument] = None
     source_used = "none"
+    apply_unreachable = False
 
-    if apply_url:
-        text, source_used, resolved_url = fetch_external_text(session, apply_url)
-        if text and external_content_matches_job(text, job):
-            evidence_url = resolved_url or apply_url
-            if is_direct_job_url(evidence_url):
-                content = text
-                job["apply_url"] = evidence_url
-                job["direct_evidence_verified"] = True
-            else:
-                # A matching board page can enrich a corroborated listing but
-                # must not prevent discovery of a stronger employer/ATS page.
-                aggregator_content = text
-                source_used = "aggregator"
-        elif text:
-            source_used = "mismatch"
+    try:
+        if apply_url:
+            fetched, source_used, resolved_url = fetch_external_document(session, apply_url, host_health, deadline)
+            apply_unreachable = source_used == "unreachable"
+            if fetched and external_content_matches_job(fetched, job):
+                evidence_url = resolved_url or apply_url
+                if is_direct_job_url(evidence_url):
+                    document = fetched
+                    job["apply_url"] = evidence_url
+                    job["direct_evidence_verified"] = True
+                else:
+                    # A matching board page can enrich a corroborated listing but
+                    # must not prevent discovery of a stronger employer/ATS page.
+                    aggregator_document = fetched
+                    source_used = "aggregator"
+            elif fetched:
+                source_used = "mismatch"
 
-    if not content:
-        links = extract_embedded_direct_job_urls(aggregator_content)
-        searched_links = search_alternate_urls(
-            session,
-            job.get("title") or "",
-            job.get("company") or "",
-        ) if not links else []
-        links.extend(link for link in searched_links if link not in links)
-        for link in links:
-            text, source_used, resolved_url = fetch_external_text(session, link)
-            if text and external_content_matches_job(text, job):
-                content = text
-                evidence_url = resolved_url or link
+        if not document:
+            links = extract_embedded_direct_job_urls(aggregator_document)
+            searched_links = search_alternate_urls(
+                session,
+                job.get("title") or "",
+                job.get("company") or "",
+                search_cache,
+                deadline=deadline,
+            ) if not links else []
+            links.extend(link for link in searched_links if link not in links)
+            winner, link_source, exhausted = evaluate_alternate_links(
+                session, links, job, host_health, deadline, link_fan_out
+            )
+            source_used = link_source or source_used
+            if winner:
+                document = winner.document
+                evidence_url = winner.resolved_url or winner.url
                 if is_direct_job_url(evidence_url) or not apply_url:
                     job["apply_url"] = evidence_url
                 job["direct_evidence_verified"] = is_direct_job_url(evidence_url)
-                break
-            if text:
-                source_used = "mismatch"
+            if exhausted:
+                job["enrichment_budget_exhausted"] = True
+    except DeadlineExceeded:
+        job["enrichment_budget_exhausted"] = True
 
-    if not content and aggregator_content:
-        content = aggregator_content
+    if not document and aggregator_document:
+        document = aggregator_document
         source_used = "aggregator"
+    if not document and (apply_unreachable or source_used == "unreachable"):
+        job["enrichment_fetch_failed"] = True
 
-    if content:
-        external_jsonld = extract_external_jobposting(content)
+    if document:
+        external_jsonld = document.jsonld
         conflicts = reconcile_external_jobposting(job, external_jsonld) if external_jsonld else []
-        conflicts.extend(reconcile_explicit_external_facts(job, content))
-        has_job_detail = external_content_has_job_detail(content, external_jsonld)
+        conflicts.extend(reconcile_explicit_external_facts(job, document))
+        has_job_detail = external_content_has_job_detail(document, external_jsonld)
         evidence_host = hostname_without_www(job.get("apply_url"))
         if evidence_host.endswith("fa.oraclecloud.com") and not has_job_detail:
             conflicts.append("Direct Oracle ATS page lacks a live job description")
-        if external_content_is_closed(content):
+        if external_content_is_closed(document):
             conflicts.append("Direct employer or ATS page says the job is closed")
         if conflicts:
             job["evidence_conflicts"] = conflicts
             job["direct_evidence_verified"] = False
-        external_company = extract_external_company_name(content)
+        external_company = document.site_name
         current_company = clean_text(str(job.get("company") or ""))
         if (
             external_company
@@ -3158,7 +4777,7 @@ def enrich_job(session: requests.Session, job: Dict[str, Any]) -> Dict[str, Any]
             job["company"] = external_company
         job["job_level"] = determine_job_level(
             str(job.get("title") or ""),
-            content,
+            document.text,
         )
 
         structured_description = ""
@@ -3166,7 +4785,7 @@ def enrich_job(session: requests.Session, job: Dict[str, Any]) -> Dict[str, Any]
             structured_description = normalize_description_text(
                 strip_html(html.unescape(str(external_jsonld.get("description") or "")))
             )
-        content = structured_description if len(_plain_markdown(structured_description)) >= 100 else normalize_external_content(content)
+        content = structured_description if len(_plain_markdown(structured_description)) >= 100 else document.visible
         content = trim_legal_boilerplate(content)
         external_sections = parse_description_sections(content)
         external_sections_are_complete = (
@@ -3217,8 +4836,10 @@ def enrich_job(session: requests.Session, job: Dict[str, Any]) -> Dict[str, Any]
 
     if "direct_evidence_verified" not in job:
         job["direct_evidence_verified"] = False
-    if source_used != "none":
+    if source_used != "none" or job.get("enrichment_budget_exhausted"):
         enrichment_note = f"enrichment_source={source_used}"
+        if job.get("enrichment_budget_exhausted"):
+            enrichment_note += "; enrichment_budget_exhausted"
         existing_note = job.get("additional_notes")
         job["additional_notes"] = f"{existing_note}; {enrichment_note}" if existing_note else enrichment_note
     if job.get("direct_evidence_verified") and is_direct_job_url(job.get("apply_url")):
@@ -3421,13 +5042,254 @@ def write_csv(path: str, rows: List[Dict[str, Any]], headers: List[str]) -> int:
     return len(rows)
 
 
+FRONTIER_TTL_SECONDS: Dict[str, float] = {
+    "inserted": 30 * 24 * 3600,
+    "duplicate": 30 * 24 * 3600,
+    "closed": 30 * 24 * 3600,
+    "stale": 30 * 24 * 3600,
+    "conflict": 14 * 24 * 3600,
+    "invalid": 7 * 24 * 3600,
+    "unverified": 3 * 24 * 3600,
+    "transient": 0,
+}
+# Outcomes that hold whatever else is listed that day. Only these let a
+# listing be passed over before consolidation; the rest can change once
+# another source carries the same posting.
+FRONTIER_TERMINAL_OUTCOMES = frozenset({"inserted", "duplicate", "closed", "stale"})
+# Outcomes that make a LinkedIn listing not worth its detail-page fetch. An
+# "unverified" posting is fetched again: today's copy may corroborate another.
+FRONTIER_PREFETCH_OUTCOMES = FRONTIER_TERMINAL_OUTCOMES | {"conflict", "invalid"}
+FRONTIER_RETENTION_SECONDS = 90 * 24 * 3600
+FRONTIER_TRACKING_PARAMS = {"ref", "refid", "trk", "trackingid", "gh_src", "fbclid", "gclid"}
+
+
+def canonical_url(url: str) -> str:
+    """One key per posting URL: scheme, www., fragment and tracking parameters dropped."""
+    parsed = urlparse((url or "").strip())
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if not host:
+        return (url or "").strip()
+    if parsed.port and parsed.port not in {80, 443}:
+        host = f"{host}:{parsed.port}"
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in FRONTIER_TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip("/")
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """Content hash of a posting's title, company and description.
+
+    A consolidated posting also hashes the sources in its ``source_evidence``:
+    whether it is corroborated ("unverified" or not) depends on them.
+    """
+    text = "|".join(
+        normalize_text(str(job.get(field) or "")) for field in ("title", "company", "description")
+    )
+    sources = sorted({str(item.get("source") or "") for item in job.get("source_evidence") or []})
+    if sources:
+        text += "|" + ",".join(sources)
+    return hashlib.blake2b(text.encode(), digest_size=12).hexdigest()
+
+
+def classify_validation_errors(errors: List[str]) -> str:
+    """Frontier outcome class for a validation failure."""
+    text = " | ".join(errors)
+    if "Duplicate check DB error" in text:
+        return "transient"
+    if "is not strictly later than cutoff_date" in text:
+        return "stale"
+    if "says the job is closed" in text:
+        return "closed"
+    if "Source evidence conflict" in text:
+        return "conflict"
+    if "lacks verified direct employer evidence" in text:
+        return "unverified"
+    return "invalid"
+
+
+class CrawlFrontier:
+    """Last outcome per canonical posting URL, kept across runs.
+
+    Most of a day's listings were already handled on an earlier day: inserted,
+    found in the DB, or rejected by validation. ``record`` stores the outcome
+    with the posting's content fingerprint, and ``skip`` answers whether the URL
+    can be passed over before any fetch, DB check or enrichment. Each outcome
+    class has its own TTL in ``ttls``: a closed or already-inserted posting is
+    skipped for weeks, one that lacked employer evidence for a few days, and a
+    transient failure (DB error, spent enrichment budget, unreachable pages)
+    not at all. A changed
+    fingerprint, including a new source listing the posting, always means it
+    is looked at again. With ``path`` the
+    entries are read at start and written back by ``save``; without it the
+    frontier only lives for the run.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        retention: float = FRONTIER_RETENTION_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttls = dict(FRONTIER_TTL_SECONDS if ttls is None else ttls)
+        self.retention = retention
+        self.clock = clock
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.loaded = 0
+        self.skipped: Counter = Counter()
+        self.recorded: Counter = Counter()
+        self.changed = 0
+        self.expired = 0
+        if path:
+            self._load(path)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return canonical_url(url)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != self.VERSION:
+            return
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return
+        now = self.clock()
+        for key, entry in entries.items():
+            if (
+                isinstance(entry, dict)
+                and isinstance(entry.get("outcome"), str)
+                and isinstance(entry.get("checked_at"), (int, float))
+                and isinstance(entry.get("last_seen"), (int, float))
+                and now - entry["last_seen"] < self.retention
+            ):
+                self._entries[key] = {
+                    "outcome": entry["outcome"],
+                    "fingerprint": entry.get("fingerprint") if isinstance(entry.get("fingerprint"), str) else None,
+                    "checked_at": entry["checked_at"],
+                    "last_seen": entry["last_seen"],
+                }
+        self.loaded = len(self._entries)
+
+    def skip(
+        self,
+        url: str,
+        fingerprint: Optional[str] = None,
+        outcomes: Optional[Iterable[str]] = None,
+    ) -> Optional[str]:
+        """The remembered outcome when ``url`` needs no work this run, else None.
+
+        With ``outcomes``, other remembered outcomes are not skipped.
+        """
+        if not url:
+            return None
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(self.key(url))
+            if entry is None:
+                return None
+            entry["last_seen"] = now
+            if outcomes is not None and entry["outcome"] not in outcomes:
+                return None
+            if now - entry["checked_at"] >= self.ttls.get(entry["outcome"], 0):
+                self.expired += 1
+                return None
+            if fingerprint and entry["fingerprint"] and fingerprint != entry["fingerprint"]:
+                self.changed += 1
+                return None
+            self.skipped[entry["outcome"]] += 1
+            return entry["outcome"]
+
+    def alias(self, url: str, aliases: Iterable[str]) -> None:
+        """Record ``url``'s outcomes this run under ``aliases`` too.
+
+        A consolidated posting is recorded under one URL; its other sources'
+        URLs are aliased to it so their listings can be skipped before the
+        fetch that would merge them again.
+        """
+        if not url:
+            return
+        key = self.key(url)
+        with self._lock:
+            self._aliases.setdefault(key, set()).update(
+                self.key(alias) for alias in aliases if alias and self.key(alias) != key
+            )
+
+    def record(self, url: str, outcome: str, fingerprint: Optional[str] = None) -> None:
+        if not url:
+            return
+        now = self.clock()
+        with self._lock:
+            key = self.key(url)
+            for entry_key in [key, *sorted(self._aliases.get(key, ()))]:
+                previous = self._entries.get(entry_key) or {}
+                self._entries[entry_key] = {
+                    "outcome": outcome,
+                    "fingerprint": fingerprint or previous.get("fingerprint"),
+                    "checked_at": now,
+                    "last_seen": now,
+                }
+            self.recorded[outcome] += 1
+
+    def save(self) -> None:
+        """Write entries seen within ``retention`` to ``path``, replacing the file atomically."""
+        if not self.path:
+            return
+        now = self.clock()
+        with self._lock:
+            entries = {
+                key: dict(entry) for key, entry in sorted(self._entries.items())
+                if now - entry["last_seen"] < self.retention
+            }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "entries": entries}, f, ensure_ascii=True)
+        os.replace(temporary_path, self.path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "loaded": self.loaded,
+                "skipped": sum(self.skipped.values()),
+                "skipped_by_outcome": dict(sorted(self.skipped.items())),
+                "changed": self.changed,
+                "expired": self.expired,
+                "recorded": dict(sorted(self.recorded.items())),
+            }
+
+
 def process_candidate_job(
-    job: Dict[str, Any], cutoff_date: Optional[date] = None
+    job: Dict[str, Any],
+    cutoff_date: Optional[date] = None,
+    search_cache: Optional[SearchResultCache] = None,
+    host_health: Optional[HostCircuitBreaker] = None,
+    job_budget: Optional[float] = ENRICHMENT_JOB_BUDGET_SECONDS,
+    run_deadline: Optional[Deadline] = None,
 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     local_session = requests.Session()
     local_session.headers.update(HEADERS)
 
-    job = enrich_job(local_session, dict(job))
+    # The job's budget starts when a worker picks it up, not when it is queued.
+    deadline = Deadline(job_budget, run_deadline)
+    job = enrich_job(local_session, dict(job), search_cache, host_health, deadline)
 
     candidate = build_candidate_record(job)
     insert_candidate = convert_nan_to_insert_ready(candidate)
@@ -3446,6 +5308,21 @@ def process_candidate_job(
 
 
 def main() -> int:
+    # HTTP retries across every call site stop after A11YJOBS_RETRY_BUDGET in a run.
+    retry_budget = os.getenv("A11YJOBS_RETRY_BUDGET", "").strip()
+    RETRY_POLICY.reset(int(retry_budget) if retry_budget.isdigit() else RETRY_BUDGET)
+    PSQL_RETRY_POLICY.reset(None)
+    # Enrichment stops at A11YJOBS_JOB_BUDGET_SECONDS per job and at
+    # A11YJOBS_RUN_BUDGET_SECONDS after the run started; 0 means no limit.
+    job_budget = env_seconds("A11YJOBS_JOB_BUDGET_SECONDS", ENRICHMENT_JOB_BUDGET_SECONDS)
+    run_budget = env_seconds("A11YJOBS_RUN_BUDGET_SECONDS", ENRICHMENT_RUN_BUDGET_SECONDS)
+    run_deadline = Deadline(run_budget)
+    # Postings handled on an earlier day are skipped until their outcome's TTL
+    # passes. Set A11YJOBS_FRONTIER to another file, or to "off" to start afresh.
+    frontier_path = os.getenv("A11YJOBS_FRONTIER", FRONTIER_JSON).strip()
+    frontier = CrawlFrontier(
+        None if frontier_path.lower() in {"", "0", "off", "false", "no"} else frontier_path
+    )
     db_url = load_database_url()
     print(f"🔐 Using DATABASE_URL: {mask_db_url(db_url)}")
 
@@ -3496,13 +5373,17 @@ def main() -> int:
 
     a11yjobs_jobs: List[Dict[str, Any]] = []
     for link in links_after_listing_prefilter:
+        # Non-terminal outcomes are parsed again: the listing may corroborate
+        # another source's copy of the posting in consolidation below.
+        if frontier.skip(link, outcomes=FRONTIER_TERMINAL_OUTCOMES):
+            continue
         job = parse_job_detail(session, link, listing_hint_date=job_link_hints.get(link))
         if job:
             a11yjobs_jobs.append(job)
         time.sleep(0.2)
 
     print("🔎 Collecting additional job boards with JobSpy")
-    jobspy_jobs, jobspy_report = scrape_jobspy_jobs(cutoff_date)
+    jobspy_jobs, jobspy_report = scrape_jobspy_jobs(cutoff_date, db_url, frontier)
     source_errors.extend(jobspy_report.get("errors") or [])
     if not soup and jobspy_report.get("status") in {"failed", "unavailable"}:
         raise RuntimeError("All source families failed before candidate generation")
@@ -3528,6 +5409,11 @@ def main() -> int:
     ]
     source_counts_newer = dict(sorted(Counter(job.get("job_source") or "unknown" for job in newer_source_jobs).items()))
     new_jobs, cross_source_duplicates = consolidate_source_candidates(newer_source_jobs)
+    # Each near-duplicate folded into another posting's evidence is one
+    # posting the run no longer DB-checks or enriches on its own.
+    near_duplicates_merged = sum(
+        1 for row in cross_source_duplicates if row["reason"] == "cross_source_near_duplicate"
+    )
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -3550,12 +5436,24 @@ def main() -> int:
     ]
 
     if not new_jobs:
+        try:
+            frontier.save()
+        except OSError as exc:
+            print(f"⚠️ Could not save the crawl frontier to {frontier.path}: {exc}")
         write_json(CANDIDATES_JSON, {
             "cutoff_date": cutoff_date.isoformat(),
             "latest_source_date": latest_source_date.isoformat() if latest_source_date else None,
             "source_counts_found": source_counts_found,
             "source_counts_newer": source_counts_newer,
             "jobspy_report": jobspy_report,
+            "text_analysis_cache": text_analysis_stats(),
+            "field_extraction": field_extraction_stats(),
+            "extraction_guards": extraction_guard_stats(),
+            "html_parsing": html_parse_stats(),
+            "fetch": fetch_stats(),
+            "retries": retry_stats(),
+            "database_retries": PSQL_RETRY_POLICY.stats(),
+            "frontier": frontier.stats(),
             "source_errors": source_errors,
             "jobs": [],
         })
@@ -3576,6 +5474,14 @@ def main() -> int:
         print(f"source_counts_found: {json.dumps(source_counts_found, sort_keys=True)}")
         print(f"source_counts_newer: {json.dumps(source_counts_newer, sort_keys=True)}")
         print(f"jobspy_report: {json.dumps(jobspy_report, sort_keys=True)}")
+        print(f"text_analysis_cache: {json.dumps(text_analysis_stats(), sort_keys=True)}")
+        print(f"field_extraction: {json.dumps(field_extraction_stats(), sort_keys=True)}")
+        print(f"extraction_guards: {json.dumps(extraction_guard_stats(), sort_keys=True)}")
+        print(f"html_parsing: {json.dumps(html_parse_stats(), sort_keys=True)}")
+        print(f"fetch: {json.dumps(fetch_stats(), sort_keys=True)}")
+        print(f"retries: {json.dumps(retry_stats(), sort_keys=True)}")
+        print(f"database_retries: {json.dumps(PSQL_RETRY_POLICY.stats(), sort_keys=True)}")
+        print(f"frontier: {json.dumps(frontier.stats(), sort_keys=True)}")
         print(f"source_errors: {len(source_errors)}")
         print(f"filtered_newer_jobs: 0")
         print("deduped_candidates: 0")
@@ -3602,11 +5508,26 @@ def main() -> int:
     seen_source_urls = set()
 
     jobs_for_enrichment: List[Dict[str, Any]] = []
+    # Enriched source_url -> (URL the posting was found under, its fingerprint),
+    # so outcomes decided after enrichment are recorded under the listed URL.
+    frontier_keys: Dict[str, Tuple[str, str]] = {}
+    frontier_skipped: List[Dict[str, Any]] = []
 
     for job in new_jobs:
         source_url = job.get("source_url") or ""
         title = job.get("title") or ""
         company = job.get("company") or ""
+        fingerprint = job_fingerprint(job)
+        frontier.alias(source_url, [item.get("url") for item in job.get("source_evidence") or []])
+        known_outcome = frontier.skip(source_url, fingerprint)
+        if known_outcome:
+            frontier_skipped.append({
+                "source_url": source_url,
+                "title": title,
+                "company": company,
+                "outcome": known_outcome,
+            })
+            continue
         if source_url in seen_source_urls:
             duplicates.append({
                 "source_url": source_url,
@@ -3625,6 +5546,7 @@ def main() -> int:
                 "company": company,
                 "errors": [f"Duplicate check DB error: {exc}"],
             })
+            frontier.record(source_url, "transient", fingerprint)
             continue
         if is_dup:
             duplicates.append({
@@ -3633,30 +5555,68 @@ def main() -> int:
                 "company": company,
                 "reason": dup_reason,
             })
+            frontier.record(source_url, "duplicate", fingerprint)
             continue
 
         seen_source_urls.add(source_url)
         jobs_for_enrichment.append(job)
 
+    # Ranked alternate URLs survive between daily runs. Set
+    # A11YJOBS_SEARCH_CACHE to another file, or to "off" to search afresh.
+    search_cache_path = os.getenv("A11YJOBS_SEARCH_CACHE", SEARCH_CACHE_JSON).strip()
+    search_cache = SearchResultCache(
+        None if search_cache_path.lower() in {"", "0", "off", "false", "no"} else search_cache_path
+    )
+    # Hosts that block direct fetches are skipped for the rest of the run
+    # (re-probed after a cool-down) instead of costing every job two fetches.
+    host_health = HostCircuitBreaker()
     if jobs_for_enrichment:
         max_workers = min(8, len(jobs_for_enrichment))
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_map = {
-                executor.submit(process_candidate_job, job, cutoff_date): job
+                executor.submit(
+                    process_candidate_job, job, cutoff_date, search_cache, host_health, job_budget, run_deadline
+                ): job
                 for job in jobs_for_enrichment
             }
             for future in as_completed(future_map):
                 candidate, insert_candidate, failure = future.result()
                 candidates_with_nan.append(candidate)
+                listed = future_map[future]
+                listed_url = listed.get("source_url") or ""
                 if failure:
                     failures.append(failure)
+                    outcome = classify_validation_errors(failure["errors"])
+                    if (
+                        candidate.get("enrichment_budget_exhausted") is True
+                        or candidate.get("enrichment_fetch_failed") is True
+                    ):
+                        outcome = "transient"
+                    frontier.record(listed_url, outcome, job_fingerprint(listed))
                 elif insert_candidate:
                     insert_ready.append(insert_candidate)
+                    frontier_keys[insert_candidate.get("source_url") or ""] = (listed_url, job_fingerprint(listed))
+
+    try:
+        search_cache.save()
+    except OSError as exc:
+        print(f"⚠️ Could not save the search cache to {search_cache.path}: {exc}")
+
+    enrichment_deadlines = {
+        "job_budget_seconds": job_budget,
+        "run_budget_seconds": run_budget,
+        "run_deadline_reached": run_deadline.expired(),
+        "budget_exhausted": sum(1 for candidate in candidates_with_nan if candidate.get("enrichment_budget_exhausted") is True),
+        "fetch_failed": sum(1 for candidate in candidates_with_nan if candidate.get("enrichment_fetch_failed") is True),
+    }
 
     insert_ready, cutoff_failures = exclude_post_enrichment_cutoff_rows(
         insert_ready, cutoff_date
     )
     failures.extend(cutoff_failures)
+    for failure in cutoff_failures:
+        listed_url, fingerprint = frontier_keys.get(failure["source_url"], (failure["source_url"], ""))
+        frontier.record(listed_url, "stale", fingerprint)
 
     write_json(CANDIDATES_JSON, {
         "cutoff_date": cutoff_date.isoformat(),
@@ -3664,6 +5624,19 @@ def main() -> int:
         "source_counts_found": source_counts_found,
         "source_counts_newer": source_counts_newer,
         "jobspy_report": jobspy_report,
+        "text_analysis_cache": text_analysis_stats(),
+        "field_extraction": field_extraction_stats(),
+        "extraction_guards": extraction_guard_stats(),
+        "html_parsing": html_parse_stats(),
+        "fetch": fetch_stats(),
+        "retries": retry_stats(),
+        "database_retries": PSQL_RETRY_POLICY.stats(),
+        "search_cache": search_cache.stats(),
+        "host_health": host_health.report(),
+        "enrichment_deadlines": enrichment_deadlines,
+        "frontier": frontier.stats(),
+        "frontier_skipped": frontier_skipped,
+        "near_duplicates_merged": near_duplicates_merged,
         "source_errors": source_errors,
         "duplicates": duplicates,
         "validation_failures": failures,
@@ -3784,8 +5757,10 @@ def main() -> int:
                 "error": f"duplicate check failed: {exc}",
             })
             continue
+        listed_url, fingerprint = frontier_keys.get(source_url, (source_url, ""))
         if is_dup:
             skipped_duplicates += 1
+            frontier.record(listed_url, "duplicate", fingerprint)
             continue
 
         notes = job.get("additional_notes")
@@ -3802,6 +5777,7 @@ def main() -> int:
         code, _, err = psql_query(db_url, insert_sql)
         if code == 0:
             inserted += 1
+            frontier.record(listed_url, "inserted", fingerprint)
         else:
             errors += 1
             insert_error_report.append({
@@ -3812,6 +5788,11 @@ def main() -> int:
             })
             print(f"❌ Insert error for {source_url}: {err}")
 
+    try:
+        frontier.save()
+    except OSError as exc:
+        print(f"⚠️ Could not save the crawl frontier to {frontier.path}: {exc}")
+
     total_after = fetch_total_count(db_url)
 
     # Post-insert tests
@@ -3853,9 +5834,22 @@ def main() -> int:
     print(f"source_errors: {len(source_errors)}")
     print(f"filtered_newer_jobs: {len(newer_source_jobs)}")
     print(f"consolidated_candidates: {len(new_jobs)}")
+    print(f"near_duplicates_merged: {near_duplicates_merged}")
     print(f"deduped_candidates: {len(insert_ready)}")
     print(f"duplicates_removed: {len(duplicates)}")
     print(f"validation_failures: {len(failures)}")
+    print(f"text_analysis_cache: {json.dumps(text_analysis_stats(), sort_keys=True)}")
+    print(f"field_extraction: {json.dumps(field_extraction_stats(), sort_keys=True)}")
+    print(f"extraction_guards: {json.dumps(extraction_guard_stats(), sort_keys=True)}")
+    print(f"html_parsing: {json.dumps(html_parse_stats(), sort_keys=True)}")
+    print(f"fetch: {json.dumps(fetch_stats(), sort_keys=True)}")
+    print(f"retries: {json.dumps(retry_stats(), sort_keys=True)}")
+    print(f"database_retries: {json.dumps(PSQL_RETRY_POLICY.stats(), sort_keys=True)}")
+    print(f"search_cache: {json.dumps(search_cache.stats(), sort_keys=True)}")
+    host_report = host_health.report()
+    print(f"host_health: {json.dumps({key: host_report[key] for key in ('hosts_seen', 'open', 'skipped_attempts')}, sort_keys=True)}")
+    print(f"enrichment_deadlines: {json.dumps(enrichment_deadlines, sort_keys=True)}")
+    print(f"frontier: {json.dumps(frontier.stats(), sort_keys=True)}")
     print("pre_insert_tests: PASS")
     print(f"inserted: {inserted}")
     print(f"skipped_duplicates: {skipped_duplicates}")
@@ -19,6 +19,8 @@ import psycopg2
 from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
+from a11yjobs_http import RETRY_POLICY, load_page
+
 # Load environment variables
 script_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(script_dir)
@@ -78,20 +80,12 @@ class A11yJobsScraper:
             print("Database connection closed")
     
     def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage"""
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-            except Exception as e:
-                if attempt < retries - 1:
-                    print(f"   ⚠️  Retry {attempt + 1}/{retries} for {url}")
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    print(f"   ❌ Failed to fetch {url}: {e}")
-                    return None
-        return None
+        """Fetch and parse a webpage, retrying transient failures with backoff"""
+        try:
+            return RETRY_POLICY.call(load_page, self.session, url, attempts=retries, site='page')
+        except Exception as e:
+            print(f"   ❌ Failed to fetch {url}: {e}")
+            return None
     
     def extract_job_links(self, soup: BeautifulSoup) -> List[str]:
         """Extract job detail page URLs from the listings page"""
@@ -1,31 +1,104 @@
+import io
 import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
 import unittest
-from datetime import date
-from unittest.mock import Mock
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
 
+import requests
 from bs4 import BeautifulSoup
 
+import a11yjobs_http
+import run_a11yjobs_daily
+
+try:
+    import pandas as pd
+except ImportError:  # pandas ships with python-jobspy
+    pd = None
+
+try:
+    import jobspy
+except ImportError:
+    jobspy = None
+
+# The scraper server is built from scraper-server/ alone, so it keeps its own
+# copies of the helpers shared with these scripts; ServerParityTests pins
+# each pair to the same behaviour.
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraper-server"))
+try:
+    from app.utils import bounded_fetch as server_bounded_fetch
+    from app.utils import html_parsing as server_html_parsing
+    from app.utils import keyword_matcher as server_keyword_matcher
+    from app.utils import retry_policy as server_retry_policy
+    from app.utils import safe_extract as server_safe_extract
+except ImportError:
+    server_bounded_fetch = server_html_parsing = server_keyword_matcher = None
+    server_retry_policy = server_safe_extract = None
+
+from a11yjobs_http import (
+    Deadline,
+    DeadlineExceeded,
+    RetryPolicy,
+    RetryScheduler,
+    fetch_bounded,
+    fetch_stats,
+    html_parse_stats,
+    load_page,
+    retry_after_seconds,
+    select_html,
+)
 from run_a11yjobs_daily import (
     REQUIREMENTS_FALLBACK,
     RESPONSIBILITIES_FALLBACK,
+    FIELD_EXTRACTORS,
+    FieldExtractor,
+    KeywordMatcher,
+    minhash_signature,
+    TextAnalysisCache,
+    accessibility_relevance_score,
+    extract_accessibility_focus,
+    extract_certifications,
+    extract_skills,
     extract_company_website,
     extract_experience,
     extract_structured_fields,
+    extraction_guard_stats,
+    LINKS_ONLY,
+    strip_html,
+    field_extraction_stats,
     consolidate_source_candidates,
     description_is_clean,
     external_content_matches_job,
+    FetchedDocument,
     external_content_has_job_detail,
     external_content_is_closed,
     exclude_post_enrichment_cutoff_rows,
     extract_contact_email,
+    extract_embedded_direct_job_urls,
     extract_external_company_name,
+    extract_external_jobposting,
     extract_job_link_hints,
     extract_jsonld_jobposting,
     extract_next_listing_url,
+    fetch_external_document,
     fetch_external_text,
+    HostCircuitBreaker,
     enrich_job,
+    evaluate_alternate_links,
     is_direct_job_url,
+    fetch_linkedin_descriptions,
+    fetch_linkedin_job_details,
     jobspy_record_to_job,
+    prefilter_linkedin_listings,
+    scrape_jobspy_jobs,
+    preprocess_jobspy_frame,
     determine_job_level,
     normalize_description_text,
     normalize_country_code,
@@ -40,6 +113,15 @@ from run_a11yjobs_daily import (
     reconcile_external_jobposting,
     reconcile_explicit_external_facts,
     search_alternate_urls,
+    DuckDuckGoHtmlSearch,
+    SearchBackend,
+    SearchResultCache,
+    StaticSearchBackend,
+    canonical_url,
+    classify_validation_errors,
+    CrawlFrontier,
+    FRONTIER_TERMINAL_OUTCOMES,
+    job_fingerprint,
     trim_legal_boilerplate,
     convert_nan_to_insert_ready,
     validate_enriched_record,
@@ -47,6 +129,33 @@ from run_a11yjobs_daily import (
 )
 
 
+class StreamedBody(io.BytesIO):
+    """Response body that remembers how many bytes were actually read."""
+
+    consumed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        self.consumed += len(data)
+        return data
+
+
+def page_response(
+    page: str,
+    url: str = "https://example.com/",
+    status_code: int = 200,
+    content_type: str = "text/html; charset=utf-8",
+) -> requests.Response:
+    """A ``requests.Response`` streaming ``page`` the way a live one would."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = StreamedBody(page.encode("utf-8"))
+    return response
+
+
 class DescriptionQualityTests(unittest.TestCase):
     def test_inertia_listing_payload_exposes_jobs_and_pagination(self):
         payload = {
@@ -107,15 +216,11 @@ class DescriptionQualityTests(unittest.TestCase):
             },
         }
         encoded = json.dumps(payload).replace('"', "&quot;")
-        response = Mock(
-            status_code=200,
-            text=f'<html><body><div id="app" data-page="{encoded}"></div></body></html>',
-        )
-        response.content = response.text.encode()
-        response.raise_for_status.return_value = None
-        session = Mock()
-        session.get.return_value = response
         url = "https://www.a11yjobs.com/jobs/accessibility-engineer-example-ABC12"
+        session = Mock()
+        session.get.return_value = page_response(
+            f'<html><body><div id="app" data-page="{encoded}"></div></body></html>', url,
+        )
 
         job = parse_job_detail(session, url)
 
@@ -806,6 +911,25 @@ Requirements
         self.assertIn("web", structured["accessibility_focus"])
         self.assertNotIn("documents", structured["accessibility_focus"])
 
+    def test_registered_extractor_reads_its_scope_and_triggers_skip_absent_fields(self):
+        extractor = FieldExtractor(
+            "screen_readers", "preferred",
+            lambda text, fields: [name for name in ("JAWS", "NVDA") if name in text.terms],
+            triggers=("jaws", "nvda"),
+            default=[],
+        )
+        sections = {"requirements": "Test web pages against WCAG.", "nice_to_have": "Experience with NVDA."}
+        with patch("run_a11yjobs_daily.FIELD_EXTRACTORS", FIELD_EXTRACTORS + [extractor]):
+            before = field_extraction_stats().get("years_experience", {"skipped": 0})["skipped"]
+            structured = extract_structured_fields("Audit websites against WCAG and test with NVDA.", sections)
+            skipped = field_extraction_stats()["years_experience"]["skipped"] - before
+
+        self.assertEqual(structured["screen_readers"], ["NVDA"])
+        self.assertEqual(structured["assistive_tech_experience"], ["NVDA"])
+        self.assertIsNone(structured["years_experience"])
+        self.assertEqual(skipped, 1)
+        self.assertNotIn("_preferred_section_certifications", structured)
+
     def test_combined_wcag_versions_preserve_latest_stated_version(self):
         structured = extract_structured_fields(
             "This role audits web applications against WCAG 2.1/2.2 Level AA.",
@@ -876,6 +1000,767 @@ Requirements
         self.assertIn("requirements is placeholder text", errors)
 
 
+class KeywordMatcherTests(unittest.TestCase):
+    def test_single_scan_finds_overlapping_and_prefix_terms(self):
+        matcher = KeywordMatcher(["WCAG", "WCAG 2.1", "web accessibility", "accessibility testing"])
+        hits = matcher.scan("Own web accessibility testing against WCAG 2.1 AA.")
+
+        self.assertEqual(set(hits), {"WCAG", "WCAG 2.1", "web accessibility", "accessibility testing"})
+        self.assertEqual(hits["WCAG"], [(38, 42)])
+        self.assertEqual(hits["WCAG 2.1"], [(38, 46)])
+
+    def test_terms_are_word_bounded(self):
+        matcher = KeywordMatcher(["ADA", "ARIA"])
+
+        self.assertEqual(matcher.scan("Remote in Canada or Bulgaria"), {})
+        self.assertIn("ADA", matcher.scan("ADA, Section 508 and (ARIA) patterns"))
+
+    def test_aliases_report_under_one_label(self):
+        self.assertEqual(
+            extract_certifications("Trusted Tester Certification and CPACC are required."),
+            ["CPACC", "DHS Trusted Tester"],
+        )
+        self.assertEqual(extract_certifications("The role was posted for WAS holders."), ["WAS"])
+
+    def test_finding_nouns_only_discard_their_own_mention(self):
+        text = "Log document accessibility defects. Lead document accessibility for PDF forms."
+
+        self.assertIn("document accessibility", extract_skills(text))
+        self.assertNotIn("document accessibility", extract_skills("Triage document accessibility issues."))
+        self.assertIn("documents", extract_accessibility_focus(text))
+
+    def test_relevance_markers_only_need_to_start_a_word(self):
+        self.assertEqual(accessibility_relevance_score("Engineer", "Based in Bulgaria."), 0)
+        self.assertEqual(accessibility_relevance_score("Accessibility Lead", "Use screen readers and ARIA."), 7)
+
+
+class TextAnalysisCacheTests(unittest.TestCase):
+    def test_views_are_computed_once_per_text(self):
+        cache = TextAnalysisCache(maxsize=2)
+        text = "**Overview** Build [accessible](https://example.com) products with WCAG and JAWS."
+
+        first = cache.get(text)
+        self.assertIs(cache.get(text), first)
+        self.assertEqual(first.plain, "Overview Build accessible products with WCAG and JAWS")
+        self.assertIn("wcag", first.tokens)
+        self.assertIn("JAWS", first.terms)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TextAnalysisCache(maxsize=2)
+        first = cache.get("one")
+        cache.get("two")
+        cache.get("one")
+        cache.get("three")
+
+        self.assertIs(cache.get("one"), first)
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.stats()["misses"], 3)
+
+    def test_sections_are_handed_out_as_copies(self):
+        analyzed = TextAnalysisCache().get("Short text")
+        analyzed.sections["description"] = "changed"
+
+        self.assertNotEqual(analyzed.sections["description"], "changed")
+
+
+class HtmlParsingTests(unittest.TestCase):
+    PAGE = (
+        "<html><head><title>Accessibility Engineer</title>"
+        '<meta property="OG:site_name" content="Acme &amp; Co">'
+        '<script type="Application/LD+JSON">{"@type": "JobPosting", "title": "Accessibility Engineer"}</script>'
+        "</head><body><nav><a href=\"/careers\">Careers</a></nav>"
+        '<a href="/jobs/1/apply/go?ref=board">Apply</a></body></html>'
+    )
+
+    def test_string_lookups_match_full_tree_on_every_backend(self):
+        expected_posting = extract_jsonld_jobposting(BeautifulSoup(self.PAGE, "html.parser"))
+        self.assertEqual(expected_posting["title"], "Accessibility Engineer")
+        for lexbor in (a11yjobs_http._LEXBOR_PARSER, None):
+            with self.subTest(lexbor=lexbor), patch.object(a11yjobs_http, "_LEXBOR_PARSER", lexbor):
+                self.assertEqual(extract_external_jobposting(self.PAGE), expected_posting)
+                self.assertEqual(extract_external_company_name(self.PAGE), "Acme & Co")
+                self.assertEqual(
+                    select_html(self.PAGE.encode(), "test", "a[href]", LINKS_ONLY, "href"),
+                    ["/careers", "/jobs/1/apply/go?ref=board"],
+                )
+        self.assertIn("jsonld", html_parse_stats()["purposes"])
+
+    def test_marked_job_body_is_rewritten_without_a_second_parse(self):
+        filler = "Audit web and native products against WCAG 2.2 with screen reader users. " * 3
+        page = (
+            "<html><body><nav>Home | Careers</nav>"
+            f'<section itemprop="description"><h2>What you will do</h2><p>{filler}</p>'
+            "<ul><li>Run audits</li><li>Coach teams</li></ul><script>track()</script>"
+            "Remote friendly</section></body></html>"
+        )
+        before = html_parse_stats()["purposes"].get("external_content", {}).get("documents", 0)
+
+        text = normalize_external_content(page)
+
+        self.assertIn("**What you will do**", text)
+        self.assertIn("- Run audits", text)
+        self.assertIn("Remote friendly", text)
+        self.assertNotIn("track()", text)
+        self.assertNotIn("Home | Careers", text)
+        self.assertEqual(html_parse_stats()["purposes"]["external_content"]["documents"], before + 1)
+
+    def test_plain_text_skips_the_parser(self):
+        self.assertEqual(strip_html("Five years of WCAG work\nRemote"), "Five years of WCAG work\nRemote")
+        self.assertEqual(strip_html("Salary &amp; benefits<br>"), "Salary & benefits")
+
+
+class FetchedDocumentTests(unittest.TestCase):
+    PAGE = (
+        "<html><head><title>Accessibility Engineer</title>"
+        '<meta property="og:site_name" content="Example Company">'
+        '<script type="application/ld+json">{"@type": "JobPosting", "title": "Accessibility Engineer"}</script>'
+        '</head><body><div class="job__location">Toronto, Ontario, Canada</div>'
+        "<h2>Responsibilities</h2><p>Example Company is hiring an accessibility engineer to audit "
+        "web and mobile products against WCAG 2.2 with screen reader users.</p>"
+        "<h2>Qualifications</h2><p>Three years of accessibility testing with JAWS, NVDA and VoiceOver, "
+        "plus experience coaching product teams on inclusive design and remediation.</p>"
+        '<p>Apply at https:\\/\\/careers.example.com\\/jobs\\/42 or '
+        '<a href="https://jobs.lever.co/example/7">Lever</a>.</p>'
+        "<noscript>This position has been filled</noscript></body></html>"
+    )
+    JOB = {"title": "Accessibility Engineer", "company": "Example Company"}
+
+    def checks(self, content):
+        job = dict(self.JOB)
+        return (
+            external_content_matches_job(content, job),
+            extract_external_jobposting(content),
+            extract_external_company_name(content),
+            external_content_has_job_detail(content),
+            external_content_is_closed(content),
+            reconcile_explicit_external_facts(job, content),
+            job,
+            normalize_external_content(content),
+            extract_embedded_direct_job_urls(content),
+        )
+
+    def test_checks_agree_on_text_and_document_and_parse_the_page_once(self):
+        document = FetchedDocument(self.PAGE, "https://job-boards.greenhouse.io/example/jobs/1")
+        before = html_parse_stats()["purposes"]
+
+        results = self.checks(document)
+        self.checks(document)
+
+        after = html_parse_stats()["purposes"]
+        parses = {
+            purpose: after.get(purpose, {}).get("documents", 0) - before.get(purpose, {}).get("documents", 0)
+            for purpose in ("external_content", "external_document", "embedded_links")
+        }
+        self.assertEqual(parses, {"external_content": 0, "external_document": 1, "embedded_links": 0})
+        self.assertEqual(results, self.checks(self.PAGE))
+        self.assertFalse(results[4])
+        self.assertEqual(results[6]["location"], "Toronto, Ontario, Canada")
+        self.assertEqual(results[8], ["https://careers.example.com/jobs/42", "https://jobs.lever.co/example/7"])
+        # Stripping tags for ``visible`` left the shared tree whole.
+        self.assertIsNotNone(document.soup.find("noscript"))
+
+    def test_fetch_returns_the_document_and_its_resolved_url(self):
+        response = page_response(self.PAGE, "https://example.com/jobs/1")
+        session = Mock()
+        session.get.return_value = response
+
+        document, source, resolved_url = fetch_external_document(session, "https://example.com/j/1")
+
+        self.assertEqual((source, resolved_url, document.url), ("direct", "https://example.com/jobs/1", response.url))
+        self.assertEqual(document.raw, self.PAGE.encode())
+        self.assertEqual(session.get.call_count, 1)
+
+
+class SearchResultCacheTests(unittest.TestCase):
+    QUERY = "Accessibility Engineer Example Co job posting"
+    RESULTS = {QUERY: [
+        "https://www.indeed.com/viewjob?jk=1",
+        "https://jobs.lever.co/example/123",
+        "not a url",
+    ]}
+
+    def setUp(self):
+        self.now = 1_000_000.0
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "search_cache.json")
+
+    def cache(self) -> SearchResultCache:
+        return SearchResultCache(self.path, ttl=100, negative_ttl=10, clock=lambda: self.now)
+
+    def test_ranked_links_persist_across_runs_until_the_ttl(self):
+        backend = StaticSearchBackend(self.RESULTS)
+        first_run = self.cache()
+        expected = ["https://jobs.lever.co/example/123", "https://www.indeed.com/viewjob?jk=1"]
+        self.assertEqual(search_alternate_urls(Mock(), "Accessibility Engineer", "Example Co", first_run, backend), expected)
+        first_run.save()
+
+        second_run = self.cache()
+        self.assertEqual(
+            search_alternate_urls(Mock(), "Accessibility  Engineer", "Example Co.", second_run, backend),
+            expected,
+        )
+        self.assertEqual(backend.queries, [self.QUERY])
+        self.assertEqual(second_run.stats()["hits"], 1)
+
+        self.now += 100
+        search_alternate_urls(Mock(), "Accessibility Engineer", "Example Co", second_run, backend)
+        self.assertEqual(len(backend.queries), 2)
+        self.assertEqual(second_run.stats()["expired"], 1)
+
+    def test_empty_results_are_cached_briefly_and_failures_not_at_all(self):
+        cache = self.cache()
+        empty = StaticSearchBackend()
+        self.assertEqual(search_alternate_urls(Mock(), "Accessibility Lead", "Nobody", cache, empty), [])
+        self.assertEqual(search_alternate_urls(Mock(), "Accessibility Lead", "Nobody", cache, empty), [])
+        self.assertEqual(len(empty.queries), 1)
+        self.now += 10
+        search_alternate_urls(Mock(), "Accessibility Lead", "Nobody", cache, empty)
+        self.assertEqual(len(empty.queries), 2)
+
+        failing = Mock(search=Mock(side_effect=requests.Timeout()))
+        search_alternate_urls(Mock(), "Accessibility Tester", "Example Co", cache, failing)
+        search_alternate_urls(Mock(), "Accessibility Tester", "Example Co", cache, failing)
+        self.assertEqual(failing.search.call_count, 2)
+
+    def test_captcha_page_is_a_failed_search_not_an_empty_one(self):
+        cache = self.cache()
+        anomaly = '<html><body><form id="challenge-form"><div class="anomaly-modal__title">Select all squares</div></form></body></html>'
+        results = (
+            '<html><body><a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fjobs.lever.co%2Fexample%2F123">'
+            "Accessibility Engineer</a></body></html>"
+        )
+        session = Mock()
+        session.get.side_effect = [
+            page_response(anomaly, "https://duckduckgo.com/html/"),
+            page_response(results, "https://duckduckgo.com/html/"),
+        ]
+        backend = DuckDuckGoHtmlSearch()
+
+        self.assertEqual(search_alternate_urls(session, "Accessibility Engineer", "Example Co", cache, backend), [])
+        self.assertEqual(cache.stats()["stored"], 0)
+        self.assertEqual(
+            search_alternate_urls(session, "Accessibility Engineer", "Example Co", cache, backend),
+            ["https://jobs.lever.co/example/123"],
+        )
+        with self.assertRaises(TypeError):
+            SearchBackend()
+
+    def test_unreadable_cache_file_starts_empty(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertEqual(self.cache().stats()["entries"], 0)
+
+
+class CrawlFrontierTests(unittest.TestCase):
+    JOB = {
+        "title": "Accessibility Engineer",
+        "company": "Example Co",
+        "description": "Audit products against WCAG 2.2 and pair with designers on remediation.",
+    }
+
+    def setUp(self):
+        self.now = 1_000_000.0
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "crawl_frontier.json")
+
+    def frontier(self) -> CrawlFrontier:
+        return CrawlFrontier(
+            self.path,
+            ttls={"inserted": 100, "unverified": 10, "transient": 0},
+            retention=1000,
+            clock=lambda: self.now,
+        )
+
+    def test_tracking_parameters_and_url_spelling_share_one_key(self):
+        self.assertEqual(
+            canonical_url("https://www.Example.com/jobs/123/?utm_source=x&b=2&gh_src=abc&a=1#apply"),
+            "example.com/jobs/123?a=1&b=2",
+        )
+        self.assertEqual(canonical_url("http://example.com/jobs/123"), canonical_url("https://example.com/jobs/123/"))
+        self.assertNotEqual(canonical_url("https://example.com/jobs?id=1"), canonical_url("https://example.com/jobs?id=2"))
+
+    def test_outcomes_persist_and_expire_per_class(self):
+        fingerprint = job_fingerprint(self.JOB)
+        first_run = self.frontier()
+        first_run.record("https://example.com/jobs/1", "inserted", fingerprint)
+        first_run.record("https://example.com/jobs/2", "unverified", fingerprint)
+        first_run.record("https://example.com/jobs/3", "transient", fingerprint)
+        first_run.save()
+
+        self.now += 50
+        second_run = self.frontier()
+        self.assertEqual(second_run.skip("https://www.example.com/jobs/1/?utm_medium=email", fingerprint), "inserted")
+        self.assertIsNone(second_run.skip("https://example.com/jobs/2", fingerprint))
+        self.assertIsNone(second_run.skip("https://example.com/jobs/3", fingerprint))
+        self.assertIsNone(second_run.skip("https://example.com/jobs/4", fingerprint))
+        stats = second_run.stats()
+        self.assertEqual((stats["loaded"], stats["skipped"], stats["expired"]), (3, 1, 2))
+
+    def test_changed_posting_is_looked_at_again(self):
+        frontier = self.frontier()
+        frontier.record("https://example.com/jobs/1", "inserted", job_fingerprint(self.JOB))
+        self.assertEqual(frontier.skip("https://example.com/jobs/1"), "inserted")
+        edited = dict(self.JOB, description=self.JOB["description"] + " Remote within the US.")
+        self.assertIsNone(frontier.skip("https://example.com/jobs/1", job_fingerprint(edited)))
+        self.assertEqual(frontier.stats()["changed"], 1)
+        self.assertEqual(job_fingerprint(dict(self.JOB, title="accessibility  engineer")), job_fingerprint(self.JOB))
+
+    def test_unverified_posting_is_looked_at_again_once_another_source_lists_it(self):
+        frontier = self.frontier()
+        listed_alone = dict(self.JOB, source_evidence=[{"source": "indeed", "url": "https://indeed.com/1"}])
+        frontier.record("https://indeed.com/1", "unverified", job_fingerprint(listed_alone))
+        self.assertEqual(frontier.skip("https://indeed.com/1", job_fingerprint(listed_alone)), "unverified")
+
+        corroborated = dict(self.JOB, source_evidence=listed_alone["source_evidence"] + [
+            {"source": "linkedin", "url": "https://linkedin.com/jobs/view/2"},
+        ])
+        self.assertIsNone(frontier.skip("https://indeed.com/1", job_fingerprint(corroborated)))
+        self.assertEqual(job_fingerprint(dict(self.JOB, source_evidence=[])), job_fingerprint(self.JOB))
+
+    def test_only_terminal_outcomes_skip_before_consolidation(self):
+        frontier = self.frontier()
+        frontier.record("https://www.a11yjobs.com/jobs/1", "inserted")
+        frontier.record("https://www.a11yjobs.com/jobs/2", "unverified")
+        self.assertEqual(frontier.skip("https://www.a11yjobs.com/jobs/1", outcomes=FRONTIER_TERMINAL_OUTCOMES), "inserted")
+        self.assertIsNone(frontier.skip("https://www.a11yjobs.com/jobs/2", outcomes=FRONTIER_TERMINAL_OUTCOMES))
+        self.assertEqual(frontier.skip("https://www.a11yjobs.com/jobs/2"), "unverified")
+        self.assertEqual(frontier.stats()["skipped"], 2)
+
+    def test_entries_unseen_past_retention_are_dropped(self):
+        frontier = self.frontier()
+        frontier.record("https://example.com/jobs/1", "inserted")
+        self.now += 1000
+        frontier.save()
+        self.assertEqual(self.frontier().stats()["entries"], 0)
+
+    def test_validation_failures_map_to_outcome_classes(self):
+        cases = {
+            "transient": ["Duplicate check DB error: connection refused"],
+            "stale": ["date_posted 2026-01-01 is not strictly later than cutoff_date 2026-01-02 after source enrichment"],
+            "closed": ["Source evidence conflict: Direct employer or ATS page says the job is closed"],
+            "conflict": ["Source evidence conflict: company mismatch"],
+            "unverified": ["Job lacks verified direct employer evidence or two independent sources"],
+            "invalid": ["Description too short", "Invalid currency"],
+        }
+        for outcome, errors in cases.items():
+            self.assertEqual(classify_validation_errors(errors), outcome)
+
+
+class BoundedFetchTests(unittest.TestCase):
+    def fetch(self, response: requests.Response, max_bytes: int = 1024):
+        session = Mock()
+        session.get.return_value = response
+        return fetch_bounded(session, response.url, timeout=5, max_bytes=max_bytes)
+
+    def test_non_page_content_types_are_dropped_on_their_headers(self):
+        pdf = page_response("%PDF-1.7 " * 500, "https://example.com/job.pdf", content_type="application/pdf")
+        pdf.headers["Content-Length"] = "4500"
+        before = fetch_stats()
+
+        result = self.fetch(pdf)
+
+        self.assertEqual((result.skipped, result.content), ("content_type", b""))
+        self.assertEqual(pdf.raw.consumed, 0)
+        self.assertEqual(fetch_stats()["bytes_avoided"] - before["bytes_avoided"], 4500)
+
+    def test_oversized_declared_length_is_not_read(self):
+        response = page_response("<p>x</p>" * 1000, "https://example.com/jobs/1")
+        response.headers["Content-Length"] = "8000"
+
+        result = self.fetch(response)
+
+        self.assertEqual(result.skipped, "content_length")
+        self.assertEqual(response.raw.consumed, 0)
+
+    def test_undeclared_stream_stops_at_the_cap_and_decodes_the_prefix(self):
+        page = "<html><body><h1>Accessibility Engineer</h1>" + "<p>Café WCAG audits</p>" * 20000
+        response = page_response(page, "https://example.com/jobs/1")
+
+        result = self.fetch(response, max_bytes=100_000)
+
+        self.assertTrue(result.truncated)
+        self.assertEqual(len(result.content), 100_000)
+        self.assertLess(response.raw.consumed, len(page.encode()))
+        self.assertTrue(result.text.startswith("<html><body><h1>Accessibility Engineer</h1><p>Café"))
+
+    def test_json_and_small_pages_are_read_whole(self):
+        result = self.fetch(page_response('{"title": "Accessibility Lead"}', content_type="application/json"))
+        self.assertEqual((result.skipped, result.truncated, result.text), (None, False, '{"title": "Accessibility Lead"}'))
+
+
+class HostCircuitBreakerTests(unittest.TestCase):
+    BLOCKED = "<html><body><h1>Access denied</h1><p>" + "Complete the captcha to continue. " * 10 + "</p></body></html>"
+    POSTING = "<html><body><h1>Accessibility Engineer</h1><p>" + "Audit products against WCAG 2.2. " * 10 + "</p></body></html>"
+
+    def setUp(self):
+        self.now = 0.0
+        self.breaker = HostCircuitBreaker(failure_threshold=2, cooldown=60, clock=lambda: self.now)
+        self.session = Mock()
+        self.session.get.side_effect = self.respond
+        self.direct_page = self.BLOCKED
+
+    def respond(self, url, timeout, stream):
+        page = self.POSTING if url.startswith("https://r.jina.ai/") else self.direct_page
+        return page_response(page, url)
+
+    def fetch(self, job_id: int):
+        self.session.get.reset_mock()
+        result = fetch_external_text(self.session, f"https://careers.example.com/jobs/{job_id}", self.breaker)
+        return result[1], [call.args[0].split("/")[2] for call in self.session.get.call_args_list]
+
+    def test_blocking_host_goes_straight_to_jina_until_the_cooldown(self):
+        self.assertEqual(self.fetch(1), ("jina", ["careers.example.com", "r.jina.ai"]))
+        self.assertEqual(self.fetch(2), ("jina", ["careers.example.com", "r.jina.ai"]))
+        self.assertEqual(self.fetch(3), ("jina", ["r.jina.ai"]))
+
+        report = self.breaker.report()
+        self.assertEqual(report["open"], ["careers.example.com:direct"])
+        self.assertEqual(report["hosts"]["careers.example.com"]["direct"]["skipped"], 1)
+
+        self.now += 60
+        self.direct_page = self.POSTING
+        self.assertEqual(self.fetch(4), ("direct", ["careers.example.com"]))
+        self.assertEqual(self.breaker.report()["open"], [])
+
+    def test_half_open_host_admits_one_probe_and_reopens_on_failure(self):
+        for _ in range(2):
+            self.breaker.record("ats.example.com", "direct", False)
+        self.assertFalse(self.breaker.allow("ats.example.com", "direct"))
+        self.now += 60
+        self.assertTrue(self.breaker.allow("ats.example.com", "direct"))
+        self.assertFalse(self.breaker.allow("ats.example.com", "direct"))
+        self.breaker.record("ats.example.com", "direct", False)
+        self.now += 30
+        self.assertFalse(self.breaker.allow("ats.example.com", "direct"))
+        self.assertTrue(self.breaker.allow("other.example.com", "direct"))
+
+    def test_probe_cut_short_by_its_deadline_lets_the_next_caller_probe(self):
+        for _ in range(2):
+            self.breaker.record("careers.example.com", "direct", False)
+        self.now += 60
+        deadline = Deadline(10, clock=lambda: self.now)
+
+        def time_out(url, timeout, stream):
+            deadline.cancel()
+            raise requests.Timeout("cancelled")
+
+        self.session.get.side_effect = time_out
+        with self.assertRaises(DeadlineExceeded):
+            fetch_external_document(self.session, "https://careers.example.com/jobs/1", self.breaker, deadline)
+
+        circuit = self.breaker.report()["hosts"]["careers.example.com"]["direct"]
+        self.assertEqual((circuit["state"], circuit["failures"]), ("open", 2))
+        self.assertTrue(self.breaker.allow("careers.example.com", "direct"))
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(budget=3, base=1.0, max_delay=8.0, rng=lambda: 0.5, sleep=self.sleeps.append)
+
+    def test_backoff_grows_with_jitter_and_respects_retry_after(self):
+        self.assertEqual(self.policy.delay(1, 5), 0.75)
+        self.assertEqual(self.policy.delay(2, 5), 1.5)
+        self.assertEqual(self.policy.delay(3, 5, retry_after=20.0), 20.0)
+        self.assertIsNone(self.policy.delay(1, 5), "budget of three retries is spent")
+        self.assertEqual(self.policy.stats()["budget_exhausted"], 1)
+        self.assertIsNone(RetryPolicy(rng=lambda: 0.0).delay(1, 3, retry_after=3600.0))
+        self.assertEqual(
+            retry_after_seconds({"Retry-After": "Wed, 21 Oct 2026 07:28:30 GMT"},
+                                now=datetime(2026, 10, 21, 7, 28, tzinfo=timezone.utc)),
+            30.0,
+        )
+
+    def test_only_transient_http_failures_are_retried(self):
+        session = Mock()
+        throttled = page_response("busy", "https://example.com/jobs", status_code=429)
+        throttled.headers["Retry-After"] = "4"
+        session.get.side_effect = [
+            throttled,
+            requests.ConnectionError("reset"),
+            page_response("<h1>Accessibility Engineer</h1>", "https://example.com/jobs"),
+        ]
+
+        soup = self.policy.call(load_page, session, "https://example.com/jobs", attempts=3, site="page")
+
+        self.assertEqual(soup.h1.get_text(), "Accessibility Engineer")
+        self.assertEqual(self.sleeps, [4.0, 1.5])
+        self.assertEqual(self.policy.stats()["sites"]["page"], {"retries": 2, "gave_up": 0, "wait_seconds": 5.5})
+
+        session.get.side_effect = [page_response("gone", "https://example.com/jobs", status_code=404)]
+        with self.assertRaises(requests.HTTPError):
+            self.policy.call(load_page, session, "https://example.com/jobs", site="page")
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_scheduled_retries_wait_on_the_delay_queue_not_a_worker(self):
+        policy = RetryPolicy(budget=None, base=0.2, rng=lambda: 0.0)
+        attempts = Counter()
+        finished = []
+
+        def flaky(name):
+            attempts[name] += 1
+            if name == "slow" and attempts[name] == 1:
+                raise requests.Timeout("timed out")
+            finished.append(name)
+            return name
+
+        with ThreadPoolExecutor(max_workers=1) as executor, RetryScheduler(executor, policy) as retries:
+            futures = [retries.submit(flaky, name, site="test") for name in ("slow", "a", "b")]
+            self.assertEqual([future.result(timeout=5) for future in futures], ["slow", "a", "b"])
+
+        self.assertEqual(finished, ["a", "b", "slow"])
+        self.assertEqual((policy.stats()["retries"], policy.stats()["deferred"]), (1, 1))
+
+    def test_database_retries_do_not_spend_the_network_budget(self):
+        spent = RetryPolicy(budget=0)
+        database = RetryPolicy(budget=None, rng=lambda: 0.0, sleep=self.sleeps.append)
+        dropped = types.SimpleNamespace(returncode=2, stdout="", stderr="server closed the connection unexpectedly")
+        answered = types.SimpleNamespace(returncode=0, stdout="42\n", stderr="")
+
+        with patch.object(run_a11yjobs_daily, "RETRY_POLICY", spent), \
+                patch.object(run_a11yjobs_daily, "PSQL_RETRY_POLICY", database), \
+                patch("run_a11yjobs_daily.subprocess.run", side_effect=[dropped, dropped, answered]):
+            self.assertEqual(run_a11yjobs_daily.psql_query("postgresql://db", "SELECT 42;"), (0, "42", ""))
+
+        self.assertEqual(self.sleeps, [0.5, 1.0])
+        self.assertEqual(database.stats()["sites"]["psql"]["retries"], 2)
+        self.assertEqual(spent.stats()["sites"], {})
+
+
+class EnrichmentDeadlineTests(unittest.TestCase):
+    OTHER_ROLE = "<html><body><h1>Office Manager</h1><p>" + "Run the front desk and order supplies. " * 10 + "</p></body></html>"
+    SEARCH_PAGE = "".join(
+        f'<a class="result__a" href="https://boards.greenhouse.io/example/jobs/{n}">Result</a>' for n in range(3)
+    )
+
+    def setUp(self):
+        self.now = 0.0
+        self.timeouts = []
+
+    def test_job_deadline_clips_timeouts_and_never_outlives_the_run(self):
+        run = Deadline(30.0, clock=lambda: self.now)
+        job = Deadline(10.0, run)
+        self.assertEqual(job.timeout(5.0), 5.0)
+        self.now = 7.0
+        self.assertEqual(job.timeout(5.0), 3.0)
+        self.assertEqual(Deadline(None, run).remaining(), 23.0)
+        self.now = 10.0
+        with self.assertRaises(DeadlineExceeded):
+            job.timeout(5.0)
+        self.assertIsNone(Deadline(None).remaining())
+
+    def respond(self, url, timeout, stream=False, params=None):
+        self.timeouts.append(timeout)
+        self.now += 4.0
+        if "duckduckgo.com" in url:
+            return page_response(self.SEARCH_PAGE, url)
+        return page_response(self.OTHER_ROLE, url)
+
+    def test_exhausted_budget_keeps_the_job_with_evidence_so_far(self):
+        session = Mock()
+        session.get.side_effect = self.respond
+        job = {
+            "title": "Accessibility Engineer",
+            "company": "Example Company",
+            "source_url": "https://www.a11yjobs.com/jobs/example",
+            "apply_url": "https://careers.example.com/jobs/1",
+            "description": "A" * 120,
+        }
+
+        with patch("run_a11yjobs_daily.requests.Session", return_value=session):
+            enriched = enrich_job(session, job, deadline=Deadline(10.0, clock=lambda: self.now), link_fan_out=1)
+
+        self.assertTrue(enriched["enrichment_budget_exhausted"])
+        self.assertFalse(enriched["direct_evidence_verified"])
+        self.assertEqual(enriched["source_url"], "https://www.a11yjobs.com/jobs/example")
+        self.assertIn("enrichment_budget_exhausted", enriched["additional_notes"])
+        # Apply page, search, then one of three links with the 2 s that were left.
+        self.assertEqual(self.timeouts, [5, 5, 2])
+
+    def test_unreachable_pages_mark_the_job_fetch_failed(self):
+        def respond(url, timeout, stream=False, params=None):
+            if "duckduckgo.com" in url:
+                return page_response("<html><body></body></html>", url)
+            if url.startswith("https://r.jina.ai/"):
+                return page_response("Bad gateway", url, status_code=502)
+            raise requests.Timeout("no answer")
+
+        session = Mock()
+        session.get.side_effect = respond
+        job = {
+            "title": "Accessibility Engineer",
+            "company": "Example Company",
+            "apply_url": "https://careers.example.com/jobs/1",
+        }
+
+        with patch("run_a11yjobs_daily.requests.Session", return_value=session):
+            enriched = enrich_job(session, dict(job))
+        self.assertTrue(enriched["enrichment_fetch_failed"])
+        self.assertIn("enrichment_source=unreachable", enriched["additional_notes"])
+
+        # A page that answers but is not a posting is not a fetch failure.
+        session.get.side_effect = lambda url, timeout, stream=False, params=None: page_response(
+            "<p>Not found</p>", url, status_code=404
+        )
+        with patch("run_a11yjobs_daily.requests.Session", return_value=session):
+            enriched = enrich_job(session, dict(job))
+        self.assertNotIn("enrichment_fetch_failed", enriched)
+        self.assertIn("enrichment_source=failed", enriched["additional_notes"])
+
+
+class AlternateLinkTests(unittest.TestCase):
+    JOB = {"title": "Accessibility Engineer", "company": "Example Company"}
+    POSTING = (
+        "<html><body><h1>Accessibility Engineer</h1><p>Example Company is hiring an Accessibility "
+        "Engineer to audit products against WCAG 2.2, test with assistive technology and coach "
+        "product teams on inclusive design.</p></body></html>"
+    )
+    OTHER_ROLE = "<html><body><h1>Office Manager</h1><p>" + "Run the front desk and order supplies. " * 10 + "</p></body></html>"
+
+    def session(self, pages):
+        """Serves ``pages[host] = (delay, page)`` and records the hosts asked for."""
+        requested = []
+
+        def respond(url, timeout, stream):
+            host = url.split("/")[2]
+            requested.append(host)
+            delay, page = pages[host]
+            time.sleep(delay)
+            return page_response(page, url)
+
+        session = Mock(get=Mock(side_effect=respond))
+        # Alternate links fetch on sessions of their own; hand them this one.
+        session_class = patch("run_a11yjobs_daily.requests.Session", return_value=session)
+        session_class.start()
+        self.addCleanup(session_class.stop)
+        return session, requested
+
+    def test_best_ranked_match_wins_in_about_the_slowest_latency(self):
+        session, _ = self.session({
+            "first.example.com": (0.3, self.POSTING),
+            "second.example.com": (0.05, self.POSTING),
+            "third.example.com": (0.3, self.OTHER_ROLE),
+        })
+        links = [f"https://{host}.example.com/jobs/1" for host in ("first", "second", "third")]
+
+        start = time.monotonic()
+        winner, source, exhausted = evaluate_alternate_links(session, links, self.JOB, fan_out=3)
+
+        self.assertEqual((winner.rank, winner.url, source, exhausted), (0, links[0], "direct", False))
+        self.assertLess(time.monotonic() - start, 0.55)
+
+    def test_lower_ranked_links_are_cancelled_once_a_higher_one_matches(self):
+        session, requested = self.session({
+            "first.example.com": (0.05, self.POSTING),
+            "second.example.com": (1.0, self.OTHER_ROLE),
+            "third.example.com": (0.0, self.OTHER_ROLE),
+        })
+        links = [f"https://{host}.example.com/jobs/1" for host in ("first", "second", "third")]
+
+        start = time.monotonic()
+        winner, _, _ = evaluate_alternate_links(session, links, self.JOB, fan_out=2)
+
+        self.assertEqual(winner.rank, 0)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertNotIn("third.example.com", requested)
+
+    def test_no_match_reports_what_a_sequential_walk_ends_on(self):
+        session, _ = self.session({
+            "first.example.com": (0.0, self.OTHER_ROLE),
+            "second.example.com": (0.0, "<p>short</p>"),
+            "r.jina.ai": (0.0, "<p>short</p>"),
+        })
+        links = ["https://first.example.com/jobs/1", "https://second.example.com/jobs/1"]
+
+        self.assertEqual(evaluate_alternate_links(session, links, self.JOB), (None, "failed", False))
+        self.assertEqual(evaluate_alternate_links(session, links[:1], self.JOB), (None, "mismatch", False))
+
+    def test_cancelled_fetch_keeps_off_the_job_session_and_the_breaker(self):
+        answered = threading.Event()
+
+        def respond(url, timeout, stream):
+            if url.startswith("https://first."):
+                time.sleep(0.05)
+                return page_response(self.POSTING, url)
+            time.sleep(0.3)
+            answered.set()
+            return page_response("Forbidden", url, status_code=403)
+
+        link_sessions = []
+
+        def new_session():
+            link_sessions.append(Mock(get=Mock(side_effect=respond)))
+            return link_sessions[-1]
+
+        job_session = Mock()
+        breaker = HostCircuitBreaker(failure_threshold=1)
+        links = ["https://first.example.com/jobs/1", "https://second.example.com/jobs/1"]
+        with patch("run_a11yjobs_daily.requests.Session", side_effect=new_session):
+            winner, _, _ = evaluate_alternate_links(job_session, links, self.JOB, breaker, fan_out=2)
+            self.assertTrue(answered.wait(2))
+            time.sleep(0.05)
+
+        self.assertEqual(winner.rank, 0)
+        job_session.get.assert_not_called()
+        self.assertEqual(len(link_sessions), 2)
+        for link_session in link_sessions:
+            link_session.close.assert_called_once()
+        report = breaker.report()
+        self.assertEqual((report["open"], report["hosts"]), ([], {}))
+
+
+class ExtractionGuardTests(unittest.TestCase):
+    def test_once_quadratic_inputs_finish_quickly(self):
+        adversarial = {
+            "blank lines": "\n" * 100000,
+            "unclosed brackets": "](" + "[" * 100000,
+            "unclosed links": "[x](" * 25000,
+            "email local run": "a." * 50000 + "@",
+        }
+        for label, text in adversarial.items():
+            with self.subTest(label):
+                start = time.perf_counter()
+                parse_description_sections(text)
+                extract_contact_email(text)
+                self.assertLess(time.perf_counter() - start, 2.0)
+
+    def test_exhausted_budget_falls_back_to_valid_results(self):
+        source = "Responsibilities\n- Audit WCAG conformance\n\nRequirements\n- 5 years of experience"
+        with patch.dict("run_a11yjobs_daily.EXTRACTION_STEP_BUDGETS", {"description": 0, "structured_fields": 0}):
+            before = extraction_guard_stats().get("structured_fields", {"budget_exhausted": 0})
+            normalized = normalize_description_text(source)
+            structured = extract_structured_fields(source, {})
+            after = extraction_guard_stats()["structured_fields"]
+
+        self.assertEqual(normalized, "Responsibilities - Audit WCAG conformance Requirements - 5 years of experience")
+        self.assertEqual(structured["required_skills"], [])
+        self.assertIsNone(structured["years_experience"])
+        self.assertEqual(after["budget_exhausted"], before["budget_exhausted"] + 1)
+
+    def test_budgets_count_work_not_wall_clock_time(self):
+        source = "Salary: $90,000 - $110,000 per year.\nResponsibilities\n- Audit WCAG conformance"
+        expected = (normalize_description_text(source), parse_salary(source))
+        with patch("run_a11yjobs_daily.time.monotonic", side_effect=lambda: time.perf_counter() + 10 ** 6):
+            self.assertEqual((normalize_description_text(source), parse_salary(source)), expected)
+
+        def exhausted_after(line_count: int) -> int:
+            before = extraction_guard_stats().get("description", {"budget_exhausted": 0})["budget_exhausted"]
+            normalize_description_text("\n".join(f"- Item {n}" for n in range(line_count)))
+            return extraction_guard_stats().get("description", {"budget_exhausted": 0})["budget_exhausted"] - before
+
+        self.assertEqual(exhausted_after(9000), 0)
+        self.assertEqual(exhausted_after(12000), 1)
+
+    def test_oversized_input_is_truncated_to_its_cap(self):
+        text = "Email recruiter jane@example.com with questions. " + "x" * 300000 + " apply to bob@example.org"
+        self.assertEqual(extract_contact_email(text), "jane@example.com")
+        self.assertEqual(extract_contact_email("x" * 300000 + " contact bob@example.org"), None)
+
+
 class LocationQualityTests(unittest.TestCase):
     def test_us_state_is_not_stored_as_a_country(self):
         self.assertEqual(parse_location_fields("Seattle, WA"), ("Seattle", "US"))
@@ -1147,6 +2032,165 @@ class MultiSourceQualityTests(unittest.TestCase):
         }
         self.assertIsNone(jobspy_record_to_job(record))
 
+    @unittest.skipUnless(pd is not None, "pandas is not installed")
+    def test_jobspy_frame_prefilter_only_drops_rows_mapping_rejects(self):
+        relevant = (
+            "The team needs an accessibility specialist for WCAG audits, ARIA pattern reviews "
+            "and screen reader testing across web and mobile products. "
+        ) * 2
+        base = {"site": "indeed", "company": "Example Company", "date_posted": "2026-07-15", "job_url_direct": None}
+        frame = pd.DataFrame([
+            {**base, "title": "Accessibility Specialist", "job_url": "https://www.indeed.com/viewjob?jk=1", "description": relevant},
+            {**base, "site": "linkedin", "title": "Accessibility Specialist", "job_url": "https://www.indeed.com/viewjob?jk=1", "description": relevant},
+            {**base, "title": "Frontend Developer", "job_url": "https://www.indeed.com/viewjob?jk=2", "description": relevant},
+            {**base, "title": "Workplace Manager", "job_url": "https://www.indeed.com/viewjob?jk=3", "description": "Facilities leases and vendors. " * 10},
+            {**base, "title": "Accessibility Lead", "company": "nan", "job_url": "https://www.indeed.com/viewjob?jk=4", "description": relevant},
+        ])
+
+        rows, stats = preprocess_jobspy_frame(frame)
+
+        self.assertEqual([row["title"] for row in rows], ["Accessibility Specialist", "Frontend Developer"])
+        self.assertEqual(stats, {
+            "raw_rows": 5,
+            "duplicate_urls": 1,
+            "missing_required_fields": 1,
+            "irrelevant": 1,
+            "rows_to_map": 2,
+        })
+        dropped = frame.iloc[[3, 4]].astype(object).where(frame.notna(), None).to_dict("records")
+        self.assertTrue(all(jobspy_record_to_job(row) is None for row in dropped))
+        self.assertIsNotNone(jobspy_record_to_job(rows[1]))
+
+    def test_linkedin_listing_prefilter_skips_off_topic_and_stored_postings(self):
+        listings = [
+            {"title": "Accessibility Engineer", "company": "Acme", "job_url": "https://www.linkedin.com/jobs/view/1"},
+            {"title": "Accessibility Engineer", "company": "Acme", "job_url": "https://www.linkedin.com/jobs/view/1"},
+            {"title": "Office Manager", "company": "Acme", "job_url": "https://www.linkedin.com/jobs/view/2"},
+            {"title": "WCAG Auditor", "company": "Globex", "job_url": "https://www.linkedin.com/jobs/view/3"},
+            {"title": "Digital Accessibility Lead", "company": "Initech", "job_url": "https://www.linkedin.com/jobs/view/4"},
+        ]
+
+        survivors, stats = prefilter_linkedin_listings(
+            listings,
+            known_urls={"https://www.linkedin.com/jobs/view/3"},
+            known_keys={"digitalaccessibilitylead::initech"},
+        )
+
+        self.assertEqual([row["job_url"] for row in survivors], ["https://www.linkedin.com/jobs/view/1"])
+        self.assertEqual(stats, {
+            "listings": 5, "duplicate_urls": 1, "irrelevant_titles": 1, "already_stored": 2, "frontier_skipped": 0,
+        })
+
+    def test_linkedin_listing_prefilter_skips_postings_the_frontier_rejected(self):
+        frontier = CrawlFrontier()
+        # The closed posting was consolidated under its employer URL.
+        frontier.alias("https://careers.acme.com/jobs/1", ["https://www.linkedin.com/jobs/view/1"])
+        frontier.record("https://careers.acme.com/jobs/1", "closed")
+        frontier.record("https://www.linkedin.com/jobs/view/2", "invalid")
+        frontier.record("https://www.linkedin.com/jobs/view/3", "unverified")
+        listings = [
+            {"title": "Accessibility Engineer", "company": "Acme", "job_url": f"https://www.linkedin.com/jobs/view/{n}"}
+            for n in (1, 2, 3, 4)
+        ]
+
+        survivors, stats = prefilter_linkedin_listings(listings, set(), set(), frontier)
+
+        self.assertEqual(
+            [row["job_url"] for row in survivors],
+            ["https://www.linkedin.com/jobs/view/3", "https://www.linkedin.com/jobs/view/4"],
+        )
+        self.assertEqual(stats["frontier_skipped"], 2)
+
+    LINKEDIN_JOB_PAGE = (
+        '<html><body><code id="applyUrl" style="display: none"><!--"https://www.linkedin.com/jobs/view/'
+        'externalApply/1?url=https%3A%2F%2Fjobs%2Elever%2Eco%2Facme%2F8f2c&amp;urlHash=AbCd"--></code>'
+        '<div class="description__text description__text--rich"><section class="show-more-less-html">'
+        '<div class="show-more-less-html__markup"><p><strong>About the role</strong></p>'
+        "<p>Lead <em>WCAG</em> audits for our products.</p><ul><li>Test with JAWS</li><li>Coach teams</li></ul>"
+        "</div></section></div>"
+        '<ul class="description__job-criteria-list">'
+        '<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Seniority level</h3>'
+        '<span class="description__job-criteria-text description__job-criteria-text--criteria">Mid-Senior level</span></li>'
+        '<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Employment type</h3>'
+        '<span class="description__job-criteria-text description__job-criteria-text--criteria">Full-time</span></li>'
+        '<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Industries</h3>'
+        '<span class="description__job-criteria-text description__job-criteria-text--criteria">Software Development</span></li>'
+        "</ul></body></html>"
+    )
+
+    @unittest.skipUnless(jobspy is not None, "python-jobspy is not installed")
+    def test_linkedin_job_page_yields_jobspy_detail_fields(self):
+        session = Mock()
+        session.get.return_value = page_response(self.LINKEDIN_JOB_PAGE, "https://www.linkedin.com/jobs/view/1")
+
+        details = fetch_linkedin_job_details(session, "https://www.linkedin.com/jobs/view/1")
+
+        self.assertIn("**About the role**", details["description"])
+        self.assertIn("Lead *WCAG* audits for our products.", details["description"])
+        self.assertIn("- Test with JAWS", details["description"])
+        self.assertEqual(details["job_url_direct"], "https://jobs.lever.co/acme/8f2c")
+        self.assertEqual(details["job_type"], "fulltime")
+        self.assertEqual(details["job_level"], "mid-senior level")
+        self.assertEqual(details["company_industry"], "Software Development")
+
+    @unittest.skipUnless(jobspy is not None, "python-jobspy is not installed")
+    def test_linkedin_signup_wall_is_not_read_as_a_description(self):
+        session = Mock()
+        session.get.return_value = page_response(
+            self.LINKEDIN_JOB_PAGE, "https://www.linkedin.com/signup/cold-join?session_redirect=%2Fjobs%2Fview%2F1"
+        )
+
+        self.assertIsNone(fetch_linkedin_job_details(session, "https://www.linkedin.com/jobs/view/1"))
+
+    @unittest.skipUnless(jobspy is not None, "python-jobspy is not installed")
+    def test_two_phase_rows_keep_the_direct_apply_url(self):
+        listing = {
+            "site": "linkedin", "title": "Accessibility Engineer", "company": "Acme",
+            "job_url": "https://www.linkedin.com/jobs/view/1", "job_url_direct": None,
+            "job_type": None, "description": None,
+        }
+        session = Mock(headers={})
+        session.get.side_effect = lambda url, **kwargs: page_response(self.LINKEDIN_JOB_PAGE, url)
+
+        with patch("run_a11yjobs_daily.requests.Session", return_value=session):
+            fetched, stats = fetch_linkedin_descriptions([listing], workers=2)
+
+        self.assertEqual(stats, {"descriptions_fetched": 1, "description_failures": 0})
+        self.assertEqual(fetched[0]["job_url_direct"], "https://jobs.lever.co/acme/8f2c")
+        self.assertEqual(fetched[0]["job_type"], "fulltime")
+        self.assertEqual(fetched[0]["job_url"], "https://www.linkedin.com/jobs/view/1")
+
+    @unittest.skipUnless(pd is not None, "pandas is not installed")
+    def test_linkedin_descriptions_are_fetched_only_for_prefiltered_listings(self):
+        def fake_scrape_jobs(site_name, linkedin_fetch_description, **kwargs):
+            calls.append((tuple(site_name), linkedin_fetch_description))
+            if site_name != ["linkedin"]:
+                return pd.DataFrame()
+            return pd.DataFrame([
+                {"site": "linkedin", "title": "Accessibility Engineer", "company": "Acme",
+                 "job_url": "https://www.linkedin.com/jobs/view/1", "description": None},
+                {"site": "linkedin", "title": "Office Manager", "company": "Acme",
+                 "job_url": "https://www.linkedin.com/jobs/view/2", "description": None},
+            ])
+
+        calls = []
+        environment = {
+            "MULTISOURCE_SOURCES": "indeed,linkedin",
+            "MULTISOURCE_SEARCH_TERMS": "accessibility",
+            "MULTISOURCE_MARKETS": "United States",
+        }
+        fake_jobspy = types.SimpleNamespace(scrape_jobs=fake_scrape_jobs)
+        with patch.dict(sys.modules, {"jobspy": fake_jobspy}), patch.dict("os.environ", environment), \
+                patch("run_a11yjobs_daily.fetch_linkedin_job_details", return_value=None) as fetch:
+            _, report = scrape_jobspy_jobs(date(2026, 7, 1))
+
+        self.assertEqual(calls, [(("indeed",), True), (("linkedin",), False)])
+        fetch.assert_called_once()
+        self.assertEqual(fetch.call_args.args[1], "https://www.linkedin.com/jobs/view/1")
+        self.assertEqual(report["linkedin_two_phase"]["irrelevant_titles"], 1)
+        self.assertEqual(report["linkedin_two_phase"]["description_failures"], 1)
+        self.assertEqual(report["raw_source_counts"], {"linkedin": 2})
+
     def test_generic_employer_careers_home_is_not_direct_job_evidence(self):
         self.assertFalse(is_direct_job_url("https://www.example.com/careers/"))
         self.assertFalse(is_direct_job_url("https://www.cgi.com/en/careers"))
@@ -1326,6 +2370,60 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
         self.assertEqual(consolidated[0]["evidence_source_count"], 1)
         self.assertEqual(len(duplicates), 1)
 
+    def test_near_duplicate_titles_and_company_suffixes_share_evidence(self):
+        description = (
+            "Acme is hiring an accessibility engineer to audit web and mobile products against WCAG, "
+            "pair with designers on inclusive patterns and test with JAWS, NVDA and VoiceOver. "
+        )
+        linkedin = {
+            "title": "Sr. Accessibility Engineer",
+            "company": "Acme, Inc.",
+            "description": description * 2,
+            "job_source": "linkedin",
+            "source_url": "https://www.linkedin.com/jobs/view/1",
+            "relevance_score": 10,
+        }
+        indeed = {
+            "title": "Senior Accessibility Engineer",
+            "company": "ACME",
+            "description": description * 2,
+            "job_source": "indeed",
+            "source_url": "https://www.indeed.com/viewjob?jk=1",
+            "relevance_score": 10,
+        }
+
+        consolidated, duplicates = consolidate_source_candidates([linkedin, indeed])
+
+        self.assertEqual(len(consolidated), 1)
+        self.assertEqual(consolidated[0]["job_source"], "indeed")
+        self.assertEqual(consolidated[0]["evidence_source_count"], 2)
+        self.assertEqual(duplicates[0]["reason"], "cross_source_near_duplicate")
+
+    def test_near_duplicate_detection_keeps_distinct_levels_and_employers(self):
+        description = "Audit products against WCAG and coach engineering teams on ARIA patterns. " * 4
+        base = {"description": description, "job_source": "linkedin", "relevance_score": 10}
+        jobs = [
+            {**base, "title": "Accessibility Engineer II", "company": "Acme", "source_url": "https://www.linkedin.com/jobs/view/2"},
+            {**base, "title": "Accessibility Engineer III", "company": "Acme", "source_url": "https://www.linkedin.com/jobs/view/3"},
+            {**base, "title": "Accessibility Engineer II", "company": "Globex", "source_url": "https://www.linkedin.com/jobs/view/4"},
+        ]
+
+        consolidated, duplicates = consolidate_source_candidates(jobs)
+
+        self.assertEqual(len(consolidated), 3)
+        self.assertEqual(duplicates, [])
+
+    def test_minhash_signature_estimates_shared_features(self):
+        shared = [f"feature-{index}" for index in range(200)]
+        same = minhash_signature(shared)
+        similar = minhash_signature(shared[:180] + [f"other-{index}" for index in range(20)])
+        unrelated = minhash_signature([f"other-{index}" for index in range(200)])
+
+        self.assertEqual(same, minhash_signature(reversed(shared)))
+        matches = lambda left, right: sum(a == b for a, b in zip(left, right)) / len(left)
+        self.assertGreater(matches(same, similar), 0.6)
+        self.assertLess(matches(same, unrelated), 0.2)
+
     def test_validation_allows_application_url_without_fabricated_email(self):
         record = {
             "title": "Accessibility Engineer",
@@ -1369,8 +2467,8 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
             'The role includes WCAG reviews, engineering collaboration, and documented remediation.</p>'
             '<p>Apply through this employer applicant tracking system.</p></body></html>'
         )
-        apply_response = Mock(status_code=200, text=apply_page, url="https://www.a11yjobs.com/jobs/example/apply")
-        ats_response = Mock(status_code=200, text=ats_page, url="https://job-boards.greenhouse.io/example/jobs/123")
+        apply_response = page_response(apply_page, "https://www.a11yjobs.com/jobs/example/apply")
+        ats_response = page_response(ats_page, "https://job-boards.greenhouse.io/example/jobs/123")
         session = Mock()
         session.get.side_effect = [apply_response, ats_response]
 
@@ -1396,12 +2494,8 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
             'accessibility engineer to test web and mobile products with assistive technology. '
             'Responsibilities include WCAG reviews and documented remediation guidance.</p></body></html>'
         )
-        apply_response = Mock(status_code=200, text=apply_page, url=apply_url)
-        ats_response = Mock(
-            status_code=200,
-            text=ats_page,
-            url="https://job-boards.greenhouse.io/example/jobs/123",
-        )
+        apply_response = page_response(apply_page, apply_url)
+        ats_response = page_response(ats_page, "https://job-boards.greenhouse.io/example/jobs/123")
         session = Mock()
         session.get.side_effect = [apply_response, ats_response]
 
@@ -1461,7 +2555,7 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
         <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fcareers.insidehighered.com%2Fjob%2F123">Board</a>
         <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.governmentjobs.com%2Fjobs%2F456">ATS</a>
         </body></html>"""
-        response = Mock(status_code=200, text=search_page)
+        response = Mock(status_code=200, text=search_page, content=search_page.encode())
         response.raise_for_status.return_value = None
         session = Mock()
         session.get.return_value = response
@@ -1483,7 +2577,7 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
             'assistive technology. This detailed employer posting supports the '
             'role identity and application destination.</p></body></html>'
         )
-        response = Mock(status_code=200, text=ats_page, url=ats_url)
+        response = page_response(ats_page, ats_url)
         session = Mock()
         session.get.return_value = response
         job = {
@@ -1510,7 +2604,7 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
         with WCAG and assistive technology. Responsibilities include manual audits,
         engineering collaboration, and documented remediation guidance.</p>
         </body></html>"""
-        response = Mock(status_code=200, text=ats_page, url=ats_url)
+        response = page_response(ats_page, ats_url)
         session = Mock()
         session.get.return_value = response
         job = {
@@ -1560,7 +2654,7 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
         <meta property="og:title" content="Accessibility Specialist" />
         <meta property="og:description" content="Example Company accessibility role." />
         </head><body><footer>Example Company careers privacy and legal links.</footer></body></html>"""
-        response = Mock(status_code=200, text=ats_page, url=ats_url)
+        response = page_response(ats_page, ats_url)
         session = Mock()
         session.get.return_value = response
         job = {
@@ -1597,11 +2691,9 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
             "experience advising faculty on inclusive digital learning.</p></body></html>"
         )
         responses = [
-            Mock(status_code=200, text=board_page, url=board_url),
-            Mock(status_code=200, text=ats_page, url=ats_url),
+            page_response(board_page, board_url),
+            page_response(ats_page, ats_url),
         ]
-        for response in responses:
-            response.raise_for_status.return_value = None
         session = Mock()
         session.get.side_effect = responses
         job = {
@@ -1614,7 +2706,8 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
             "requirements": "Know WCAG.",
         }
 
-        enriched = enrich_job(session, job)
+        with patch("run_a11yjobs_daily.requests.Session", return_value=session):
+            enriched = enrich_job(session, job)
 
         self.assertTrue(enriched["direct_evidence_verified"])
         self.assertEqual(enriched["apply_url"], ats_url)
@@ -1667,6 +2760,18 @@ Hiring Range is $57,542.40 - $63,296.64 USD Annual.
         self.assertEqual(job["salary_type"], "hourly")
         self.assertEqual(job["country"], "US")
 
+    def test_heading_precedence_and_wrapped_items_survive_single_pass(self):
+        source = (
+            "Overview\r\nWe build accessible public services for millions of residents and need a specialist "
+            "to lead audits, coach teams and publish conformance reports every quarter.\r\n\r\n"
+            "Essential\r\n- Five years of experience with\r\n   assistive technology testing\r\n\r\n"
+            "Why Acme?\r\nFree lunch and a great office."
+        )
+        sections = parse_description_sections(source)
+
+        self.assertEqual(sections["requirements"], "- Five years of experience with assistive technology testing")
+        self.assertNotIn("Free lunch", json.dumps(sections))
+
     def test_glued_direct_responsibility_headings_are_restored(self):
         source = """Job Overview: This accessibility website role improves public services for disabled users. The work includes governance and training across several content teams.
         Job Responsibilities: Website Accessibility Compliance
@@ -1868,5 +2973,138 @@ Second source-backed line.",
         self.assertTrue(any("part-time/1099" in conflict for conflict in conflicts))
 
 
+@unittest.skipUnless(server_keyword_matcher is not None, "scraper-server is not importable")
+class ServerParityTests(unittest.TestCase):
+    def test_keyword_matchers_report_the_same_spans(self):
+        terms = ["ADA", "WCAG", "WCAG 2.1", "screen reader", ("JAWS", "jaws"), ("NVDA", "nvda"),
+                 ("screen reader", "screenreader"), "İstanbul"]
+        texts = [
+            "",
+            "Canada-based role: ADA and WCAG 2.1 audits with JAWS, NVDA and a screenreader.",
+            "WCAG_2 ADAs wcag 2.10 İstanbul office, screen readers",
+        ]
+        for options in ({}, {"right_bounded": False}, {"ignore_case": False}):
+            script = KeywordMatcher(terms, **options)
+            server = server_keyword_matcher.KeywordMatcher(terms, **options)
+            for text in texts:
+                with self.subTest(options=options, text=text):
+                    self.assertEqual(script.scan(text), server.scan(text))
+                    self.assertEqual(script.labels(text), server.labels(text))
+
+    def test_email_search_and_work_budgets_agree(self):
+        self.assertEqual(
+            (run_a11yjobs_daily.EMAIL_LOCAL_PART_MAX, run_a11yjobs_daily.EMAIL_DOMAIN_MAX),
+            (server_safe_extract.EMAIL_LOCAL_PART_MAX, server_safe_extract.EMAIL_DOMAIN_MAX),
+        )
+        pattern = run_a11yjobs_daily._CONTACT_EMAIL_RE
+        texts = [
+            "Apply to jobs@acme.com or a11y.team@acme.co.uk; not @handle or x@y.",
+            "a" * 5000 + "@acme.com",
+            "jobs@acme.com" + "@" * 300 + ".com",
+            "x" * 70 + "@" + "y" * 300 + ".com hr@acme.io",
+        ]
+        for text in texts:
+            with self.subTest(text=text[:40]):
+                self.assertEqual(run_a11yjobs_daily.find_emails(pattern, text),
+                                 server_safe_extract.find_emails(pattern, text))
+
+        costs = [3, 4, 1, 5, 1]
+        with patch.dict("run_a11yjobs_daily.EXTRACTION_STEP_BUDGETS", {"description": 8}):
+            script = run_a11yjobs_daily.ExtractionBudget("description")
+            server = server_safe_extract.ExtractionBudget(8)
+            self.assertEqual([script.exhausted(cost) for cost in costs],
+                             [server.exhausted(cost) for cost in costs])
+
+    def test_html_parser_choice_and_trees_agree(self):
+        def resolve(module, requested):
+            try:
+                return module.resolve_html_parser(requested)
+            except (ImportError, ValueError) as error:
+                return type(error)
+
+        for requested in ("auto", " AUTO ", "", "html.parser", "lxml", "html5lib"):
+            with self.subTest(requested=requested):
+                self.assertEqual(resolve(a11yjobs_http, requested), resolve(server_html_parsing, requested))
+
+        page = '<html><body><p class="role">Café <b>WCAG</b><p>unclosed<a href="/apply">Apply</a></body></html>'
+        server = server_html_parsing.HtmlParser(a11yjobs_http.HTML_PARSER)
+        self.assertEqual(str(a11yjobs_http.parse_html(page.encode(), "test")), str(server.parse(page.encode())))
+
+    def test_bounded_fetches_read_the_same_bytes(self):
+        self.assertEqual(a11yjobs_http.FETCHABLE_MEDIA_TYPES, server_bounded_fetch.FETCHABLE_MEDIA_TYPES)
+        self.assertEqual(a11yjobs_http.FETCH_MAX_BYTES, server_bounded_fetch.DEFAULT_MAX_BYTES)
+
+        def responses():
+            pdf = page_response("%PDF-1.7 " * 50, "https://example.com/job.pdf", content_type="application/pdf")
+            declared = page_response("<p>x</p>" * 100, "https://example.com/jobs/1")
+            declared.headers["Content-Length"] = "800"
+            return [
+                page_response("<h1>Accessibility Engineer</h1>"),
+                page_response('{"title": "Lead"}', content_type="application/json; charset=latin-1"),
+                page_response("<p>Café WCAG audits</p>" * 40, "https://example.com/jobs/2"),
+                page_response("Not found", status_code=404),
+                pdf,
+                declared,
+            ]
+
+        fetcher = server_bounded_fetch.BoundedFetcher(max_bytes=500)
+        for script_response, server_response in zip(responses(), responses()):
+            with self.subTest(url=script_response.url, content_type=script_response.headers["Content-Type"]):
+                script, server = Mock(), Mock()
+                script.get.return_value, server.get.return_value = script_response, server_response
+                script_result = fetch_bounded(script, script_response.url, timeout=5, max_bytes=500)
+                server_result = fetcher.get(server, server_response.url, timeout=5)
+                self.assertEqual(script_result._replace(headers=None), server_result._replace(headers=None))
+                self.assertEqual(script_response.raw.consumed, server_response.raw.consumed)
+
+    def test_retry_policies_back_off_and_give_up_alike(self):
+        self.assertEqual(
+            (a11yjobs_http.RETRY_BASE_SECONDS, a11yjobs_http.RETRY_MAX_DELAY_SECONDS,
+             a11yjobs_http.RETRY_AFTER_MAX_SECONDS, a11yjobs_http.RETRY_BUDGET, a11yjobs_http.RETRYABLE_STATUSES),
+            (server_retry_policy.BASE_SECONDS, server_retry_policy.MAX_DELAY_SECONDS,
+             server_retry_policy.MAX_RETRY_AFTER_SECONDS, server_retry_policy.DEFAULT_BUDGET,
+             server_retry_policy.RETRYABLE_STATUSES),
+        )
+        now = datetime(2026, 10, 21, 7, 28, tzinfo=timezone.utc)
+        for headers in ({}, {"Retry-After": "7"}, {"Retry-After": "-3"}, {"Retry-After": "soon"},
+                        {"Retry-After": "Wed, 21 Oct 2026 07:28:30 GMT"}):
+            with self.subTest(headers=headers):
+                self.assertEqual(retry_after_seconds(headers, now), server_retry_policy.retry_after_seconds(headers, now))
+
+        errors = [requests.Timeout(), requests.ConnectionError(), requests.exceptions.SSLError(), ValueError()]
+        for status in (404, 408, 429, 503):
+            errors.append(requests.HTTPError(response=page_response("", status_code=status)))
+        self.assertEqual([a11yjobs_http.is_transient_http_error(error) for error in errors],
+                         [server_retry_policy.is_transient_http_error(error) for error in errors])
+
+        calls = [(1, 4, None), (2, 4, None), (3, 4, 20.0), (4, 4, None), (1, 4, 600.0), (1, 4, None), (2, 4, None)]
+        script = RetryPolicy(budget=3, base=1.0, max_delay=8.0, rng=lambda: 0.25)
+        server = server_retry_policy.RetryPolicy(budget=3, base=1.0, max_delay=8.0, rng=lambda: 0.25)
+        self.assertEqual([script.delay(*call, site="test") for call in calls],
+                         [server.delay(*call, site="test") for call in calls])
+        self.assertEqual(script.stats(), server.stats())
+
+    def test_retry_schedulers_park_retries_alike(self):
+        for scheduler, policy_class in ((RetryScheduler, RetryPolicy),
+                                        (server_retry_policy.RetryScheduler, server_retry_policy.RetryPolicy)):
+            with self.subTest(scheduler=scheduler.__module__):
+                policy = policy_class(budget=None, base=0.2, rng=lambda: 0.0)
+                attempts = Counter()
+                finished = []
+
+                def flaky(name):
+                    attempts[name] += 1
+                    if name == "slow" and attempts[name] == 1:
+                        raise requests.Timeout("timed out")
+                    finished.append(name)
+                    return name
+
+                with ThreadPoolExecutor(max_workers=1) as executor, scheduler(executor, policy) as retries:
+                    futures = [retries.submit(flaky, name, site="test") for name in ("slow", "a", "b")]
+                    self.assertEqual([future.result(timeout=5) for future in futures], ["slow", "a", "b"])
+                self.assertEqual(finished, ["a", "b", "slow"])
+                self.assertEqual((policy.stats()["retries"], policy.stats()["deferred"]), (1, 1))
+
+
 if __name__ == "__main__":
     unittest.main()